@@ -19,7 +19,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_dom_settled, wait_for_phase_change, wait_for_workout
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -51,7 +52,7 @@ class AdvancedSeleniumTests:
         options.add_argument("--disable-backgrounding-occluded-windows")
         options.add_argument("--disable-renderer-backgrounding")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 20)
         logger.info("✅ Advanced Chrome WebDriver initialized")
@@ -88,7 +89,7 @@ class AdvancedSeleniumTests:
                 
                 if preset_buttons:
                     preset_buttons[0].click()
-                    time.sleep(2)
+                    wait_for_dom_settled(self.driver)
                     
                     # Check if form was populated
                     form_data = self.driver.execute_script("""
@@ -130,8 +131,9 @@ class AdvancedSeleniumTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         # Check for substitution data
         substitution_data = self.driver.execute_script("""
@@ -187,8 +189,9 @@ class AdvancedSeleniumTests:
             """)
             
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
             customization_tests["work_rest_times"] = {
@@ -234,8 +237,9 @@ class AdvancedSeleniumTests:
             """)
             
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
             customization_tests["circuit_customization"] = {
@@ -268,8 +272,9 @@ class AdvancedSeleniumTests:
                 """)
                 
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 generate_btn.click()
-                time.sleep(2)
+                wait_for_workout(self.driver)
                 
                 workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
                 if not workout_data:
@@ -316,12 +321,14 @@ class AdvancedSeleniumTests:
         try:
             # Generate and start workout
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+            mark(self.driver)
             start_btn.click()
-            time.sleep(2)
+            wait_for_phase_change(self.driver)
             
             # Test player interactions
             player_interactions = self.driver.execute_script("""
@@ -386,7 +393,7 @@ class AdvancedSeleniumTests:
         for viewport in viewports:
             try:
                 self.driver.set_window_size(viewport["width"], viewport["height"])
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
                 
                 # Check if elements are still accessible
                 responsive_check = self.driver.execute_script("""
@@ -519,7 +526,7 @@ class AdvancedSeleniumTests:
             
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
             generate_btn.click()
-            time.sleep(2)
+            wait_for_dom_settled(self.driver)
             
             # Check for error handling
             error_handling = self.driver.execute_script("""
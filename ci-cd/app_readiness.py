@@ -0,0 +1,142 @@
+"""Wait primitives keyed on app state, shared by the Playwright and Selenium suites.
+
+The suites used to sleep for a fixed time after every action. These helpers
+poll a JavaScript predicate instead and return as soon as the app reports
+that it is ready:
+
+- ``wait_for_app``: the workout form and ``window.userAccount`` exist.
+- ``wait_for_workout``: ``window.currentWorkoutData.sequence`` is non-empty
+  and, after ``mark``, is a different workout from the marked one.
+- ``wait_for_phase_change``: ``window.workoutState`` moved to another phase
+  or exercise since ``mark``.
+- ``wait_for_dom_settled``: no DOM mutation for ``quiet`` seconds.
+
+Every helper accepts either a Playwright page (sync or async API) or a
+Selenium WebDriver, and returns ``True`` when the app became ready or
+``False`` on timeout. With the async Playwright API the result is an
+awaitable. Callers keep their own assertions, so a timeout is reported by
+the check that follows rather than by the wait itself.
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any, Awaitable, Optional, Union
+
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_QUIET = 0.15
+POLL_INTERVAL = 0.05
+
+# Installs the shared state (``window.__appReadiness``) and a MutationObserver
+# that timestamps the last DOM change. Idempotent; every predicate calls it.
+_STATE = """(() => {
+    if (!window.__appReadiness) {
+        const state = { workout: undefined, phase: undefined, index: undefined, lastMutation: performance.now() };
+        const observer = new MutationObserver(() => { state.lastMutation = performance.now(); });
+        observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true, characterData: true });
+        window.__appReadiness = state;
+    }
+    return window.__appReadiness;
+})()"""
+
+MARK = f"""() => {{
+    const state = {_STATE};
+    state.workout = window.currentWorkoutData || null;
+    state.phase = window.workoutState?.phase ?? null;
+    state.index = window.workoutState?.currentIndex ?? null;
+    state.lastMutation = performance.now();
+    return true;
+}}"""
+
+APP_READY = """() => !!document.getElementById('workout-form') && !!window.userAccount"""
+
+WORKOUT_READY = f"""() => {{
+    const state = {_STATE};
+    const data = window.currentWorkoutData;
+    const hasSequence = !!data && Array.isArray(data.sequence) && data.sequence.length > 0;
+    return hasSequence && (state.workout === undefined || data !== state.workout);
+}}"""
+
+PHASE_CHANGED = f"""() => {{
+    const state = {_STATE};
+    const current = window.workoutState;
+    if (!current) return false;
+    return (current.phase ?? null) !== state.phase || (current.currentIndex ?? null) !== state.index;
+}}"""
+
+DOM_SETTLED = f"""(quietMs) => {{
+    const state = {_STATE};
+    return performance.now() - state.lastMutation >= quietMs;
+}}"""
+
+WaitResult = Union[bool, Awaitable[bool]]
+
+
+def _is_playwright(target: Any) -> bool:
+    return hasattr(target, "wait_for_function")
+
+
+async def _settle(waiting: Awaitable[Any], timeout_error: type) -> bool:
+    try:
+        await waiting
+    except timeout_error:
+        return False
+    return True
+
+
+def _playwright_wait(page: Any, predicate: str, arg: Any, timeout: float) -> WaitResult:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        waiting = page.wait_for_function(predicate, arg=arg, timeout=timeout * 1000)
+    except PlaywrightTimeoutError:
+        return False
+    if inspect.isawaitable(waiting):
+        return _settle(waiting, PlaywrightTimeoutError)
+    return True
+
+
+def _selenium_wait(driver: Any, predicate: str, arg: Any, timeout: float) -> bool:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    script = f"return !!(({predicate})(arguments[0]));"
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda current: current.execute_script(script, arg)
+        )
+    except TimeoutException:
+        return False
+    return True
+
+
+def wait_for(target: Any, predicate: str, arg: Any = None, timeout: float = DEFAULT_TIMEOUT) -> WaitResult:
+    """Poll the JavaScript function ``predicate(arg)`` until it is truthy."""
+    if _is_playwright(target):
+        return _playwright_wait(target, predicate, arg, timeout)
+    return _selenium_wait(target, predicate, arg, timeout)
+
+
+def mark(target: Any) -> Optional[Awaitable[Any]]:
+    """Remember the current workout and player phase; call before the action being waited on."""
+    if _is_playwright(target):
+        return target.evaluate(MARK)
+    target.execute_script(f"return ({MARK})();")
+    return None
+
+
+def wait_for_app(target: Any, timeout: float = DEFAULT_TIMEOUT) -> WaitResult:
+    return wait_for(target, APP_READY, timeout=timeout)
+
+
+def wait_for_workout(target: Any, timeout: float = DEFAULT_TIMEOUT) -> WaitResult:
+    return wait_for(target, WORKOUT_READY, timeout=timeout)
+
+
+def wait_for_phase_change(target: Any, timeout: float = DEFAULT_TIMEOUT) -> WaitResult:
+    return wait_for(target, PHASE_CHANGED, timeout=timeout)
+
+
+def wait_for_dom_settled(target: Any, quiet: float = DEFAULT_QUIET, timeout: float = DEFAULT_TIMEOUT) -> WaitResult:
+    return wait_for(target, DOM_SETTLED, arg=quiet * 1000, timeout=timeout)
@@ -18,11 +18,39 @@ import requests
 from datetime import datetime
 from pathlib import Path
 import logging
-import hashlib
-import pickle
 import threading
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Optional, Tuple
 import shutil
+import sqlite3
+
+from source_snapshot import SourceSnapshot
+from cache_store import CacheSchemaError, CacheStore, DEFAULT_MAX_BYTES, DEFAULT_TTL_SECONDS
+from check_cache import CheckCache, fingerprint_files, pipeline_code_files
+from source_watcher import SourceWatcher
+from module_graph import ModuleGraph
+from bundle_budget import (
+    BASELINE_PATH as BUNDLE_BASELINE_PATH,
+    Budget,
+    BudgetReport,
+    analyze as analyze_bundle_budget,
+    load_baseline,
+    save_baseline,
+)
+from impact_analysis import ImpactError, changed_files, load_recorded_inputs, record_inputs, select_checks
+from feature_matcher import FeatureDetector
+from equipment_coverage import ALWAYS_AVAILABLE, EquipmentCoverageIndex
+from exercise_catalog import ExerciseCatalog, load_catalog
+from exercise_index import ExerciseIndex, load_index
+from workout_harness import HarnessUnavailable, form_space, run_form_space
+from category_scheduler import (
+    DurationHistory,
+    critical_path_priorities,
+    default_worker_count,
+    plan_schedule,
+    priority_order,
+    validate_dag,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +64,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class AutomatedTestPipeline:
+    # Category entry points that read nothing but the source snapshot
+    CACHEABLE_CATEGORY_METHODS = {'run_security_tests'}
+
     def __init__(self, persist_artifacts: bool = True, enable_cache: bool = True):
         self.project_root = Path(__file__).parent.parent
         self.persist_artifacts = persist_artifacts
@@ -47,13 +78,17 @@ class AutomatedTestPipeline:
             'summary': {}
         }
         self.pipeline_start_time = time.time()
+        # Per-thread buffer for test result writes while categories run concurrently.
+        self._thread_state = threading.local()
+
+        # Every static check reads src/ through this snapshot: one I/O pass per run,
+        # and all checks see the same bytes even if a file is saved mid-run.
+        self.src_root = self.project_root / 'src'
+        self.snapshot = SourceSnapshot.capture(self.src_root)
         
-        # Performance thresholds and constants
-        self.MAX_JS_SIZE = 250000  # 250KB (increased from 200KB)
-        self.MAX_HTML_SIZE = 100000  # 100KB (increased from 80KB)
+        # Performance thresholds and constants (transfer-size budgets live in enhanced_pipeline_config.json)
         self.HIGH_COMPLEXITY_THRESHOLD = 20  # Number of features for high complexity (increased from 15)
         self.FEATURE_DETECTION_TIMEOUT = 10  # Seconds for feature detection
-        self.SERVER_STARTUP_DELAY = 5  # Seconds to wait for server startup
         
         # Status constants
         self.STATUS_PASSED = 'PASSED'
@@ -99,10 +134,25 @@ class AutomatedTestPipeline:
             }
         }
         
-        # Initialize file hash tracking and cache
-        self.cache_file = self.project_root / 'ci-cd' / '.test_cache.pkl'
-        self.file_hashes = {}
-        self.update_file_hashes()
+        # Per-check result cache keyed on the snapshot reads each check made
+        self.pipeline_settings = self.load_pipeline_settings()
+        self.cache_file = self.project_root / 'ci-cd' / '.test_cache.sqlite3'
+        self.check_cache = self.open_check_cache() if self.enable_cache else None
+        # Observed category durations feed the critical-path scheduler
+        self.duration_history = DurationHistory(self.project_root / 'ci-cd' / '.test_durations.json')
+        self.max_workers = None
+        # Sizes from the previous run, so bundle growth is caught even while under budget
+        self.bundle_baseline_file = BUNDLE_BASELINE_PATH
+        # Only an explicit --save-bundle-baseline moves the committed baseline
+        self.save_bundle_baseline = False
+        self._bundle_report: Optional[Tuple[SourceSnapshot, BudgetReport]] = None
+        # Git change set (worktree, staged or a revision range) limiting the run to affected categories
+        self.changes = None
+        # Snapshot reads per category from its last run, used by --watch and --changes to pick what to rerun
+        self.category_reads = {}
+        self._cached_feature_detector = None
+        self._form_space_results: Dict[Any, Tuple[Dict[str, Any], Dict[str, Optional[str]]]] = {}
+        self._form_space_lock = threading.Lock()
 
         # Canonical release contract and explicit non-blocking legacy suites.
         self.release_test_contract = {
@@ -113,6 +163,7 @@ class AutomatedTestPipeline:
                 'python ci-cd/quality_gate.py '
                 '--results reports/test_results/automated_test_results.json '
                 '--e2e reports/test_results/e2e_smoke_result.json '
+                '--bench-verdict reports/benchmarks/bench_verdict.json '
                 '--min-success-rate 85 '
                 '--min-security-score 70 '
                 '--min-accessibility-score 80 '
@@ -159,7 +210,7 @@ class AutomatedTestPipeline:
             self.run_performance_tests()
             
             # Phase 7: Security tests
-            self.run_security_tests()
+            self._run_check('run_security_tests', self.run_security_tests)
             
             # Phase 8: Generate final report
             self.generate_final_report()
@@ -169,6 +220,9 @@ class AutomatedTestPipeline:
             
             # Phase 10: Enforce mandatory workflow sequence
             self.enforce_workflow_sequence()
+            
+            # Phase 11: Save per-check results to cache
+            self.save_test_cache()
         
         except Exception as e:
             logger.error(f"❌ Pipeline failed: {str(e)}")
@@ -194,14 +248,16 @@ class AutomatedTestPipeline:
         
         missing_files = []
         for file in required_files:
-            if not (self.project_root / file).exists():
+            path = self.project_root / file
+            present = self.snapshot.exists(path) if file.startswith('src/') else path.exists()
+            if not present:
                 missing_files.append(file)
         
         if missing_files:
             raise FileNotFoundError(f"Missing required files: {missing_files}")
         
         logger.info("✅ Pre-flight checks passed")
-        self.test_results['tests']['preflight'] = {'status': self.STATUS_PASSED, 'details': 'All required files present'}
+        self._record_test('preflight', {'status': self.STATUS_PASSED, 'details': 'All required files present'})
     
     def auto_update_pipeline_config(self):
         """Automatically update pipeline configuration based on detected features"""
@@ -221,35 +277,29 @@ class AutomatedTestPipeline:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
             html_path = self.project_root / 'src' / 'index.html'
             
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Use centralized feature list for detection
+            # Use centralized feature list for detection: one scan per file for all patterns
+            detections = self._feature_detector(features_config['app_features']).detect(
+                [self.snapshot[html_path]], [self.snapshot[js_path]]
+            )
             detected_features = {}
+            feature_locations = {}
             active_features = []
             
-            for feature_key, feature_data in features_config['app_features'].items():
-                html_patterns = feature_data['detection_patterns']['html']
-                js_patterns = feature_data['detection_patterns']['js']
+            for feature_key, detection in detections.items():
+                detected_features[feature_key] = detection.detected
                 
-                # Check if feature is present in codebase
-                html_detected = any(pattern in html_content for pattern in html_patterns)
-                js_detected = any(pattern in js_content for pattern in js_patterns)
-                
-                detected_features[feature_key] = html_detected or js_detected
-                
-                if detected_features[feature_key]:
+                if detection.detected:
                     active_features.append(feature_key)
-                    logger.info(f"✅ Detected: {feature_data['name']}")
+                    feature_locations[feature_key] = detection.locations()
+                    logger.info(f"✅ Detected: {detection.name} ({detection.hits[0].location()})")
                 else:
-                    logger.info(f"❌ Not detected: {feature_data['name']}")
+                    logger.info(f"❌ Not detected: {detection.name}")
             
             # Store feature detection results for pipeline optimization
             self.test_results['pipeline_config'] = {
                 'timestamp': datetime.now().isoformat(),
                 'detected_features': detected_features,
+                'feature_locations': feature_locations,
                 'feature_count': len(active_features),
                 'total_features': len(features_config['app_features']),
                 'feature_list_version': features_config['metadata']['version'],
@@ -274,16 +324,55 @@ class AutomatedTestPipeline:
             logger.info("🔄 Falling back to hardcoded feature detection")
             self._fallback_feature_detection()
     
+    def _feature_detector(self, features: Dict[str, Any]) -> FeatureDetector:
+        """Compiled detector for the current feature list, shared by every caller in this run"""
+        cached = self._cached_feature_detector
+        if cached is None or cached.features != features:
+            cached = self._cached_feature_detector = FeatureDetector(features)
+        return cached
+
+    def _exercise_catalog(self) -> Optional[ExerciseCatalog]:
+        """Parsed ``exercises`` array from the snapshot, or None when the database file is absent"""
+        source = self.snapshot.get(self.project_root / 'src' / 'js' / 'core' / 'exercise-database.js')
+        return load_catalog(source) if source is not None else None
+
+    def _exercise_index(self) -> Optional[ExerciseIndex]:
+        """Lookup indexes over the parsed exercises, shared by every database check"""
+        source = self.snapshot.get(self.project_root / 'src' / 'js' / 'core' / 'exercise-database.js')
+        return load_index(source) if source is not None else None
+
+    def _module_graph(self) -> ModuleGraph:
+        """ES-module import graph of the snapshot, parsed once per file content"""
+        return ModuleGraph.build(self.snapshot)
+
+    def _bundle_budget(self) -> BudgetReport:
+        """Budget report for the configured entry, measured once per snapshot and diffed
+        against the committed baseline (rewritten only when save_bundle_baseline is set)"""
+        cached = self._bundle_report
+        if cached is not None and cached[0] is self.snapshot:
+            return cached[1]
+        report = analyze_bundle_budget(
+            self.snapshot,
+            Budget.from_config(self.project_root / 'ci-cd' / 'enhanced_pipeline_config.json'),
+            load_baseline(self.bundle_baseline_file),
+            self._module_graph(),
+        )
+        self._bundle_report = (self.snapshot, report)
+        if self.save_bundle_baseline:
+            try:
+                save_baseline(report, self.bundle_baseline_file)
+            except OSError as e:
+                logger.warning(f"Could not save bundle size baseline: {e}")
+        return report
+
     def _fallback_feature_detection(self):
         """Fallback feature detection when app_features.json is not available"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
             html_path = self.project_root / 'src' / 'index.html'
             
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
+            html_content = self.snapshot.read_text(html_path)
             
             # Fallback detection patterns (legacy method)
             detected_features = {
@@ -309,6 +398,7 @@ class AutomatedTestPipeline:
             self.test_results['pipeline_config'] = {
                 'timestamp': datetime.now().isoformat(),
                 'detected_features': detected_features,
+                'feature_locations': feature_locations,
                 'feature_count': len(active_features),
                 'total_features': len(detected_features),
                 'feature_list_version': 'fallback',
@@ -382,47 +472,46 @@ class AutomatedTestPipeline:
                 logger.info("✅ Code quality tests passed")
             else:
                 logger.warning(f"⚠️ AI code review had issues: {result.stderr}")
-                self.test_results['tests']['code_quality'] = {
+                self._record_test('code_quality', {
                     'status': 'WARNING',
                     'details': f'AI review completed with warnings: {result.stderr[:200]}'
-                }
+                })
                 
         except subprocess.TimeoutExpired:
             logger.warning("⚠️ AI code review timed out")
-            self.test_results['tests']['code_quality'] = {
+            self._record_test('code_quality', {
                 'status': 'WARNING',
                 'details': 'AI review timed out after 5 minutes'
-            }
+            })
         except Exception as e:
             logger.error(f"❌ Code quality tests failed: {str(e)}")
-            self.test_results['tests']['code_quality'] = {
+            self._record_test('code_quality', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
     
     def run_additional_ai_checks(self):
         """Run additional AI model checks for comprehensive analysis"""
         logger.info("🤖 Running Additional AI Model Checks")
         
         ai_checks = {
-            'code_complexity': self.analyze_code_complexity(),
-            'security_analysis': self.analyze_security_patterns(),
-            'performance_patterns': self.analyze_performance_patterns(),
-            'accessibility_analysis': self.analyze_accessibility(),
-            'best_practices': self.analyze_best_practices()
+            'code_complexity': self._run_check('analyze_code_complexity', self.analyze_code_complexity),
+            'security_analysis': self._run_check('analyze_security_patterns', self.analyze_security_patterns),
+            'performance_patterns': self._run_check('analyze_performance_patterns', self.analyze_performance_patterns),
+            'accessibility_analysis': self._run_check('analyze_accessibility', self.analyze_accessibility),
+            'best_practices': self._run_check('analyze_best_practices', self.analyze_best_practices)
         }
         
-        self.test_results['tests']['ai_analysis'] = {
+        self._record_test('ai_analysis', {
             'status': 'PASSED' if all(check['status'] == 'PASSED' for check in ai_checks.values()) else 'WARNING',
             'details': ai_checks
-        }
+        })
     
     def analyze_code_complexity(self):
         """Analyze code complexity and maintainability"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             # Complexity metrics
             lines_of_code = len(js_content.split('\n'))
@@ -455,8 +544,7 @@ class AutomatedTestPipeline:
         """Analyze security patterns and vulnerabilities"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             security_issues = []
             
@@ -480,8 +568,7 @@ class AutomatedTestPipeline:
         """Analyze performance patterns and optimization opportunities"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             performance_issues = []
             
@@ -499,8 +586,7 @@ class AutomatedTestPipeline:
         """Analyze accessibility patterns and ARIA usage"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             accessibility_issues = []
             
@@ -524,8 +610,7 @@ class AutomatedTestPipeline:
         """Analyze coding best practices and standards"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             best_practice_issues = []
             best_practice_notes = []
@@ -572,23 +657,22 @@ class AutomatedTestPipeline:
                         error_count = sum(f.get('errorCount', 0) for f in lint_results)
                         warn_count = sum(f.get('warningCount', 0) for f in lint_results)
                         status = 'PASSED' if error_count == 0 else 'FAILED'
-                        self.test_results['tests']['static_analysis'] = {
+                        self._record_test('static_analysis', {
                             'status': status,
                             'details': {
                                 'eslint': True,
                                 'error_count': error_count,
                                 'warning_count': warn_count
                             }
-                        }
+                        })
                         return
                 except Exception as error:
                     logger.warning(f"⚠️ Local ESLint run failed, falling back to legacy checks: {error}")
             
             # Fallback: existing basic checks on legacy entry file if present
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            if js_path.exists():
-                with open(js_path, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
+            if self.snapshot.exists(js_path):
+                js_content = self.snapshot.read_text(js_path)
             else:
                 js_content = ''
             
@@ -598,17 +682,17 @@ class AutomatedTestPipeline:
                 'dependency_check': self.check_dependencies(js_content)
             }
             
-            self.test_results['tests']['static_analysis'] = {
+            self._record_test('static_analysis', {
                 'status': 'PASSED' if all(check['status'] == 'PASSED' for check in static_analysis.values()) else 'WARNING',
                 'details': static_analysis
-            }
+            })
             
         except Exception as e:
             logger.error(f"❌ Static analysis failed: {str(e)}")
-            self.test_results['tests']['static_analysis'] = {
+            self._record_test('static_analysis', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
     
     def check_javascript_syntax(self, js_content):
         """Check JavaScript syntax validity"""
@@ -654,13 +738,24 @@ class AutomatedTestPipeline:
                 dependencies.append('fetch API')
             if 'XMLHttpRequest' in js_content:
                 dependencies.append('XMLHttpRequest')
-            if 'import ' in js_content:
+            
+            graph = self._module_graph()
+            main_imports = graph.imports.get('js/main.js', frozenset())
+            if main_imports:
                 dependencies.append('ES6 modules')
             
             return {
-                'status': 'PASSED',
+                # An import that resolves to no file breaks the page at load time
+                'status': 'WARNING' if graph.missing else 'PASSED',
                 'dependencies_found': dependencies,
-                'total_dependencies': len(dependencies)
+                'total_dependencies': len(dependencies),
+                'module_graph': {
+                    'modules': len(graph.modules),
+                    'entries': graph.entries,
+                    'main_imports': sorted(main_imports),
+                    'missing_imports': graph.missing,
+                    'unreachable_modules': graph.unreachable(),
+                }
             }
         except Exception as e:
             return {'status': 'FAILED', 'details': str(e)}
@@ -678,11 +773,11 @@ class AutomatedTestPipeline:
                 medium_priority = len([issue for issue in ai_results.get('issues', []) if issue.get('priority') == 'MEDIUM'])
                 low_priority = len([issue for issue in ai_results.get('issues', []) if issue.get('priority') == 'LOW'])
                 
-                self.test_results['tests']['code_quality'] = {
+                self._record_test('code_quality', {
                     'status': 'PASSED' if high_priority == 0 else 'WARNING',
                     'details': f'High: {high_priority}, Medium: {medium_priority}, Low: {low_priority}',
                     'ai_report': ai_results
-                }
+                })
                 
         except Exception as e:
             logger.warning(f"Could not parse AI review results: {str(e)}")
@@ -697,20 +792,20 @@ class AutomatedTestPipeline:
             
             # Core tests that are always needed
             core_tests = [
-                self.test_html_structure(),
-                self.test_javascript_functionality(),
-                self.test_exercise_database(),
-                self.test_actual_functionality(),
-                self.test_form_data_validation(),
-                self.test_comprehensive_form_combinations(),
-                self.test_workout_timing_data_flow(),
-                self.test_circuit_data_preservation(),
-                self.test_circuit_ui_cleanup(),
-                self.test_workout_flow_navigation(),
-                self.test_visual_enhancement_features(),
-                self.test_video_system_functionality(),
-                self.test_guide_slider_functionality(),
-                self.test_visual_enhancement_integration()
+                self._run_check('test_html_structure', self.test_html_structure),
+                self._run_check('test_javascript_functionality', self.test_javascript_functionality),
+                self._run_check('test_exercise_database', self.test_exercise_database),
+                self._run_check('test_actual_functionality', self.test_actual_functionality),
+                self._run_check('test_form_data_validation', self.test_form_data_validation),
+                self._run_check('test_comprehensive_form_combinations', self.test_comprehensive_form_combinations),
+                self._run_check('test_workout_timing_data_flow', self.test_workout_timing_data_flow),
+                self._run_check('test_circuit_data_preservation', self.test_circuit_data_preservation),
+                self._run_check('test_circuit_ui_cleanup', self.test_circuit_ui_cleanup),
+                self._run_check('test_workout_flow_navigation', self.test_workout_flow_navigation),
+                self._run_check('test_visual_enhancement_features', self.test_visual_enhancement_features),
+                self._run_check('test_video_system_functionality', self.test_video_system_functionality),
+                self._run_check('test_guide_slider_functionality', self.test_guide_slider_functionality),
+                self._run_check('test_visual_enhancement_integration', self.test_visual_enhancement_integration)
             ]
             
             # Combine core and dynamic tests
@@ -761,12 +856,12 @@ class AutomatedTestPipeline:
                     # Dynamic tests with auto-generated names
                     test_details[f'dynamic_test_{i-len(core_tests)}'] = test
             
-            self.test_results['tests']['ui_functionality'] = {
+            self._record_test('ui_functionality', {
                 'status': ui_status,
                 'details': test_details,
                 'dynamic_tests_count': len(dynamic_tests),
                 'core_tests_count': len(core_tests)
-            }
+            })
             
             logger.info(f"✅ UI functionality tests completed: {ui_status}")
             logger.info(f"   - Core tests: {len(core_tests)}")
@@ -774,25 +869,24 @@ class AutomatedTestPipeline:
             
         except Exception as e:
             logger.error(f"❌ UI functionality tests failed: {str(e)}")
-            self.test_results['tests']['ui_functionality'] = {
+            self._record_test('ui_functionality', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
             
             
         except Exception as e:
             logger.error(f"❌ UI functionality tests failed: {str(e)}")
-            self.test_results['tests']['ui_functionality'] = {
+            self._record_test('ui_functionality', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
 
     def test_html_structure(self):
         """Test basic HTML structure and accessibility"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             tests = {
                 'has_title': '<title>' in html_content,
@@ -820,8 +914,7 @@ class AutomatedTestPipeline:
         """Test JavaScript functionality and dependencies"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_exercises_array': ('const exercises = [' in js_content) or ('import { exercises }' in js_content) or ('exerciseDatabase' in js_content),
@@ -849,8 +942,7 @@ class AutomatedTestPipeline:
         """Test comprehensive form interaction logic"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_duration_validation': 'durationSlider' in js_content,
@@ -882,42 +974,39 @@ class AutomatedTestPipeline:
         try:
             # Check if exercise database is imported in main.js
             main_js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(main_js_path, 'r', encoding='utf-8') as f:
-                main_js_content = f.read()
+            main_js_content = self.snapshot.read_text(main_js_path)
             
             # Check if exercise database file exists and is imported
             exercise_db_path = self.project_root / 'src' / 'js' / 'core' / 'exercise-database.js'
-            if not exercise_db_path.exists():
+            if not self.snapshot.exists(exercise_db_path):
                 return {'status': 'FAILED', 'details': 'Exercise database file not found'}
             
             # Check if main.js imports the exercise database
             if 'exerciseDatabase' not in main_js_content and 'import { exercises }' not in main_js_content:
                 return {'status': 'FAILED', 'details': 'Exercise database not imported in main.js'}
             
-            # Read the exercise database file
-            with open(exercise_db_path, 'r', encoding='utf-8') as f:
-                exercise_db_content = f.read()
-            
-            # Extract exercise data from the database file
-            exercises_start = exercise_db_content.find('const exercises = [')
-            if exercises_start == -1:
+            catalog = self._exercise_catalog()
+            if not catalog:
                 return {'status': 'FAILED', 'details': 'Exercise database not found in exercise-database.js'}
+            integrity_issues = self._exercise_index().integrity_issues()
             
-            exercises_end = exercise_db_content.find('];', exercises_start)
-            exercises_section = exercise_db_content[exercises_start:exercises_end]
-            
+            types = set(catalog.types())
+            equipment = set(catalog.equipment())
+            levels = set(catalog.levels())
             tests = {
-                'has_warmup_exercises': 'type: "warmup"' in exercises_section,
-                'has_main_exercises': 'type: "main"' in exercises_section,
-                'has_cooldown_exercises': 'type: "cooldown"' in exercises_section,
-                'has_bodyweight_exercises': 'equipment: "Bodyweight"' in exercises_section,
-                'has_dumbbell_exercises': 'equipment: "Dumbbells"' in exercises_section,
-                'has_beginner_level': '"Beginner"' in exercises_section,
-                'has_intermediate_level': '"Intermediate"' in exercises_section,
-                # Relaxed: detect Advanced present anywhere in level arrays
-                'has_advanced_level': '"Advanced"' in exercises_section,
-                'has_exercise_descriptions': 'description:' in exercises_section,
-                'has_muscle_groups': 'muscle:' in exercises_section
+                'has_warmup_exercises': 'warmup' in types,
+                'has_main_exercises': 'main' in types,
+                'has_cooldown_exercises': 'cooldown' in types,
+                'has_bodyweight_exercises': 'Bodyweight' in equipment,
+                'has_dumbbell_exercises': 'Dumbbells' in equipment,
+                'has_beginner_level': 'Beginner' in levels,
+                'has_intermediate_level': 'Intermediate' in levels,
+                'has_advanced_level': 'Advanced' in levels,
+                'has_exercise_descriptions': all(record.description for record in catalog.records),
+                'has_muscle_groups': all(record.muscle for record in catalog.records),
+                'all_entries_complete': not catalog.issues,
+                'no_duplicate_entries': not any(issue.kind == 'duplicate_entry' for issue in integrity_issues),
+                'known_types_and_levels': not any(issue.kind in ('unknown_type', 'unknown_level') for issue in integrity_issues)
             }
             
             passed = sum(tests.values())
@@ -926,7 +1015,10 @@ class AutomatedTestPipeline:
             return {
                 'status': 'PASSED' if passed == total else 'WARNING',
                 'score': f'{passed}/{total}',
-                'details': tests
+                'details': tests,
+                'exercise_count': len(catalog),
+                'issues': list(catalog.issues),
+                'integrity_issues': [issue.describe() for issue in integrity_issues]
             }
             
         except Exception as e:
@@ -940,8 +1032,7 @@ class AutomatedTestPipeline:
         """Test responsive design implementation"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             tests = {
                 'has_viewport_meta': 'viewport' in html_content,
@@ -970,19 +1061,17 @@ class AutomatedTestPipeline:
         """Test analytics dashboard functionality and tracking"""
         try:
             # Check if dashboard files exist
-            dashboard_html = (self.project_root / 'src' / 'dashboard.html').exists()
-            dashboard_js = (self.project_root / 'src' / 'dashboard.js').exists()
+            dashboard_html = self.snapshot.exists(self.project_root / 'src' / 'dashboard.html')
+            dashboard_js = self.snapshot.exists(self.project_root / 'src' / 'dashboard.js')
             
             # Check main app for analytics integration
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             # Check dashboard HTML for required elements
             html_path = self.project_root / 'src' / 'dashboard.html'
             if dashboard_html:
-                with open(html_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+                html_content = self.snapshot.read_text(html_path)
             else:
                 html_content = ""
             
@@ -1014,12 +1103,10 @@ class AutomatedTestPipeline:
         """Test accessibility features and ARIA implementation"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_semantic_html': True,
@@ -1049,8 +1136,7 @@ class AutomatedTestPipeline:
         """Test error handling and user feedback mechanisms"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_error_functions': 'showError' in js_content,
@@ -1079,12 +1165,10 @@ class AutomatedTestPipeline:
         """Test UI performance and optimization"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             # Performance checks (relaxed thresholds for richer UI)
             js_size = len(js_content)
@@ -1120,12 +1204,10 @@ class AutomatedTestPipeline:
         """Test work and rest time slider functionality"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_work_time_slider': 'work-time' in html_content,
@@ -1158,12 +1240,10 @@ class AutomatedTestPipeline:
         """Test training pattern selection and management functionality"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_training_pattern_section': 'Training Pattern' in html_content,
@@ -1201,12 +1281,9 @@ class AutomatedTestPipeline:
             player_path = self.project_root / 'src' / 'js' / 'features' / 'workout-player.js'
             substitution_path = self.project_root / 'src' / 'js' / 'features' / 'smart-substitution.js'
             
-            with open(generator_path, 'r', encoding='utf-8') as f:
-                generator_content = f.read()
-            with open(player_path, 'r', encoding='utf-8') as f:
-                player_content = f.read()
-            with open(substitution_path, 'r', encoding='utf-8') as f:
-                substitution_content = f.read()
+            generator_content = self.snapshot.read_text(generator_path)
+            player_content = self.snapshot.read_text(player_path)
+            substitution_content = self.snapshot.read_text(substitution_path)
             
             tests = {
                 'has_circuit_generation': 'generateCircuitWorkout' in generator_content,
@@ -1237,8 +1314,7 @@ class AutomatedTestPipeline:
         """Test Tabata interval workout generation and timing"""
         try:
             generator_path = self.project_root / 'src' / 'js' / 'core' / 'workout-generator.js'
-            with open(generator_path, 'r', encoding='utf-8') as f:
-                generator_content = f.read()
+            generator_content = self.snapshot.read_text(generator_path)
             
             tests = {
                 'has_tabata_generation': 'generateTabataWorkout' in generator_content,
@@ -1266,8 +1342,7 @@ class AutomatedTestPipeline:
         """Test pyramid training workout generation and progression"""
         try:
             generator_path = self.project_root / 'src' / 'js' / 'core' / 'workout-generator.js'
-            with open(generator_path, 'r', encoding='utf-8') as f:
-                generator_content = f.read()
+            generator_content = self.snapshot.read_text(generator_path)
             
             tests = {
                 'has_pyramid_generation': 'generatePyramidWorkout' in generator_content,
@@ -1296,8 +1371,7 @@ class AutomatedTestPipeline:
         """CRITICAL: Test actual application functionality and script dependencies"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             # Extract all script tags
             import re
@@ -1314,7 +1388,7 @@ class AutomatedTestPipeline:
                 clean_script_src = script_src.split('?')[0]
                 # Script paths in HTML are relative to src/, so add src/ prefix
                 script_path = self.project_root / 'src' / clean_script_src
-                if not script_path.exists():
+                if not self.snapshot.exists(script_path):
                     # Skip legacy main.js file (removed in modular refactor)
                     if 'main.js' in clean_script_src:
                         continue
@@ -1333,9 +1407,8 @@ class AutomatedTestPipeline:
             
             # Check for form submission functionality and core functions
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            if js_path.exists():
-                with open(js_path, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
+            if self.snapshot.exists(js_path):
+                js_content = self.snapshot.read_text(js_path)
                 if 'addEventListener' not in js_content or 'submit' not in js_content:
                     functionality_issues.append('Form submission handler missing')
                 if 'exercises' not in js_content:
@@ -1372,8 +1445,7 @@ class AutomatedTestPipeline:
         """CRITICAL: Test form data collection and validation logic"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             # Check for proper form structure
             form_issues = []
@@ -1398,9 +1470,8 @@ class AutomatedTestPipeline:
             
             js_issues = []
             for js_file in js_files:
-                if js_file.exists():
-                    with open(js_file, 'r', encoding='utf-8') as f:
-                        js_content = f.read()
+                if self.snapshot.exists(js_file):
+                    js_content = self.snapshot.read_text(js_file)
                     
                     # Check for proper FormData usage
                     if 'FormData' in js_content:
@@ -1444,8 +1515,7 @@ class AutomatedTestPipeline:
         """Ensure overview and player containers and controls exist"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             tests = {
                 'has_overview_screen': ('overview-screen' in html_content) or ('workout-overview' in html_content),
                 'has_overview_list': 'overview-list' in html_content,
@@ -1471,8 +1541,7 @@ class AutomatedTestPipeline:
         """Check that timers, phases, and pause logic exist in JS"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_phase_state': "phase: 'work'" in js_content or 'appState.phase' in js_content,
                 'has_remaining_seconds': 'remainingSeconds' in js_content,
@@ -1497,11 +1566,9 @@ class AutomatedTestPipeline:
         """Validate sound/vibration toggles and cue functions exist"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_sound_toggle': 'toggle-sound' in html_content,
                 'has_vibration_toggle': 'toggle-vibration' in html_content,
@@ -1525,11 +1592,9 @@ class AutomatedTestPipeline:
         """Check for rest overlay markup and binding in JS"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_rest_overlay': 'rest-overlay' in html_content,
                 'has_rest_overlay_timer': 'rest-overlay-timer' in html_content,
@@ -1551,8 +1616,7 @@ class AutomatedTestPipeline:
         """Validate keyboard shortcuts and swipe gesture hooks exist"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_keydown_listener': 'keydown' in js_content,
                 'space_pause_logic': "e.key === ' '" in js_content or 'btn.textContent = appState.isPaused' in js_content,
@@ -1575,11 +1639,9 @@ class AutomatedTestPipeline:
         """Ensure section badge exists and is referenced in JS"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_section_badge_html': 'section-badge' in html_content,
                 'sets_section_badge_in_js': 'sectionBadge' in js_content and 'ex._section' in js_content
@@ -1598,11 +1660,9 @@ class AutomatedTestPipeline:
         """Verify audio context init and sound toggle logic exist"""
         try:
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             tests = {
                 'has_sound_toggle_html': 'toggle-sound' in html_content,
                 'has_audio_context_state': 'audioContext' in js_content,
@@ -1623,8 +1683,7 @@ class AutomatedTestPipeline:
         """Check presence of spoken countdown and announcements"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             has_phase_check = ("appState.phase === 'work'" in js_content) or ("appState.phase === \"work\"" in js_content)
             has_last5_check = 'remainingSeconds <= 5' in js_content
             tests = {
@@ -1649,8 +1708,7 @@ class AutomatedTestPipeline:
         try:
             # Dynamically detect form options from HTML
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             # Extract available durations
             import re
@@ -1665,47 +1723,30 @@ class AutomatedTestPipeline:
             pattern_pattern = r'<input[^>]*name="training-pattern"[^>]*value="([^"]*)"[^>]*>'
             available_patterns = re.findall(pattern_pattern, html_content)
             
-            # Extract available fitness levels
-            level_pattern = r'<option[^>]*value="([^"]*)"[^>]*>'
-            level_matches = re.findall(level_pattern, html_content)
+            # Extract available fitness levels from the fitness-level select only
+            level_select = re.search(r'<select[^>]*id="fitness-level"[^>]*>(.*?)</select>', html_content, re.S)
+            level_matches = re.findall(r'<option[^>]*value="([^"]*)"[^>]*>', level_select.group(1)) if level_select else []
             available_levels = [level for level in level_matches if level and level not in ['', 'Select Level']]
             
-            # Generate test scenarios dynamically
-            test_scenarios = []
-            
-            # Create representative test scenarios (not all combinations to keep test time reasonable)
-            for duration in available_durations[:2]:  # Test first 2 durations
-                for level in available_levels[:2]:    # Test first 2 levels
-                    for pattern in available_patterns[:2]:  # Test first 2 patterns
-                        # Single equipment tests
-                        for equipment in available_equipment[:3]:  # Test first 3 equipment types
-                            test_scenarios.append({
-                                'duration': duration,
-                                'equipment': [equipment],
-                                'level': level,
-                                'pattern': pattern
-                            })
-                        
-                        # Multi-equipment test (if we have enough equipment)
-                        if len(available_equipment) >= 2:
-                            test_scenarios.append({
-                                'duration': duration,
-                                'equipment': available_equipment[:2],
-                                'level': level,
-                                'pattern': pattern
-                            })
+            # The whole form space; Bodyweight is always selectable, as in the equipment coverage check
+            test_scenarios = form_space(
+                [int(duration) for duration in available_durations if duration.isdigit()],
+                available_equipment,
+                available_levels,
+                available_patterns,
+                always_available=ALWAYS_AVAILABLE,
+            )
             
             # Check if workout generator can handle all scenarios
             js_path = self.project_root / 'src' / 'js' / 'core' / 'workout-generator.js'
-            if not js_path.exists():
+            if not self.snapshot.exists(js_path):
                 return {
                     'status': 'FAILED',
                     'error': 'Workout generator file not found',
                     'critical_issues': ['Missing workout-generator.js']
                 }
             
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             # Validate that the generator can handle all scenarios
             validation_results = {
@@ -1740,25 +1781,34 @@ class AutomatedTestPipeline:
                 }
             
             # Validate that exercise database has exercises for all detected equipment
-            exercise_db_path = self.project_root / 'src' / 'js' / 'core' / 'exercise-database.js'
+            catalog = self._exercise_catalog()
             equipment_coverage = {}
             
-            if exercise_db_path.exists():
-                with open(exercise_db_path, 'r', encoding='utf-8') as f:
-                    exercise_content = f.read()
-                
+            if catalog is not None:
+                database_equipment = set(catalog.equipment())
                 for equipment in available_equipment:
-                    # Check if exercises exist for this equipment type
-                    equipment_lower = equipment.lower()
-                    has_exercises = equipment_lower in exercise_content.lower()
-                    equipment_coverage[equipment] = has_exercises
+                    equipment_coverage[equipment] = equipment in database_equipment
+            
+            # Run generateWorkout for every scenario in one headless page
+            generation = self._generate_form_space(test_scenarios)
+            if generation['status'] == 'FAILED':
+                return {
+                    'status': 'FAILED',
+                    'validation_results': validation_results,
+                    'generation': generation,
+                    'critical_issues': [
+                        f"{example['scenario']}: {'; '.join(example['violations'])}"
+                        for example in generation.get('examples', [])[:5]
+                    ] or [generation.get('error', 'Workout generation failed')]
+                }
             
             # All validations passed
             return {
                 'status': 'PASSED',
                 'validation_results': validation_results,
-                'all_scenarios_supported': True,
+                'all_scenarios_supported': generation['status'] == 'PASSED',
                 'form_combinations_tested': len(test_scenarios),
+                'generation': generation,
                 'detected_form_options': {
                     'durations': available_durations,
                     'equipment': available_equipment,
@@ -1776,6 +1826,44 @@ class AutomatedTestPipeline:
                 'critical_issues': ['Comprehensive form combination test failed']
             }
     
+    def _generate_form_space(self, scenarios) -> Dict[str, Any]:
+        """Generate a workout per scenario and check each one against the exercise index"""
+        index = self._exercise_index()
+        if index is None:
+            return {'status': 'SKIPPED', 'reason': 'Exercise database not found', 'scenarios': len(scenarios)}
+        key = (id(index), tuple(scenarios))
+        with self._form_space_lock:
+            cached = self._form_space_results.get(key)
+            # --watch swaps in a new snapshot after each edit: an entry only holds
+            # while every file the harness read is unchanged
+            if cached is None or not self.snapshot.matches(cached[1]):
+                with self.snapshot.track_reads() as reads:
+                    summary = self._run_form_space(index, scenarios)
+                cached = self._form_space_results[key] = (summary, dict(reads))
+            else:
+                # Later callers depend on the modules the first run loaded
+                self.snapshot.replay_reads(cached[1])
+        summary = cached[0]
+        if summary.get('status') == 'SKIPPED':
+            self._mark_uncacheable()
+        return dict(summary)
+    
+    def _run_form_space(self, index: ExerciseIndex, scenarios) -> Dict[str, Any]:
+        started = time.time()
+        try:
+            summary = run_form_space(self.snapshot, index, scenarios)
+        except HarnessUnavailable as e:
+            return {'status': 'SKIPPED', 'reason': str(e), 'scenarios': len(scenarios)}
+        except Exception as e:
+            return {'status': 'FAILED', 'error': f'Workout generation harness failed: {e}', 'scenarios': len(scenarios)}
+        elapsed = time.time() - started
+        summary.update({
+            'status': 'FAILED' if summary['failed'] else 'PASSED',
+            'execution_time': round(elapsed, 3),
+            'scenarios_per_second': round(len(scenarios) / elapsed, 1) if elapsed > 0 else None
+        })
+        return summary
+    
     def test_circuit_data_preservation(self):
         """Test that circuit data is properly preserved through the enhancement process"""
         try:
@@ -1784,12 +1872,9 @@ class AutomatedTestPipeline:
             substitution_path = self.project_root / 'src' / 'js' / 'features' / 'smart-substitution.js'
             player_path = self.project_root / 'src' / 'js' / 'features' / 'workout-player.js'
             
-            with open(generator_path, 'r', encoding='utf-8') as f:
-                generator_content = f.read()
-            with open(substitution_path, 'r', encoding='utf-8') as f:
-                substitution_content = f.read()
-            with open(player_path, 'r', encoding='utf-8') as f:
-                player_content = f.read()
+            generator_content = self.snapshot.read_text(generator_path)
+            substitution_content = self.snapshot.read_text(substitution_path)
+            player_content = self.snapshot.read_text(player_path)
             
             tests = {
                 'circuit_data_creation': 'workout._circuitData = {' in generator_content,
@@ -1818,8 +1903,7 @@ class AutomatedTestPipeline:
         try:
             # Check HTML form structure for timing inputs
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             # Check for timing input elements
             timing_checks = {
@@ -1839,12 +1923,11 @@ class AutomatedTestPipeline:
             
             for js_file in js_files:
                 js_path = self.project_root / js_file
-                if not js_path.exists():
+                if not self.snapshot.exists(js_path):
                     timing_data_flow[js_file] = {'status': 'MISSING', 'error': 'File not found'}
                     continue
                 
-                with open(js_path, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
+                js_content = self.snapshot.read_text(js_path)
                 
                 # Check for timing-related code patterns
                 timing_patterns = {
@@ -1871,22 +1954,19 @@ class AutomatedTestPipeline:
                 'initializeWorkoutPlayer': False
             }
             
-            if workout_generator_path.exists():
-                with open(workout_generator_path, 'r', encoding='utf-8') as f:
-                    generator_content = f.read()
+            if self.snapshot.exists(workout_generator_path):
+                generator_content = self.snapshot.read_text(workout_generator_path)
                 critical_functions['displayWorkout'] = 'function displayWorkout' in generator_content or 'displayWorkout(' in generator_content
             
-            if workout_player_path.exists():
-                with open(workout_player_path, 'r', encoding='utf-8') as f:
-                    player_content = f.read()
+            if self.snapshot.exists(workout_player_path):
+                player_content = self.snapshot.read_text(workout_player_path)
                 critical_functions['window.startWorkout'] = 'window.startWorkout' in player_content
                 critical_functions['initializeWorkoutPlayer'] = 'initializeWorkoutPlayer' in player_content
             
             # Check for timing value extraction from form
             form_timing_extraction = False
-            if workout_player_path.exists():
-                with open(workout_player_path, 'r', encoding='utf-8') as f:
-                    player_content = f.read()
+            if self.snapshot.exists(workout_player_path):
+                player_content = self.snapshot.read_text(workout_player_path)
                 form_timing_extraction = (
                     'getElementById(\'work-time\')' in player_content or 
                     'getElementById("work-time")' in player_content
@@ -1942,121 +2022,15 @@ class AutomatedTestPipeline:
     def test_exhaustive_equipment_combinations(self):
         """Test that all equipment combinations can generate valid workout plans"""
         try:
-            source_paths = [
-                self.project_root / 'src' / 'js' / 'core' / 'exercise-database.js',
-                self.project_root / 'src' / 'js' / 'core' / 'workout-generator.js',
-            ]
-            js_content = None
-            source_file = None
-            for path in source_paths:
-                if path.exists():
-                    source_file = path
-                    with open(path, 'r', encoding='utf-8') as f:
-                        js_content = f.read()
-                    break
-
-            if js_content is None:
+            exercise_index = self._exercise_index()
+            if exercise_index is None:
                 return {
                     'status': 'FAILED',
                     'error': 'Exercise database not found'
                 }
-
-            def extract_exercise_objects(content: str):
-                start_idx = content.find('export const exercises')
-                if start_idx == -1:
-                    start_idx = content.find('const exercises')
-                if start_idx == -1:
-                    return []
-                bracket_start = content.find('[', start_idx)
-                if bracket_start == -1:
-                    return []
-
-                in_str = None
-                escape = False
-                bracket_depth = 0
-                bracket_end = None
-                for i in range(bracket_start, len(content)):
-                    ch = content[i]
-                    if in_str:
-                        if escape:
-                            escape = False
-                        elif ch == '\\\\':
-                            escape = True
-                        elif ch == in_str:
-                            in_str = None
-                        continue
-                    if ch in ('"', "'", '`'):
-                        in_str = ch
-                        continue
-                    if ch == '[':
-                        bracket_depth += 1
-                    elif ch == ']':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            bracket_end = i
-                            break
-
-                if bracket_end is None:
-                    return []
-
-                array_content = content[bracket_start + 1: bracket_end]
-                objects = []
-                in_str = None
-                escape = False
-                depth = 0
-                start = None
-                for idx, ch in enumerate(array_content):
-                    if in_str:
-                        if escape:
-                            escape = False
-                        elif ch == '\\\\':
-                            escape = True
-                        elif ch == in_str:
-                            in_str = None
-                        continue
-                    if ch in ('"', "'", '`'):
-                        in_str = ch
-                        continue
-                    if ch == '{':
-                        if depth == 0:
-                            start = idx
-                        depth += 1
-                    elif ch == '}':
-                        depth -= 1
-                        if depth == 0 and start is not None:
-                            objects.append(array_content[start:idx + 1])
-                            start = None
-                return objects
-
-            import re
-            exercises = []
-            for obj in extract_exercise_objects(js_content):
-                name_match = re.search(r"name:\s*['\"]([^'\"]+)['\"]", obj)
-                equipment_match = re.search(r"equipment:\s*['\"]([^'\"]+)['\"]", obj)
-                muscle_match = re.search(r"muscle:\s*['\"]([^'\"]+)['\"]", obj)
-                type_match = re.search(r"type:\s*['\"]([^'\"]+)['\"]", obj)
-                level_match = re.search(r"level:\s*(\[[^\]]*\]|['\"][^'\"]+['\"])", obj, re.S)
-
-                if not (name_match and equipment_match and muscle_match and type_match and level_match):
-                    continue
-
-                level_raw = level_match.group(1).strip()
-                if level_raw.startswith('['):
-                    levels = [
-                        lvl.strip().strip("\"'")
-                        for lvl in re.findall(r"['\"]([^'\"]+)['\"]", level_raw)
-                    ]
-                else:
-                    levels = [level_raw.strip().strip("\"'")]
-
-                exercises.append({
-                    'name': name_match.group(1),
-                    'description': '',
-                    'equipment': equipment_match.group(1),
-                    'level': levels,
-                    'muscle': muscle_match.group(1),
-                    'type': type_match.group(1)
-                })
+            # Repeated (name, type) entries would count the same exercise twice towards a minimum
+            unique_records = exercise_index.unique_records()
+            exercises = [record.as_dict() for record in unique_records]
             
             if not exercises:
                 return {
@@ -2064,58 +2038,33 @@ class AutomatedTestPipeline:
                     'details': 'No exercises found in database'
                 }
             
-            # Gather equipment types and levels
-            equipments = sorted(set(e['equipment'] for e in exercises))
-            levels = ['Beginner', 'Intermediate', 'Advanced']
-            
-            # Helper function to check availability
-            def available(exs, eq_subset, level_filter, etype):
-                return [e for e in exs if e['type'] == etype and 
-                       (e['equipment'] in eq_subset or e['equipment'] == 'Bodyweight') and 
-                       (level_filter in e['level'])]
-            
-            # Test requirements
-            warmup_count = 5
-            cooldown_count = 5
-            main_min_options = 10
-            
-            # Generate all possible equipment subsets
-            import itertools
-            all_eq = equipments
-            subsets = []
-            for r in range(0, len(all_eq) + 1):
-                subsets.extend(itertools.combinations(all_eq, r))
-            
-            # Test all combinations
-            total_combinations = 0
-            failures = []
+            # Bitmask index: per-(type, level) counts per equipment, summed over subset bits
+            index = EquipmentCoverageIndex(exercises)
+            total_combinations = index.total_combinations
             
-            for eq_subset in subsets:
-                for lvl in levels:
-                    total_combinations += 1
-                    warm = available(exercises, eq_subset, lvl, 'warmup')
-                    main = available(exercises, eq_subset, lvl, 'main')
-                    cool = available(exercises, eq_subset, lvl, 'cooldown')
-                    
-                    ok = (len(warm) >= warmup_count and 
-                          len(main) >= main_min_options and 
-                          len(cool) >= cooldown_count)
-                    
-                    if not ok:
-                        failures.append({
-                            'equipment_subset': list(eq_subset),
-                            'level': lvl,
-                            'warmup_available': len(warm),
-                            'main_available': len(main),
-                            'cooldown_available': len(cool)
-                        })
+            # Failing subsets are downward closed, so they are enumerated without touching passing ones
+            failures = []
+            maximal_failing_subsets = {}
+            for lvl in index.levels:
+                for failure in index.failures(lvl):
+                    failures.append({
+                        'equipment_subset': list(failure.equipment),
+                        'level': lvl,
+                        'warmup_available': failure.available['warmup'],
+                        'main_available': failure.available['main'],
+                        'cooldown_available': failure.available['cooldown']
+                    })
+                maximal = index.maximal_failures(lvl)
+                if maximal:
+                    maximal_failing_subsets[lvl] = [list(failure.equipment) for failure in maximal]
             
             # Determine test status
             if failures:
                 return {
                     'status': 'FAILED',
                     'details': f'{len(failures)} combinations failed out of {total_combinations} tested',
-                    'failures': failures[:10],  # Show first 10 failures
+                    'failures': failures,
+                    'maximal_failing_subsets': maximal_failing_subsets,
                     'total_combinations': total_combinations
                 }
             else:
@@ -2123,7 +2072,8 @@ class AutomatedTestPipeline:
                     'status': 'PASSED',
                     'details': f'All {total_combinations} equipment combinations validated successfully',
                     'total_combinations': total_combinations,
-                    'equipment_types': len(equipments)
+                    'equipment_types': len(index.equipment),
+                    'duplicate_entries_ignored': len(exercise_index) - len(unique_records)
                 }
                 
         except Exception as e:
@@ -2146,49 +2096,29 @@ class AutomatedTestPipeline:
             with open(features_file, 'r', encoding='utf-8') as f:
                 features_config = json.load(f)
             
-            # Check for modular structure first, fallback to original
-            js_path = self.project_root / 'src' / 'js' / 'main.js'
-            if not js_path.exists():
-                js_path = self.project_root / 'src' / 'js' / 'main.js'
-            
             html_path = self.project_root / 'src' / 'index.html'
             
-            # Read all JS files for comprehensive detection
-            js_content = ""
-            if js_path.exists():
-                with open(js_path, 'r', encoding='utf-8') as f:
-                    js_content = f.read()
-            
-            # Also read modular JS files if they exist
-            js_dir = self.project_root / 'src' / 'js'
-            if js_dir.exists():
-                for js_file in js_dir.rglob('*.js'):
-                    with open(js_file, 'r', encoding='utf-8') as f:
-                        js_content += f.read() + "\n"
-            
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Every JS module (main.js included) is scanned once for all feature patterns
+            js_sources = list(self.snapshot.iter_files('js/', '.js'))
+            detections = self._feature_detector(features_config['app_features']).detect(
+                [self.snapshot[html_path]], js_sources
+            )
             
             dynamic_tests = []
             
             # Use centralized feature list for dynamic detection
-            for feature_key, feature_data in features_config['app_features'].items():
-                html_patterns = feature_data['detection_patterns']['html']
-                js_patterns = feature_data['detection_patterns']['js']
-                
-                # Check if feature is present in codebase
-                html_detected = any(pattern in html_content for pattern in html_patterns)
-                js_detected = any(pattern in js_content for pattern in js_patterns)
+            for feature_key, detection in detections.items():
+                feature_data = features_config['app_features'][feature_key]
                 
-                if html_detected or js_detected:
-                    logger.info(f"🎯 Detected: {feature_data['name']}")
+                if detection.detected:
+                    logger.info(f"🎯 Detected: {feature_data['name']} ({detection.hits[0].location()})")
                     
                     # Get the test function name and call it
                     test_function_name = feature_data['test_function']
                     if hasattr(self, test_function_name):
                         test_function = getattr(self, test_function_name)
                         try:
-                            test_result = test_function()
+                            test_result = self._run_check(test_function_name, test_function)
                             dynamic_tests.append(test_result)
                         except Exception as e:
                             logger.warning(f"⚠️ Test function {test_function_name} failed: {str(e)}")
@@ -2199,7 +2129,7 @@ class AutomatedTestPipeline:
             
             # Special case: Equipment validation (always run as it's core functionality)
             logger.info("🏋️ Running equipment validation")
-            dynamic_tests.append(self.test_exhaustive_equipment_combinations())
+            dynamic_tests.append(self._run_check('test_exhaustive_equipment_combinations', self.test_exhaustive_equipment_combinations))
             
             logger.info(f"🎯 Dynamic detection found {len(dynamic_tests)} feature tests to run")
             return dynamic_tests
@@ -2217,93 +2147,91 @@ class AutomatedTestPipeline:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
             html_path = self.project_root / 'src' / 'index.html'
             
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
+            html_content = self.snapshot.read_text(html_path)
             
             dynamic_tests = []
             
             # Fallback detection patterns (legacy method)
             if 'workout-overview' in html_content and 'workout-player' in html_content:
                 logger.info("📱 Detected multi-step workout flow")
-                dynamic_tests.append(self.test_overview_and_player_ui())
+                dynamic_tests.append(self._run_check('test_overview_and_player_ui', self.test_overview_and_player_ui))
             
             if 'timer' in js_content.lower() and ('setInterval' in js_content or 'setTimeout' in js_content):
                 logger.info("⏱️ Detected timer functionality")
-                dynamic_tests.append(self.test_timer_and_pause_resume_presence())
+                dynamic_tests.append(self._run_check('test_timer_and_pause_resume_presence', self.test_timer_and_pause_resume_presence))
             
             if 'AudioContext' in js_content or 'navigator.vibrate' in js_content:
                 logger.info("🔊 Detected audio/vibration features")
-                dynamic_tests.append(self.test_cues_and_preferences_presence())
+                dynamic_tests.append(self._run_check('test_cues_and_preferences_presence', self.test_cues_and_preferences_presence))
             
             if 'rest-overlay' in html_content and 'rest-overlay' in js_content:
                 logger.info("😴 Detected rest overlay")
-                dynamic_tests.append(self.test_rest_overlay_presence())
+                dynamic_tests.append(self._run_check('test_rest_overlay_presence', self.test_rest_overlay_presence))
             
             if 'keydown' in js_content or 'addEventListener' in js_content:
                 logger.info("⌨️ Detected navigation features")
-                dynamic_tests.append(self.test_keyboard_and_swipe_presence())
+                dynamic_tests.append(self._run_check('test_keyboard_and_swipe_presence', self.test_keyboard_and_swipe_presence))
             
             if 'section-badge' in html_content and 'section-badge' in js_content:
                 logger.info("🏷️ Detected section badges")
-                dynamic_tests.append(self.test_section_badge_presence())
+                dynamic_tests.append(self._run_check('test_section_badge_presence', self.test_section_badge_presence))
             
             if 'speechSynthesis' in js_content or 'speak(' in js_content:
                 logger.info("🗣️ Detected speech functionality")
-                dynamic_tests.append(self.test_spoken_countdown_presence())
+                dynamic_tests.append(self._run_check('test_spoken_countdown_presence', self.test_spoken_countdown_presence))
             
             if 'swapExercise' in js_content or 'findSimilarExercise' in js_content:
                 logger.info("🔄 Detected exercise swapping")
-                dynamic_tests.append(self.test_exercise_swapping_functionality())
+                dynamic_tests.append(self._run_check('test_exercise_swapping_functionality', self.test_exercise_swapping_functionality))
             
             # Equipment validation (always run)
             logger.info("🏋️ Running equipment validation")
-            dynamic_tests.append(self.test_exhaustive_equipment_combinations())
+            dynamic_tests.append(self._run_check('test_exhaustive_equipment_combinations', self.test_exhaustive_equipment_combinations))
             
             if 'generate-btn' in html_content and 'addEventListener' in js_content:
                 logger.info("📝 Detected form interactions")
-                dynamic_tests.append(self.test_form_interactions())
+                dynamic_tests.append(self._run_check('test_form_interactions', self.test_form_interactions))
             
             if 'md:' in html_content or 'lg:' in html_content:
                 logger.info("📱 Detected responsive design")
-                dynamic_tests.append(self.test_responsive_design())
+                dynamic_tests.append(self._run_check('test_responsive_design', self.test_responsive_design))
             
             if 'aria-' in html_content or 'role=' in html_content:
                 logger.info("♿ Detected accessibility features")
-                dynamic_tests.append(self.test_accessibility_features())
+                dynamic_tests.append(self._run_check('test_accessibility_features', self.test_accessibility_features))
             
             if 'showError' in js_content or 'try {' in js_content:
                 logger.info("⚠️ Detected error handling")
-                dynamic_tests.append(self.test_error_handling())
+                dynamic_tests.append(self._run_check('test_error_handling', self.test_error_handling))
             
             if 'localStorage' in js_content or 'performance' in js_content:
                 logger.info("⚡ Detected performance features")
-                dynamic_tests.append(self.test_ui_performance())
+                dynamic_tests.append(self._run_check('test_ui_performance', self.test_ui_performance))
             
             if 'workTime' in js_content or 'restTime' in js_content:
                 logger.info("⏰ Detected timing functionality")
-                dynamic_tests.append(self.test_timing_functionality())
+                dynamic_tests.append(self._run_check('test_timing_functionality', self.test_timing_functionality))
             
             if 'training-pattern' in html_content and 'generatePatternBasedWorkout' in js_content:
                 logger.info("🎯 Detected training pattern functionality")
-                dynamic_tests.append(self.test_training_pattern_functionality())
+                dynamic_tests.append(self._run_check('test_training_pattern_functionality', self.test_training_pattern_functionality))
             
             if 'generateCircuitWorkout' in js_content or 'circuit_round' in js_content:
                 logger.info("🔄 Detected circuit training functionality")
-                dynamic_tests.append(self.test_circuit_training_functionality())
+                dynamic_tests.append(self._run_check('test_circuit_training_functionality', self.test_circuit_training_functionality))
             
             if 'generateTabataWorkout' in js_content or 'tabata_set' in js_content:
                 logger.info("⏱️ Detected Tabata interval functionality")
-                dynamic_tests.append(self.test_tabata_functionality())
+                dynamic_tests.append(self._run_check('test_tabata_functionality', self.test_tabata_functionality))
             
             if 'generatePyramidWorkout' in js_content or 'pyramid_set' in js_content:
                 logger.info("🏗️ Detected pyramid training functionality")
-                dynamic_tests.append(self.test_pyramid_training_functionality())
+                dynamic_tests.append(self._run_check('test_pyramid_training_functionality', self.test_pyramid_training_functionality))
             
             if 'workoutDurationMinutes' in js_content and 'updatePatternSettingsForDuration' in js_content:
                 logger.info("🧮 Detected smart calculation functionality")
-                dynamic_tests.append(self.test_smart_calculation_functionality())
+                dynamic_tests.append(self._run_check('test_smart_calculation_functionality', self.test_smart_calculation_functionality))
             
             logger.info(f"🔄 Fallback detection found {len(dynamic_tests)} feature tests to run")
             return dynamic_tests
@@ -2316,8 +2244,7 @@ class AutomatedTestPipeline:
         """Test the new exercise swapping functionality"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             tests = {
                 'has_swap_function': 'function swapExercise' in js_content,
@@ -2344,12 +2271,10 @@ class AutomatedTestPipeline:
         """Test smart calculation of training pattern settings based on workout duration"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             tests = {
                 # Core smart calculation functions
@@ -2433,17 +2358,21 @@ class AutomatedTestPipeline:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
             
             js_content = ""
-            if smart_substitution_path.exists():
-                with open(smart_substitution_path, 'r', encoding='utf-8') as f:
-                    js_content += f.read()
+            if self.snapshot.exists(smart_substitution_path):
+                js_content += self.snapshot.read_text(smart_substitution_path)
             
-            if js_path.exists():
-                with open(js_path, 'r', encoding='utf-8') as f:
-                    js_content += f.read()
+            if self.snapshot.exists(js_path):
+                js_content += self.snapshot.read_text(js_path)
             
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
+            
+            index = self._exercise_index()
+            records = index.records if index is not None else ()
+            dangling = [
+                issue.describe() for issue in (index.integrity_issues() if index is not None else ())
+                if issue.kind in ('unknown_alternative', 'self_alternative')
+            ]
             
             tests = {
                 # Core Smart Substitution Functions
@@ -2453,11 +2382,12 @@ class AutomatedTestPipeline:
                 'has_get_difficulty_function': 'getDifficultyLevel' in js_content,
                 
                 # Exercise Database Enhancement
-                'has_alternatives_property': 'alternatives:' in js_content,
-                'has_difficulty_property': 'difficulty:' in js_content,
-                'has_equipment_needed_property': 'equipment_needed:' in js_content,
-                'has_muscle_groups_property': 'muscle_groups:' in js_content,
-                'has_injury_safe_property': 'injury_safe:' in js_content,
+                'has_alternatives_property': any(record.alternatives for record in records),
+                'has_difficulty_property': any(record.difficulty is not None for record in records),
+                'has_equipment_needed_property': any(record.equipment_needed for record in records),
+                'has_muscle_groups_property': any(record.muscle_groups for record in records),
+                'has_injury_safe_property': any(record.injury_safe for record in records),
+                'alternatives_resolve': index is not None and not dangling,
                 
                 # UI Integration
                 'has_smart_alternative_buttons': '🧠 Smart Alternative' in html_content,
@@ -2483,6 +2413,7 @@ class AutomatedTestPipeline:
                 'status': 'PASSED' if passed == total else 'WARNING',
                 'score': f'{passed}/{total}',
                 'details': tests,
+                'dangling_alternatives': dangling,
                 'feature': 'Smart Exercise Substitution'
             }
             
@@ -2508,47 +2439,48 @@ class AutomatedTestPipeline:
             
             tests = {
                 # Directory structure
-                'has_js_directory': js_dir.exists(),
-                'has_core_directory': core_dir.exists(),
-                'has_features_directory': features_dir.exists(),
-                'has_utils_directory': utils_dir.exists(),
+                'has_js_directory': self.snapshot.exists(js_dir),
+                'has_core_directory': self.snapshot.exists(core_dir),
+                'has_features_directory': self.snapshot.exists(features_dir),
+                'has_utils_directory': self.snapshot.exists(utils_dir),
                 
                 # Core modules
-                'has_main_js': main_js.exists(),
-                'has_exercise_database': exercise_db.exists(),
-                'has_workout_generator': workout_gen.exists(),
+                'has_main_js': self.snapshot.exists(main_js),
+                'has_exercise_database': self.snapshot.exists(exercise_db),
+                'has_workout_generator': self.snapshot.exists(workout_gen),
                 
                 # Feature modules
-                'has_smart_substitution': smart_sub.exists(),
-                'has_user_accounts': user_acc.exists(),
+                'has_smart_substitution': self.snapshot.exists(smart_sub),
+                'has_user_accounts': self.snapshot.exists(user_acc),
                 
                 # Utility modules
-                'has_constants': constants.exists(),
+                'has_constants': self.snapshot.exists(constants),
             }
             
+            graph = self._module_graph()
+            tests['imports_all_resolve'] = not graph.missing
+            
             # Check module content if files exist
-            if main_js.exists():
-                with open(main_js, 'r', encoding='utf-8') as f:
-                    main_content = f.read()
+            if self.snapshot.exists(main_js):
+                main_content = self.snapshot.read_text(main_js)
                 tests.update({
-                    'main_has_imports': 'import' in main_content,
-                    'main_has_exports': 'export' in main_content,
+                    'main_has_imports': bool(graph.imports.get('js/main.js')),
+                    'main_has_exports': bool(graph.exports.get('js/main.js')),
                     'main_has_fitflow_app': 'FitFlowApp' in main_content,
                     'main_has_global_exports': 'window.' in main_content,
                 })
             
-            if exercise_db.exists():
-                with open(exercise_db, 'r', encoding='utf-8') as f:
-                    db_content = f.read()
+            if self.snapshot.exists(exercise_db):
+                db_content = self.snapshot.read_text(exercise_db)
+                catalog = self._exercise_catalog()
                 tests.update({
                     'db_has_export': 'export const exercises' in db_content,
-                    'db_has_exercise_data': 'Arm Circles' in db_content,
+                    'db_has_exercise_data': catalog is not None and 'Arm Circles' in catalog.names(),
                     'db_has_helpers': 'exerciseDatabase' in db_content,
                 })
             
-            if workout_gen.exists():
-                with open(workout_gen, 'r', encoding='utf-8') as f:
-                    gen_content = f.read()
+            if self.snapshot.exists(workout_gen):
+                gen_content = self.snapshot.read_text(workout_gen)
                 tests.update({
                     'gen_has_generate_function': 'generateWorkout' in gen_content,
                     'gen_has_form_handler': 'handleFormSubmission' in gen_content,
@@ -2557,12 +2489,11 @@ class AutomatedTestPipeline:
             
             # Check HTML integration
             html_path = self.project_root / 'src' / 'index.html'
-            if html_path.exists():
-                with open(html_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
+            if self.snapshot.exists(html_path):
+                html_content = self.snapshot.read_text(html_path)
                 tests.update({
                     'html_has_module_import': 'type="module"' in html_content,
-                    'html_has_main_js': 'js/main.js' in html_content,
+                    'html_has_main_js': 'js/main.js' in graph.imports.get('index.html', ()),
                     'html_has_fallback': 'nomodule' in html_content,
                     'html_has_workout_section': 'workout-section' in html_content,
                 })
@@ -2584,12 +2515,10 @@ class AutomatedTestPipeline:
         """Test comprehensive security and privacy features"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             tests = {
                 # Password Security
@@ -2645,12 +2574,10 @@ class AutomatedTestPipeline:
         """Test user account system functionality"""
         try:
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             html_path = self.project_root / 'src' / 'index.html'
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            html_content = self.snapshot.read_text(html_path)
             
             tests = {
                 # UserAccount Class
@@ -2702,41 +2629,28 @@ class AutomatedTestPipeline:
         logger.info("⚡ Running Performance Tests")
         
         try:
-            # Test file sizes
-            file_sizes = {}
-            for file_path in ['main.js', 'index.html', 'exercise_images_database.js']:
-                full_path = self.project_root / file_path
-                if full_path.exists():
-                    file_sizes[file_path] = full_path.stat().st_size
-            
-            # Performance thresholds
-            performance_status = 'PASSED'
-            warnings = []
+            # Raw/gzip/brotli size of every file index.html loads, against the configured budgets
+            report = self._bundle_budget()
+            performance_status = report.status
+            warnings = report.violations + report.regressions
             
-            if file_sizes.get('main.js', 0) > self.MAX_JS_SIZE:
-                warnings.append(f'main.js is larger than {self.MAX_JS_SIZE // 1000}KB')
-                performance_status = 'WARNING'
-            
-            if file_sizes.get('exercise_images_database.js', 0) > 50000:  # 50KB
-                warnings.append('exercise_images_database.js is larger than 50KB')
-                performance_status = 'WARNING'
-            
-            self.test_results['tests']['performance'] = {
+            self._record_test('performance', {
                 'status': performance_status,
                 'details': {
-                    'file_sizes': file_sizes,
+                    'file_sizes': {size.key: size.raw for size in report.files},
+                    'bundle_budget': report.to_dict(),
                     'warnings': warnings
                 }
-            }
+            })
             
             logger.info(f"✅ Performance tests completed: {performance_status}")
             
         except Exception as e:
             logger.error(f"❌ Performance tests failed: {str(e)}")
-            self.test_results['tests']['performance'] = {
+            self._record_test('performance', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
     
     def run_security_tests(self):
         """Run basic security checks"""
@@ -2747,8 +2661,7 @@ class AutomatedTestPipeline:
             
             # Check for hardcoded API keys
             js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(js_path, 'r', encoding='utf-8') as f:
-                js_content = f.read()
+            js_content = self.snapshot.read_text(js_path)
             
             # Security checks
             if 'API_KEY' in js_content or 'api_key' in js_content:
@@ -2772,22 +2685,22 @@ class AutomatedTestPipeline:
             if security_issues:
                 security_status = 'WARNING'
             
-            self.test_results['tests']['security'] = {
+            self._record_test('security', {
                 'status': security_status,
                 'details': {
                     'issues_found': security_issues,
                     'total_issues': len(security_issues)
                 }
-            }
+            })
             
             logger.info(f"✅ Security tests completed: {security_status}")
             
         except Exception as e:
             logger.error(f"❌ Security tests failed: {str(e)}")
-            self.test_results['tests']['security'] = {
+            self._record_test('security', {
                 'status': 'FAILED',
                 'details': str(e)
-            }
+            })
     
     def generate_final_report(self):
         """Generate comprehensive test report"""
@@ -2865,7 +2778,8 @@ class AutomatedTestPipeline:
             'success_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0,
             'total_duration': total_duration,
             'parallel_efficiency': parallel_efficiency,
-            'cache_used': False,
+            'cache_used': bool(self.check_cache and self.check_cache.hits),
+            'check_cache': self.check_cache.stats() if self.check_cache else None,
             'performance_metrics': performance_metrics,
             'bundle_analysis': bundle_analysis,
             'security_score': security_score,
@@ -2903,23 +2817,26 @@ class AutomatedTestPipeline:
         }
         
         try:
-            # Analyze bundle sizes
-            js_size = os.path.getsize(self.project_root / 'src' / 'js' / 'main.js')
-            html_size = os.path.getsize(self.project_root / 'src' / 'index.html')
-            dashboard_size = os.path.getsize(self.project_root / 'src' / 'dashboard.html')
-            
-            metrics['bundle_sizes'] = {
-                'javascript': {'size_kb': js_size / 1024, 'status': 'PASSED' if js_size < self.MAX_JS_SIZE else 'WARNING'},
-                'html': {'size_kb': html_size / 1024, 'status': 'PASSED' if html_size < self.MAX_HTML_SIZE else 'WARNING'},
-                'dashboard': {'size_kb': dashboard_size / 1024, 'status': 'PASSED'}
-            }
+            # Transfer size of each page and everything it loads
+            graph = self._module_graph()
+            report = self._bundle_budget()
+            for entry in graph.entries:
+                entry_report = report if entry == report.entry else analyze_bundle_budget(
+                    self.snapshot, Budget(entry=entry), graph=graph)
+                total = entry_report.total
+                metrics['bundle_sizes'][entry] = {
+                    'size_kb': total.raw / 1024,
+                    'gzip_kb': total.gzip / 1024,
+                    'brotli_kb': total.br / 1024 if total.br is not None else None,
+                    'status': entry_report.status
+                }
             
             # Calculate performance score
             size_score = 100
-            if js_size > self.MAX_JS_SIZE:
-                size_score -= 20
-            if html_size > self.MAX_HTML_SIZE:
+            if report.violations:
                 size_score -= 20
+            if report.regressions:
+                size_score -= 10
             
             metrics['performance_score'] = max(0, size_score)
             
@@ -2935,37 +2852,57 @@ class AutomatedTestPipeline:
             'function_count': 0,
             'class_count': 0,
             'import_count': 0,
+            'module_count': 0,
+            'entry_bytes': {},
+            'unreachable_modules': [],
+            'dead_exports': {},
             'optimization_opportunities': []
         }
         
         try:
             js_file = self.project_root / 'src' / 'js' / 'main.js'
-            if js_file.exists():
-                with open(js_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    
-                    bundle_analysis['total_lines'] = len(lines)
-                    bundle_analysis['function_count'] = content.count('function ')
-                    bundle_analysis['class_count'] = content.count('class ')
-                    bundle_analysis['import_count'] = content.count('import ')
-                    
-                    # Identify optimization opportunities
-                    if len(lines) > 3000:
-                        bundle_analysis['optimization_opportunities'].append(
-                            'Consider code splitting for large JavaScript bundle'
-                        )
-                    
-                    if content.count('console.log') > 0:
-                        bundle_analysis['optimization_opportunities'].append(
-                            'Remove console.log statements for production'
-                        )
+            if self.snapshot.exists(js_file):
+                content = self.snapshot.read_text(js_file)
+                lines = content.split('\n')
+                
+                bundle_analysis['total_lines'] = len(lines)
+                bundle_analysis['function_count'] = content.count('function ')
+                bundle_analysis['class_count'] = content.count('class ')
+                graph = self._module_graph()
+                bundle_analysis['import_count'] = len(graph.imports.get('js/main.js', ()))
+                bundle_analysis['module_count'] = len(graph.modules)
+                # Everything each page loads, transitively, before compression
+                bundle_analysis['entry_bytes'] = graph.entry_bytes()
+                bundle_analysis['unreachable_modules'] = graph.unreachable()
+                bundle_analysis['dead_exports'] = graph.dead_exports()
+                
+                # Identify optimization opportunities
+                if len(lines) > 3000:
+                    bundle_analysis['optimization_opportunities'].append(
+                        'Consider code splitting for large JavaScript bundle'
+                    )
+                
+                if content.count('console.log') > 0:
+                    bundle_analysis['optimization_opportunities'].append(
+                        'Remove console.log statements for production'
+                    )
+                
+                if bundle_analysis['unreachable_modules']:
+                    bundle_analysis['optimization_opportunities'].append(
+                        f"Remove modules no page loads: {', '.join(bundle_analysis['unreachable_modules'])}"
+                    )
+                
+                dead_count = sum(len(names) for names in bundle_analysis['dead_exports'].values())
+                if dead_count:
+                    bundle_analysis['optimization_opportunities'].append(
+                        f'Remove {dead_count} exports that no module imports'
+                    )
+                
+                if content.count('setTimeout') + content.count('setInterval') > 10:
+                    bundle_analysis['optimization_opportunities'].append(
+                        'Consider consolidating timer functions'
+                    )
                     
-                    if content.count('setTimeout') + content.count('setInterval') > 10:
-                        bundle_analysis['optimization_opportunities'].append(
-                            'Consider consolidating timer functions'
-                        )
-                        
         except Exception as e:
             logger.warning(f"Could not analyze bundle: {e}")
         
@@ -2978,30 +2915,29 @@ class AutomatedTestPipeline:
         try:
             # Check for security best practices
             js_file = self.project_root / 'src' / 'js' / 'main.js'
-            if js_file.exists():
-                with open(js_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Deduct points for potential security issues
-                    if 'eval(' in content:
-                        score -= 30  # eval is dangerous
-                    
-                    if 'innerHTML' in content and 'textContent' not in content:
-                        score -= 15  # Potential XSS risk
-                    
-                    if 'localStorage.setItem' in content and 'JSON.stringify' not in content:
-                        score -= 10  # Data validation
-                    
-                    # Add points for security features
-                    if 'PBKDF2' in content:
-                        score += 20  # Strong password hashing
-                    
-                    if 'verifyPassword' in content:
-                        score += 15  # Password verification
+            if self.snapshot.exists(js_file):
+                content = self.snapshot.read_text(js_file)
+                
+                # Deduct points for potential security issues
+                if 'eval(' in content:
+                    score -= 30  # eval is dangerous
+                
+                if 'innerHTML' in content and 'textContent' not in content:
+                    score -= 15  # Potential XSS risk
+                
+                if 'localStorage.setItem' in content and 'JSON.stringify' not in content:
+                    score -= 10  # Data validation
+                
+                # Add points for security features
+                if 'PBKDF2' in content:
+                    score += 20  # Strong password hashing
+                
+                if 'verifyPassword' in content:
+                    score += 15  # Password verification
+                
+                if 'privacy' in content.lower():
+                    score += 10  # Privacy considerations
                     
-                    if 'privacy' in content.lower():
-                        score += 10  # Privacy considerations
-                        
         except Exception as e:
             logger.warning(f"Could not calculate security score: {e}")
         
@@ -3013,30 +2949,29 @@ class AutomatedTestPipeline:
         
         try:
             html_file = self.project_root / 'src' / 'index.html'
-            if html_file.exists():
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Check for accessibility features
-                    if 'aria-label' in content:
-                        score += 20
-                    
-                    if 'role=' in content:
-                        score += 15
-                    
-                    if 'tabindex=' in content:
-                        score += 15
-                    
-                    if 'alt=' in content:
-                        score += 10
-                    
-                    # Deduct for missing features
-                    if 'aria-label' not in content:
-                        score -= 30
+            if self.snapshot.exists(html_file):
+                content = self.snapshot.read_text(html_file)
+                
+                # Check for accessibility features
+                if 'aria-label' in content:
+                    score += 20
+                
+                if 'role=' in content:
+                    score += 15
+                
+                if 'tabindex=' in content:
+                    score += 15
+                
+                if 'alt=' in content:
+                    score += 10
+                
+                # Deduct for missing features
+                if 'aria-label' not in content:
+                    score -= 30
+                
+                if 'role=' not in content:
+                    score -= 20
                     
-                    if 'role=' not in content:
-                        score -= 20
-                        
         except Exception as e:
             logger.warning(f"Could not calculate accessibility score: {e}")
         
@@ -3135,27 +3070,17 @@ class AutomatedTestPipeline:
             # Phase 1: Pre-flight checks
             self.run_preflight_checks()
             
-            # Phase 2: Check for changes and load cache
-            if not self.has_changes_since_last_run():
-                logger.info("🔄 No file changes detected, loading cached results...")
-                cached_data = self.load_test_cache()
-                if cached_data and 'test_results' in cached_data:
-                    self.test_results = cached_data['test_results']
-                    self.test_results['timestamp'] = datetime.now().isoformat()
-                    self.test_results['summary']['cache_used'] = True
-                    logger.info("✅ Using cached test results")
-                    return self.generate_enhanced_final_report()
-            
-            # Phase 3: Auto-update pipeline configuration
+            # Phase 2: Auto-update pipeline configuration
             self.auto_update_pipeline_config()
             
-            # Phase 4: Run tests in parallel
-            self.run_tests_parallel()
+            # Phase 3: Run tests in parallel (unchanged checks are served from the per-check cache)
+            only = self.select_changed_categories(self.changes) if self.changes else None
+            self.run_tests_parallel(only=only)
             
-            # Phase 5: Generate enhanced final report
+            # Phase 4: Generate enhanced final report
             self.generate_enhanced_final_report()
             
-            # Phase 6: Save results to cache
+            # Phase 5: Save per-check results to cache
             self.save_test_cache()
             
         except Exception as e:
@@ -3165,85 +3090,277 @@ class AutomatedTestPipeline:
         
         return self.test_results
     
-    def run_tests_parallel(self):
-        """Execute test categories in parallel for optimal performance"""
+    def _category_dependencies(self, only: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """Dependency lists, restricted to ``only`` when rerunning a subset (others keep prior results)"""
+        selected = [category for category in self.test_categories if only is None or category in only]
+        return {
+            category: [dep for dep in self.test_categories[category]['dependencies'] if dep in selected]
+            for category in selected
+        }
+
+    def _category_estimates(self) -> Dict[str, float]:
+        """Expected category durations: learned history first, configured estimate otherwise"""
+        return self.duration_history.estimates({
+            category: config['estimated_time'] for category, config in self.test_categories.items()
+        })
+
+    def _resolve_max_workers(self, max_workers: Optional[int] = None) -> int:
+        if max_workers is None:
+            max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = default_worker_count(len(self.test_categories))
+        return max(1, min(max_workers, len(self.test_categories) or 1))
+
+    def plan_tests(self, max_workers: Optional[int] = None):
+        """Predict the critical-path-first schedule without running anything"""
+        return plan_schedule(
+            self._category_dependencies(),
+            self._category_estimates(),
+            self._resolve_max_workers(max_workers),
+        )
+
+    def run_watch(self, interval: float = 0.5):
+        """Stay resident: rerun only the categories whose source inputs changed after each edit"""
+        logger.info("👀 Watch mode: initial full run")
+        self.run_pipeline_parallel()
+        self.save_results()
+
+        watcher = SourceWatcher(self.src_root, interval=interval)
+        logger.info(f"👀 Watching {self.src_root} for changes ({watcher.backend}); Ctrl+C to stop")
+        try:
+            while True:
+                if not watcher.wait_for_change():
+                    continue
+                fresh = SourceSnapshot.capture(self.src_root)
+                changed = self.snapshot.changed_paths(fresh)
+                if not changed:
+                    continue
+                logger.info(f"✏️ Changed: {', '.join(changed)}")
+
+                affected = self._affected_categories(fresh)
+                self.snapshot = fresh
+                if not affected:
+                    logger.info("✅ No checks depend on the changed files")
+                    continue
+                self.run_incremental(affected)
+        except KeyboardInterrupt:
+            logger.info("⏹️ Watch mode stopped")
+        finally:
+            watcher.close()
+
+    def _affected_categories(self, fresh: SourceSnapshot) -> List[str]:
+        """Categories whose recorded reads differ in ``fresh``, plus everything that depends on them"""
+        return self._with_dependents({
+            category for category in self.test_categories
+            if category not in self.category_reads or not fresh.matches(self.category_reads[category])
+        })
+
+    def select_changed_categories(self, changes: str) -> Optional[List[str]]:
+        """Categories that read a file in the git change set; ``None`` (run everything) if git fails.
+
+        Reads come from the categories' last recorded runs, so a category never run before
+        is selected by any change under src/.
+        """
+        try:
+            changed = changed_files(self.project_root, changes)
+        except ImpactError as e:
+            logger.warning(f"⚠️ Impact analysis unavailable, running every category: {e}")
+            return None
+
+        if self.check_cache is not None:
+            inputs = load_recorded_inputs(self.check_cache.store, self.test_categories)
+        else:
+            inputs = {category: None for category in self.test_categories}
+        impact = select_checks(changed, inputs)
+        selected = self._with_dependents(set(impact.selected))
+        self.test_results['impact'] = {
+            'mode': changes,
+            'changed': impact.changed,
+            'selected': selected,
+            'skipped_unaffected': [category for category in self.test_categories if category not in selected],
+            'reasons': impact.reasons,
+        }
+        logger.info(f"🎯 {len(impact.changed)} changed file(s) select {len(selected)}/{len(self.test_categories)} "
+                    f"categories: {', '.join(selected) or 'none'}")
+        return selected
+
+    def _with_dependents(self, affected: set) -> List[str]:
+        """``affected`` plus every category that depends on one of them, in declaration order"""
+        grew = True
+        while grew:
+            grew = False
+            for category, config in self.test_categories.items():
+                if category not in affected and any(dep in affected for dep in config['dependencies']):
+                    affected.add(category)
+                    grew = True
+        return [category for category in self.test_categories if category in affected]
+
+    def run_incremental(self, categories: List[str]):
+        """Rerun ``categories`` against the current snapshot, streaming each result as it lands"""
+        logger.info(f"🔁 Rerunning: {', '.join(categories)}")
+        self.pipeline_start_time = time.time()
+        if self.check_cache is not None:
+            self.check_cache.hits.clear()
+            self.check_cache.misses.clear()
+
+        def stream(category, result):
+            self.test_results['tests'].update(result.get('test_writes', {}))
+            self.test_results['tests'][category] = {
+                key: value for key, value in result.items() if key != 'test_writes'
+            }
+            logger.info(f"📡 {category}: {result['status']} in {result['duration']:.2f}s")
+            for error in result.get('errors', []):
+                logger.error(f"   {error}")
+            if self.persist_artifacts:
+                self.save_results()
+
+        try:
+            self.run_tests_parallel(only=categories, on_result=stream)
+            self.generate_enhanced_final_report()
+            self.save_test_cache()
+            self.save_results()
+        except Exception as e:
+            logger.error(f"❌ Incremental run failed: {e}")
+
+    def run_tests_parallel(self, max_workers: Optional[int] = None, only: Optional[List[str]] = None,
+                           on_result=None):
+        """Execute test categories on a worker pool, longest critical path first.
+
+        ``only`` restricts the run to a subset of categories; ``on_result(category, result)``
+        is called on the scheduling thread as each category finishes.
+        """
         logger.info("⚡ Starting parallel test execution...")
         parallel_start = time.time()
-        
-        # Initialize parallel execution tracking
-        self.test_results['parallel_execution'] = {
-            'total_duration': 0,
-            'categories_executed': 0,
-            'parallel_efficiency': 0,
-            'results': {}
-        }
-        
-        # Prepare test execution plan
-        execution_plan = []
-        for category, config in self.test_categories.items():
-            execution_plan.append({
-                'category': category,
-                'config': config,
-                'priority': len(config['dependencies'])  # Lower priority for independent tests
-            })
-        
-        # Sort by priority (independent tests first)
-        execution_plan.sort(key=lambda x: x['priority'])
-        
-        # Execute tests sequentially for now (parallel execution will be added in future)
+
+        dependencies = self._category_dependencies(only)
+        categories = {category: self.test_categories[category] for category in dependencies}
+        validate_dag(dependencies)
+        estimates = self._category_estimates()
+        priorities = critical_path_priorities(dependencies, estimates)
+        max_workers = self._resolve_max_workers(max_workers)
+        plan = plan_schedule(dependencies, estimates, max_workers)
+        logger.info(
+            f"⚡ Worker pool: {max_workers} worker(s) for {len(categories)} categories, "
+            f"predicted makespan {plan.makespan:.1f}s"
+        )
+
         completed_tests = {}
-        for plan_item in execution_plan:
-            category = plan_item['category']
-            config = plan_item['config']
-            
-            try:
-                result = self.run_test_category(category, config['tests'])
-                completed_tests[category] = result
-                logger.info(f"✅ {category} completed in {result['duration']:.2f}s")
-            except Exception as e:
-                logger.error(f"❌ {category} failed: {e}")
-                completed_tests[category] = {
-                    'category': category,
-                    'status': 'FAILED',
-                    'errors': [str(e)],
-                    'duration': 0
-                }
-        
+        pending = dict(categories)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='test-category') as executor:
+            while pending or running:
+                # Dispatch ready categories highest rank first while workers are free
+                progressed = False
+                ready = [
+                    category for category in pending
+                    if all(dep in completed_tests for dep in dependencies[category])
+                ]
+                for category in priority_order(ready, priorities):
+                    failed_deps = [
+                        dep for dep in dependencies[category]
+                        if completed_tests[dep]['status'] in ('FAILED', 'SKIPPED')
+                    ]
+                    if failed_deps:
+                        logger.warning(f"⏭️ {category} skipped: dependencies did not pass ({', '.join(failed_deps)})")
+                        del pending[category]
+                        progressed = True
+                        completed_tests[category] = {
+                            'category': category,
+                            'status': 'SKIPPED',
+                            'errors': [f"Dependencies did not pass: {', '.join(failed_deps)}"],
+                            'duration': 0,
+                            'test_writes': {}
+                        }
+                    elif len(running) < max_workers:
+                        config = pending.pop(category)
+                        progressed = True
+                        running[executor.submit(self.run_test_category, category, config['tests'])] = category
+
+                if not running:
+                    if progressed:
+                        continue
+                    raise RuntimeError(f"Scheduler stalled with pending categories: {sorted(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    category = running.pop(future)
+                    try:
+                        result = future.result()
+                        logger.info(f"✅ {category} completed in {result['duration']:.2f}s")
+                    except Exception as e:
+                        logger.error(f"❌ {category} failed: {e}")
+                        result = {
+                            'category': category,
+                            'status': 'FAILED',
+                            'errors': [str(e)],
+                            'duration': 0,
+                            'test_writes': {}
+                        }
+                    completed_tests[category] = result
+                    if on_result is not None:
+                        on_result(category, result)
+
         # Store parallel execution results
         parallel_duration = time.time() - parallel_start
+
+        # Merge each category's isolated writes in declaration order so the report is
+        # deterministic regardless of completion order; category summaries win last.
+        ordered = {category: completed_tests[category] for category in categories}
+        for result in ordered.values():
+            self.test_results['tests'].update(result.pop('test_writes', {}))
+        for category, result in ordered.items():
+            self.test_results['tests'][category] = result
+
         self.test_results['parallel_execution'] = {
             'total_duration': parallel_duration,
-            'categories_executed': len(completed_tests),
-            'parallel_efficiency': self.calculate_parallel_efficiency(completed_tests),
-            'results': completed_tests
+            'sequential_duration': sum(result.get('duration', 0) for result in ordered.values()),
+            'max_workers': max_workers,
+            'predicted_makespan': plan.makespan,
+            'critical_path_priorities': priorities,
+            'categories_executed': len(ordered),
+            'parallel_efficiency': self.calculate_parallel_efficiency(ordered, parallel_duration),
+            'results': ordered
         }
-        
-        # Update main test results
-        for category, result in completed_tests.items():
-            self.test_results['tests'][category] = result
-        
+
+        for category, result in ordered.items():
+            if result['status'] != 'SKIPPED':
+                self.duration_history.record(category, result.get('duration', 0))
+        if self.enable_cache:
+            try:
+                self.duration_history.save()
+            except OSError as e:
+                logger.warning(f"Failed to save duration history: {e}")
+
         logger.info(f"⚡ Parallel execution completed in {parallel_duration:.2f}s")
-    
-    def calculate_parallel_efficiency(self, completed_tests: Dict[str, Any]) -> float:
-        """Calculate how much time was saved by parallel execution"""
+
+    def calculate_parallel_efficiency(self, completed_tests: Dict[str, Any], parallel_time: float) -> float:
+        """Calculate how much wall time was saved compared with running categories back to back"""
         if not completed_tests:
             return 0.0
-        
-        # Calculate theoretical sequential time
+
+        # Theoretical sequential time
         sequential_time = sum(test.get('duration', 0) for test in completed_tests.values())
-        
-        # Get actual parallel time
-        parallel_time = self.test_results['parallel_execution']['total_duration']
-        
+
         if sequential_time == 0:
             return 0.0
-        
+
         # Calculate efficiency (time saved percentage)
         time_saved = sequential_time - parallel_time
         efficiency = (time_saved / sequential_time) * 100
-        
+
         return max(0.0, min(100.0, efficiency))
-    
+
+    def _record_test(self, key: str, result: Dict[str, Any]):
+        """Store a test result, buffering it per thread while categories run concurrently"""
+        for capture in getattr(self._thread_state, 'check_writes', None) or ():
+            capture[key] = result
+        buffer = getattr(self._thread_state, 'test_writes', None)
+        if buffer is None:
+            self.test_results['tests'][key] = result
+        else:
+            buffer[key] = result
+
     def run_test_category(self, category_name: str, test_methods: List[str]) -> Dict[str, Any]:
         """Run a specific test category and return results"""
         start_time = time.time()
@@ -3254,98 +3371,137 @@ class AutomatedTestPipeline:
             'results': {},
             'errors': []
         }
-        
+        self._thread_state.test_writes = {}
+        snapshot = self.snapshot
+
         try:
             logger.info(f"🚀 Running {category_name}...")
-            
-            for test_method in test_methods:
-                if hasattr(self, test_method):
-                    method = getattr(self, test_method)
-                    try:
-                        result = method()
-                        category_results['results'][test_method] = result
-                    except Exception as e:
-                        error_msg = f"Error in {test_method}: {str(e)}"
-                        category_results['errors'].append(error_msg)
-                        logger.error(error_msg)
-                else:
-                    error_msg = f"Test method {test_method} not found"
-                    category_results['errors'].append(error_msg)
-                    logger.error(error_msg)
-            
+
+            with snapshot.track_reads() as reads:
+                self._run_category_methods(test_methods, category_results)
+            # Watch mode reruns a category only when something it read has changed
+            self.category_reads[category_name] = dict(reads)
+
             # Determine overall category status
             if category_results['errors']:
                 category_results['status'] = 'FAILED'
             else:
                 category_results['status'] = 'PASSED'
-                
+
         except Exception as e:
             category_results['status'] = 'FAILED'
             category_results['errors'].append(f"Category execution failed: {str(e)}")
             logger.error(f"Failed to run {category_name}: {e}")
-        
+        finally:
+            category_results['test_writes'] = self._thread_state.test_writes
+            self._thread_state.test_writes = None
+
         category_results['end_time'] = time.time()
         category_results['duration'] = category_results['end_time'] - start_time
-        
+
         return category_results
-    
-    def has_changes_since_last_run(self) -> bool:
-        """Check if files have changed since last test run"""
-        if not self.enable_cache:
-            return True
 
-        if not self.cache_file.exists():
-            return True
-            
+    def _run_category_methods(self, test_methods: List[str], category_results: Dict[str, Any]):
+        """Call each category entry point, collecting results and errors"""
+        for test_method in test_methods:
+            if hasattr(self, test_method):
+                method = getattr(self, test_method)
+                try:
+                    if test_method in self.CACHEABLE_CATEGORY_METHODS:
+                        result = self._run_check(test_method, method)
+                    else:
+                        result = method()
+                    category_results['results'][test_method] = result
+                except Exception as e:
+                    error_msg = f"Error in {test_method}: {str(e)}"
+                    category_results['errors'].append(error_msg)
+                    logger.error(error_msg)
+            else:
+                error_msg = f"Test method {test_method} not found"
+                category_results['errors'].append(error_msg)
+                logger.error(error_msg)
+
+    def _run_check(self, name: str, check) -> Any:
+        """Run a snapshot-only check, reusing its cached result while its inputs are unchanged"""
+        if self.check_cache is None:
+            return check()
+
+        cached = self.check_cache.lookup(name, self.snapshot)
+        if cached is not None:
+            logger.info(f"♻️ {name}: inputs unchanged, using cached result")
+            for key, value in cached['writes'].items():
+                self._record_test(key, value)
+            return cached['result']
+
+        stack = getattr(self._thread_state, 'check_writes', None)
+        if stack is None:
+            stack = self._thread_state.check_writes = []
+        writes = {}
+        stack.append(writes)
+        outer_uncacheable = getattr(self._thread_state, 'uncacheable', False)
+        self._thread_state.uncacheable = False
+        try:
+            with self.snapshot.track_reads() as reads:
+                result = check()
+        finally:
+            stack.pop()
+            uncacheable = self._thread_state.uncacheable
+            self._thread_state.uncacheable = outer_uncacheable or uncacheable
+        if uncacheable:
+            logger.debug(f"{name}: result depends on the environment, not cached")
+        elif not self.check_cache.store_result(name, reads, {'result': result, 'writes': writes}):
+            logger.debug(f"{name}: result could not be cached")
+        return result
+
+    def _mark_uncacheable(self) -> None:
+        """Keep the running check's result out of the cache (e.g. a browser was unavailable)"""
+        self._thread_state.uncacheable = True
+
+    def load_pipeline_settings(self) -> Dict[str, Any]:
+        """Read the 'pipeline' section of enhanced_pipeline_config.json (cache TTL and size)"""
+        config_path = self.project_root / 'ci-cd' / 'enhanced_pipeline_config.json'
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('pipeline', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {config_path.name}, using cache defaults: {e}")
+            return {}
+
+    def open_check_cache(self) -> Optional[CheckCache]:
+        """Open the shared on-disk store; a broken store means a cold run, never a failed one"""
+        settings = self.pipeline_settings
+        if not settings.get('enable_caching', True):
+            return None
+
+        legacy_cache = self.project_root / 'ci-cd' / '.test_cache.pkl'
+        if legacy_cache.exists():
+            legacy_cache.unlink()
+
+        max_mb = settings.get('cache_max_mb')
         try:
-            with open(self.cache_file, 'rb') as f:
-                cached_hashes = pickle.load(f)
-                return cached_hashes != self.file_hashes
-        except:
-            return True
-    
+            store = CacheStore(
+                self.cache_file,
+                ttl_seconds=settings.get('cache_ttl', DEFAULT_TTL_SECONDS),
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+            )
+        except (sqlite3.Error, CacheSchemaError) as e:
+            logger.warning(f"Test cache unavailable, running cold: {e}")
+            return None
+        return CheckCache(store, fingerprint_files(pipeline_code_files(Path(__file__).parent)))
+
     def save_test_cache(self):
-        """Save test results and file hashes to cache"""
-        if not self.enable_cache:
+        """Persist per-check results and the source reads they depend on"""
+        if self.check_cache is None:
             logger.info("ℹ️ Cache writes disabled for this run")
             return
 
-        cache_data = {
-            'file_hashes': self.file_hashes,
-            'test_results': self.test_results,
-            'timestamp': datetime.now().isoformat()
-        }
-        
         try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
+            self.check_cache.save()
+            # What each category read, for --changes runs from a fresh process
+            for category, reads in self.category_reads.items():
+                record_inputs(self.check_cache.store, category, reads)
         except Exception as e:
             logger.warning(f"Failed to save test cache: {e}")
-    
-    def load_test_cache(self) -> Dict[str, Any]:
-        """Load cached test results if available"""
-        if not self.enable_cache:
-            return {}
-
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'rb') as f:
-                    return pickle.load(f)
-            except:
-                pass
-        return {}
-    
-    def update_file_hashes(self):
-        """Update file hashes for change detection"""
-        self.file_hashes = {}
-        key_files = ['main.js', 'index.html', 'dashboard.html', 'dashboard.js']
-        
-        for file in key_files:
-            file_path = self.project_root / 'src' / file
-            if file_path.exists():
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    self.file_hashes[file] = hashlib.md5(content).hexdigest()
 
     def register_release_contract_metadata(self):
         """Publish canonical release sequence and non-blocking legacy suites."""
@@ -3447,8 +3603,7 @@ class AutomatedTestPipeline:
         """Test that circuit UI has been cleaned up to remove redundant progress information"""
         try:
             player_path = self.project_root / 'src' / 'js' / 'features' / 'workout-player.js'
-            with open(player_path, 'r', encoding='utf-8') as f:
-                player_content = f.read()
+            player_content = self.snapshot.read_text(player_path)
             
             # Check that redundant circuit progress information has been removed
             tests = {
@@ -3478,10 +3633,8 @@ class AutomatedTestPipeline:
             player_path = self.project_root / 'src' / 'js' / 'features' / 'workout-player.js'
             generator_path = self.project_root / 'src' / 'js' / 'core' / 'workout-generator.js'
             
-            with open(player_path, 'r', encoding='utf-8') as f:
-                player_content = f.read()
-            with open(generator_path, 'r', encoding='utf-8') as f:
-                generator_content = f.read()
+            player_content = self.snapshot.read_text(player_path)
+            generator_content = self.snapshot.read_text(generator_path)
             
             # Check that workout flow navigation is properly implemented
             tests = {
@@ -3514,11 +3667,10 @@ class AutomatedTestPipeline:
             # Check visual enhancements file exists and has required functionality
             visual_enhancements_path = self.project_root / 'src' / 'js' / 'features' / 'visual-enhancements.js'
             
-            if not visual_enhancements_path.exists():
+            if not self.snapshot.exists(visual_enhancements_path):
                 return {'status': 'FAILED', 'details': 'Visual enhancements file not found'}
             
-            with open(visual_enhancements_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.snapshot.read_text(visual_enhancements_path)
             
             # Test visual enhancement state management
             tests = {
@@ -3600,8 +3752,7 @@ class AutomatedTestPipeline:
             
             visual_enhancements_path = self.project_root / 'src' / 'js' / 'features' / 'visual-enhancements.js'
             
-            with open(visual_enhancements_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.snapshot.read_text(visual_enhancements_path)
             
             # Test video ID mappings
             video_tests = {
@@ -3670,8 +3821,7 @@ class AutomatedTestPipeline:
             
             visual_enhancements_path = self.project_root / 'src' / 'js' / 'features' / 'visual-enhancements.js'
             
-            with open(visual_enhancements_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.snapshot.read_text(visual_enhancements_path)
             
             # Test guide toggle functionality
             guide_tests = {
@@ -3736,11 +3886,9 @@ class AutomatedTestPipeline:
             workout_player_path = self.project_root / 'src' / 'js' / 'features' / 'workout-player.js'
             visual_enhancements_path = self.project_root / 'src' / 'js' / 'features' / 'visual-enhancements.js'
             
-            with open(workout_player_path, 'r', encoding='utf-8') as f:
-                player_content = f.read()
+            player_content = self.snapshot.read_text(workout_player_path)
             
-            with open(visual_enhancements_path, 'r', encoding='utf-8') as f:
-                visual_content = f.read()
+            visual_content = self.snapshot.read_text(visual_enhancements_path)
             
             # Test workout player integration
             integration_tests = {
@@ -3771,8 +3919,7 @@ class AutomatedTestPipeline:
             
             # Test cache busting
             main_js_path = self.project_root / 'src' / 'js' / 'main.js'
-            with open(main_js_path, 'r', encoding='utf-8') as f:
-                main_content = f.read()
+            main_content = self.snapshot.read_text(main_js_path)
             
             cache_tests = {
                 'cache_busting_version': 'CACHE BUSTED' in main_content,
@@ -3811,15 +3958,42 @@ def main():
                        help='Enable test result caching')
     parser.add_argument('--hook-mode', action='store_true',
                        help='Run in pre-commit mode without writing tracked artifacts')
+    parser.add_argument('--max-workers', type=int, default=None,
+                       help='Number of test categories to run concurrently '
+                            '(default: one per category, capped by PIPELINE_WORKER_CAP or 8)')
+    parser.add_argument('--save-bundle-baseline', action='store_true',
+                       help='Accept the measured bundle sizes as the new committed baseline')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Print the planned category schedule and predicted makespan, then exit')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and rerun only the checks affected by each change under src/')
+    parser.add_argument('--watch-interval', type=float, default=0.5,
+                       help='Polling interval in seconds when watchdog is not installed (default: 0.5)')
+    parser.add_argument('--changes', metavar='worktree|staged|RANGE', default=None,
+                       help='Run only the categories that read a file changed in the working tree, '
+                            'the index, or a git revision range such as main...HEAD')
     
     args = parser.parse_args()
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error('--max-workers must be at least 1')
     
     pipeline = AutomatedTestPipeline(
         persist_artifacts=not args.hook_mode,
-        enable_cache=not args.hook_mode,
+        enable_cache=True,
     )
+    pipeline.max_workers = args.max_workers
+    pipeline.save_bundle_baseline = args.save_bundle_baseline
+    pipeline.changes = args.changes
+    if args.dry_run:
+        for line in pipeline.plan_tests().describe():
+            print(line)
+        sys.exit(0)
     if args.hook_mode:
-        logger.info("🪝 Hook mode enabled: artifact and cache writes are disabled")
+        logger.info("🪝 Hook mode enabled: artifact writes are disabled (untracked check cache stays on)")
+    
+    if args.watch:
+        pipeline.run_watch(interval=args.watch_interval)
+        sys.exit(0)
     
     try:
         if args.enhanced or args.parallel:
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""Append-only benchmark history and trend-based regression detection.
+
+Every suite used to overwrite its result file, so a metric that creeps up
+a few percent per commit never trips a single-run threshold. This store
+keeps every run's raw samples in SQLite under ``reports/benchmarks/``. A
+run is keyed by commit and runner fingerprint, and each sample by
+scenario and metric. Triggers reject updates and deletes, so history is
+only ever appended.
+
+``detect`` compares the latest run of each series with earlier runs from
+the same runner fingerprint (timings from different hardware are not
+comparable), using ``bench_stats.compare``:
+
+- ``regression``/``improvement``: against the pooled samples of the
+  previous ``window`` runs;
+- ``creep``: against the oldest ``window`` runs of the last ``depth``. It
+  catches a slow drift that each step-to-step comparison considers noise.
+
+Usage:
+    python ci-cd/bench_history.py record FILE... [--commit SHA]
+    python ci-cd/bench_history.py check [--window 5] [--output reports/benchmarks/bench_verdict.json]
+    python ci-cd/bench_history.py trend [--scenario desktop/cold] [--metric lcp] [--last 10]
+
+``record`` accepts ``page_load_benchmark --output`` reports and
+``performance_monitoring_results.json``. ``check`` exits 1 on a regression
+or creep, and its JSON verdict is what ``quality_gate.py --bench-verdict``
+reads. The enhanced pipeline's ``performance_benchmarks`` test records its
+runs directly. CI carries the database between runs with ``actions/cache``,
+keyed by runner OS and architecture.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from bench_stats import compare, median, percentile
+from cache_store import Transaction
+from page_load_benchmark import GATES, Gate, Samples
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+HISTORY_PATH = PROJECT_ROOT / "reports" / "benchmarks" / "bench_history.sqlite3"
+VERDICT_PATH = PROJECT_ROOT / "reports" / "benchmarks" / "bench_verdict.json"
+SCHEMA_VERSION = 1
+DEFAULT_WINDOW = 5
+DEFAULT_DEPTH = 20
+
+# Metrics beyond the page-load ones; anything unlisted is gated at 10%
+METRIC_GATES: Dict[str, Gate] = {**GATES, "generation_ms": Gate(min_ratio=0.10, min_delta=25)}
+DEFAULT_GATE = Gate(min_ratio=0.10, min_delta=0.0)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        commit_sha TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        runner TEXT NOT NULL,
+        source TEXT NOT NULL,
+        recorded REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS samples (
+        run_id INTEGER NOT NULL REFERENCES runs (id),
+        scenario TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        value REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS samples_series ON samples (scenario, metric, run_id)",
+    "CREATE INDEX IF NOT EXISTS runs_fingerprint ON runs (fingerprint, id)",
+    *(
+        f"CREATE TRIGGER IF NOT EXISTS {table}_no_{action} BEFORE {action.upper()} ON {table} "
+        f"BEGIN SELECT RAISE(ABORT, 'benchmark history is append-only'); END"
+        for table in ("runs", "samples")
+        for action in ("update", "delete")
+    ),
+)
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def runner_fingerprint(extra: Optional[Mapping[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+    """A short digest of the hardware and runtime that timings depend on, and what went into it."""
+    runner: Dict[str, Any] = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpus": os.cpu_count() or 1,
+        "python": platform.python_version(),
+    }
+    try:
+        import psutil  # type: ignore
+
+        runner["memory_gb"] = round(psutil.virtual_memory().total / 1024 ** 3)
+    except ImportError:
+        pass
+    runner.update(extra or {})
+    digest = hashlib.sha256(json.dumps(runner, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return digest, runner
+
+
+def current_commit(project_root: Path = PROJECT_ROOT) -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=project_root, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return result.stdout.strip() if result.returncode == 0 else "unknown"
+
+
+@dataclass(frozen=True)
+class Run:
+    """One recorded run's samples for a single scenario and metric."""
+
+    run_id: int
+    commit: str
+    recorded: float
+    values: Tuple[float, ...]
+
+
+class BenchHistory:
+    """SQLite-backed, append-only store of benchmark samples."""
+
+    def __init__(self, path: Path = HISTORY_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA busy_timeout = 30000")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._lock, Transaction(self._conn):
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                # Never drop history: a newer tool's layout is left for that tool to read.
+                raise RuntimeError(f"{self.path} has schema version {version}, expected {SCHEMA_VERSION}")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def record(
+        self,
+        samples: Samples,
+        commit: Optional[str] = None,
+        fingerprint: Optional[Tuple[str, Mapping[str, Any]]] = None,
+        source: str = "",
+        recorded: Optional[float] = None,
+    ) -> int:
+        """Append one run; returns its id."""
+        digest, runner = fingerprint or runner_fingerprint()
+        rows = [
+            (scenario, metric, float(value))
+            for scenario, metrics in samples.items()
+            for metric, values in metrics.items()
+            for value in values
+        ]
+        with self._lock, Transaction(self._conn):
+            run_id = self._conn.execute(
+                "INSERT INTO runs (commit_sha, fingerprint, runner, source, recorded) VALUES (?, ?, ?, ?, ?)",
+                (commit or current_commit(), digest, json.dumps(runner, sort_keys=True), source,
+                 time.time() if recorded is None else recorded),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO samples (run_id, scenario, metric, value) VALUES (?, ?, ?, ?)",
+                [(run_id, *row) for row in rows],
+            )
+        return run_id
+
+    def series(self, fingerprint: Optional[str] = None) -> List[Tuple[str, str]]:
+        """``(scenario, metric)`` pairs with samples (from runs on ``fingerprint``, if given)."""
+        query = "SELECT DISTINCT s.scenario, s.metric FROM samples s JOIN runs r ON r.id = s.run_id"
+        params: List[Any] = []
+        if fingerprint is not None:
+            query += " WHERE r.fingerprint = ?"
+            params.append(fingerprint)
+        with self._lock:
+            return [tuple(row) for row in self._conn.execute(query + " ORDER BY 1, 2", params)]
+
+    def runs(self, scenario: str, metric: str, fingerprint: Optional[str] = None, last: Optional[int] = None) -> List[Run]:
+        """Runs of one series, oldest first; ``last`` keeps only the most recent ones."""
+        query = (
+            "SELECT r.id, r.commit_sha, r.recorded, s.value FROM samples s JOIN runs r ON r.id = s.run_id "
+            "WHERE s.scenario = ? AND s.metric = ?"
+        )
+        params: List[Any] = [scenario, metric]
+        if fingerprint is not None:
+            query += " AND r.fingerprint = ?"
+            params.append(fingerprint)
+        grouped: Dict[int, Tuple[str, float, List[float]]] = {}
+        with self._lock:
+            for run_id, commit, recorded, value in self._conn.execute(query + " ORDER BY r.id", params):
+                grouped.setdefault(run_id, (commit, recorded, []))[2].append(value)
+        runs = [Run(run_id, commit, recorded, tuple(values)) for run_id, (commit, recorded, values) in grouped.items()]
+        return runs[-last:] if last else runs
+
+    def baseline(self, fingerprint: str, window: int = DEFAULT_WINDOW) -> Samples:
+        """Pooled samples of the last ``window`` runs of every series on ``fingerprint``."""
+        samples: Samples = {}
+        for scenario, metric in self.series(fingerprint):
+            samples.setdefault(scenario, {})[metric] = _pooled(self.runs(scenario, metric, fingerprint, last=window))
+        return samples
+
+    def latest_fingerprint(self) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "BenchHistory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@dataclass
+class Finding:
+    scenario: str
+    metric: str
+    kind: str  # regression, creep or improvement
+    baseline_median: float
+    current_median: float
+    p_value: float
+    commit: str
+
+    def describe(self) -> str:
+        change = (self.current_median / self.baseline_median - 1) * 100 if self.baseline_median else 0.0
+        return (
+            f"{self.scenario} {self.metric}: {self.kind} {self.baseline_median:.1f} -> "
+            f"{self.current_median:.1f} ({change:+.1f}%, p={self.p_value:.4f}) at {self.commit[:10]}"
+        )
+
+
+@dataclass
+class Verdict:
+    fingerprint: Optional[str]
+    compared: int = 0
+    findings: List[Finding] = field(default_factory=list)
+
+    def _of(self, *kinds: str) -> List[str]:
+        return [finding.describe() for finding in self.findings if finding.kind in kinds]
+
+    @property
+    def status(self) -> str:
+        return "FAILED" if self._of("regression", "creep") else "PASSED"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "fingerprint": self.fingerprint,
+            "compared_series": self.compared,
+            "regressions": self._of("regression", "creep"),
+            "improvements": self._of("improvement"),
+            "findings": [asdict(finding) for finding in self.findings],
+        }
+
+
+def _pooled(runs: Iterable[Run]) -> List[float]:
+    return [value for run in runs for value in run.values]
+
+
+def detect(
+    history: BenchHistory,
+    fingerprint: Optional[str] = None,
+    window: int = DEFAULT_WINDOW,
+    depth: int = DEFAULT_DEPTH,
+    gates: Mapping[str, Gate] = METRIC_GATES,
+) -> Verdict:
+    """Judge the latest run of every series on ``fingerprint`` (default: the most recent runner)."""
+    fingerprint = fingerprint or history.latest_fingerprint()
+    verdict = Verdict(fingerprint)
+    if fingerprint is None:
+        return verdict
+    for scenario, metric in history.series(fingerprint):
+        runs = history.runs(scenario, metric, fingerprint, last=depth)
+        if len(runs) < 2:
+            continue
+        verdict.compared += 1
+        current, recent = runs[-1], runs[-1 - window:-1]
+        gate = gates.get(metric, DEFAULT_GATE)
+
+        def finding(kind: str, baseline: List[float], result: Any) -> Finding:
+            return Finding(scenario, metric, kind, median(baseline), median(current.values),
+                           result.p_value, current.commit)
+
+        baseline = _pooled(recent)
+        worse = compare(baseline, current.values, min_ratio=gate.min_ratio, min_delta=gate.min_delta)
+        if worse.regressed:
+            verdict.findings.append(finding("regression", baseline, worse))
+            continue
+        better = compare(current.values, baseline, min_ratio=gate.min_ratio, min_delta=gate.min_delta)
+        if better.regressed:
+            verdict.findings.append(finding("improvement", baseline, better))
+            continue
+        # Creep: only meaningful once the reference runs are older than the recent window
+        if len(runs) > 2 * window:
+            reference = _pooled(runs[:window])
+            drift = compare(reference, current.values, min_ratio=gate.min_ratio, min_delta=gate.min_delta)
+            if drift.regressed:
+                verdict.findings.append(finding("creep", reference, drift))
+    return verdict
+
+
+def samples_from_report(data: Mapping[str, Any]) -> Samples:
+    """Samples from a ``page_load_benchmark`` report or ``performance_monitoring_results.json``."""
+    samples: Samples = {}
+    if isinstance(data.get("samples"), dict):
+        samples.update(data["samples"])
+    tests = data.get("tests") or {}
+    page_load = tests.get("page_load_performance") or {}
+    if isinstance(page_load.get("samples"), dict):
+        samples.update(page_load["samples"])
+    generation = [t for t in (tests.get("workout_generation_performance") or {}).get("generation_times", []) if t]
+    if generation:
+        samples["generation/bodyweight-30"] = {"generation_ms": [t * 1000 for t in generation]}
+    return samples
+
+
+def _trend(history: BenchHistory, fingerprint: Optional[str], scenario: Optional[str], metric: Optional[str],
+           last: int) -> None:
+    for series_scenario, series_metric in history.series(fingerprint):
+        if (scenario and series_scenario != scenario) or (metric and series_metric != metric):
+            continue
+        print(f"\n{series_scenario} {series_metric}")
+        print(f"  {'commit':10} {'recorded':16} {'n':>3} {'median':>10} {'p95':>10} {'vs prev':>8}")
+        previous = None
+        for run in history.runs(series_scenario, series_metric, fingerprint, last=last):
+            mid = median(run.values)
+            change = f"{(mid / previous - 1) * 100:+7.1f}%" if previous else f"{'':>8}"
+            recorded = time.strftime("%Y-%m-%d %H:%M", time.localtime(run.recorded))
+            print(f"  {run.commit[:10]:10} {recorded:16} {len(run.values):3} {mid:10.2f} "
+                  f"{percentile(run.values, 95):10.2f} {change}")
+            previous = mid
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark history: record runs, detect regressions, show trends")
+    parser.add_argument("--db", type=Path, default=HISTORY_PATH)
+    parser.add_argument("--fingerprint", default=None, help="Runner fingerprint (default: the latest run's)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Append the samples in result files")
+    record.add_argument("files", nargs="+", type=Path)
+    record.add_argument("--commit", default=None, help="Commit the samples belong to (default: HEAD)")
+
+    check = commands.add_parser("check", help="Compare the latest run with history")
+    check.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Previous runs pooled as the baseline")
+    check.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="Runs considered for creep detection")
+    check.add_argument("--output", type=Path, default=VERDICT_PATH, help="Where to write the JSON verdict")
+
+    trend = commands.add_parser("trend", help="Print per-run medians")
+    trend.add_argument("--scenario", default=None)
+    trend.add_argument("--metric", default=None)
+    trend.add_argument("--last", type=int, default=10)
+    args = parser.parse_args()
+
+    with BenchHistory(args.db) as history:
+        if args.command == "record":
+            for path in args.files:
+                try:
+                    samples = samples_from_report(json.loads(path.read_text(encoding="utf-8")))
+                except (OSError, ValueError) as exc:
+                    print(f"Cannot read {path}: {exc}", file=sys.stderr)
+                    return 1
+                if not samples:
+                    print(f"No benchmark samples in {path}", file=sys.stderr)
+                    continue
+                run_id = history.record(samples, commit=args.commit, source=path.name)
+                print(f"Recorded run {run_id} from {path} ({len(samples)} scenarios)")
+            return 0
+
+        if args.command == "trend":
+            _trend(history, args.fingerprint or history.latest_fingerprint(), args.scenario, args.metric, args.last)
+            return 0
+
+        verdict = detect(history, args.fingerprint, args.window, args.depth)
+    report = verdict.to_dict()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    for line in report["regressions"]:
+        print(f"REGRESSION  {line}")
+    for line in report["improvements"]:
+        print(f"IMPROVEMENT {line}")
+    print(f"{report['status']} ({report['compared_series']} series compared)")
+    return 1 if report["status"] == "FAILED" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
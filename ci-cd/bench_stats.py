@@ -0,0 +1,174 @@
+"""Robust statistics for repeated benchmark samples.
+
+Timings on shared runners are noisy and right-skewed, so a summary is the
+median and p95 with a bootstrap confidence interval for the median, never a
+single sample or a mean. ``compare`` calls a change a regression only when
+both of these hold:
+
+- a one-sided Mann-Whitney U test finds the current samples tend to be
+  larger than the baseline (``p < alpha``);
+- the median moved by more than a practical threshold: ``min_ratio`` of the
+  baseline median and at least ``min_delta`` in the metric's own unit.
+
+So a statistically real but tiny shift passes, and so does a large shift
+hidden in noise. Everything is pure Python: the CI image has no numpy/scipy.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_ALPHA = 0.01
+DEFAULT_RESAMPLES = 2000
+MIN_SAMPLES = 3
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """``q``-th percentile (0-100) with linear interpolation between ranks."""
+    if not values:
+        raise ValueError("percentile of no values")
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def median(values: Sequence[float]) -> float:
+    return percentile(values, 50)
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    statistic: Callable[[Sequence[float]], float] = median,
+    confidence: float = DEFAULT_CONFIDENCE,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile-bootstrap interval for ``statistic``; seeded so reports are reproducible."""
+    rng = random.Random(seed)
+    n = len(values)
+    estimates = [statistic([values[rng.randrange(n)] for _ in range(n)]) for _ in range(resamples)]
+    tail = (1 - confidence) * 50
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+
+@dataclass(frozen=True)
+class Summary:
+    n: int
+    median: float
+    p95: float
+    mean: float
+    stdev: float
+    ci_low: float
+    ci_high: float
+
+    def to_dict(self, digits: int = 3) -> Dict[str, float]:
+        return {name: round(value, digits) if isinstance(value, float) else value
+                for name, value in self.__dict__.items()}
+
+
+def summarize(values: Sequence[float], confidence: float = DEFAULT_CONFIDENCE) -> Summary:
+    values = list(values)
+    mean = sum(values) / len(values)
+    stdev = math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1)) if len(values) > 1 else 0.0
+    ci_low, ci_high = bootstrap_ci(values, confidence=confidence)
+    return Summary(len(values), median(values), percentile(values, 95), mean, stdev, ci_low, ci_high)
+
+
+def _ranks(values: Sequence[float]) -> Tuple[list, float]:
+    """Average ranks (1-based) of ``values`` and the tie correction term sum(t^3 - t)."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        size = j - i + 1
+        ties += size ** 3 - size
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """One-sided p-value that ``current`` tends to exceed ``baseline``.
+
+    Normal approximation with tie and continuity correction; adequate from
+    about five samples per side, which is what the benchmarks collect.
+    """
+    n1, n2 = len(current), len(baseline)
+    ranks, ties = _ranks(list(current) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass(frozen=True)
+class Comparison:
+    baseline_median: float
+    current_median: float
+    delta: float
+    ratio: Optional[float]
+    p_value: float
+    # Bootstrap interval for the change in medians (current - baseline)
+    ci_low: float
+    ci_high: float
+    significant: bool
+    regressed: bool
+
+    def to_dict(self, digits: int = 4) -> Dict[str, object]:
+        return {name: round(value, digits) if isinstance(value, float) else value
+                for name, value in self.__dict__.items()}
+
+
+def compare(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    alpha: float = DEFAULT_ALPHA,
+    min_ratio: float = 0.10,
+    min_delta: float = 0.0,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+) -> Comparison:
+    """Whether ``current`` is a significant and material regression over ``baseline`` (higher is worse)."""
+    baseline, current = list(baseline), list(current)
+    base_median, current_median = median(baseline), median(current)
+    delta = current_median - base_median
+
+    rng = random.Random(seed)
+    differences = [
+        median([current[rng.randrange(len(current))] for _ in current])
+        - median([baseline[rng.randrange(len(baseline))] for _ in baseline])
+        for _ in range(DEFAULT_RESAMPLES)
+    ]
+    tail = (1 - confidence) * 50
+    ci_low, ci_high = percentile(differences, tail), percentile(differences, 100 - tail)
+
+    enough = len(baseline) >= MIN_SAMPLES and len(current) >= MIN_SAMPLES
+    p_value = mann_whitney_greater(current, baseline) if enough else 1.0
+    significant = p_value < alpha
+    material = delta > max(min_delta, min_ratio * abs(base_median))
+    return Comparison(
+        baseline_median=base_median,
+        current_median=current_median,
+        delta=delta,
+        ratio=current_median / base_median if base_median else None,
+        p_value=p_value,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        significant=significant,
+        regressed=significant and material,
+    )
@@ -0,0 +1,173 @@
+"""Cross-engine expansion of browser tests for the enhanced pipeline.
+
+``enhanced_pipeline_config.json`` lists the engines per runner::
+
+    "browsers": {
+        "selenium":   {"enabled": true, "browsers": ["chrome", "firefox"]},
+        "playwright": {"enabled": true, "browsers": ["chromium", "firefox", "webkit"]}
+    }
+
+A test definition that sets ``'browsers': 'playwright'`` (or ``'selenium'``)
+becomes one cell per configured engine. The cells run on their own bounded
+pool, concurrently with the non-browser tests, so adding an engine costs
+roughly one more concurrent browser rather than another pass of wall time.
+The pool size comes from ``psutil``: no more browsers than logical CPUs, and
+no more than fit in the currently available memory at ``BROWSER_MEMORY_MB``
+each. ``split_installed`` checks for each configured engine's browser
+binary before the run. Engines that are not installed produce no cells and
+are reported as missing instead of as SKIPPED results.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+BROWSER_MEMORY_MB = 512
+DEFAULT_ENGINES: Mapping[str, Tuple[str, ...]] = {
+    "selenium": ("chrome",),
+    "playwright": ("chromium",),
+}
+
+
+@dataclass(frozen=True)
+class BrowserCell:
+    """One browser test bound to one engine, e.g. ``selenium_e2e[firefox]``."""
+
+    test: str
+    runner: str
+    engine: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.test}[{self.engine}]"
+
+
+def load_engines(config_path: Path) -> Dict[str, Tuple[str, ...]]:
+    """Enabled engines per runner from the ``browsers`` section; defaults if it is missing."""
+    try:
+        section = json.loads(Path(config_path).read_text(encoding="utf-8")).get("browsers", {})
+    except (OSError, ValueError):
+        return dict(DEFAULT_ENGINES)
+
+    engines: Dict[str, Tuple[str, ...]] = {}
+    for runner, default in DEFAULT_ENGINES.items():
+        settings = section.get(runner)
+        if settings is None:
+            engines[runner] = default
+        elif settings.get("enabled", True):
+            engines[runner] = tuple(dict.fromkeys(settings.get("browsers") or default))
+        else:
+            engines[runner] = ()
+    return engines
+
+
+EngineProbe = Callable[[str, str], bool]  # (runner, engine) -> installed
+
+
+@functools.lru_cache(maxsize=1)
+def _playwright_browsers() -> FrozenSet[str]:
+    """Playwright engines whose downloaded browser binary exists (nothing is launched)."""
+    try:
+        from playwright.sync_api import sync_playwright  # type: ignore
+    except ImportError:
+        return frozenset()
+    installed = set()
+    try:
+        with sync_playwright() as playwright:
+            for name in ("chromium", "firefox", "webkit"):
+                if Path(getattr(playwright, name).executable_path).exists():
+                    installed.add(name)
+    except Exception:
+        return frozenset()
+    return frozenset(installed)
+
+
+def engine_installed(runner: str, engine: str) -> bool:
+    """Whether ``runner`` can find a browser binary for ``engine`` on this host."""
+    if runner == "playwright":
+        return engine in _playwright_browsers()
+    if runner == "selenium":
+        try:
+            import selenium  # type: ignore  # noqa: F401
+        except ImportError:
+            return False
+        if engine == "chrome":
+            from driver_resolver import DriverResolutionError, detect_browser
+
+            try:
+                detect_browser()
+            except DriverResolutionError:
+                return False
+            return True
+        return shutil.which(engine) is not None
+    return False
+
+
+def split_installed(
+    engines: Mapping[str, Sequence[str]], probe: EngineProbe = engine_installed
+) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+    """Configured engines per runner split into ``(installed, missing)``."""
+    installed: Dict[str, Tuple[str, ...]] = {}
+    missing: Dict[str, Tuple[str, ...]] = {}
+    for runner, names in engines.items():
+        installed[runner] = tuple(name for name in names if probe(runner, name))
+        absent = tuple(name for name in names if name not in installed[runner])
+        if absent:
+            missing[runner] = absent
+    return installed, missing
+
+
+def expand(
+    tests: Iterable[str],
+    definitions: Mapping[str, Mapping[str, Any]],
+    engines: Mapping[str, Sequence[str]],
+) -> Tuple[List[str], List[BrowserCell]]:
+    """Split selected tests into plain tests and per-engine browser cells.
+
+    A browser test whose runner has no enabled engines produces no cells.
+    """
+    plain: List[str] = []
+    cells: List[BrowserCell] = []
+    for test in tests:
+        runner = definitions[test].get("browsers")
+        if not runner:
+            plain.append(test)
+            continue
+        cells.extend(BrowserCell(test, runner, engine) for engine in engines.get(runner, ()))
+    return plain, cells
+
+
+def matrix_workers(
+    cells: int,
+    cpu_count: Optional[int] = None,
+    available_bytes: Optional[int] = None,
+    per_browser_mb: int = BROWSER_MEMORY_MB,
+) -> int:
+    """Concurrent browsers for ``cells`` runs, bounded by logical CPUs and available memory."""
+    if cells <= 0:
+        return 0
+    if cpu_count is None or available_bytes is None:
+        import psutil
+
+        cpu_count = cpu_count if cpu_count is not None else psutil.cpu_count(logical=True)
+        available_bytes = available_bytes if available_bytes is not None else psutil.virtual_memory().available
+    by_memory = int(available_bytes // (per_browser_mb * 1024 * 1024))
+    return max(1, min(cells, cpu_count or 1, by_memory))
+
+
+def engine_summary(results: Iterable[Tuple[str, str, float]]) -> Dict[str, Dict[str, Any]]:
+    """Per-engine counts and timing from ``(engine, status, duration)`` triples."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for engine, status, duration in results:
+        entry = summary.setdefault(engine, {"tests": 0, "passed": 0, "total_seconds": 0.0, "slowest_seconds": 0.0})
+        entry["tests"] += 1
+        entry["passed"] += status == "passed"
+        entry["total_seconds"] = round(entry["total_seconds"] + duration, 3)
+        entry["slowest_seconds"] = round(max(entry["slowest_seconds"], duration), 3)
+    return summary
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Transfer-size budgets for everything a page loads.
+
+``analyze`` walks the ``module_graph`` closure of an entry page (the
+``<script type="module">`` tree plus the stylesheets, icons and manifest it
+links) and measures every file raw, gzip and, when the optional ``brotli``
+package is installed, brotli. The encodings are the ones ``static_server``
+serves. Budgets come from ``performance.bundle_budget`` in
+``enhanced_pipeline_config.json``:
+
+- ``module_kb`` limits any single file, and ``modules`` overrides it per file;
+- ``total_kb`` limits the whole entry;
+- ``metric`` picks the size the limits apply to: ``gzip``, ``br`` or ``raw``.
+  ``br`` falls back to ``gzip`` when brotli is not installed.
+
+Each run is also diffed against ``bundle_baseline.json``. That file is
+committed, so CI reads the same baseline as local runs, and it only changes
+when someone accepts new sizes with ``--save-baseline`` and commits the
+result. Growth above ``max_growth_percent`` that is also at least
+``min_growth_bytes`` is reported as a regression, even under budget. Since
+the baseline does not advance on its own, slow growth across many commits
+adds up until it is reported.
+
+Usage:
+    python ci-cd/bundle_budget.py [--entry index.html] [--save-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from module_graph import ModuleGraph
+from source_snapshot import SourceFile, SourceSnapshot
+from static_server import SRC_ROOT, brotli_available, transfer_sizes
+
+
+CONFIG_PATH = Path(__file__).parent / "enhanced_pipeline_config.json"
+BASELINE_PATH = Path(__file__).parent / "bundle_baseline.json"
+KB = 1024
+_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class FileSize:
+    """Bytes on the wire for one file (or an entry's total); ``br`` is None without brotli."""
+
+    key: str
+    raw: int
+    gzip: int
+    br: Optional[int] = None
+
+    def size(self, metric: str) -> int:
+        value = getattr(self, metric)
+        return self.gzip if value is None else value
+
+    def to_dict(self) -> Dict[str, Optional[int]]:
+        return {"raw": self.raw, "gzip": self.gzip, "br": self.br}
+
+
+@dataclass(frozen=True)
+class Budget:
+    entry: str = "index.html"
+    metric: str = "gzip"
+    module_kb: Optional[float] = None
+    total_kb: Optional[float] = None
+    modules: Mapping[str, float] = field(default_factory=dict)
+    max_growth_percent: float = 5.0
+    min_growth_bytes: int = 512
+
+    @classmethod
+    def from_config(cls, path: Path = CONFIG_PATH) -> "Budget":
+        """The ``performance.bundle_budget`` section; no limits if it is missing."""
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                section = json.load(handle).get("performance", {}).get("bundle_budget", {})
+        except (OSError, ValueError):
+            section = {}
+        names = {item.name for item in fields(cls)}
+        return cls(**{name: value for name, value in section.items() if name in names})
+
+    @property
+    def effective_metric(self) -> str:
+        return "gzip" if self.metric == "br" and not brotli_available() else self.metric
+
+    def limit_for(self, key: str) -> Optional[int]:
+        kb = self.modules.get(key, self.module_kb)
+        return None if kb is None else int(kb * KB)
+
+
+@dataclass
+class BudgetReport:
+    entry: str
+    metric: str
+    files: List[FileSize]
+    total: FileSize
+    violations: List[str] = field(default_factory=list)
+    regressions: List[str] = field(default_factory=list)
+    # Growth in ``metric`` bytes against the baseline; files new since then are listed in ``added``
+    deltas: Dict[str, int] = field(default_factory=dict)
+    added: List[str] = field(default_factory=list)
+    baseline_found: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.violations:
+            return "FAILED"
+        return "WARNING" if self.regressions else "PASSED"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entry": self.entry,
+            "metric": self.metric,
+            "status": self.status,
+            "total": self.total.to_dict(),
+            "files": {size.key: size.to_dict() for size in self.files},
+            "violations": self.violations,
+            "regressions": self.regressions,
+            "deltas": self.deltas,
+            "added": self.added,
+            "baseline_found": self.baseline_found,
+        }
+
+
+_measured: "OrderedDict[str, FileSize]" = OrderedDict()
+_measured_lock = threading.Lock()
+
+
+def measure(source: SourceFile) -> FileSize:
+    """Transfer sizes of one snapshot file, cached by path and content hash."""
+    cache_key = f"{source.path}\0{source.sha256}"
+    with _measured_lock:
+        cached = _measured.get(cache_key)
+        if cached is not None:
+            _measured.move_to_end(cache_key)
+            return cached
+    sizes = transfer_sizes(source.path, source.data)
+    measured = FileSize(source.path, sizes["raw"], sizes["gzip"], sizes.get("br"))
+    with _measured_lock:
+        _measured[cache_key] = measured
+        while len(_measured) > _CACHE_SIZE:
+            _measured.popitem(last=False)
+    return measured
+
+
+def _total(entry: str, files: List[FileSize]) -> FileSize:
+    brotli = [size.br for size in files]
+    return FileSize(
+        entry,
+        sum(size.raw for size in files),
+        sum(size.gzip for size in files),
+        None if None in brotli else sum(brotli),
+    )
+
+
+def _grew(budget: Budget, before: int, after: int) -> bool:
+    growth = after - before
+    return growth >= budget.min_growth_bytes and growth * 100 > budget.max_growth_percent * before
+
+
+def analyze(
+    snapshot: SourceSnapshot,
+    budget: Optional[Budget] = None,
+    baseline: Optional[Mapping[str, Mapping[str, Mapping[str, Optional[int]]]]] = None,
+    graph: Optional[ModuleGraph] = None,
+) -> BudgetReport:
+    """Measure ``budget.entry`` and everything it loads; check limits and growth since ``baseline``."""
+    budget = budget or Budget()
+    graph = graph or ModuleGraph.build(snapshot)
+    metric = budget.effective_metric
+    files = []
+    for key in sorted(graph.dependencies_of([budget.entry])):
+        source = snapshot.get(key)
+        if source is not None:
+            files.append(measure(source))
+    report = BudgetReport(budget.entry, metric, files, _total(budget.entry, files))
+
+    for size in files:
+        limit = budget.limit_for(size.key)
+        if limit is not None and size.size(metric) > limit:
+            report.violations.append(
+                f"{size.key}: {size.size(metric) / KB:.1f} KB {metric} exceeds {limit / KB:.0f} KB"
+            )
+    if budget.total_kb is not None and report.total.size(metric) > budget.total_kb * KB:
+        report.violations.append(
+            f"{budget.entry} total: {report.total.size(metric) / KB:.1f} KB {metric} "
+            f"exceeds {budget.total_kb:.0f} KB"
+        )
+
+    previous = (baseline or {}).get(budget.entry)
+    if previous:
+        report.baseline_found = True
+        for size in files + [report.total]:
+            key = "*total*" if size is report.total else size.key
+            before = (previous.get(key) or {}).get(metric)
+            if before is None:
+                if size is not report.total:
+                    report.added.append(size.key)
+                continue
+            report.deltas[key] = size.size(metric) - before
+            if _grew(budget, before, size.size(metric)):
+                report.regressions.append(
+                    f"{key}: {metric} grew {before / KB:.1f} -> {size.size(metric) / KB:.1f} KB since last run"
+                )
+    return report
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Dict[str, Dict[str, Optional[int]]]]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_baseline(report: BudgetReport, path: Path = BASELINE_PATH) -> None:
+    """Store ``report``'s sizes as the next run's baseline; written atomically."""
+    entries = load_baseline(path)
+    sizes = {size.key: size.to_dict() for size in report.files}
+    sizes["*total*"] = report.total.to_dict()
+    entries[report.entry] = sizes
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"entries": entries}, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check transfer-size budgets for a page and what it loads")
+    parser.add_argument("--entry", default=None, help="Entry page under src/ (default: from config)")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Accept this run's sizes as the new baseline (commit the file)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    budget = Budget.from_config(args.config)
+    if args.entry:
+        budget = replace(budget, entry=args.entry)
+    report = analyze(SourceSnapshot.capture(SRC_ROOT), budget, load_baseline(args.baseline))
+    if args.save_baseline:
+        save_baseline(report, args.baseline)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(f"{'file':44} {'raw KB':>9} {'gzip KB':>9} {'br KB':>9} {'delta B':>9}")
+        for size in report.files + [report.total]:
+            key = "*total*" if size is report.total else size.key
+            br = f"{size.br / KB:9.1f}" if size.br is not None else f"{'-':>9}"
+            delta = report.deltas.get(key)
+            print(f"{key:44} {size.raw / KB:9.1f} {size.gzip / KB:9.1f} {br} {'' if delta is None else delta:>9}")
+        for line in report.violations:
+            print(f"OVER BUDGET {line}")
+        for line in report.regressions:
+            print(f"REGRESSION  {line}")
+        print(f"{report.status} ({report.metric})")
+    return 1 if report.violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""Versioned, process-safe key/value store for pipeline caches.
+
+Backed by SQLite in WAL mode, so a pre-commit run and an IDE watcher can read
+and write the same checkout's cache at the same time. Every write is a
+transaction, so a crashed process never leaves a half-written file, and a
+file that is no longer a database is recreated empty. Values are JSON,
+grouped by namespace, and expire after a TTL. The store is capped at a byte
+budget by evicting the least recently used entries, and a single key can be
+read without loading the rest of the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+SCHEMA_VERSION = 1
+DEFAULT_TTL_SECONDS = 14 * 24 * 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created REAL NOT NULL,
+        accessed REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+)
+
+
+class CacheSchemaError(RuntimeError):
+    """The store was created by a newer version of this tool."""
+
+
+class CacheStore:
+    """SQLite-backed JSON cache with TTL expiry and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._open()
+        except sqlite3.DatabaseError as exc:
+            if isinstance(exc, sqlite3.OperationalError):
+                raise  # locked or unreadable: not ours to throw away
+            # Not a database any more (truncated or overwritten). It only ever held a cache.
+            self._discard()
+            self._open()
+
+    def _open(self) -> None:
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA busy_timeout = 30000")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._migrate()
+
+    def _discard(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                Path(f"{self.path}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+
+    def _migrate(self) -> None:
+        with self._lock, self._transaction():
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                # Written by a newer tool: leave it alone rather than downgrade it.
+                raise CacheSchemaError(f"{self.path} has schema version {version}, expected {SCHEMA_VERSION}")
+            if version not in (0, SCHEMA_VERSION):
+                # Older layout: start this store cold rather than misread it.
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+            if version != SCHEMA_VERSION:
+                for statement in _SCHEMA:
+                    self._conn.execute(statement)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _transaction(self):
+        return Transaction(self._conn)
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created > self.ttl_seconds
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the value for ``key`` or ``None`` when missing, expired or unreadable."""
+        return self.get_many(namespace, [key]).get(key)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        now = self._clock()
+        found: Dict[str, Any] = {}
+        stale = []
+        with self._lock, self._transaction():
+            placeholders = ",".join("?" for _ in keys)
+            rows = self._conn.execute(
+                f"SELECT key, value, created FROM entries WHERE namespace = ? AND key IN ({placeholders})",
+                [namespace, *keys],
+            ).fetchall()
+            for key, value, created in rows:
+                if self._expired(created, now):
+                    stale.append(key)
+                    continue
+                try:
+                    found[key] = json.loads(value)
+                except ValueError:
+                    stale.append(key)
+            if stale:
+                self._conn.executemany(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", [(namespace, key) for key in stale]
+                )
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, key) for key in found],
+                )
+        return found
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """Store ``value`` (must be JSON-serialisable) and evict LRU entries past the byte budget."""
+        payload = json.dumps(value, sort_keys=True)
+        now = self._clock()
+        with self._lock, self._transaction():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload.encode("utf-8")), now, now),
+            )
+            self._evict_locked()
+
+    def update(self, namespace: str, key: str, change: Callable[[Optional[Any]], Any]) -> Any:
+        """Read, change and write one entry inside a single ``BEGIN IMMEDIATE`` transaction.
+
+        ``change`` receives the current value (``None`` when missing, expired
+        or unreadable) and returns the new one. Concurrent updates of the same
+        key are serialised, so none of them is lost.
+        """
+        now = self._clock()
+        with self._lock, self._transaction():
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            current = None
+            if row is not None and not self._expired(row[1], now):
+                try:
+                    current = json.loads(row[0])
+                except ValueError:
+                    current = None
+            value = change(current)
+            payload = json.dumps(value, sort_keys=True)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload.encode("utf-8")), now, now),
+            )
+            self._evict_locked()
+        return value
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock, self._transaction():
+            self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def purge_expired(self) -> int:
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock, self._transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE created < ?", (self._clock() - self.ttl_seconds,)
+            )
+            return cursor.rowcount
+
+    def _evict_locked(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT namespace, key, size FROM entries ORDER BY accessed ASC").fetchall()
+        victims = []
+        for namespace, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((namespace, key))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CacheStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT``/``ROLLBACK`` on an autocommit connection.
+
+    Shared by the SQLite stores here (this cache and ``bench_history``).
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
@@ -0,0 +1,188 @@
+"""Critical-path list scheduling for the pipeline's test categories.
+
+Categories form a DAG through their ``dependencies``. Each category gets an
+upward rank: its expected duration plus the longest chain of work that is
+waiting on it. Ready categories are dispatched in rank order, which puts the
+longest critical path first and packs the remaining work around it.
+Expected durations come from a small history file that learns from previous
+runs and falls back to the configured ``estimated_time``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+Dependencies = Mapping[str, Sequence[str]]
+
+DEFAULT_WORKER_CAP = 8
+WORKER_CAP_ENV = "PIPELINE_WORKER_CAP"
+
+
+def validate_dag(dependencies: Dependencies) -> List[str]:
+    """Return a topological order of ``dependencies`` or raise ``ValueError``."""
+    for name, deps in dependencies.items():
+        unknown = [dep for dep in deps if dep not in dependencies]
+        if unknown:
+            raise ValueError(f"{name} depends on unknown categories: {unknown}")
+
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    order: List[str] = []
+    while remaining:
+        ready = sorted(name for name, deps in remaining.items() if not deps)
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {sorted(remaining)}")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return order
+
+
+def critical_path_priorities(
+    dependencies: Dependencies, durations: Mapping[str, float]
+) -> Dict[str, float]:
+    """Upward rank per category: own duration plus the longest dependent chain."""
+    order = validate_dag(dependencies)
+    dependents: Dict[str, List[str]] = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(name)
+
+    ranks: Dict[str, float] = {}
+    for name in reversed(order):
+        tail = max((ranks[child] for child in dependents[name]), default=0.0)
+        ranks[name] = float(durations.get(name, 0.0)) + tail
+    return ranks
+
+
+def priority_order(names: Iterable[str], priorities: Mapping[str, float]) -> List[str]:
+    """Sort ``names`` highest rank first, breaking ties by name for stable plans."""
+    return sorted(names, key=lambda name: (-priorities.get(name, 0.0), name))
+
+
+@dataclass(frozen=True)
+class ScheduledTask:
+    name: str
+    worker: int
+    start: float
+    end: float
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    tasks: Tuple[ScheduledTask, ...]
+    workers: int
+    makespan: float
+    sequential_time: float
+
+    def describe(self) -> List[str]:
+        """Human-readable plan lines for dry runs."""
+        lines = [
+            f"Planned schedule on {self.workers} worker(s):",
+        ]
+        for task in sorted(self.tasks, key=lambda item: (item.start, item.worker)):
+            lines.append(
+                f"  worker {task.worker}: {task.name:<20} {task.start:7.1f}s -> {task.end:7.1f}s"
+            )
+        lines.append(f"Predicted makespan: {self.makespan:.1f}s (sequential {self.sequential_time:.1f}s)")
+        return lines
+
+
+def plan_schedule(
+    dependencies: Dependencies, durations: Mapping[str, float], max_workers: int
+) -> SchedulePlan:
+    """Simulate critical-path-first list scheduling on ``max_workers`` workers."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    priorities = critical_path_priorities(dependencies, durations)
+
+    worker_free = [0.0] * max_workers
+    finished: Dict[str, float] = {}
+    tasks: List[ScheduledTask] = []
+    pending = set(dependencies)
+    while pending:
+        ready = [name for name in pending if all(dep in finished for dep in dependencies[name])]
+        name = priority_order(ready, priorities)[0]
+        ready_at = max((finished[dep] for dep in dependencies[name]), default=0.0)
+        worker = min(range(max_workers), key=lambda index: (max(worker_free[index], ready_at), index))
+        start = max(worker_free[worker], ready_at)
+        end = start + float(durations.get(name, 0.0))
+        worker_free[worker] = end
+        finished[name] = end
+        tasks.append(ScheduledTask(name=name, worker=worker, start=start, end=end))
+        pending.remove(name)
+
+    return SchedulePlan(
+        tasks=tuple(tasks),
+        workers=max_workers,
+        makespan=max(finished.values(), default=0.0),
+        sequential_time=sum(float(durations.get(name, 0.0)) for name in dependencies),
+    )
+
+
+class DurationHistory:
+    """Exponentially weighted moving average of observed category durations."""
+
+    def __init__(self, path: Path, alpha: float = 0.5):
+        self.path = Path(path)
+        self.alpha = alpha
+        self._durations: Dict[str, float] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        for name, value in (data.get("durations") or {}).items():
+            if isinstance(value, (int, float)) and value >= 0:
+                self._durations[name] = float(value)
+
+    def estimate(self, name: str, default: float) -> float:
+        return self._durations.get(name, float(default))
+
+    def estimates(self, defaults: Mapping[str, float]) -> Dict[str, float]:
+        return {name: self.estimate(name, default) for name, default in defaults.items()}
+
+    def record(self, name: str, duration: float) -> None:
+        previous = self._durations.get(name)
+        if previous is None:
+            self._durations[name] = float(duration)
+        else:
+            self._durations[name] = self.alpha * float(duration) + (1 - self.alpha) * previous
+
+    def save(self) -> None:
+        """Write atomically so a concurrent reader never sees a partial file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"durations": self._durations}, handle, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def default_worker_count(task_count: int, cap: Optional[int] = None) -> int:
+    """One worker per category, up to ``cap`` (``PIPELINE_WORKER_CAP``, default 8).
+
+    Categories spend their time waiting on browsers and subprocesses, not
+    on Python, so the CPU count is not the limit: a 1-CPU runner still
+    overlaps them.
+    """
+    if cap is None:
+        try:
+            cap = int(os.environ.get(WORKER_CAP_ENV, DEFAULT_WORKER_CAP))
+        except ValueError:
+            cap = DEFAULT_WORKER_CAP
+    return max(1, min(task_count, cap))
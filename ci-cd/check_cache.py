@@ -0,0 +1,116 @@
+"""Per-check result cache keyed on the exact source inputs each check read.
+
+Every entry stores the read set recorded by ``SourceSnapshot.track_reads``
+(``token -> state``) and a fingerprint of the pipeline code. An entry is
+reused only when the code is unchanged and every recorded read would observe
+the same state in the current snapshot. An edit to ``exercise-database.js``
+therefore invalidates only the checks that looked at that file.
+Entries live in the shared ``CacheStore`` under the ``checks`` namespace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from cache_store import CacheStore
+from source_snapshot import SourceSnapshot
+
+
+NAMESPACE = "checks"
+MAX_VARIANTS_PER_CHECK = 4
+
+
+def pipeline_code_files(directory: Path) -> List[Path]:
+    """The pipeline's modules and tracked JSON config (dotfiles are runtime state, not config)."""
+    directory = Path(directory)
+    return sorted(
+        path for pattern in ("*.py", "*.json") for path in directory.glob(pattern) if not path.name.startswith(".")
+    )
+
+
+def fingerprint_files(paths: Iterable[Path]) -> str:
+    """Hash the given files so cached results die with the code that produced them."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        digest.update(path.name.encode("utf-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def inputs_digest(code_fingerprint: str, reads: Mapping[str, Optional[str]]) -> str:
+    digest = hashlib.sha256(code_fingerprint.encode("utf-8"))
+    for token in sorted(reads):
+        digest.update(f"{token}\0{reads[token]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CheckCache:
+    """Check name -> recent ``(read set, result)`` variants, persisted in a ``CacheStore``."""
+
+    def __init__(self, store: CacheStore, code_fingerprint: str):
+        self.store = store
+        self.code_fingerprint = code_fingerprint
+        self._lock = threading.Lock()
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+
+    def _variants(self, name: str) -> List[Dict[str, Any]]:
+        try:
+            variants = self.store.get(NAMESPACE, name)
+        except sqlite3.Error:
+            return []
+        return variants if isinstance(variants, list) else []
+
+    def lookup(self, name: str, snapshot: SourceSnapshot) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``name`` if its code and inputs are unchanged."""
+        for variant in self._variants(name):
+            if variant.get("code") == self.code_fingerprint and snapshot.matches(variant.get("reads", {})):
+                with self._lock:
+                    self.hits.append(name)
+                # A hit still depends on those inputs for anyone tracking this thread's reads.
+                snapshot.replay_reads(variant["reads"])
+                return variant["result"]
+        with self._lock:
+            self.misses.append(name)
+        return None
+
+    def store_result(self, name: str, reads: Mapping[str, Optional[str]], result: Dict[str, Any]) -> bool:
+        """Record ``result``; returns False when it could not be serialised or written."""
+        key = inputs_digest(self.code_fingerprint, reads)
+        variant = {
+            "key": key,
+            "code": self.code_fingerprint,
+            "reads": dict(reads),
+            "result": result,
+        }
+
+        def merge(current: Any) -> List[Dict[str, Any]]:
+            variants = current if isinstance(current, list) else []
+            variants = [item for item in variants if isinstance(item, dict) and item.get("key") != key]
+            return [variant] + variants[: MAX_VARIANTS_PER_CHECK - 1]
+
+        try:
+            # One transaction, so a concurrent run storing another variant is not overwritten
+            self.store.update(NAMESPACE, name, merge)
+        except (TypeError, ValueError, sqlite3.Error):
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": len(self.hits),
+                "misses": len(self.misses),
+                "rerun_checks": sorted(self.misses),
+            }
+
+    def save(self) -> None:
+        """Entries are written through as they are stored; only expired rows are left to drop."""
+        self.store.purge_expired()
@@ -19,7 +19,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_dom_settled, wait_for_phase_change, wait_for_workout
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -47,7 +48,7 @@ class ComprehensiveSeleniumTests:
         options.add_argument("--disable-web-security")
         options.add_argument("--allow-running-insecure-content")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 15)
         logger.info("✅ Chrome WebDriver initialized")
@@ -99,7 +100,7 @@ class ComprehensiveSeleniumTests:
         # Test empty form submission
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
         generate_btn.click()
-        time.sleep(1)
+        wait_for_dom_settled(self.driver)
         
         # Check for validation errors or workout generation
         try:
@@ -133,8 +134,9 @@ class ComprehensiveSeleniumTests:
         
         # Generate workout
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         # Verify workout generation
         workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -163,7 +165,7 @@ class ComprehensiveSeleniumTests:
             try:
                 # Reset form
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
                 
                 # Fill form for this pattern
                 self.driver.execute_script(f"""
@@ -175,8 +177,9 @@ class ComprehensiveSeleniumTests:
                 
                 # Generate workout
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 generate_btn.click()
-                time.sleep(3)
+                wait_for_workout(self.driver)
                 
                 # Check results
                 workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -215,8 +218,9 @@ class ComprehensiveSeleniumTests:
         
         # Generate workout
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         # Verify circuit-specific data
         workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -249,7 +253,7 @@ class ComprehensiveSeleniumTests:
             try:
                 # Reset and select equipment
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
                 
                 # Select equipment
                 for eq in equipment:
@@ -268,8 +272,9 @@ class ComprehensiveSeleniumTests:
                 
                 # Generate workout
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 generate_btn.click()
-                time.sleep(3)
+                wait_for_workout(self.driver)
                 
                 # Check results
                 workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -294,7 +299,7 @@ class ComprehensiveSeleniumTests:
             try:
                 # Reset form
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
                 
                 # Set level
                 self.driver.execute_script(f"""
@@ -306,8 +311,9 @@ class ComprehensiveSeleniumTests:
                 
                 # Generate workout
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 generate_btn.click()
-                time.sleep(3)
+                wait_for_workout(self.driver)
                 
                 # Check results
                 workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -338,13 +344,15 @@ class ComprehensiveSeleniumTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         # Start workout
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         # Test workout player controls
         player_tests = self.driver.execute_script("""
@@ -407,12 +415,14 @@ class ComprehensiveSeleniumTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         # Test timer functionality
         timer_tests = self.driver.execute_script("""
@@ -460,8 +470,9 @@ class ComprehensiveSeleniumTests:
                 document.getElementById('fitness-level').value = 'Beginner';
             """)
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(2)
+            wait_for_workout(self.driver)
             
             workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
             edge_cases["short_duration"] = {
@@ -480,8 +491,9 @@ class ComprehensiveSeleniumTests:
                 document.getElementById('fitness-level').value = 'Advanced';
             """)
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
             edge_cases["long_duration"] = {
@@ -499,8 +511,9 @@ class ComprehensiveSeleniumTests:
                 document.getElementById('fitness-level').value = 'Intermediate';
             """)
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(2)
+            wait_for_workout(self.driver)
             
             workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
             edge_cases["no_equipment"] = {
@@ -0,0 +1,293 @@
+"""Pre-warmed pool of Chrome WebDriver sessions shared by the Selenium suites.
+
+Each Selenium suite used to resolve the chromedriver binary and launch its
+own Chrome in ``setup_driver``. ``DriverPool`` resolves the driver once
+(offline, through ``driver_resolver``), launches ``size`` browsers up front
+(in parallel) and leases them to suites. When a lease ends the session is
+reset before the next suite gets it:
+
+- extra windows are closed;
+- cookies and the app origin's storage are cleared;
+- the window size is restored;
+- the page goes back to ``about:blank``.
+
+A session that cannot be reset is quit and replaced.
+
+Browsers are launched with a per-suite argument profile (``PROFILES``),
+the same flags each suite passes when it launches its own Chrome. A lease
+asks for a profile and gets an idle session launched with it. If only
+sessions of other profiles are idle, one of them is quit and relaunched. A
+suite therefore never inherits another suite's flags, such as the security
+suite's ``--disable-web-security``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from driver_resolver import resolve_chromedriver
+
+
+WINDOW_SIZE = (1920, 1080)
+# Headless Chrome's window when no --window-size is given
+HEADLESS_WINDOW_SIZE = (800, 600)
+DEFAULT_PROFILE = "default"
+
+_BASE_ARGUMENTS: Tuple[str, ...] = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-logging",
+)
+_WINDOW_ARGUMENT = f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}"
+
+
+@dataclass(frozen=True)
+class DriverProfile:
+    """Launch flags for a session and the window size a reset restores."""
+
+    arguments: Tuple[str, ...]
+    window_size: Tuple[int, int] = WINDOW_SIZE
+
+
+PROFILES: Dict[str, DriverProfile] = {
+    DEFAULT_PROFILE: DriverProfile(_BASE_ARGUMENTS + (_WINDOW_ARGUMENT,)),
+    # Resizes the window per device itself
+    "responsive": DriverProfile(_BASE_ARGUMENTS, HEADLESS_WINDOW_SIZE),
+    "performance": DriverProfile(
+        _BASE_ARGUMENTS
+        + (
+            _WINDOW_ARGUMENT,
+            "--enable-features=NetworkService,NetworkServiceLogging",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+        )
+    ),
+    "security": DriverProfile(
+        _BASE_ARGUMENTS + (_WINDOW_ARGUMENT, "--disable-web-security", "--allow-running-insecure-content")
+    ),
+    "accessibility": DriverProfile(_BASE_ARGUMENTS + (_WINDOW_ARGUMENT, "--force-device-scale-factor=1")),
+}
+
+DriverFactory = Callable[[str], Any]  # profile name -> driver
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """Path of the chromedriver binary, resolved offline once per process (see ``driver_resolver``)."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = resolve_chromedriver()
+        return _driver_path
+
+
+def chrome_factory(headless: bool = True) -> DriverFactory:
+    """A factory that launches Chrome with a profile's arguments through the shared driver binary."""
+
+    def launch(profile: str = DEFAULT_PROFILE) -> Any:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        options = Options()
+        if headless:
+            options.add_argument("--headless")
+        for argument in PROFILES[profile].arguments:
+            options.add_argument(argument)
+        return webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+
+    return launch
+
+
+def default_pool_size(suites: int) -> int:
+    """One browser per two cores, never more than there are suites to run."""
+    return max(1, min(suites, (os.cpu_count() or 2) // 2))
+
+
+def _origin(url: str) -> Optional[str]:
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def reset_session(driver: Any, origins: Sequence[str] = (), window_size: Sequence[int] = WINDOW_SIZE) -> None:
+    """Return a session to a blank state; raises if the browser is unusable."""
+    handles = list(driver.window_handles)
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.delete_all_cookies()
+    for origin in origins:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    driver.set_window_size(*window_size)
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """``size`` long-lived WebDriver sessions leased to one suite at a time."""
+
+    def __init__(
+        self,
+        size: int,
+        factory: Optional[DriverFactory] = None,
+        base_url: Optional[str] = None,
+        headless: bool = True,
+        warm_profiles: Sequence[str] = (),
+    ):
+        self.size = max(1, size)
+        self.factory = factory or chrome_factory(headless)
+        origin = _origin(base_url) if base_url else None
+        self.origins: Sequence[str] = (origin,) if origin else ()
+        unknown = sorted(set(warm_profiles) - set(PROFILES))
+        if unknown:
+            raise ValueError(f"Unknown driver profiles: {unknown}")
+        # Profiles to launch up front, in order; the remaining slots get the default
+        self.warm_profiles = (list(warm_profiles) + [DEFAULT_PROFILE] * self.size)[: self.size]
+        self.launched = 0
+        self.replaced = 0
+        self._idle: List[Tuple[str, Any]] = []
+        self._all: List[Any] = []
+        self._available = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def __enter__(self) -> "DriverPool":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def _launch(self, profile: str) -> Any:
+        driver = self.factory(profile)
+        with self._lock:
+            self.launched += 1
+            self._all.append(driver)
+        return driver
+
+    def start(self) -> None:
+        """Launch every session in parallel; the first launch failure is raised."""
+        if self._started:
+            return
+        self._started = True
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._launch, profile) for profile in self.warm_profiles]
+        try:
+            drivers = [future.result() for future in futures]
+        except Exception:
+            self.close()
+            raise
+        for profile, driver in zip(self.warm_profiles, drivers):
+            self._release(profile, driver)
+
+    def _release(self, profile: str, driver: Any) -> None:
+        with self._lock:
+            self._idle.append((profile, driver))
+        self._available.release()
+
+    def _discard(self, driver: Any) -> None:
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _relaunch(self, profile: str) -> Optional[Any]:
+        try:
+            driver = self._launch(profile)
+        except Exception:
+            return None
+        with self._lock:
+            self.replaced += 1
+        return driver
+
+    def _take(self, profile: str) -> Tuple[Optional[str], Optional[Any]]:
+        """An idle session, preferring ``profile``; ``(None, None)`` if the slot has no browser."""
+        with self._lock:
+            for index, (idle_profile, driver) in enumerate(self._idle):
+                if idle_profile == profile:
+                    return self._idle.pop(index)
+            return self._idle.pop() if self._idle else (None, None)
+
+    def _return(self, profile: str, driver: Optional[Any]) -> None:
+        if driver is not None:
+            try:
+                reset_session(driver, self.origins, PROFILES[profile].window_size)
+            except Exception:
+                self._discard(driver)
+                driver = self._relaunch(profile)
+        if driver is None:
+            # Keep the slot so waiting suites are not starved; the next lease retries a launch.
+            self._available.release()
+            return
+        self._release(profile, driver)
+
+    @contextmanager
+    def lease(self, profile: str = DEFAULT_PROFILE) -> Iterator[Optional[Any]]:
+        """Borrow a session launched with ``profile``; it is reset (or replaced) when the block exits.
+
+        Yields ``None`` only if the slot's browser died and could not be relaunched.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown driver profile: {profile}")
+        self.start()
+        self._available.acquire()
+        idle_profile, driver = self._take(profile)
+        if driver is not None and idle_profile != profile:
+            # Flags are fixed at launch: swap the other profile's browser for one of ours
+            self._discard(driver)
+            try:
+                driver = self._launch(profile)
+            except Exception:
+                driver = None
+        elif driver is None:
+            driver = self._relaunch(profile)
+        try:
+            yield driver
+        finally:
+            self._return(profile, driver)
+
+    def map(self, tasks: Sequence[Callable[[Any], Any]], profiles: Optional[Sequence[str]] = None) -> List[Any]:
+        """Run each task with a leased driver, up to ``size`` at once; results keep task order.
+
+        ``profiles`` gives each task's driver profile (default for all when omitted).
+        A task that raises yields its exception object instead of a result.
+        """
+        profiles = list(profiles) if profiles is not None else [DEFAULT_PROFILE] * len(tasks)
+
+        def run(job: Tuple[Callable[[Any], Any], str]) -> Any:
+            task, profile = job
+            try:
+                with self.lease(profile) as driver:
+                    if driver is None:
+                        raise RuntimeError("no browser session available")
+                    return task(driver)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, zip(tasks, profiles)))
+
+    def close(self) -> None:
+        with self._lock:
+            drivers, self._all, self._idle = self._all, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
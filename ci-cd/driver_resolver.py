@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Offline chromedriver resolution for the Selenium suites.
+
+``resolve_chromedriver`` replaces ``ChromeDriverManager().install()``. It
+finds the installed Chrome/Chromium and reads its version. It then picks a
+chromedriver with the same major version from a local cache directory and
+checks the binary against the sha256 recorded in the cache manifest. It never
+touches the network. When nothing matches it raises ``DriverResolutionError``,
+and the message says which browser was found and how to fill the cache.
+
+Resolution order:
+
+1. ``CHROMEDRIVER``, if set, is used as is.
+2. The cache (``CHROMEDRIVER_CACHE`` or ``~/.cache/workout-generator/chromedriver``).
+3. A chromedriver on ``PATH`` whose major version matches the browser, as
+   installed by distro packages.
+
+The cache is filled explicitly, either from a binary you already have::
+
+    python ci-cd/driver_resolver.py --add /path/to/chromedriver
+
+or, on a host with network access, through webdriver-manager::
+
+    python ci-cd/driver_resolver.py --fetch
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+MANIFEST_NAME = "manifest.json"
+DRIVER_NAME = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+BROWSER_CANDIDATES: Sequence[str] = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+)
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+Version = Tuple[int, int, int, int]
+VersionProbe = Callable[[str], Optional[str]]
+
+
+class DriverResolutionError(RuntimeError):
+    """Raised when no verified chromedriver matches the installed browser."""
+
+
+def parse_version(text: str) -> Optional[Version]:
+    match = _VERSION_RE.search(text or "")
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups())  # type: ignore[return-value]
+
+
+def format_version(version: Version) -> str:
+    return ".".join(str(part) for part in version)
+
+
+def probe_version(binary: str) -> Optional[str]:
+    """``binary --version`` output, or ``None`` if it cannot be run."""
+    try:
+        completed = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return (completed.stdout or completed.stderr).strip() or None
+
+
+def sha256_of(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    configured = os.environ.get("CHROMEDRIVER_CACHE")
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "workout-generator" / "chromedriver"
+
+
+def detect_browser(
+    candidates: Sequence[str] = BROWSER_CANDIDATES,
+    probe: VersionProbe = probe_version,
+) -> Tuple[str, Version]:
+    """First installed Chrome/Chromium and its version; ``CHROME_BINARY`` is tried first."""
+    configured = os.environ.get("CHROME_BINARY")
+    ordered = ([configured] if configured else []) + list(candidates)
+    for candidate in ordered:
+        binary = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if not binary:
+            continue
+        version = parse_version(probe(binary) or "")
+        if version:
+            return binary, version
+    raise DriverResolutionError(
+        "No Chrome or Chromium installation found (tried CHROME_BINARY and "
+        + ", ".join(candidates[:5])
+        + ", ...). Set CHROME_BINARY to the browser executable."
+    )
+
+
+@dataclass(frozen=True)
+class CachedDriver:
+    version: str
+    path: str
+    sha256: str
+
+    @property
+    def parsed_version(self) -> Version:
+        return parse_version(self.version) or (0, 0, 0, 0)
+
+
+class DriverCache:
+    """Directory of chromedriver binaries, one per version, indexed by ``manifest.json``."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root is not None else default_cache_dir()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def entries(self) -> List[CachedDriver]:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        entries = []
+        for item in data.get("drivers", []):
+            try:
+                entries.append(CachedDriver(str(item["version"]), str(item["path"]), str(item["sha256"])))
+            except (KeyError, TypeError):
+                continue
+        return entries
+
+    def _write(self, entries: Sequence[CachedDriver]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {"drivers": [asdict(entry) for entry in sorted(entries, key=lambda e: e.parsed_version)]}
+        handle, tmp = tempfile.mkstemp(dir=self.root, prefix=".manifest-", suffix=".json")
+        with os.fdopen(handle, "w", encoding="utf-8") as out:
+            json.dump(payload, out, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def add(self, binary: Path, version: Optional[str] = None, probe: VersionProbe = probe_version) -> CachedDriver:
+        """Copy ``binary`` into the cache and record its version and checksum."""
+        binary = Path(binary)
+        parsed = parse_version(version or probe(str(binary)) or "")
+        if parsed is None:
+            raise DriverResolutionError(f"Could not read a chromedriver version from {binary}")
+        label = format_version(parsed)
+        target = self.root / label / DRIVER_NAME
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(binary, target)
+        target.chmod(target.stat().st_mode | 0o111)
+        entry = CachedDriver(label, target.relative_to(self.root).as_posix(), sha256_of(target))
+        self._write([existing for existing in self.entries() if existing.version != label] + [entry])
+        return entry
+
+    def match(self, browser_version: Version) -> Optional[CachedDriver]:
+        """Same major version as the browser; the same build is preferred, then the newest."""
+        same_major = [entry for entry in self.entries() if entry.parsed_version[0] == browser_version[0]]
+        if not same_major:
+            return None
+        return max(same_major, key=lambda entry: (entry.parsed_version[:3] == browser_version[:3], entry.parsed_version))
+
+    def verify(self, entry: CachedDriver) -> Path:
+        path = self.root / entry.path
+        if not path.is_file():
+            raise DriverResolutionError(f"Cached chromedriver {entry.version} is missing at {path}")
+        actual = sha256_of(path)
+        if actual != entry.sha256:
+            raise DriverResolutionError(
+                f"Cached chromedriver {entry.version} at {path} failed its checksum "
+                f"(expected {entry.sha256[:12]}..., got {actual[:12]}...); re-add it with --add"
+            )
+        return path
+
+
+def _system_driver(browser_version: Version, probe: VersionProbe) -> Optional[str]:
+    binary = shutil.which(DRIVER_NAME)
+    if not binary:
+        return None
+    version = parse_version(probe(binary) or "")
+    if version and version[0] == browser_version[0]:
+        return binary
+    return None
+
+
+def resolve_chromedriver(
+    cache: Optional[DriverCache] = None,
+    browser_version: Optional[Version] = None,
+    probe: VersionProbe = probe_version,
+) -> str:
+    """Path of a verified chromedriver for the installed browser, without network access."""
+    explicit = os.environ.get("CHROMEDRIVER")
+    if explicit:
+        if not os.path.isfile(explicit):
+            raise DriverResolutionError(f"CHROMEDRIVER points to {explicit}, which does not exist")
+        return explicit
+
+    cache = cache or DriverCache()
+    if browser_version is None:
+        _binary, browser_version = detect_browser(probe=probe)
+
+    entry = cache.match(browser_version)
+    if entry is not None:
+        return str(cache.verify(entry))
+
+    system = _system_driver(browser_version, probe)
+    if system:
+        return system
+
+    cached = ", ".join(entry.version for entry in cache.entries()) or "none"
+    raise DriverResolutionError(
+        f"No chromedriver for Chrome {format_version(browser_version)} (major {browser_version[0]}) "
+        f"in {cache.root} (cached: {cached}). Add one with "
+        f"'python ci-cd/driver_resolver.py --add /path/to/chromedriver' or, with network access, '--fetch'."
+    )
+
+
+def fetch_into_cache(cache: DriverCache) -> CachedDriver:
+    """Download a matching driver with webdriver-manager (network) and add it to the cache."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return cache.add(Path(ChromeDriverManager().install()))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Resolve chromedriver from the local offline cache")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache directory (default: CHROMEDRIVER_CACHE or ~/.cache)")
+    parser.add_argument("--add", type=Path, metavar="PATH", help="Copy a chromedriver binary into the cache")
+    parser.add_argument("--fetch", action="store_true", help="Download a matching driver with webdriver-manager (needs network)")
+    args = parser.parse_args(argv)
+
+    cache = DriverCache(args.cache_dir)
+    try:
+        if args.add:
+            entry = cache.add(args.add)
+            print(f"Cached chromedriver {entry.version} ({entry.sha256[:12]}) in {cache.root}")
+        elif args.fetch:
+            entry = fetch_into_cache(cache)
+            print(f"Cached chromedriver {entry.version} ({entry.sha256[:12]}) in {cache.root}")
+        print(resolve_chromedriver(cache))
+    except DriverResolutionError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
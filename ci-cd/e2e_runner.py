@@ -13,12 +13,14 @@ from __future__ import annotations
 import json
 import logging
 import socket
-import threading
 import time
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
-from urllib.parse import unquote, urlsplit
+from typing import Any, Callable, Dict, Optional
+
+from app_readiness import mark, wait_for_workout
+from static_server import acquire_shared, release_shared
+
+
+CHROMIUM_ARGS = ["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"]
 
 
 def _is_port_open(host: str, port: int) -> bool:
@@ -42,60 +44,6 @@ def _retry_test(test_func: Callable, max_retries: int = 3, delay: float = 1.0) -
     return None
 
 
-class _SrcHandler(SimpleHTTPRequestHandler):
-    """Serve files from src/ while ignoring query and fragment."""
-
-    def translate_path(self, path: str) -> str:
-        root = Path(__file__).resolve().parent.parent / "src"
-        clean_path = unquote(urlsplit(path).path).lstrip("/")
-        full = (root / clean_path).resolve()
-        if full.is_dir():
-            index = full / "index.html"
-            if index.exists():
-                return str(index)
-        return str(full)
-
-
-def _find_open_port(host: str, starting_port: int) -> int:
-    port = starting_port
-    while _is_port_open(host, port):
-        port += 1
-    return port
-
-
-def _is_http_service(host: str, port: int) -> bool:
-    """Best-effort check that a port serves HTTP responses."""
-    try:
-        with socket.create_connection((host, port), timeout=0.5) as conn:
-            conn.sendall(b"GET / HTTP/1.0\r\nHost: localhost\r\n\r\n")
-            chunk = conn.recv(16)
-            return chunk.startswith(b"HTTP/")
-    except Exception:
-        return False
-
-
-def _start_local_server() -> Tuple[Optional[ThreadingHTTPServer], int]:
-    host, default_port = "127.0.0.1", 8001
-
-    if _is_port_open(host, default_port):
-        if _is_http_service(host, default_port):
-            logging.info(f"Reusing existing HTTP server on {host}:{default_port}")
-            return None, default_port
-        logging.warning(
-            f"Port {default_port} is in use by non-HTTP service; selecting fallback port."
-        )
-        port = _find_open_port(host, default_port + 1)
-    else:
-        port = default_port
-
-    server = ThreadingHTTPServer((host, port), _SrcHandler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-    time.sleep(0.4)
-    logging.info(f"Started smoke server on {host}:{port}")
-    return server, port
-
-
 def _configure_form_and_submit(page: Any) -> bool:
     """Set minimal valid form values and submit once."""
     return bool(
@@ -177,8 +125,12 @@ def _workout_generated(page: Any) -> bool:
     )
 
 
-def run_dynamic_smoke() -> Dict[str, Any]:
-    """Run deterministic E2E smoke checks."""
+def run_dynamic_smoke(engine: str = "chromium", base_url: Optional[str] = None) -> Dict[str, Any]:
+    """Run deterministic E2E smoke checks on one Playwright engine.
+
+    ``engine`` is ``chromium``, ``firefox`` or ``webkit``. Without ``base_url``
+    the app is served from the shared in-memory server.
+    """
     try:
         from playwright.sync_api import sync_playwright  # type: ignore
     except Exception as exc:
@@ -188,17 +140,15 @@ def run_dynamic_smoke() -> Dict[str, Any]:
             "checks": {},
         }
 
-    local_server, port = _start_local_server()
-    url = f"http://127.0.0.1:{port}/"
+    server = acquire_shared() if base_url is None else None
+    url = base_url or server.url
     checks: Dict[str, bool] = {}
     errors = []
 
     try:
         with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
-            )
+            launch_args = CHROMIUM_ARGS if engine == "chromium" else []
+            browser = getattr(playwright, engine).launch(headless=True, args=launch_args)
             page = browser.new_page()
             page.set_default_timeout(15000)
 
@@ -211,9 +161,10 @@ def run_dynamic_smoke() -> Dict[str, Any]:
             checks["has_fitness_level"] = bool(page.query_selector("#fitness-level"))
 
             def _submit_and_verify() -> bool:
+                mark(page)
                 if not _configure_form_and_submit(page):
                     raise RuntimeError("could not configure minimal valid form input")
-                page.wait_for_timeout(700)
+                wait_for_workout(page, timeout=5)
                 if not _workout_generated(page):
                     raise AssertionError("workout was not generated after submit")
                 return True
@@ -235,9 +186,8 @@ def run_dynamic_smoke() -> Dict[str, Any]:
         checks.setdefault("has_fitness_level", False)
         checks.setdefault("workout_generation", False)
     finally:
-        if local_server is not None:
-            local_server.shutdown()
-            local_server.server_close()
+        if server is not None:
+            release_shared()
 
     required_checks = [
         "app_loaded",
@@ -253,6 +203,7 @@ def run_dynamic_smoke() -> Dict[str, Any]:
         "checks": checks,
         "required_checks": required_checks,
         "url": url,
+        "engine": engine,
         "errors": errors,
     }
 
@@ -21,7 +21,6 @@ from pathlib import Path
 import logging
 import hashlib
 import pickle
-import threading
 from typing import Dict, List, Any, Tuple, Optional
 import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -30,6 +29,16 @@ import psutil
 from dataclasses import dataclass
 from enum import Enum
 
+from bench_history import BenchHistory, runner_fingerprint
+from browser_matrix import BrowserCell, engine_summary, expand, load_engines, matrix_workers, split_installed
+from e2e_runner import run_dynamic_smoke
+from impact_analysis import ImpactError, changed_files, select_checks
+from module_graph import ModuleGraph
+from page_load_benchmark import BenchmarkUnavailable, benchmark_with_playwright, evaluate
+from resource_admission import ResourceCost, ResourceGovernor
+from source_snapshot import SourceSnapshot
+from static_server import shared_server
+
 # Configure enhanced logging
 logging.basicConfig(
     level=logging.INFO,
@@ -64,13 +73,17 @@ class TestResult:
     details: Optional[Dict] = None
     retry_count: int = 0
     max_retries: int = 2
+    engine: Optional[str] = None
 
 class EnhancedAutomatedPipeline:
-    def __init__(self):
+    def __init__(self, changes: str = 'HEAD~1..HEAD'):
         self.project_root = Path(__file__).parent.parent
         self.pipeline_start_time = time.time()
         self.test_results: List[TestResult] = []
-        self.parallel_workers = min(4, psutil.cpu_count())
+        # Threads are only carriers: the governor admits each test when its
+        # declared CPU/RSS cost fits the host's CPUs and available memory.
+        self.governor = ResourceGovernor()
+        self.parallel_workers = max(1, psutil.cpu_count(logical=True) or 1)
         
         # Enhanced configuration
         self.config = {
@@ -80,13 +93,24 @@ class EnhancedAutomatedPipeline:
             'enable_selenium': True,
             'enable_playwright': True,
             'enable_smart_selection': True,
+            'changes': changes,  # git change set for smart selection: worktree, staged or a revision range
             'enable_notifications': True,
             'critical_threshold': 0.95,  # 95% of critical tests must pass
             'important_threshold': 0.80,  # 80% of important tests must pass
+            'page_load_samples': 5,  # loads per cache state in the page-load benchmark
         }
         
         # Test definitions
         self.test_definitions = self._define_tests()
+
+        # Browser engines per runner, from the 'browsers' section of the config file
+        self.engines = load_engines(Path(__file__).parent / 'enhanced_pipeline_config.json')
+        if not self.config['enable_selenium']:
+            self.engines['selenium'] = ()
+        if not self.config['enable_playwright']:
+            self.engines['playwright'] = ()
+        self.browser_matrix: Dict[str, Any] = {}
+        self.impact: Dict[str, Any] = {}
         
         logger.info(f"🚀 Enhanced Pipeline initialized with {self.parallel_workers} workers")
 
@@ -98,19 +122,25 @@ class EnhancedAutomatedPipeline:
                 'category': TestCategory.CRITICAL,
                 'description': 'Verify app loads successfully',
                 'timeout': 30,
-                'retry_on_failure': True
+                'retry_on_failure': True,
+                'cost': {'cpu': 0.2, 'rss_mb': 32},
+                'inputs': ['file:index.html']
             },
             'core_workout_flow': {
                 'category': TestCategory.CRITICAL,
                 'description': 'Test basic workout generation and execution',
                 'timeout': 60,
-                'retry_on_failure': True
+                'retry_on_failure': True,
+                'cost': {'cpu': 0.1, 'rss_mb': 16},
+                'inputs': ['entry:index.html']
             },
             'security_scan': {
                 'category': TestCategory.CRITICAL,
                 'description': 'Security vulnerability scan',
                 'timeout': 45,
-                'retry_on_failure': False
+                'retry_on_failure': False,
+                'cost': {'cpu': 0.5, 'rss_mb': 32},
+                'inputs': ['glob:*.js']
             },
             
             # Important Tests (Should Pass)
@@ -118,25 +148,44 @@ class EnhancedAutomatedPipeline:
                 'category': TestCategory.IMPORTANT,
                 'description': 'UI components and interactions',
                 'timeout': 90,
-                'retry_on_failure': True
+                'retry_on_failure': True,
+                'cost': {'cpu': 0.2, 'rss_mb': 32},
+                'inputs': ['file:index.html']
             },
             'performance_benchmarks': {
                 'category': TestCategory.IMPORTANT,
-                'description': 'Performance and load time tests',
-                'timeout': 60,
-                'retry_on_failure': True
+                'description': 'Repeated cold/warm page-load benchmark',
+                'timeout': 180,
+                'retry_on_failure': False,  # samples are already repeated; a retry would just re-roll them
+                'exclusive': True,  # timed alone, after everything else has finished
+                'cost': {'cpu': 1.0, 'rss_mb': 400},
+                'inputs': ['entry:index.html']
             },
             'accessibility_audit': {
                 'category': TestCategory.IMPORTANT,
                 'description': 'Accessibility compliance check',
                 'timeout': 45,
-                'retry_on_failure': True
+                'retry_on_failure': True,
+                'cost': {'cpu': 0.3, 'rss_mb': 32},
+                'inputs': ['glob:*.html']
             },
             'selenium_e2e': {
                 'category': TestCategory.IMPORTANT,
                 'description': 'Selenium end-to-end testing',
                 'timeout': 120,
-                'retry_on_failure': True
+                'retry_on_failure': True,
+                'browsers': 'selenium',
+                'cost': {'cpu': 1.5, 'rss_mb': 700},
+                'inputs': ['entry:index.html']
+            },
+            'browser_smoke': {
+                'category': TestCategory.IMPORTANT,
+                'description': 'Playwright smoke test on every configured engine',
+                'timeout': 60,
+                'retry_on_failure': True,
+                'browsers': 'playwright',
+                'cost': {'cpu': 1.0, 'rss_mb': 450},
+                'inputs': ['entry:index.html']
             },
             
             # Nice-to-have Tests (Can Fail)
@@ -144,79 +193,71 @@ class EnhancedAutomatedPipeline:
                 'category': TestCategory.NICE_TO_HAVE,
                 'description': 'Visual regression testing',
                 'timeout': 60,
-                'retry_on_failure': False
+                'retry_on_failure': False,
+                'cost': {'cpu': 0.1, 'rss_mb': 16},
+                'inputs': ['entry:index.html', 'glob:*.css']
             },
             'edge_case_handling': {
                 'category': TestCategory.NICE_TO_HAVE,
                 'description': 'Edge case and error handling',
                 'timeout': 45,
-                'retry_on_failure': False
+                'retry_on_failure': False,
+                'cost': {'cpu': 0.1, 'rss_mb': 16},
+                'inputs': ['entry:index.html']
             }
         }
 
     def _smart_test_selection(self) -> List[str]:
-        """Intelligently select tests based on git changes"""
+        """Select the tests whose inputs under src/ (see impact_analysis) a git change touches"""
         if not self.config['enable_smart_selection']:
             return list(self.test_definitions.keys())
         
         try:
-            # Get changed files from git
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', 'HEAD~1', 'HEAD'],
-                capture_output=True, text=True, cwd=self.project_root
-            )
-            
-            if result.returncode != 0:
-                logger.warning("Could not determine git changes, running all tests")
-                return list(self.test_definitions.keys())
-            
-            changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            # Determine which tests to run based on changes
-            selected_tests = []
-            
-            # Always run critical tests
-            for test_name, test_def in self.test_definitions.items():
-                if test_def['category'] == TestCategory.CRITICAL:
-                    selected_tests.append(test_name)
-            
-            # Add tests based on file changes
-            for file_path in changed_files:
-                if any(pattern in file_path for pattern in ['src/', 'js/', 'html', 'css']):
-                    if 'ui_functionality' not in selected_tests:
-                        selected_tests.append('ui_functionality')
-                    if 'selenium_e2e' not in selected_tests:
-                        selected_tests.append('selenium_e2e')
-                
-                if 'security' in file_path or 'auth' in file_path:
-                    if 'security_scan' not in selected_tests:
-                        selected_tests.append('security_scan')
-                
-                if any(pattern in file_path for pattern in ['performance', 'optimization']):
-                    if 'performance_benchmarks' not in selected_tests:
-                        selected_tests.append('performance_benchmarks')
-            
-            logger.info(f"🎯 Smart selection: Running {len(selected_tests)}/{len(self.test_definitions)} tests")
-            return selected_tests
-            
-        except Exception as e:
-            logger.warning(f"Smart selection failed: {e}, running all tests")
+            changed = changed_files(self.project_root, self.config['changes'])
+        except ImpactError as e:
+            logger.warning(f"Could not determine git changes, running all tests: {e}")
             return list(self.test_definitions.keys())
+        
+        # 'entry:' inputs cover a page and every module it loads
+        graph = ModuleGraph.build(SourceSnapshot.capture(self.project_root / 'src'))
+        inputs = {name: test_def['inputs'] for name, test_def in self.test_definitions.items()}
+        impact = select_checks(changed, inputs, graph)
+        # Critical tests run on every change, affected or not
+        always = [name for name, test_def in self.test_definitions.items()
+                  if test_def['category'] == TestCategory.CRITICAL and name not in impact.selected]
+        selected = [name for name in self.test_definitions if name in impact.selected or name in always]
+        self.impact = {'mode': self.config['changes'], **impact.to_dict(), 'always_run': always}
+        self.impact['skipped'] = [name for name in impact.skipped if name not in always]
+        
+        for test_name in impact.selected:
+            logger.info(f"   {test_name}: {', '.join(impact.reasons[test_name][:3])}")
+        for test_name in always:
+            logger.info(f"   {test_name}: critical, always run")
+        logger.info(f"🎯 Smart selection: Running {len(selected)}/{len(self.test_definitions)} tests "
+                    f"for {len(changed)} changed file(s)")
+        return selected
 
-    def _run_test(self, test_name: str) -> TestResult:
-        """Run a single test with error handling and retries"""
+    def _run_admitted(self, test_name: str, engine: Optional[str] = None) -> TestResult:
+        """Run a test once the governor has room for its declared resource cost"""
+        with self.governor.admit(ResourceCost.from_definition(self.test_definitions[test_name])):
+            return self._run_test(test_name, engine)
+
+    def _run_test(self, test_name: str, engine: Optional[str] = None) -> TestResult:
+        """Run a single test (on one browser engine, for browser tests) with error handling and retries"""
         test_def = self.test_definitions[test_name]
+        label = BrowserCell(test_name, test_def['browsers'], engine).name if engine else test_name
         start_time = time.time()
         
         result = TestResult(
-            name=test_name,
+            name=label,
             category=test_def['category'],
             status=TestStatus.RUNNING,
             duration=0,
-            max_retries=test_def.get('retry_on_failure', False) and self.config['retry_attempts'] or 0
+            max_retries=test_def.get('retry_on_failure', False) and self.config['retry_attempts'] or 0,
+            engine=engine
         )
         
-        logger.info(f"🧪 Running {test_name} ({test_def['category'].value})")
+        logger.info(f"🧪 Running {label} ({test_def['category'].value})")
         
         try:
             # Execute the specific test
@@ -233,7 +274,9 @@ class EnhancedAutomatedPipeline:
             elif test_name == 'accessibility_audit':
                 result = self._test_accessibility_audit(result)
             elif test_name == 'selenium_e2e':
-                result = self._test_selenium_e2e(result)
+                result = self._test_selenium_e2e(result, engine or 'chrome')
+            elif test_name == 'browser_smoke':
+                result = self._test_browser_smoke(result, engine or 'chromium')
             elif test_name == 'visual_regression':
                 result = self._test_visual_regression(result)
             elif test_name == 'edge_case_handling':
@@ -245,27 +288,24 @@ class EnhancedAutomatedPipeline:
             result.duration = time.time() - start_time
             
             if result.status == TestStatus.PASSED:
-                logger.info(f"✅ {test_name} passed in {result.duration:.2f}s")
+                logger.info(f"✅ {label} passed in {result.duration:.2f}s")
             else:
-                logger.error(f"❌ {test_name} failed: {result.error}")
+                logger.error(f"❌ {label} failed: {result.error}")
                 
         except Exception as e:
             result.duration = time.time() - start_time
             result.status = TestStatus.FAILED
             result.error = f"Unexpected error: {str(e)}"
-            logger.error(f"💥 {test_name} crashed: {e}")
+            logger.error(f"💥 {label} crashed: {e}")
         
         return result
 
     def _test_app_loading(self, result: TestResult) -> TestResult:
         """Test that the app loads successfully"""
         try:
-            # Start local server
-            server_thread = self._start_local_server()
-            time.sleep(2)
-            
-            # Test app loading
-            response = requests.get('http://127.0.0.1:8001', timeout=10)
+            # Test app loading against the shared in-memory server
+            with shared_server() as server:
+                response = requests.get(server.url, timeout=10)
             if response.status_code == 200 and 'workout' in response.text.lower():
                 result.status = TestStatus.PASSED
                 result.details = {'status_code': response.status_code, 'content_length': len(response.text)}
@@ -273,9 +313,6 @@ class EnhancedAutomatedPipeline:
                 result.status = TestStatus.FAILED
                 result.error = f"App failed to load properly: {response.status_code}"
             
-            # Stop server
-            self._stop_local_server()
-            
         except Exception as e:
             result.status = TestStatus.FAILED
             result.error = f"App loading test failed: {str(e)}"
@@ -329,12 +366,9 @@ class EnhancedAutomatedPipeline:
             # Fixed version of the UI functionality test
             # This addresses the "list index out of range" error
             
-            # Start local server
-            server_thread = self._start_local_server()
-            time.sleep(2)
-            
             # Test basic UI elements
-            response = requests.get('http://127.0.0.1:8001', timeout=10)
+            with shared_server() as server:
+                response = requests.get(server.url, timeout=10)
             if response.status_code != 200:
                 result.status = TestStatus.FAILED
                 result.error = f"Failed to load app: {response.status_code}"
@@ -364,9 +398,6 @@ class EnhancedAutomatedPipeline:
                     'total_elements': len(required_elements)
                 }
             
-            # Stop server
-            self._stop_local_server()
-            
         except Exception as e:
             result.status = TestStatus.FAILED
             result.error = f"UI functionality test failed: {str(e)}"
@@ -374,45 +405,29 @@ class EnhancedAutomatedPipeline:
         return result
 
     def _test_performance_benchmarks(self, result: TestResult) -> TestResult:
-        """Test performance and load times"""
+        """Benchmark repeated cold and warm page loads against this runner's benchmark history"""
         try:
-            # Start local server
-            server_thread = self._start_local_server()
-            time.sleep(2)
-            
-            # Measure load time
-            start_time = time.time()
-            response = requests.get('http://127.0.0.1:8001', timeout=10)
-            load_time = time.time() - start_time
-            
-            # Check file sizes
-            js_files = list(self.project_root.glob('src/**/*.js'))
-            total_js_size = sum(f.stat().st_size for f in js_files)
-            
-            # Performance thresholds
-            max_load_time = 3.0  # seconds
-            max_js_size = 500000  # 500KB
-            
-            issues = []
-            if load_time > max_load_time:
-                issues.append(f"Load time too slow: {load_time:.2f}s > {max_load_time}s")
-            if total_js_size > max_js_size:
-                issues.append(f"JS bundle too large: {total_js_size} bytes > {max_js_size} bytes")
-            
-            if issues:
-                result.status = TestStatus.FAILED
-                result.error = "; ".join(issues)
-            else:
-                result.status = TestStatus.PASSED
-                result.details = {
-                    'load_time': load_time,
-                    'total_js_size': total_js_size,
-                    'js_files_count': len(js_files)
-                }
-            
-            # Stop server
-            self._stop_local_server()
-            
+            samples = benchmark_with_playwright(samples=self.config['page_load_samples'])
+            # The baseline is the pooled samples of this runner's recent runs; the run
+            # is then appended, so every pipeline run extends the history
+            fingerprint = runner_fingerprint()
+            with BenchHistory() as history:
+                report = evaluate(samples, history.baseline(fingerprint[0]))
+                run_id = history.record(samples, fingerprint=fingerprint, source='enhanced_pipeline')
+            result.status = TestStatus.FAILED if report['regressions'] else TestStatus.PASSED
+            result.error = "; ".join(report['regressions']) or None
+            result.details = {
+                'summary': report['summary'],
+                'comparisons': report['comparisons'],
+                'baseline_found': report['baseline_found'],
+                'fingerprint': fingerprint[0],
+                'recorded_run': run_id,
+            }
+        except BenchmarkUnavailable as e:
+            # Chromium is not installed on this host: nothing was measured or recorded
+            result.status = TestStatus.SKIPPED
+            result.error = str(e)
+            result.details = {'recorded_run': None}
         except Exception as e:
             result.status = TestStatus.FAILED
             result.error = f"Performance test failed: {str(e)}"
@@ -452,8 +467,8 @@ class EnhancedAutomatedPipeline:
         
         return result
 
-    def _test_selenium_e2e(self, result: TestResult) -> TestResult:
-        """Run Selenium end-to-end tests"""
+    def _test_selenium_e2e(self, result: TestResult, browser: str = 'chrome') -> TestResult:
+        """Run Selenium end-to-end tests on one browser"""
         try:
             # Run the existing Selenium test suite
             selenium_script = self.project_root / 'ci-cd' / 'final_selenium_test.py'
@@ -462,15 +477,19 @@ class EnhancedAutomatedPipeline:
                 result.error = "Selenium test script not found"
                 return result
             
-            # Execute Selenium tests
-            process = subprocess.run(
-                [sys.executable, str(selenium_script)],
-                capture_output=True, text=True, timeout=120, cwd=self.project_root
-            )
+            # Execute Selenium tests; each engine writes its own results file
+            output = self.project_root / 'reports' / 'test_results' / f'final_selenium_{browser}.json'
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with shared_server() as server:
+                process = subprocess.run(
+                    [sys.executable, str(selenium_script), '--browser', browser,
+                     '--base-url', server.url, '--output', str(output)],
+                    capture_output=True, text=True, timeout=120, cwd=self.project_root
+                )
             
             if process.returncode == 0:
                 result.status = TestStatus.PASSED
-                result.details = {'selenium_tests_passed': True}
+                result.details = {'selenium_tests_passed': True, 'browser': browser}
             else:
                 result.status = TestStatus.FAILED
                 result.error = f"Selenium tests failed: {process.stderr}"
@@ -484,6 +503,22 @@ class EnhancedAutomatedPipeline:
         
         return result
 
+    def _test_browser_smoke(self, result: TestResult, engine: str = 'chromium') -> TestResult:
+        """Run the deterministic E2E smoke check on one Playwright engine"""
+        try:
+            with shared_server() as server:
+                smoke = run_dynamic_smoke(engine, server.url)
+            errors = smoke.get('errors') or [smoke.get('details', '')]
+            # Engines without a browser binary never get a cell, so any error here is a failure
+            result.status = TestStatus.PASSED if smoke.get('status') == 'PASSED' else TestStatus.FAILED
+            result.error = None if result.status == TestStatus.PASSED else "; ".join(str(e) for e in errors)
+            result.details = {'engine': engine, 'checks': smoke.get('checks', {})}
+        except Exception as e:
+            result.status = TestStatus.FAILED
+            result.error = f"Browser smoke test failed on {engine}: {str(e)}"
+        
+        return result
+
     def _test_visual_regression(self, result: TestResult) -> TestResult:
         """Test visual regression (placeholder)"""
         try:
@@ -508,25 +543,6 @@ class EnhancedAutomatedPipeline:
         
         return result
 
-    def _start_local_server(self) -> threading.Thread:
-        """Start local development server"""
-        def run_server():
-            os.chdir(self.project_root / 'src')
-            os.system('python3 -m http.server 8001 > /dev/null 2>&1')
-        
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-        return server_thread
-
-    def _stop_local_server(self):
-        """Stop local development server"""
-        try:
-            # Kill any process using port 8001
-            subprocess.run(['pkill', '-f', 'python3 -m http.server 8001'], 
-                         capture_output=True)
-        except:
-            pass
-
     def run_pipeline(self) -> bool:
         """Run the enhanced pipeline with parallel execution"""
         logger.info("🚀 Starting Enhanced Automated Test Pipeline")
@@ -537,31 +553,75 @@ class EnhancedAutomatedPipeline:
             selected_tests = self._smart_test_selection()
             logger.info(f"🎯 Selected {len(selected_tests)} tests for execution")
             
+            # Browser tests fan out into one cell per configured engine that is installed here;
+            # missing engines are reported, not turned into SKIPPED results
+            installed_engines, missing_engines = split_installed(self.engines)
+            for runner, names in missing_engines.items():
+                logger.warning(f"⚠️ {runner} engines not installed, not run: {', '.join(names)}")
+            plain_tests, cells = expand(selected_tests, self.test_definitions, installed_engines)
+            # Exclusive tests (the page-load benchmark) would time the parallel tests' load; they run afterwards
+            exclusive_tests = [name for name in plain_tests if self.test_definitions[name].get('exclusive')]
+            plain_tests = [name for name in plain_tests if name not in exclusive_tests]
+            browser_workers = matrix_workers(len(cells))
+            
             # Phase 2: Parallel test execution
             logger.info(f"⚡ Running tests in parallel with {self.parallel_workers} workers")
-            
-            with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-                # Submit all tests
-                future_to_test = {
-                    executor.submit(self._run_test, test_name): test_name 
-                    for test_name in selected_tests
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_test):
-                    test_name = future_to_test[future]
-                    try:
-                        test_result = future.result()
+            if cells:
+                logger.info(f"🌐 Running {len(cells)} browser cells on {browser_workers} concurrent browsers")
+            
+            # Hold one server for the whole run on an OS-assigned port; the
+            # server-backed tests borrow it instead of starting and killing their own.
+            # Browser cells get their own bounded pool so they run alongside the plain tests.
+            matrix_start = time.time()
+            matrix_end = matrix_start
+            with shared_server(port=0):
+                with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor, \
+                        ThreadPoolExecutor(max_workers=max(1, browser_workers)) as browser_executor:
+                    # Submit all tests
+                    future_to_test = {
+                        executor.submit(self._run_admitted, test_name): (test_name, None)
+                        for test_name in plain_tests
+                    }
+                    future_to_test.update({
+                        browser_executor.submit(self._run_admitted, cell.test, cell.engine): (cell.test, cell.engine)
+                        for cell in cells
+                    })
+                    
+                    # Collect results as they complete
+                    for future in as_completed(future_to_test):
+                        test_name, engine = future_to_test[future]
+                        try:
+                            test_result = future.result()
+                        except Exception as e:
+                            logger.error(f"💥 Test {test_name} crashed: {e}")
+                            test_result = TestResult(
+                                name=f"{test_name}[{engine}]" if engine else test_name,
+                                category=self.test_definitions[test_name]['category'],
+                                status=TestStatus.FAILED,
+                                duration=0,
+                                error=f"Test execution crashed: {str(e)}",
+                                engine=engine
+                            )
                         self.test_results.append(test_result)
-                    except Exception as e:
-                        logger.error(f"💥 Test {test_name} crashed: {e}")
-                        self.test_results.append(TestResult(
-                            name=test_name,
-                            category=self.test_definitions[test_name]['category'],
-                            status=TestStatus.FAILED,
-                            duration=0,
-                            error=f"Test execution crashed: {str(e)}"
-                        ))
+                        if engine:
+                            matrix_end = time.time()
+                
+                # _run_test turns any error into a FAILED result, so these need no crash handling
+                for test_name in exclusive_tests:
+                    logger.info(f"⏱️ Running {test_name} alone")
+                    self.test_results.append(self._run_test(test_name))
+            
+            self.browser_matrix = {
+                'workers': browser_workers,
+                'cells': len(cells),
+                'engines_configured': {runner: list(names) for runner, names in self.engines.items()},
+                'engines_missing': {runner: list(names) for runner, names in missing_engines.items()},
+                'wall_seconds': round(matrix_end - matrix_start, 3) if cells else 0.0,
+                'by_engine': engine_summary(
+                    (f"{self._runner_of(r)}:{r.engine}", r.status.value, r.duration)
+                    for r in self.test_results if r.engine
+                ),
+            }
             
             # Phase 3: Analyze results
             self._analyze_results()
@@ -579,6 +639,10 @@ class EnhancedAutomatedPipeline:
             logger.error(f"💥 Pipeline failed: {str(e)}")
             return False
 
+    def _runner_of(self, result: TestResult) -> str:
+        """Browser runner ('selenium' or 'playwright') of a per-engine result"""
+        return self.test_definitions[result.name.split('[', 1)[0]]['browsers']
+
     def _analyze_results(self):
         """Analyze test results and categorize by status"""
         self.analysis = {
@@ -598,12 +662,16 @@ class EnhancedAutomatedPipeline:
         for result in self.test_results:
             self.analysis['by_category'][result.category.value].append(result)
         
-        # Calculate success rates
+        # Calculate success rates over the tests that ran; SKIPPED results verified nothing
+        # and are left out, but a category where everything was skipped has not passed
         for category in TestCategory:
             category_results = self.analysis['by_category'][category.value]
-            if category_results:
-                passed_count = len([r for r in category_results if r.status == TestStatus.PASSED])
-                self.analysis[f'{category.value}_success_rate'] = passed_count / len(category_results)
+            ran = [r for r in category_results if r.status != TestStatus.SKIPPED]
+            if ran:
+                passed_count = len([r for r in ran if r.status == TestStatus.PASSED])
+                self.analysis[f'{category.value}_success_rate'] = passed_count / len(ran)
+            elif category_results:
+                self.analysis[f'{category.value}_success_rate'] = 0.0
             else:
                 self.analysis[f'{category.value}_success_rate'] = 1.0
 
@@ -615,11 +683,19 @@ class EnhancedAutomatedPipeline:
         critical_ready = critical_rate >= self.config['critical_threshold']
         important_ready = important_rate >= self.config['important_threshold']
         
-        release_ready = critical_ready and important_ready
+        # Rates default to 100% for empty categories; a run that executed nothing verified nothing
+        ran = self.analysis['total_tests'] - self.analysis['skipped']
+        release_ready = critical_ready and important_ready and ran > 0
+        if ran == 0:
+            logger.warning("⚠️ No tests ran, nothing was verified")
         
         logger.info(f"📊 Release Readiness Analysis:")
         logger.info(f"   Critical Tests: {critical_rate:.1%} (threshold: {self.config['critical_threshold']:.1%})")
         logger.info(f"   Important Tests: {important_rate:.1%} (threshold: {self.config['important_threshold']:.1%})")
+        if self.analysis['skipped']:
+            logger.info(f"   Skipped (not counted): {self.analysis['skipped']}")
+        for runner, names in self.browser_matrix.get('engines_missing', {}).items():
+            logger.info(f"   Not verified on {runner}: {', '.join(names)} (not installed)")
         logger.info(f"   Release Ready: {'✅ YES' if release_ready else '❌ NO'}")
         
         return release_ready
@@ -640,11 +716,22 @@ class EnhancedAutomatedPipeline:
                     'status': r.status.value,
                     'duration': r.duration,
                     'error': r.error,
-                    'details': r.details
+                    'details': r.details,
+                    'engine': r.engine
                 }
                 for r in self.test_results
             ],
-            'analysis': self.analysis,
+            'browser_matrix': self.browser_matrix,
+            'admission': self.governor.snapshot(),
+            'impact': self.impact,
+            # by_category holds TestResult objects; the report lists their names
+            'analysis': {
+                **self.analysis,
+                'by_category': {
+                    category: [r.name for r in results]
+                    for category, results in self.analysis['by_category'].items()
+                },
+            },
             'release_ready': self._determine_release_readiness(),
             'config': self.config
         }
@@ -659,6 +746,11 @@ class EnhancedAutomatedPipeline:
         logger.info(f"📊 Report saved to: {report_path}")
 
 if __name__ == "__main__":
-    pipeline = EnhancedAutomatedPipeline()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Enhanced Automated Pipeline')
+    parser.add_argument('--changes', default='HEAD~1..HEAD', metavar='worktree|staged|RANGE',
+                        help='Git change set that selects the tests to run (default: HEAD~1..HEAD)')
+    pipeline = EnhancedAutomatedPipeline(changes=parser.parse_args().changes)
     success = pipeline.run_pipeline()
     sys.exit(0 if success else 1)
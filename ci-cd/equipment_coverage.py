@@ -0,0 +1,140 @@
+"""Bitmask index for checking exercise coverage across equipment combinations.
+
+Every piece of equipment gets one bit. For each ``(type, level)`` bucket the
+index stores how many exercises use each piece of equipment. The count for any
+equipment subset is therefore a sum over the subset's bits. The sum is taken
+over 8-bit chunks with precomputed tables, so a query costs ``n / 8`` lookups
+instead of a rescan of the exercise list.
+
+Adding equipment can only add exercises, so the subsets that fail a
+requirement are closed under taking subsets. ``failures`` walks that family
+depth-first and prunes at the first passing subset, so the work grows with the
+number of failures rather than with ``2^n``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+
+DEFAULT_LEVELS: Tuple[str, ...] = ("Beginner", "Intermediate", "Advanced")
+DEFAULT_REQUIREMENTS: Tuple[Tuple[str, int], ...] = (("warmup", 5), ("main", 10), ("cooldown", 5))
+ALWAYS_AVAILABLE: Tuple[str, ...] = ("Bodyweight",)
+
+_CHUNK_BITS = 8
+_CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+
+
+@dataclass(frozen=True)
+class CoverageFailure:
+    mask: int
+    equipment: Tuple[str, ...]
+    level: str
+    available: Mapping[str, int]
+
+
+class EquipmentCoverageIndex:
+    """Per-(type, level) equipment counts with O(n/8) subset queries."""
+
+    def __init__(
+        self,
+        exercises: Iterable[Mapping[str, object]],
+        levels: Sequence[str] = DEFAULT_LEVELS,
+        requirements: Sequence[Tuple[str, int]] = DEFAULT_REQUIREMENTS,
+        always_available: Sequence[str] = ALWAYS_AVAILABLE,
+    ):
+        exercises = list(exercises)
+        self.levels = tuple(levels)
+        self.requirements = tuple(requirements)
+        self.always_available = frozenset(always_available)
+        self.equipment: Tuple[str, ...] = tuple(sorted({str(exercise["equipment"]) for exercise in exercises}))
+        self._bit = {name: index for index, name in enumerate(self.equipment)}
+
+        buckets = [(etype, level) for etype, _minimum in self.requirements for level in self.levels]
+        per_equipment: Dict[Tuple[str, str], List[int]] = {bucket: [0] * len(self.equipment) for bucket in buckets}
+        self._base: Dict[Tuple[str, str], int] = {bucket: 0 for bucket in buckets}
+        for exercise in exercises:
+            equipment = str(exercise["equipment"])
+            exercise_levels = exercise["level"]
+            if isinstance(exercise_levels, str):
+                exercise_levels = [exercise_levels]
+            for level in exercise_levels:
+                bucket = (str(exercise["type"]), level)
+                if bucket not in per_equipment:
+                    continue
+                if equipment in self.always_available:
+                    self._base[bucket] += 1
+                else:
+                    per_equipment[bucket][self._bit[equipment]] += 1
+
+        self._chunks = (len(self.equipment) + _CHUNK_BITS - 1) // _CHUNK_BITS
+        self._tables: Dict[Tuple[str, str], List[List[int]]] = {
+            bucket: [self._chunk_table(counts[chunk * _CHUNK_BITS:(chunk + 1) * _CHUNK_BITS]) for chunk in range(self._chunks)]
+            for bucket, counts in per_equipment.items()
+        }
+
+    @staticmethod
+    def _chunk_table(counts: Sequence[int]) -> List[int]:
+        table = [0] * (1 << len(counts))
+        for mask in range(1, len(table)):
+            low = mask & -mask
+            table[mask] = table[mask ^ low] + counts[low.bit_length() - 1]
+        return table
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << len(self.equipment)) - 1
+
+    @property
+    def total_combinations(self) -> int:
+        return (1 << len(self.equipment)) * len(self.levels)
+
+    def mask(self, equipment: Iterable[str]) -> int:
+        mask = 0
+        for name in equipment:
+            mask |= 1 << self._bit[name]
+        return mask
+
+    def names(self, mask: int) -> Tuple[str, ...]:
+        return tuple(name for index, name in enumerate(self.equipment) if mask >> index & 1)
+
+    def count(self, mask: int, etype: str, level: str) -> int:
+        """Exercises of ``etype`` at ``level`` usable with the equipment in ``mask``."""
+        bucket = (etype, level)
+        total = self._base[bucket]
+        tables = self._tables[bucket]
+        for chunk in range(self._chunks):
+            total += tables[chunk][(mask >> (chunk * _CHUNK_BITS)) & _CHUNK_MASK]
+        return total
+
+    def available(self, mask: int, level: str) -> Dict[str, int]:
+        return {etype: self.count(mask, etype, level) for etype, _minimum in self.requirements}
+
+    def passes(self, mask: int, level: str) -> bool:
+        return all(self.count(mask, etype, level) >= minimum for etype, minimum in self.requirements)
+
+    def failures(self, level: str) -> Iterator[CoverageFailure]:
+        """Every failing subset at ``level``, in canonical (lowest-bit-first) DFS order."""
+        if self.passes(0, level):
+            return
+        stack = [(0, 0)]
+        while stack:
+            mask, next_bit = stack.pop()
+            yield CoverageFailure(mask, self.names(mask), level, self.available(mask, level))
+            for bit in range(len(self.equipment) - 1, next_bit - 1, -1):
+                child = mask | (1 << bit)
+                if not self.passes(child, level):
+                    stack.append((child, bit + 1))
+
+    def maximal_failures(self, level: str) -> List[CoverageFailure]:
+        """Failing subsets that pass as soon as any one more piece of equipment is added."""
+        maximal = []
+        for failure in self.failures(level):
+            if all(
+                self.passes(failure.mask | (1 << bit), level)
+                for bit in range(len(self.equipment))
+                if not failure.mask >> bit & 1
+            ):
+                maximal.append(failure)
+        return maximal
@@ -0,0 +1,144 @@
+"""Typed exercise records parsed from ``src/js/core/exercise-database.js``.
+
+The ``exercises`` array literal is streamed through ``js_literal`` in one
+linear pass. Every element becomes a frozen ``ExerciseRecord``. Elements
+that lack a required field are reported as issues instead of being dropped
+silently. Parsed catalogs are cached by the file's sha256, so every
+database check in a run (and every rerun in ``--watch`` mode) shares one
+parse until the file actually changes.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from js_literal import iter_declared_array
+from source_snapshot import SourceFile
+
+
+DECLARATION = "exercises"
+REQUIRED_FIELDS: Tuple[str, ...] = ("name", "equipment", "level", "muscle", "type")
+_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class ExerciseRecord:
+    name: str
+    equipment: str
+    levels: Tuple[str, ...]
+    muscle: str
+    type: str
+    difficulty: Optional[int]
+    alternatives: Tuple[str, ...]
+    injury_safe: Tuple[str, ...]
+    equipment_needed: Tuple[str, ...]
+    muscle_groups: Tuple[str, ...]
+    description: str
+    line: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The ``{name, equipment, level, muscle, type}`` shape used by the coverage index."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "equipment": self.equipment,
+            "level": list(self.levels),
+            "muscle": self.muscle,
+            "type": self.type,
+        }
+
+
+@dataclass(frozen=True)
+class ExerciseCatalog:
+    path: str
+    sha256: str
+    records: Tuple[ExerciseRecord, ...]
+    issues: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return [record.as_dict() for record in self.records]
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(record.name for record in self.records)
+
+    def types(self) -> Tuple[str, ...]:
+        return tuple(sorted({record.type for record in self.records}))
+
+    def equipment(self) -> Tuple[str, ...]:
+        return tuple(sorted({record.equipment for record in self.records}))
+
+    def levels(self) -> Tuple[str, ...]:
+        return tuple(sorted({level for record in self.records for level in record.levels}))
+
+
+def _strings(value: Any) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, list):
+        return tuple(item for item in value if isinstance(item, str))
+    return ()
+
+
+def _record(entry: Mapping[str, Any], line: int) -> ExerciseRecord:
+    difficulty = entry.get("difficulty")
+    return ExerciseRecord(
+        name=str(entry["name"]),
+        equipment=str(entry["equipment"]),
+        levels=_strings(entry["level"]),
+        muscle=str(entry["muscle"]),
+        type=str(entry["type"]),
+        difficulty=int(difficulty) if isinstance(difficulty, (int, float)) and not isinstance(difficulty, bool) else None,
+        alternatives=_strings(entry.get("alternatives")),
+        injury_safe=_strings(entry.get("injury_safe")),
+        equipment_needed=_strings(entry.get("equipment_needed")),
+        muscle_groups=_strings(entry.get("muscle_groups")),
+        description=entry.get("description") if isinstance(entry.get("description"), str) else "",
+        line=line,
+    )
+
+
+def parse_catalog(source: SourceFile) -> ExerciseCatalog:
+    """Parse ``source``; raises ``JSLiteralError`` if the array literal is malformed."""
+    if source.text is None:
+        raise ValueError(f"{source.path} is not UTF-8 text")
+    records: List[ExerciseRecord] = []
+    issues: List[str] = []
+    for offset, entry in iter_declared_array(source.text, DECLARATION):
+        line = source.line_of(offset)
+        if not isinstance(entry, dict):
+            issues.append(f"line {line}: entry is not an object")
+            continue
+        missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+        if missing:
+            label = entry.get("name") or "<unnamed>"
+            issues.append(f"line {line}: {label} is missing {', '.join(missing)}")
+            continue
+        records.append(_record(entry, line))
+    return ExerciseCatalog(source.path, source.sha256, tuple(records), tuple(issues))
+
+
+_cache: "OrderedDict[str, ExerciseCatalog]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_catalog(source: SourceFile) -> ExerciseCatalog:
+    """``parse_catalog`` with results shared by content hash."""
+    with _cache_lock:
+        cached = _cache.get(source.sha256)
+        if cached is not None:
+            _cache.move_to_end(source.sha256)
+            return cached
+    catalog = parse_catalog(source)
+    with _cache_lock:
+        _cache[source.sha256] = catalog
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return catalog
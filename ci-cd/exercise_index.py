@@ -0,0 +1,182 @@
+"""Relational lookups over the parsed exercise catalogue.
+
+``ExerciseIndex`` builds hash indexes over the ``ExerciseRecord`` values from
+``exercise_catalog``. Lookups by name, by ``(type, level, equipment)`` slot
+and by muscle are O(1). There are also inverted indexes over
+``alternatives`` (which exercises list X as an alternative) and
+``injury_safe`` (which exercises are safe for a condition).
+``integrity_issues`` checks the cross-references that the JavaScript side
+assumes but never enforces.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from equipment_coverage import DEFAULT_LEVELS
+from exercise_catalog import ExerciseCatalog, ExerciseRecord, load_catalog
+from source_snapshot import SourceFile
+
+
+EXERCISE_TYPES: Tuple[str, ...] = ("warmup", "main", "cooldown")
+_CACHE_SIZE = 8
+
+Slot = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class IntegrityIssue:
+    kind: str
+    exercise: str
+    detail: str
+    line: int
+
+    def describe(self) -> str:
+        return f"line {self.line}: {self.exercise}: {self.detail}"
+
+
+def _group(pairs: Iterable[Tuple[str, ExerciseRecord]]) -> Dict[str, Tuple[ExerciseRecord, ...]]:
+    grouped: Dict[str, List[ExerciseRecord]] = {}
+    for key, record in pairs:
+        grouped.setdefault(key, []).append(record)
+    return {key: tuple(records) for key, records in grouped.items()}
+
+
+class ExerciseIndex:
+    """Hash indexes over exercise records; every lookup returns records in database order."""
+
+    def __init__(
+        self,
+        records: Iterable[ExerciseRecord],
+        levels: Sequence[str] = DEFAULT_LEVELS,
+        types: Sequence[str] = EXERCISE_TYPES,
+    ):
+        self.records: Tuple[ExerciseRecord, ...] = tuple(records)
+        self.levels = tuple(levels)
+        self.types = tuple(types)
+        self._by_name = _group((record.name, record) for record in self.records)
+        self._by_muscle = _group((record.muscle, record) for record in self.records)
+        self._listed_as_alternative = _group(
+            (alternative, record) for record in self.records for alternative in dict.fromkeys(record.alternatives)
+        )
+        self._safe_for = _group(
+            (condition, record) for record in self.records for condition in dict.fromkeys(record.injury_safe)
+        )
+        slots: Dict[Slot, List[ExerciseRecord]] = {}
+        for record in self.records:
+            for level in dict.fromkeys(record.levels):
+                slots.setdefault((record.type, level, record.equipment), []).append(record)
+        self._by_slot: Dict[Slot, Tuple[ExerciseRecord, ...]] = {slot: tuple(items) for slot, items in slots.items()}
+
+    @classmethod
+    def from_catalog(cls, catalog: ExerciseCatalog) -> "ExerciseIndex":
+        return cls(catalog.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ExerciseRecord]:
+        return iter(self.records)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def named(self, name: str) -> Tuple[ExerciseRecord, ...]:
+        """All entries called ``name``; the same movement may appear once per workout phase."""
+        return self._by_name.get(name, ())
+
+    def get(self, name: str, etype: Optional[str] = None) -> Optional[ExerciseRecord]:
+        for record in self.named(name):
+            if etype is None or record.type == etype:
+                return record
+        return None
+
+    def slot(self, etype: str, level: str, equipment: str) -> Tuple[ExerciseRecord, ...]:
+        return self._by_slot.get((etype, level, equipment), ())
+
+    def slots(self) -> Tuple[Slot, ...]:
+        return tuple(self._by_slot)
+
+    def for_muscle(self, muscle: str) -> Tuple[ExerciseRecord, ...]:
+        return self._by_muscle.get(muscle, ())
+
+    def muscles(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._by_muscle))
+
+    def alternatives(self, name: str) -> Tuple[ExerciseRecord, ...]:
+        """Entries that the exercises called ``name`` list as alternatives (unknown names are skipped)."""
+        resolved: Dict[int, ExerciseRecord] = {}
+        for record in self.named(name):
+            for alternative in record.alternatives:
+                for candidate in self.named(alternative):
+                    resolved.setdefault(id(candidate), candidate)
+        return tuple(resolved.values())
+
+    def listed_as_alternative(self, name: str) -> Tuple[ExerciseRecord, ...]:
+        """Inverse of ``alternatives``: entries that name ``name`` as one of their alternatives."""
+        return self._listed_as_alternative.get(name, ())
+
+    def safe_for(self, condition: str) -> Tuple[ExerciseRecord, ...]:
+        return self._safe_for.get(condition, ())
+
+    def conditions(self) -> Tuple[str, ...]:
+        return tuple(sorted(self._safe_for))
+
+    def unique_records(self) -> Tuple[ExerciseRecord, ...]:
+        """Records with repeated ``(name, type)`` entries collapsed to the first occurrence."""
+        seen = set()
+        unique = []
+        for record in self.records:
+            key = (record.name, record.type)
+            if key not in seen:
+                seen.add(key)
+                unique.append(record)
+        return tuple(unique)
+
+    def integrity_issues(self) -> Tuple[IntegrityIssue, ...]:
+        """Dangling alternatives, self references, repeated entries and unknown types or levels."""
+        issues: List[IntegrityIssue] = []
+        first_line: Dict[Tuple[str, str], int] = {}
+        for record in self.records:
+            key = (record.name, record.type)
+            if key in first_line:
+                issues.append(IntegrityIssue(
+                    "duplicate_entry", record.name, f"repeats the {record.type} entry at line {first_line[key]}", record.line
+                ))
+            else:
+                first_line[key] = record.line
+            if record.type not in self.types:
+                issues.append(IntegrityIssue("unknown_type", record.name, f"type {record.type!r}", record.line))
+            for level in record.levels:
+                if level not in self.levels:
+                    issues.append(IntegrityIssue("unknown_level", record.name, f"level {level!r}", record.line))
+            for alternative in record.alternatives:
+                if alternative == record.name:
+                    issues.append(IntegrityIssue("self_alternative", record.name, "lists itself as an alternative", record.line))
+                elif alternative not in self._by_name:
+                    issues.append(IntegrityIssue(
+                        "unknown_alternative", record.name, f"alternative {alternative!r} is not in the database", record.line
+                    ))
+        return tuple(issues)
+
+
+_cache: "OrderedDict[str, ExerciseIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_index(source: SourceFile) -> ExerciseIndex:
+    """Index for ``source``, shared by content hash like ``load_catalog``."""
+    with _cache_lock:
+        cached = _cache.get(source.sha256)
+        if cached is not None:
+            _cache.move_to_end(source.sha256)
+            return cached
+    index = ExerciseIndex.from_catalog(load_catalog(source))
+    with _cache_lock:
+        _cache[source.sha256] = index
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
@@ -0,0 +1,156 @@
+"""Single-pass multi-pattern feature detection for ``app_features.json``.
+
+All detection patterns are compiled into one trie-shaped regular expression
+(shared prefixes are factored, so the engine explores each branch once). The
+regex engine's first-character prefilter skips text that cannot start any
+pattern. Each match start is resumed one character later, so overlapping
+occurrences are found too. Where several patterns start at the same offset,
+the regex reports the longest, and the precomputed prefix closure adds the
+shorter patterns that are prefixes of it. The result is exact: every
+occurrence of every pattern, found in one pass per file.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from source_snapshot import SourceFile
+
+
+def _trie_regex(patterns: Sequence[str]) -> str:
+    trie: Dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if terminal else body
+
+    return build(trie)
+
+
+class PatternMatcher:
+    """Compiled matcher reporting every (overlapping) occurrence of every pattern."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(sorted({pattern for pattern in patterns if pattern}))
+        self._regex = re.compile(_trie_regex(self.patterns)) if self.patterns else None
+        known = set(self.patterns)
+        self._also_matches: Dict[str, Tuple[str, ...]] = {
+            pattern: tuple(pattern[:size] for size in range(1, len(pattern)) if pattern[:size] in known)
+            for pattern in self.patterns
+        }
+
+    def scan(self, text: str) -> Dict[str, List[int]]:
+        """Return ``pattern -> sorted start offsets`` for every pattern found in ``text``."""
+        hits: Dict[str, List[int]] = {}
+        if self._regex is None:
+            return hits
+        search = self._regex.search
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            longest = match.group()
+            hits.setdefault(longest, []).append(start)
+            for prefix in self._also_matches[longest]:
+                hits.setdefault(prefix, []).append(start)
+            match = search(text, start + 1)
+        return hits
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    pattern: str
+    path: str
+    line: int
+    column: int
+
+    def location(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}"
+
+
+@dataclass(frozen=True)
+class FeatureDetection:
+    key: str
+    name: str
+    test_function: Optional[str]
+    html_hits: Tuple[PatternHit, ...]
+    js_hits: Tuple[PatternHit, ...]
+
+    @property
+    def detected(self) -> bool:
+        return bool(self.html_hits or self.js_hits)
+
+    @property
+    def hits(self) -> Tuple[PatternHit, ...]:
+        return self.html_hits + self.js_hits
+
+    def locations(self) -> Dict[str, Dict[str, List[str]]]:
+        """``file -> pattern -> ["line:column", ...]`` for reports."""
+        located: Dict[str, Dict[str, List[str]]] = {}
+        for hit in self.hits:
+            located.setdefault(hit.path, {}).setdefault(hit.pattern, []).append(f"{hit.line}:{hit.column}")
+        return located
+
+
+class FeatureDetector:
+    """Detect ``app_features.json`` features with one scan per source file."""
+
+    def __init__(self, features: Mapping[str, Mapping[str, Any]]):
+        self.features = features
+        patterns = []
+        for feature in features.values():
+            detection = feature.get("detection_patterns", {})
+            patterns.extend(detection.get("html", ()))
+            patterns.extend(detection.get("js", ()))
+        self.matcher = PatternMatcher(patterns)
+        self._scans: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+        self._lock = threading.Lock()
+
+    def scan_file(self, source: SourceFile) -> Dict[str, List[int]]:
+        """Scan ``source`` once; repeated calls for the same content reuse the result."""
+        key = (source.path, source.sha256)
+        with self._lock:
+            cached = self._scans.get(key)
+        if cached is None:
+            cached = self.matcher.scan(source.text or "")
+            with self._lock:
+                self._scans[key] = cached
+        return cached
+
+    def _hits(self, patterns: Iterable[str], sources: Sequence[SourceFile]) -> Tuple[PatternHit, ...]:
+        wanted = list(dict.fromkeys(patterns))
+        hits = []
+        for source in sources:
+            found = self.scan_file(source)
+            for pattern in wanted:
+                for offset in found.get(pattern, ()):
+                    line, column = source.position(offset)
+                    hits.append(PatternHit(pattern, source.path, line, column))
+        return tuple(hits)
+
+    def detect(
+        self, html_sources: Sequence[SourceFile], js_sources: Sequence[SourceFile]
+    ) -> Dict[str, FeatureDetection]:
+        """HTML patterns are matched against ``html_sources`` and JS patterns against ``js_sources``."""
+        detections = {}
+        for key, feature in self.features.items():
+            detection = feature.get("detection_patterns", {})
+            detections[key] = FeatureDetection(
+                key=key,
+                name=feature.get("name", key),
+                test_function=feature.get("test_function"),
+                html_hits=self._hits(detection.get("html", ()), html_sources),
+                js_hits=self._hits(detection.get("js", ()), js_sources),
+            )
+        return detections
@@ -4,6 +4,7 @@ Final Selenium E2E Test - Simple and Working
 This version focuses on the core functionality and provides clear results.
 """
 
+import argparse
 import json
 import logging
 import time
@@ -14,38 +15,52 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_phase_change, wait_for_workout
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def run_selenium_tests():
-    """Run comprehensive Selenium E2E tests"""
-    logger.info("🚀 Starting Final Selenium E2E Tests")
-    
-    # Setup WebDriver
+def _create_driver(browser):
+    """Headless Chrome (through the offline driver cache) or Firefox."""
+    if browser == "firefox":
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+        options = FirefoxOptions()
+        options.add_argument("-headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        return webdriver.Firefox(options=options)
+
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+
+
+def run_selenium_tests(browser="chrome", base_url="http://127.0.0.1:8001"):
+    """Run comprehensive Selenium E2E tests"""
+    logger.info(f"🚀 Starting Final Selenium E2E Tests ({browser})")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    # Setup WebDriver
+    driver = _create_driver(browser)
     wait = WebDriverWait(driver, 15)
     
     results = {
         "timestamp": time.time(),
-        "base_url": "http://127.0.0.1:8001",
+        "base_url": base_url,
+        "browser": browser,
         "tests": {}
     }
     
     try:
         # Test 1: App Loading
         logger.info("🧪 Test 1: App Loading")
-        driver.get("http://127.0.0.1:8001")
+        driver.get(base_url)
         wait.until(EC.presence_of_element_located((By.ID, "workout-form")))
         results["tests"]["app_loading"] = {"status": "PASSED", "details": "App loaded successfully"}
         
@@ -89,8 +104,9 @@ def run_selenium_tests():
         
         # Click generate button
         generate_btn = driver.find_element(By.ID, "generate-btn")
+        mark(driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(driver)
         
         # Check if workout was generated
         workout_generated = driver.execute_script("""
@@ -157,8 +173,9 @@ def run_selenium_tests():
             
             # Click start workout button
             start_btn = driver.find_element(By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')
+            mark(driver)
             start_btn.click()
-            time.sleep(2)
+            wait_for_phase_change(driver)
             
             # Test workout player controls
             controls_test = driver.execute_script("""
@@ -272,16 +289,22 @@ def run_selenium_tests():
 
 def main():
     """Main function"""
-    results = run_selenium_tests()
+    parser = argparse.ArgumentParser(description="Final Selenium E2E tests")
+    parser.add_argument("--browser", choices=["chrome", "firefox"], default="chrome")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8001")
+    parser.add_argument("--output", default="final_selenium_results.json")
+    args = parser.parse_args()
+
+    results = run_selenium_tests(args.browser, args.base_url)
     
     # Output results
     print(json.dumps(results, indent=2))
     
     # Save results
-    with open("final_selenium_results.json", 'w') as f:
+    with open(args.output, 'w') as f:
         json.dump(results, f, indent=2)
     
-    logger.info("📊 Results saved to final_selenium_results.json")
+    logger.info(f"📊 Results saved to {args.output}")
 
 
 if __name__ == "__main__":
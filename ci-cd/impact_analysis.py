@@ -0,0 +1,168 @@
+"""Pick the checks a change can affect, from a git diff and each check's inputs.
+
+A check's inputs are read tokens in the ``SourceSnapshot.track_reads``
+format (``file:js/main.js``, ``dir:js/core``, ``glob:js/*.js``), with keys
+relative to ``src/``. They come from two places:
+
+- recorded reads: ``AutomatedTestPipeline`` persists what each category
+  actually read on its last run (``record_inputs``). The browser harness
+  serves modules from the snapshot, so this covers every module a page
+  loaded at runtime;
+- declared inputs: tests that never go through the snapshot, like the
+  enhanced pipeline's HTTP and browser tests, list tokens in their
+  definition. ``entry:index.html`` stands for the page plus everything it
+  loads, expanded through the ``module_graph`` import graph.
+
+A change to pipeline code (``ci-cd/*.py`` or ``ci-cd/*.json``, tests
+excluded) selects everything, and so does a check with no known inputs.
+Changes outside ``src/`` and the pipeline select nothing.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from module_graph import ModuleGraph
+
+
+NAMESPACE = "impact"
+SRC_PREFIX = "src/"
+PIPELINE_CODE: Sequence[str] = ("ci-cd/*.py", "ci-cd/*.json")
+WORKTREE = "worktree"
+STAGED = "staged"
+
+
+class ImpactError(RuntimeError):
+    """Raised when the changed files cannot be determined."""
+
+
+def _git(project_root: Path, *args: str) -> List[str]:
+    try:
+        completed = subprocess.run(
+            ["git", *args], cwd=project_root, capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        raise ImpactError(f"git {' '.join(args)} failed: {exc}") from exc
+    if completed.returncode != 0:
+        raise ImpactError(f"git {' '.join(args)} failed: {completed.stderr.strip()}")
+    return [line for line in completed.stdout.splitlines() if line]
+
+
+def changed_files(project_root: Path, changes: str = WORKTREE) -> List[str]:
+    """Repo-relative paths changed in the working tree, the index, or a revision range.
+
+    ``changes`` is ``worktree`` (tracked edits plus untracked files), ``staged``
+    or anything ``git diff`` accepts, such as ``HEAD~1..HEAD`` or ``main...``.
+    Renames count as a deletion plus an addition.
+    """
+    if changes == WORKTREE:
+        paths = _git(project_root, "diff", "--name-only", "--no-renames", "HEAD")
+        paths += _git(project_root, "ls-files", "--others", "--exclude-standard")
+    elif changes == STAGED:
+        paths = _git(project_root, "diff", "--cached", "--name-only", "--no-renames")
+    else:
+        paths = _git(project_root, "diff", "--name-only", "--no-renames", changes)
+    return sorted(set(paths))
+
+
+def token_covers(token: str, key: str) -> bool:
+    """Whether a change to snapshot key ``key`` can alter what ``token`` observed."""
+    kind, _, argument = token.partition(":")
+    if kind == "file":
+        return argument == key
+    if kind == "dir":
+        return bool(argument) and (key == argument or key.startswith(argument + "/"))
+    if kind == "glob":
+        prefix, _, suffix = argument.partition("*")
+        return key.startswith(prefix) and key.endswith(suffix)
+    return False
+
+
+def expand_inputs(tokens: Iterable[str], graph: Optional[ModuleGraph]) -> List[str]:
+    """Replace ``entry:`` tokens with file tokens for the entry's import closure."""
+    expanded: List[str] = []
+    for token in tokens:
+        kind, _, argument = token.partition(":")
+        if kind != "entry":
+            expanded.append(token)
+        elif graph is None:
+            expanded.append(f"glob:{_dirname(argument)}*")
+        else:
+            expanded.extend(f"file:{key}" for key in sorted(graph.dependencies_of([argument])))
+    return expanded
+
+
+def _dirname(key: str) -> str:
+    head, _, _tail = key.rpartition("/")
+    return f"{head}/" if head else ""
+
+
+def _matches(path: str, pattern: str) -> bool:
+    # fnmatch's "*" crosses "/", so ci-cd/*.py would also match ci-cd/tests/
+    return path.count("/") == pattern.count("/") and fnmatch.fnmatch(path, pattern)
+
+
+@dataclass
+class Impact:
+    """Selected checks and, for each, the changed paths that selected it."""
+
+    changed: List[str]
+    selected: List[str] = field(default_factory=list)
+    reasons: Dict[str, List[str]] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "changed": self.changed,
+            "selected": self.selected,
+            "skipped": self.skipped,
+            "reasons": self.reasons,
+        }
+
+
+def select_checks(
+    changed: Iterable[str],
+    inputs: Mapping[str, Optional[Iterable[str]]],
+    graph: Optional[ModuleGraph] = None,
+    pipeline_code: Sequence[str] = PIPELINE_CODE,
+) -> Impact:
+    """Checks (in ``inputs`` order) whose inputs cover a changed file.
+
+    ``inputs[check]`` is ``None`` when nothing is known about the check; it is
+    then selected by any change under ``src/``.
+    """
+    changed = sorted(set(changed))
+    impact = Impact(changed=changed)
+    code = [path for path in changed if any(_matches(path, pattern) for pattern in pipeline_code)]
+    src_keys = [path[len(SRC_PREFIX):] for path in changed if path.startswith(SRC_PREFIX)]
+
+    for check, tokens in inputs.items():
+        if code:
+            hits = [f"ci-cd: {path}" for path in code]
+        elif tokens is None:
+            hits = [f"no recorded inputs: src/{key}" for key in src_keys[:1]]
+        else:
+            expanded = expand_inputs(tokens, graph)
+            hits = [f"src/{key}" for key in src_keys if any(token_covers(token, key) for token in expanded)]
+        if hits:
+            impact.selected.append(check)
+            impact.reasons[check] = hits
+        else:
+            impact.skipped.append(check)
+    return impact
+
+
+def load_recorded_inputs(store, checks: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+    """Read tokens recorded for each check in a ``CacheStore``; ``None`` if never recorded."""
+    checks = list(checks)
+    recorded = store.get_many(NAMESPACE, checks)
+    return {check: recorded.get(check) for check in checks}
+
+
+def record_inputs(store, check: str, reads: Iterable[str]) -> None:
+    """Persist the read tokens of ``check`` (states are not needed for selection)."""
+    store.put(NAMESPACE, check, sorted(reads))
@@ -0,0 +1,212 @@
+"""Streaming tokenizer and parser for JavaScript data literals.
+
+Covers the subset of JavaScript used by data modules such as
+``src/js/core/exercise-database.js``: object and array literals, single,
+double and template-free backtick strings (with escapes), numbers,
+``true``/``false``/``null``/``undefined``, ``//`` and ``/* */`` comments and
+trailing commas. Object keys may be identifiers, strings or numbers; a
+duplicated key keeps its last value, as in JavaScript.
+
+``tokenize`` is a generator, so the parser pulls tokens only as far as the
+literal it is reading. Code after the literal (functions, regex literals, and
+so on) is never tokenized.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class JSLiteralError(ValueError):
+    """Raised for source that is not a supported JavaScript literal."""
+
+    def __init__(self, message: str, text: str, offset: int):
+        self.offset = offset
+        self.line = text.count("\n", 0, offset) + 1
+        self.column = offset - (text.rfind("\n", 0, offset) + 1) + 1
+        super().__init__(f"{message} at line {self.line}, column {self.column}")
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+_TOKEN = re.compile(
+    r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+    |(?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    |(?P<punct>\.\.\.|[{}\[\]():,;=+\-])
+    """,
+    re.S | re.X,
+)
+
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)", re.S)
+_KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+def _unescape(match: "re.Match[str]") -> str:
+    escape = match.group(1)
+    if escape in ("\n", "\r\n", "\r", "\u2028", "\u2029"):
+        return ""
+    if escape.startswith("u{"):
+        return chr(int(escape[2:-1], 16))
+    if escape[0] in "ux" and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return _SIMPLE_ESCAPES.get(escape, escape)
+
+
+def decode_string(literal: str) -> str:
+    """Value of a quoted JavaScript string literal, quotes included in ``literal``."""
+    body = literal[1:-1]
+    return _ESCAPE.sub(_unescape, body) if "\\" in body else body
+
+
+def tokenize(text: str, start: int = 0) -> Iterator[Token]:
+    """Yield tokens from ``text[start:]`` lazily, skipping whitespace and comments."""
+    position = start
+    length = len(text)
+    match = _TOKEN.match
+    while position < length:
+        found = match(text, position)
+        if found is None:
+            raise JSLiteralError(f"Unexpected character {text[position]!r}", text, position)
+        kind = found.lastgroup
+        end = found.end()
+        if kind != "skip":
+            yield Token(kind, found.group(), position, end)
+        position = end
+
+
+class _Parser:
+    def __init__(self, text: str, start: int):
+        self.text = text
+        self._tokens = tokenize(text, start)
+        self._peeked: Optional[Token] = None
+
+    def peek(self) -> Token:
+        if self._peeked is None:
+            self._peeked = next(self._tokens, None) or Token("eof", "", len(self.text), len(self.text))
+        return self._peeked
+
+    def next(self) -> Token:
+        token = self.peek()
+        self._peeked = None
+        return token
+
+    def fail(self, message: str, token: Token) -> JSLiteralError:
+        return JSLiteralError(message, self.text, token.start)
+
+    def expect(self, value: str) -> Token:
+        token = self.next()
+        if token.kind != "punct" or token.value != value:
+            raise self.fail(f"Expected {value!r}, found {token.value or 'end of input'!r}", token)
+        return token
+
+    def value(self) -> Any:
+        token = self.next()
+        if token.kind == "punct":
+            if token.value == "{":
+                return self.object_body()
+            if token.value == "[":
+                return [item for _offset, item in self.array_body()]
+            if token.value in "+-":
+                operand = self.next()
+                if operand.kind != "number":
+                    raise self.fail("Expected a number after sign", operand)
+                number = _number(operand.value)
+                return -number if token.value == "-" else number
+        elif token.kind == "string":
+            return self.string(token)
+        elif token.kind == "number":
+            return _number(token.value)
+        elif token.kind == "name" and token.value in _KEYWORDS:
+            return _KEYWORDS[token.value]
+        raise self.fail(f"Unsupported value {token.value or 'end of input'!r}", token)
+
+    def string(self, token: Token) -> str:
+        if token.value[0] == "`" and "${" in token.value:
+            raise self.fail("Template literal interpolation is not a constant", token)
+        return decode_string(token.value)
+
+    def object_body(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        while True:
+            token = self.next()
+            if token.kind == "punct" and token.value == "}":
+                return result
+            if token.kind == "name":
+                key = token.value
+            elif token.kind == "string":
+                key = self.string(token)
+            elif token.kind == "number":
+                key = str(_number(token.value))
+            else:
+                raise self.fail(f"Expected a property name, found {token.value or 'end of input'!r}", token)
+            self.expect(":")
+            result[key] = self.value()
+            separator = self.next()
+            if separator.kind == "punct" and separator.value == "}":
+                return result
+            if separator.kind != "punct" or separator.value != ",":
+                raise self.fail(f"Expected ',' or '}}', found {separator.value or 'end of input'!r}", separator)
+
+    def array_body(self) -> Iterator[Tuple[int, Any]]:
+        while True:
+            token = self.peek()
+            if token.kind == "punct" and token.value == "]":
+                self.next()
+                return
+            yield token.start, self.value()
+            separator = self.next()
+            if separator.kind == "punct" and separator.value == "]":
+                return
+            if separator.kind != "punct" or separator.value != ",":
+                raise self.fail(f"Expected ',' or ']', found {separator.value or 'end of input'!r}", separator)
+
+
+def _number(literal: str) -> Any:
+    if literal[:2] in ("0x", "0X"):
+        return int(literal, 16)
+    if any(char in literal for char in ".eE"):
+        return float(literal)
+    return int(literal)
+
+
+def parse_literal(text: str, start: int = 0) -> Any:
+    """Parse the single literal that begins at ``text[start:]`` (trailing code is ignored)."""
+    return _Parser(text, start).value()
+
+
+def iter_array(text: str, start: int = 0) -> Iterator[Tuple[int, Any]]:
+    """Yield ``(offset, value)`` for each element of the array literal at ``text[start:]``."""
+    parser = _Parser(text, start)
+    parser.expect("[")
+    yield from parser.array_body()
+
+
+def find_declaration(text: str, name: str) -> int:
+    """Offset of the initializer in ``[export] const|let|var <name> =``; raises if absent."""
+    pattern = re.compile(r"(?:^|[\s;])(?:export\s+)?(?:const|let|var)\s+" + re.escape(name) + r"\s*=\s*", re.M)
+    match = pattern.search(text)
+    if match is None:
+        raise JSLiteralError(f"No declaration of {name!r}", text, len(text))
+    return match.end()
+
+
+def parse_declaration(text: str, name: str) -> Any:
+    """Value of the literal assigned to ``name`` in ``text``."""
+    return parse_literal(text, find_declaration(text, name))
+
+
+def iter_declared_array(text: str, name: str) -> Iterator[Tuple[int, Any]]:
+    """Stream the elements of the array literal assigned to ``name``."""
+    return iter_array(text, find_declaration(text, name))
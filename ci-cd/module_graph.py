@@ -0,0 +1,326 @@
+"""Static ES-module import graph of the app sources, without a Node toolchain.
+
+``ModuleGraph.build`` reads every ``.js``, ``.css`` and ``.html`` file of a
+``SourceSnapshot`` (keys are relative to ``src/``) and records, per file, the
+local files it loads and the names it uses from each:
+
+- ``import ... from './x.js'``, ``import './x.js'`` and
+  ``export ... from './x.js'``;
+- ``import('./x.js')`` with a string literal, which uses every export;
+- ``<script src="...">`` and ``<link href="...">`` in HTML, which makes the
+  page an entry point.
+
+It also records each module's exports (``export const/let/var/function/
+class``, ``export default``, ``export { a as b }``), so the graph can answer
+what is reachable from the pages, which exports nothing imports, and how
+many bytes each page pulls in. Only the first name of a multi-binding
+``export const a = 1, b = 2`` is seen.
+
+Specifiers are resolved relative to the importing file, and their query
+string and fragment are dropped (``./main.js?v=63`` is ``js/main.js``). Bare
+and absolute-URL specifiers are external and are not followed. Comments are
+blanked before matching, so commented-out imports do not count.
+
+Per-file parses are cached by content sha256 and whole graphs by the
+snapshot's file hashes, so every check in a run (and every ``--watch``
+rerun) shares one parse of each unchanged file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import posixpath
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from source_snapshot import SourceSnapshot
+
+
+MODULE_SUFFIXES: Tuple[str, ...] = (".js", ".mjs", ".html", ".css")
+ALL_NAMES = "*"
+_PARSE_CACHE_SIZE = 512
+_GRAPH_CACHE_SIZE = 8
+
+_STATIC_IMPORT = re.compile(
+    r"""(?:^|[;}\s])(?P<keyword>import|export)\b(?:(?P<clause>[\w*{}\s,$]*?)\bfrom\b)?\s*"""
+    r"""(?P<quote>['"])(?P<spec>[^'"\n]+)(?P=quote)""",
+    re.MULTILINE,
+)
+_DYNAMIC_IMPORT = re.compile(r"""\bimport\s*\(\s*(['"])(?P<spec>[^'"\n]+)\1\s*\)""")
+_HTML_REFERENCE = re.compile(
+    r"""<(?:script\b[^>]*?\bsrc|link\b[^>]*?\bhref)\s*=\s*(['"])(?P<spec>[^'"]+)\1""", re.IGNORECASE
+)
+_EXPORT_DECLARATION = re.compile(
+    r"""(?:^|[;}\s])export\s+(?:(?P<default>default)\b|(?:async\s+)?"""
+    r"""(?:function\s*\*?\s*|(?:class|const|let|var)\s+)(?P<name>[\w$]+))""",
+    re.MULTILINE,
+)
+_EXPORT_LIST = re.compile(r"""(?:^|[;}\s])export\s*\{(?P<names>[^}]*)\}""", re.MULTILINE)
+_EXPORT_NAMESPACE = re.compile(r"""(?:^|[;}\s])export\s*\*\s*as\s+(?P<name>[\w$]+)""", re.MULTILINE)
+
+
+def blank_comments(text: str) -> str:
+    """``text`` with comments replaced by spaces; string literals and line breaks are kept.
+
+    Offsets are preserved, so positions found in the result are positions in ``text``.
+    """
+    out = list(text)
+    i, length = 0, len(text)
+    while i < length:
+        char = text[i]
+        if char in "'\"`":
+            i += 1
+            while i < length and text[i] != char:
+                i += 2 if text[i] == "\\" else 1
+            i += 1
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            end = length if end == -1 else end
+            out[i:end] = " " * (end - i)
+            i = end
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            out[i:end] = [c if c == "\n" else " " for c in text[i:end]]
+            i = end
+        else:
+            i += 1
+    return "".join(out)
+
+
+def resolve_specifier(importer: str, specifier: str) -> Optional[str]:
+    """Snapshot key a relative or root-relative specifier points at; ``None`` if external."""
+    parts = urlsplit(specifier)
+    if parts.scheme or parts.netloc:
+        return None
+    path = parts.path
+    if path.startswith("/"):
+        resolved = posixpath.normpath(path.lstrip("/"))
+    elif path.startswith(("./", "../")) or (importer.endswith(".html") and path and not path.startswith(".")):
+        # HTML script paths are document-relative even without "./"
+        resolved = posixpath.normpath(posixpath.join(posixpath.dirname(importer), path))
+    else:
+        return None
+    return None if resolved.startswith("..") else resolved
+
+
+def _list_names(names: str, exported: bool) -> List[str]:
+    """Names in an ``{ a, b as c }`` list: the local side, or the exported side."""
+    found = []
+    for part in names.split(","):
+        words = part.split()
+        if words:
+            found.append(words[-1] if exported else words[0])
+    return found
+
+
+def _imported_names(keyword: str, clause: Optional[str]) -> Tuple[str, ...]:
+    """Names an import or re-export statement takes from its target."""
+    if clause is None:
+        return ()
+    if ALL_NAMES in clause:
+        return (ALL_NAMES,)
+    head, _, rest = clause.partition("{")
+    names = _list_names(rest.partition("}")[0], exported=False)
+    if keyword == "import" and head.strip(" \t\n,"):
+        names.insert(0, "default")
+    return tuple(names)
+
+
+@dataclass(frozen=True)
+class ModuleInfo:
+    """What one file loads (specifier and names used) and exports, before resolution."""
+
+    loads: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    exports: FrozenSet[str]
+    size: int
+
+
+def parse_module(key: str, text: str) -> ModuleInfo:
+    size = len(text.encode("utf-8"))
+    if key.endswith(".html"):
+        loads = tuple((match.group("spec"), ()) for match in _HTML_REFERENCE.finditer(text))
+        return ModuleInfo(loads, frozenset(), size)
+    if key.endswith(".css"):
+        return ModuleInfo((), frozenset(), size)
+
+    code = blank_comments(text)
+    found = [
+        (m.start("spec"), m.group("spec"), _imported_names(m.group("keyword"), m.group("clause")))
+        for m in _STATIC_IMPORT.finditer(code)
+    ]
+    found += [(m.start("spec"), m.group("spec"), (ALL_NAMES,)) for m in _DYNAMIC_IMPORT.finditer(code)]
+
+    exports: Set[str] = set()
+    for match in _EXPORT_DECLARATION.finditer(code):
+        exports.add("default" if match.group("default") else match.group("name"))
+    for match in _EXPORT_LIST.finditer(code):
+        exports.update(_list_names(match.group("names"), exported=True))
+    exports.update(match.group("name") for match in _EXPORT_NAMESPACE.finditer(code))
+    return ModuleInfo(tuple((spec, names) for _start, spec, names in sorted(found)), frozenset(exports), size)
+
+
+def parse_specifiers(key: str, text: str) -> List[str]:
+    """Module specifiers loaded by one file, in source order."""
+    return [spec for spec, _names in parse_module(key, text).loads]
+
+
+@dataclass
+class ModuleGraph:
+    """Resolved graph; treat instances from ``build`` as read-only, they are shared.
+
+    ``imports[key]`` is the set of local files ``key`` loads, ``used[key]`` the names
+    other files take from it (``*`` for all) and ``missing`` lists unresolved targets.
+    """
+
+    imports: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    missing: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    exports: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    used: Dict[str, Set[str]] = field(default_factory=dict)
+    sizes: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, snapshot: SourceSnapshot) -> "ModuleGraph":
+        """Graph of a snapshot; reads are recorded as one glob per module suffix."""
+        sources = [
+            source
+            for suffix in MODULE_SUFFIXES
+            for source in snapshot.iter_files(suffix=suffix)
+            if source.text is not None
+        ]
+        digest = hashlib.sha256()
+        for key, source in sorted(snapshot.files.items()):
+            digest.update(f"{key}\0{source.sha256}\n".encode("utf-8"))
+
+        def assemble() -> "ModuleGraph":
+            infos = {
+                source.path: _cached(
+                    _parsed, _PARSE_CACHE_SIZE, (source.path.rpartition(".")[2], source.sha256),
+                    lambda source=source: parse_module(source.path, source.text),
+                )
+                for source in sources
+            }
+            return cls._assemble(infos, {key: source.size for key, source in snapshot.files.items()})
+
+        return _cached(_graphs, _GRAPH_CACHE_SIZE, digest.hexdigest(), assemble)
+
+    @classmethod
+    def from_sources(cls, sources: Mapping[str, str], known: Optional[Mapping[str, int]] = None) -> "ModuleGraph":
+        """Graph of ``sources``; ``known`` keys (icons, manifests) and their sizes resolve as leaves."""
+        return cls._assemble({key: parse_module(key, text) for key, text in sources.items()}, known or {})
+
+    @classmethod
+    def _assemble(cls, infos: Mapping[str, ModuleInfo], known: Mapping[str, int]) -> "ModuleGraph":
+        graph = cls()
+        graph.sizes = {**known, **{key: info.size for key, info in infos.items()}}
+        for key, info in infos.items():
+            targets: Set[str] = set()
+            missing: List[str] = []
+            for specifier, names in info.loads:
+                target = resolve_specifier(key, specifier)
+                if target is None:
+                    continue
+                if target in graph.sizes:
+                    targets.add(target)
+                    graph.used.setdefault(target, set()).update(names)
+                else:
+                    missing.append(specifier)
+            graph.imports[key] = frozenset(targets)
+            graph.exports[key] = info.exports
+            if missing:
+                graph.missing[key] = tuple(missing)
+        return graph
+
+    @property
+    def entries(self) -> List[str]:
+        """HTML pages, which load modules but are loaded by nothing."""
+        return sorted(key for key in self.imports if key.endswith(".html"))
+
+    @property
+    def modules(self) -> List[str]:
+        return sorted(key for key in self.imports if key.endswith((".js", ".mjs")))
+
+    def importers(self) -> Dict[str, Set[str]]:
+        reverse: Dict[str, Set[str]] = {key: set() for key in self.imports}
+        for key, targets in self.imports.items():
+            for target in targets:
+                reverse.setdefault(target, set()).add(key)
+        return reverse
+
+    def dependencies_of(self, keys: Iterable[str]) -> Set[str]:
+        """``keys`` plus every file they load, transitively."""
+        return _closure(keys, self.imports)
+
+    def dependents_of(self, keys: Iterable[str]) -> Set[str]:
+        """``keys`` plus every file that loads one of them, transitively."""
+        return _closure(keys, self.importers())
+
+    def reachable(self, entries: Optional[Iterable[str]] = None) -> Set[str]:
+        """Files loaded, directly or not, by ``entries`` (default: every page)."""
+        return self.dependencies_of(self.entries if entries is None else entries)
+
+    def unreachable(self) -> List[str]:
+        """JS modules no page loads."""
+        reachable = self.reachable()
+        return [key for key in self.modules if key not in reachable]
+
+    def dead_exports(self) -> Dict[str, List[str]]:
+        """Exports of reachable modules that no file imports.
+
+        Modules a page loads directly are skipped: inline scripts and the
+        browser console can use their exports without an import statement.
+        """
+        page_scripts = {target for entry in self.entries for target in self.imports[entry]}
+        reachable = self.reachable()
+        dead = {}
+        for key in self.modules:
+            used = self.used.get(key, set())
+            if key in page_scripts or key not in reachable or ALL_NAMES in used:
+                continue
+            unused = sorted(self.exports.get(key, frozenset()) - used)
+            if unused:
+                dead[key] = unused
+        return dead
+
+    def transitive_bytes(self, entry: str) -> int:
+        """Bytes of ``entry`` and every file it loads (static and dynamic), uncompressed."""
+        return sum(self.sizes.get(key, 0) for key in self.dependencies_of([entry]))
+
+    def entry_bytes(self) -> Dict[str, int]:
+        return {entry: self.transitive_bytes(entry) for entry in self.entries}
+
+
+def _closure(start: Iterable[str], edges: Mapping[str, Iterable[str]]) -> Set[str]:
+    seen: Set[str] = set()
+    stack = list(start)
+    while stack:
+        key = stack.pop()
+        if key in seen:
+            continue
+        seen.add(key)
+        stack.extend(edges.get(key, ()))
+    return seen
+
+
+_T = TypeVar("_T")
+_parsed: "OrderedDict[object, ModuleInfo]" = OrderedDict()
+_graphs: "OrderedDict[object, ModuleGraph]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cached(cache: "OrderedDict[object, _T]", size: int, key: object, factory: Callable[[], _T]) -> _T:
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+    value = factory()
+    with _cache_lock:
+        cache[key] = value
+        while len(cache) > size:
+            cache.popitem(last=False)
+    return value
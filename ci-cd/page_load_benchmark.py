@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""Repeated, throttled page-load benchmark with Core Web Vitals.
+
+One wall-clock ``driver.get`` is noise on a shared runner. This harness
+loads the page ``samples`` times per scenario. A scenario is a throttling
+profile (CDP ``Emulation.setCPUThrottlingRate`` and
+``Network.emulateNetworkConditions``) plus a cache state:
+
+- ``cold``: browser cache, cache storage and service workers cleared before
+  every load;
+- ``warm``: one unmeasured priming load, then loads that revalidate against
+  the static server's ETags.
+
+Every load reports Navigation Timing Level 2 (``ttfb``,
+``dom_content_loaded``, ``load``), ``fcp``, and, through
+``PerformanceObserver`` entries buffered from the start of the document,
+``lcp``, ``cls`` (largest session window), ``tbt`` (long-task time over
+50 ms after FCP, up to the end of the settle period) and the long-task
+count. Times are in milliseconds. Results are summarised with
+``bench_stats`` (median, p95 and a bootstrap CI). A metric fails only on a
+statistically significant and material regression against the stored
+baseline samples.
+
+Everything goes through CDP, so only Chromium-based browsers work: a
+Playwright page (``PlaywrightTarget``) or a Selenium Chrome driver
+(``SeleniumTarget``).
+
+Usage:
+    python ci-cd/page_load_benchmark.py [--profile desktop --profile mobile] [--samples 7]
+        [--cache cold|warm|both] [--base-url URL] [--save-baseline] [--output FILE]
+
+Exit status is 0 with no regression, 1 on a significant regression, and 2
+when no browser could be started.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+from bench_stats import compare, summarize
+from e2e_runner import CHROMIUM_ARGS
+from static_server import acquire_shared, release_shared
+
+
+BASELINE_PATH = Path(__file__).parent / ".page_load_baseline.json"
+DEFAULT_SAMPLES = 7
+SETTLE_MS = 1000
+CACHE_STATES = ("cold", "warm")
+
+Samples = Dict[str, Dict[str, List[float]]]  # scenario -> metric -> values
+
+
+class BenchmarkUnavailable(RuntimeError):
+    """Raised when no Chromium browser can be started for the benchmark."""
+
+
+@dataclass(frozen=True)
+class Profile:
+    """CPU slowdown factor and network conditions; ``None`` throughput means unthrottled."""
+
+    name: str
+    cpu_slowdown: float = 1.0
+    latency_ms: float = 0.0
+    download_kbps: Optional[float] = None
+    upload_kbps: Optional[float] = None
+
+
+# Mobile matches Lighthouse's default mobile throttling (4x CPU, "slow 4G")
+PROFILES: Dict[str, Profile] = {
+    "desktop": Profile("desktop"),
+    "mobile": Profile("mobile", cpu_slowdown=4, latency_ms=150, download_kbps=1638.4, upload_kbps=750),
+    "slow-3g": Profile("slow-3g", cpu_slowdown=6, latency_ms=400, download_kbps=400, upload_kbps=400),
+}
+
+
+@dataclass(frozen=True)
+class Gate:
+    """A regression must move the median by more than both thresholds (and be significant)."""
+
+    min_ratio: float
+    min_delta: float
+
+
+GATES: Dict[str, Gate] = {
+    "lcp": Gate(min_ratio=0.10, min_delta=50),
+    "load": Gate(min_ratio=0.10, min_delta=50),
+    "tbt": Gate(min_ratio=0.20, min_delta=50),
+    "cls": Gate(min_ratio=0.0, min_delta=0.05),
+}
+
+_OBSERVE = """
+(() => {
+  const metrics = window.__benchMetrics = { lcp: null, shifts: [], longTasks: [] };
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+    } catch (error) { /* entry type not supported by this engine */ }
+  };
+  observe('largest-contentful-paint', (entry) => { metrics.lcp = entry.startTime; });
+  observe('layout-shift', (entry) => { if (!entry.hadRecentInput) metrics.shifts.push([entry.startTime, entry.value]); });
+  observe('longtask', (entry) => { metrics.longTasks.push([entry.startTime, entry.duration]); });
+})();
+"""
+
+_COLLECT = """
+() => new Promise((resolve) => setTimeout(() => {
+  const metrics = window.__benchMetrics || { lcp: null, shifts: [], longTasks: [] };
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = performance.getEntriesByName('first-contentful-paint')[0];
+  const fcp = paint ? paint.startTime : null;
+  let cls = 0, session = 0, first = 0, last = 0;
+  for (const [time, value] of metrics.shifts) {
+    if (session && (time - last > 1000 || time - first > 5000)) session = 0;
+    if (!session) first = time;
+    session += value;
+    last = time;
+    cls = Math.max(cls, session);
+  }
+  const tbt = metrics.longTasks
+    .filter(([time]) => fcp === null || time >= fcp)
+    .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0);
+  resolve({
+    ttfb: nav ? nav.responseStart : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+    fcp,
+    lcp: metrics.lcp,
+    cls,
+    tbt,
+    long_tasks: metrics.longTasks.length,
+    transfer_bytes: nav ? nav.transferSize : null,
+  });
+}, SETTLE_MS))
+"""
+
+
+class PlaywrightTarget:
+    """CDP access to a Playwright Chromium page."""
+
+    def __init__(self, page: Any):
+        self.page = page
+        self.session = page.context.new_cdp_session(page)
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.session.send(method, params or {})
+
+    def navigate(self, url: str) -> None:
+        self.page.goto(url, wait_until="load")
+
+    def evaluate(self, function: str) -> Any:
+        return self.page.evaluate(function)
+
+
+class SeleniumTarget:
+    """CDP access to a Selenium Chrome driver (``driver.get`` waits for the load event)."""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.driver.execute_cdp_cmd(method, params or {})
+
+    def navigate(self, url: str) -> None:
+        self.driver.get(url)
+
+    def evaluate(self, function: str) -> Any:
+        self.driver.set_script_timeout(SETTLE_MS / 1000 + 10)
+        return self.driver.execute_async_script(
+            f"const done = arguments[arguments.length - 1]; Promise.resolve(({function})()).then(done);"
+        )
+
+
+def apply_profile(target: Any, profile: Profile) -> None:
+    target.send("Network.enable")
+    target.send("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_slowdown})
+    throttled = profile.download_kbps is not None
+    target.send(
+        "Network.emulateNetworkConditions",
+        {
+            "offline": False,
+            "latency": profile.latency_ms,
+            # CDP wants bytes per second; -1 disables throttling
+            "downloadThroughput": profile.download_kbps * 1024 / 8 if throttled else -1,
+            "uploadThroughput": (profile.upload_kbps or profile.download_kbps) * 1024 / 8 if throttled else -1,
+        },
+    )
+
+
+def _clear_caches(target: Any, url: str) -> None:
+    parts = urlsplit(url)
+    target.send("Network.clearBrowserCache")
+    target.send(
+        "Storage.clearDataForOrigin",
+        {"origin": f"{parts.scheme}://{parts.netloc}", "storageTypes": "cache_storage,service_workers"},
+    )
+
+
+def load_once(target: Any, url: str, cold: bool, settle_ms: int = SETTLE_MS) -> Dict[str, float]:
+    """Metrics of a single load; ``None`` readings (no LCP, say) are dropped."""
+    if cold:
+        _clear_caches(target, url)
+    target.navigate(url)
+    readings = target.evaluate(_COLLECT.replace("SETTLE_MS", str(int(settle_ms)))) or {}
+    return {name: float(value) for name, value in readings.items() if value is not None}
+
+
+def run_scenario(
+    target: Any, url: str, profile: Profile, cache: str, samples: int = DEFAULT_SAMPLES, settle_ms: int = SETTLE_MS
+) -> Dict[str, List[float]]:
+    apply_profile(target, profile)
+    if cache == "warm":
+        load_once(target, url, cold=False, settle_ms=0)
+    collected: Dict[str, List[float]] = {}
+    for _ in range(samples):
+        for name, value in load_once(target, url, cold=cache == "cold", settle_ms=settle_ms).items():
+            collected.setdefault(name, []).append(value)
+    return collected
+
+
+def run_benchmark(
+    target: Any,
+    url: str,
+    profiles: Iterable[Profile],
+    caches: Iterable[str] = CACHE_STATES,
+    samples: int = DEFAULT_SAMPLES,
+    settle_ms: int = SETTLE_MS,
+) -> Samples:
+    """Samples per ``profile/cache`` scenario; the observer is injected into every new document."""
+    target.send("Page.enable")
+    script = (target.send("Page.addScriptToEvaluateOnNewDocument", {"source": _OBSERVE}) or {}).get("identifier")
+    caches = list(caches)
+    results: Samples = {}
+    try:
+        for profile in profiles:
+            for cache in caches:
+                results[f"{profile.name}/{cache}"] = run_scenario(target, url, profile, cache, samples, settle_ms)
+    finally:
+        # Leave a pooled browser the way it was found
+        apply_profile(target, PROFILES["desktop"])
+        if script is not None:
+            target.send("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script})
+    return results
+
+
+def summarize_samples(samples: Samples) -> Dict[str, Dict[str, Dict[str, float]]]:
+    return {
+        scenario: {metric: summarize(values).to_dict() for metric, values in metrics.items() if values}
+        for scenario, metrics in samples.items()
+    }
+
+
+def compare_to_baseline(samples: Samples, baseline: Mapping[str, Mapping[str, List[float]]]) -> Dict[str, Any]:
+    """Comparisons for gated metrics present in both runs, and the regressions among them."""
+    comparisons: Dict[str, Dict[str, Any]] = {}
+    regressions: List[str] = []
+    for scenario, metrics in samples.items():
+        for metric, gate in GATES.items():
+            before, after = baseline.get(scenario, {}).get(metric), metrics.get(metric)
+            if not before or not after:
+                continue
+            result = compare(before, after, min_ratio=gate.min_ratio, min_delta=gate.min_delta)
+            comparisons.setdefault(scenario, {})[metric] = result.to_dict()
+            if result.regressed:
+                regressions.append(
+                    f"{scenario} {metric}: median {result.baseline_median:.1f} -> {result.current_median:.1f} "
+                    f"(p={result.p_value:.4f})"
+                )
+    return {"comparisons": comparisons, "regressions": regressions}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Samples:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    scenarios = data.get("samples")
+    return scenarios if isinstance(scenarios, dict) else {}
+
+
+def save_baseline(samples: Samples, path: Path = BASELINE_PATH) -> None:
+    """Merge ``samples`` into the baseline, scenario by scenario; written atomically."""
+    merged = {**load_baseline(path), **samples}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"samples": merged}, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def evaluate(samples: Samples, baseline: Mapping[str, Mapping[str, List[float]]]) -> Dict[str, Any]:
+    """Report for a run: summaries, baseline comparisons and a PASSED/FAILED status."""
+    verdict = compare_to_baseline(samples, baseline)
+    return {
+        "status": "FAILED" if verdict["regressions"] else "PASSED",
+        "baseline_found": bool(baseline),
+        "summary": summarize_samples(samples),
+        **verdict,
+        "samples": samples,
+    }
+
+
+def benchmark_with_playwright(
+    profiles: Iterable[Profile] = (PROFILES["desktop"],),
+    caches: Iterable[str] = CACHE_STATES,
+    samples: int = DEFAULT_SAMPLES,
+    base_url: Optional[str] = None,
+    settle_ms: int = SETTLE_MS,
+) -> Samples:
+    """Run the benchmark in headless Chromium, serving the app from the shared server unless ``base_url``."""
+    try:
+        from playwright.sync_api import sync_playwright  # type: ignore
+    except ImportError as exc:
+        raise BenchmarkUnavailable(f"Playwright is not installed: {exc}") from exc
+
+    server = acquire_shared() if base_url is None else None
+    try:
+        with sync_playwright() as playwright:
+            try:
+                browser = playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            except Exception as exc:
+                raise BenchmarkUnavailable(f"Chromium could not be started: {exc}") from exc
+            try:
+                # A fresh context per run: no cache or storage from earlier tests
+                page = browser.new_context().new_page()
+                return run_benchmark(
+                    PlaywrightTarget(page), base_url or server.url, profiles, caches, samples, settle_ms
+                )
+            finally:
+                browser.close()
+    finally:
+        if server is not None:
+            release_shared()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Repeated, throttled page-load benchmark")
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES),
+                        help="Throttling profile, repeatable (default: desktop)")
+    parser.add_argument("--cache", choices=("cold", "warm", "both"), default="both")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Loads per scenario")
+    parser.add_argument("--base-url", default=None, help="Benchmark a running server instead of src/")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's samples as the baseline")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+
+    profiles = [PROFILES[name] for name in args.profile or ["desktop"]]
+    caches = CACHE_STATES if args.cache == "both" else (args.cache,)
+    try:
+        samples = benchmark_with_playwright(profiles, caches, args.samples, args.base_url)
+    except BenchmarkUnavailable as exc:
+        print(f"SKIPPED: {exc}", file=sys.stderr)
+        return 2
+
+    report = evaluate(samples, load_baseline(args.baseline))
+    if args.save_baseline:
+        save_baseline(samples, args.baseline)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for scenario, metrics in report["summary"].items():
+        for metric, stats in metrics.items():
+            print(f"{scenario:18} {metric:20} median {stats['median']:10.2f}  p95 {stats['p95']:10.2f}  "
+                  f"CI [{stats['ci_low']:.2f}, {stats['ci_high']:.2f}]  n={stats['n']}")
+    for line in report["regressions"]:
+        print(f"REGRESSION {line}")
+    print(report["status"] if report["baseline_found"] else f"{report['status']} (no baseline yet)")
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,22 +18,33 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_dom_settled, wait_for_phase_change, wait_for_workout
+from bench_history import BenchHistory, samples_from_report
+from page_load_benchmark import PROFILES, SeleniumTarget, evaluate, load_baseline, run_benchmark
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class PerformanceMonitoringTests:
-    def __init__(self, base_url="http://127.0.0.1:8001", headless=True):
+    def __init__(self, base_url="http://127.0.0.1:8001", headless=True, driver=None, page_load_samples=5):
         self.base_url = base_url
+        self.page_load_samples = page_load_samples
         self.headless = headless
-        self.driver = None
+        self.driver = driver
+        self.owns_driver = driver is None
         self.wait = None
         self.screenshot_dir = "performance_screenshots"
         os.makedirs(self.screenshot_dir, exist_ok=True)
         
     def setup_driver(self):
         """Setup Chrome WebDriver with performance monitoring"""
+        if not self.owns_driver:
+            self.wait = WebDriverWait(self.driver, 15)
+            self._enable_performance_domains()
+            logger.info("✅ Performance Monitoring using pooled WebDriver")
+            return
+
         options = Options()
         if self.headless:
             options.add_argument("--headless")
@@ -48,20 +59,21 @@ class PerformanceMonitoringTests:
         options.add_argument("--disable-backgrounding-occluded-windows")
         options.add_argument("--disable-renderer-backgrounding")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 15)
-        
-        # Enable performance monitoring
+        self._enable_performance_domains()
+        logger.info("✅ Performance Monitoring WebDriver initialized")
+
+    def _enable_performance_domains(self):
+        """Enable the CDP domains the performance tests read from"""
         self.driver.execute_cdp_cmd('Performance.enable', {})
         self.driver.execute_cdp_cmd('Network.enable', {})
         self.driver.execute_cdp_cmd('Runtime.enable', {})
         
-        logger.info("✅ Performance Monitoring WebDriver initialized")
-        
     def teardown_driver(self):
-        """Clean up WebDriver"""
-        if self.driver:
+        """Clean up WebDriver (pooled sessions are returned by the pool, not quit)"""
+        if self.driver and self.owns_driver:
             self.driver.quit()
             logger.info("🔚 WebDriver closed")
             
@@ -104,63 +116,39 @@ class PerformanceMonitoringTests:
     # ==================== PAGE LOAD PERFORMANCE TESTS ====================
     
     def test_page_load_performance(self):
-        """Test 1: Page load performance metrics"""
+        """Test 1: Page load performance over repeated cold and warm loads
+
+        A single timed load on a shared runner is mostly noise, so the page is
+        loaded several times per cache state and compared statistically with
+        the stored baseline; only a significant regression fails.
+        """
         logger.info("🧪 Test 1: Page Load Performance")
         
-        # Get initial system metrics
         initial_metrics = self.get_system_metrics()
+        samples = run_benchmark(
+            SeleniumTarget(self.driver), self.base_url, [PROFILES["desktop"]], samples=self.page_load_samples
+        )
+        final_metrics = self.get_system_metrics()
+        report = evaluate(samples, load_baseline())
         
-        # Measure page load time
-        start_time = time.time()
+        # Leave the page loaded for the tests that follow
         self.driver.get(self.base_url)
         self.wait.until(EC.presence_of_element_located((By.ID, "workout-form")))
-        load_time = time.time() - start_time
-        
-        # Get performance metrics from browser
-        performance_metrics = self.driver.execute_script("""
-            if (window.performance && window.performance.timing) {
-                const timing = window.performance.timing;
-                return {
-                    navigation_start: timing.navigationStart,
-                    dom_loading: timing.domContentLoadedEventEnd - timing.domContentLoadedEventStart,
-                    dom_complete: timing.domComplete - timing.domLoading,
-                    load_complete: timing.loadEventEnd - timing.loadEventStart,
-                    total_time: timing.loadEventEnd - timing.navigationStart,
-                    first_paint: performance.getEntriesByType('paint')[0]?.startTime || 0,
-                    first_contentful_paint: performance.getEntriesByType('paint')[1]?.startTime || 0
-                };
-            }
-            return null;
-        """)
-        
-        # Get final system metrics
-        final_metrics = self.get_system_metrics()
-        
-        # Get network metrics
-        network_metrics = self.driver.execute_script("""
-            if (window.performance && window.performance.getEntriesByType) {
-                const resources = window.performance.getEntriesByType('resource');
-                return {
-                    total_resources: resources.length,
-                    total_size: resources.reduce((sum, resource) => sum + (resource.transferSize || 0), 0),
-                    load_time: resources.reduce((sum, resource) => sum + (resource.responseEnd - resource.startTime), 0)
-                };
-            }
-            return null;
-        """)
-        
         self.take_screenshot("01_page_load_performance")
         
+        for line in report["regressions"]:
+            logger.warning(f"⚠️ Page load regression: {line}")
         return {
-            "status": "PASSED" if load_time < 3.0 else "WARNING",
-            "load_time": load_time,
-            "performance_metrics": performance_metrics,
-            "network_metrics": network_metrics,
+            "status": report["status"],
+            "summary": report["summary"],
+            "comparisons": report["comparisons"],
+            "regressions": report["regressions"],
+            "baseline_found": report["baseline_found"],
+            "samples": samples,
             "system_metrics": {
                 "initial": initial_metrics,
                 "final": final_metrics
-            },
-            "meets_threshold": load_time < 3.0
+            }
         }
 
     # ==================== WORKOUT GENERATION PERFORMANCE TESTS ====================
@@ -176,7 +164,7 @@ class PerformanceMonitoringTests:
             try:
                 # Reset form
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(0.5)
+                wait_for_dom_settled(self.driver)
                 
                 # Fill form
                 self.driver.execute_script("""
@@ -249,7 +237,7 @@ class PerformanceMonitoringTests:
             try:
                 # Reset and generate workout
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(0.5)
+                wait_for_dom_settled(self.driver)
                 
                 self.driver.execute_script("""
                     document.getElementById('duration-30').checked = true;
@@ -258,8 +246,9 @@ class PerformanceMonitoringTests:
                 """)
                 
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 generate_btn.click()
-                time.sleep(2)
+                wait_for_workout(self.driver)
                 
                 # Take memory snapshot
                 memory = self.driver.execute_script("""
@@ -489,12 +478,14 @@ class PerformanceMonitoringTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         timer_tests = {}
         
@@ -544,6 +535,18 @@ class PerformanceMonitoringTests:
             "timer_tests": timer_tests
         }
 
+    def record_history(self, results):
+        """Append this run's samples to the benchmark history (results files are overwritten)"""
+        samples = samples_from_report(results)
+        if not samples:
+            return
+        try:
+            with BenchHistory() as history:
+                run_id = history.record(samples, source="performance_monitoring")
+            logger.info(f"📈 Benchmark samples appended to history (run {run_id})")
+        except Exception as e:
+            logger.warning(f"Could not record benchmark history: {e}")
+
     # ==================== MAIN TEST RUNNER ====================
     
     def run_all_tests(self):
@@ -590,6 +593,7 @@ class PerformanceMonitoringTests:
             with open("performance_monitoring_results.json", "w") as f:
                 json.dump(all_results, f, indent=2)
             logger.info("📊 Results saved to performance_monitoring_results.json")
+            self.record_history(all_results)
         
         return all_results
 
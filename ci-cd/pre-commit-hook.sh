@@ -115,19 +115,19 @@ fi
 
 # Step 2: Enhanced Automated Test Pipeline
 print_section "🚀 ENHANCED AUTOMATED TEST PIPELINE"
-print_status $BLUE "Running enhanced pipeline with parallel execution and caching..."
+print_status $BLUE "Running the checks affected by the staged changes (parallel, cached)..."
 
 # Set timeout for pipeline (8 minutes) - handle different systems
 if command -v gtimeout &> /dev/null; then
     # macOS with coreutils installed
-    gtimeout 480 python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode
+    gtimeout 480 python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode --changes staged
 elif command -v timeout &> /dev/null; then
     # Linux systems
-    timeout 480 python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode
+    timeout 480 python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode --changes staged
 else
     # macOS without coreutils - run without timeout
     print_status $YELLOW "⚠️  No timeout command available, running pipeline without timeout"
-    python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode
+    python3 ci-cd/automated_test_pipeline.py --enhanced --hook-mode --changes staged
 fi
 
 # Check if pipeline completed successfully
@@ -140,7 +140,7 @@ if [ $? -eq 0 ]; then
     fi
     
     # Check for cached results
-    if [ -f "ci-cd/.test_cache.pkl" ]; then
+    if [ -f "ci-cd/.test_cache.sqlite3" ]; then
         print_status $PURPLE "💾 Test cache updated for faster future runs"
     fi
 else
@@ -149,7 +149,20 @@ else
     exit 1
 fi
 
-# Step 3: Final confirmation
+# Step 3: Workout generation fuzzing (time-boxed, non-blocking)
+print_section "🎲 WORKOUT FUZZING"
+print_status $BLUE "Fuzzing generateWorkout with random form inputs (20s budget)..."
+python3 ci-cd/workout_fuzzer.py --budget 20 > /dev/null
+fuzz_status=$?
+if [ $fuzz_status -eq 0 ]; then
+    print_status $GREEN "✅ No invariant violations found"
+elif [ $fuzz_status -eq 2 ]; then
+    print_status $YELLOW "⚠️  Headless browser unavailable, fuzzing skipped"
+else
+    print_status $YELLOW "⚠️  Fuzzer found counterexamples - see reports/test_results/workout_fuzz_report.json"
+fi
+
+# Step 4: Final confirmation
 print_section "🎯 FINAL CONFIRMATION"
 print_status $GREEN "✅ All pre-commit checks passed!"
 print_status $GREEN "✅ Code is ready for commit!"
@@ -57,6 +57,7 @@ def evaluate_quality_gate(
     min_accessibility_score: float,
     strict_e2e: bool = False,
     fail_on_overall_warning: bool = False,
+    bench_verdict: Dict[str, Any] | None = None,
 ) -> Tuple[bool, Dict[str, Any], List[str]]:
     summary = pipeline_results.get("summary", {})
     overall_status = str(pipeline_results.get("overall_status", "UNKNOWN")).upper()
@@ -70,6 +71,9 @@ def evaluate_quality_gate(
     accessibility_score = float(summary.get("accessibility_score", 0.0))
 
     e2e_status, e2e_source = get_e2e_status(pipeline_results, e2e_results)
+    bench_status = (
+        str(bench_verdict.get("status", "UNKNOWN")).upper() if bench_verdict else "MISSING"
+    )
 
     checks = {
         "overall_status": overall_status,
@@ -80,6 +84,7 @@ def evaluate_quality_gate(
         "accessibility_score": accessibility_score,
         "e2e_status": e2e_status,
         "e2e_source": e2e_source,
+        "bench_status": bench_status,
         "thresholds": {
             "min_success_rate": min_success_rate,
             "min_security_score": min_security_score,
@@ -115,6 +120,10 @@ def evaluate_quality_gate(
         failures.append("e2e smoke status is WARNING (strict e2e mode)")
     if e2e_status in {"FAILED", "SKIPPED", "MISSING", "UNKNOWN"}:
         failures.append(f"e2e smoke status is {e2e_status}")
+    # No history yet (a fresh runner) is not a failure; a regression verdict is
+    if bench_status == "FAILED":
+        regressions = (bench_verdict or {}).get("regressions") or ["verdict is FAILED"]
+        failures.extend(f"benchmark regression: {item}" for item in regressions)
 
     return len(failures) == 0, checks, failures
 
@@ -134,6 +143,7 @@ def write_step_summary(passed: bool, checks: Dict[str, Any], failures: List[str]
         f"- Security score: {checks['security_score']:.1f}",
         f"- Accessibility score: {checks['accessibility_score']:.1f}",
         f"- E2E smoke: {checks['e2e_status']} ({checks['e2e_source']})",
+        f"- Benchmark history: {checks['bench_status']}",
         (
             "- Strict E2E warning mode: "
             f"{'enabled' if checks['strict_mode']['strict_e2e'] else 'disabled'}"
@@ -167,6 +177,11 @@ def parse_args() -> argparse.Namespace:
         default="reports/test_results/e2e_smoke_result.json",
         help="Path to dedicated e2e smoke JSON",
     )
+    parser.add_argument(
+        "--bench-verdict",
+        default=None,
+        help="Path to a bench_history.py check verdict JSON (regressions fail the gate)",
+    )
     parser.add_argument("--min-success-rate", type=float, default=85.0)
     parser.add_argument("--min-security-score", type=float, default=70.0)
     parser.add_argument("--min-accessibility-score", type=float, default=80.0)
@@ -202,6 +217,17 @@ def main() -> int:
         except Exception as exc:
             print(f"Warning: cannot parse e2e smoke result ({exc})")
 
+    bench_verdict = None
+    if args.bench_verdict:
+        bench_path = Path(args.bench_verdict)
+        if bench_path.exists():
+            try:
+                bench_verdict = load_json(bench_path)
+            except Exception as exc:
+                print(f"Warning: cannot parse benchmark verdict ({exc})")
+        else:
+            print(f"Warning: benchmark verdict not found: {bench_path}")
+
     passed, checks, failures = evaluate_quality_gate(
         pipeline_results=pipeline_results,
         e2e_results=e2e_results,
@@ -210,6 +236,7 @@ def main() -> int:
         min_accessibility_score=args.min_accessibility_score,
         strict_e2e=args.strict_e2e,
         fail_on_overall_warning=args.fail_on_overall_warning,
+        bench_verdict=bench_verdict,
     )
 
     print("=== QUALITY GATE ===")
@@ -220,6 +247,7 @@ def main() -> int:
     print(f"Security score: {checks['security_score']:.1f}")
     print(f"Accessibility score: {checks['accessibility_score']:.1f}")
     print(f"E2E smoke: {checks['e2e_status']} ({checks['e2e_source']})")
+    print(f"Benchmark history: {checks['bench_status']}")
     print(
         "Strict E2E warning mode: "
         f"{'enabled' if checks['strict_mode']['strict_e2e'] else 'disabled'}"
@@ -6,77 +6,77 @@ Covers the first release-checklist point with a focused matrix:
 - Generator modes: standard, circuit, tabata, pyramid
 - Timer modes: standard, tabata, hiit, custom
 - Auth flow: register, login, reset password, logout, session persistence
+
+All cells share one browser. Each cell runs in its own browser context, so
+cookies and localStorage are isolated, and a semaphore caps how many
+contexts are open at once. Every generator mode and generator edge case is
+a separate cell; the timer and auth flows are one cell each. Cell results
+are merged in declaration order, so the report does not depend on which
+cell finishes first.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
-import socket
-import threading
+import os
 import time
 from dataclasses import dataclass
 from functools import partial
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
+from app_readiness import mark, wait_for_app, wait_for_dom_settled, wait_for_workout
+from exercise_index import ExerciseIndex, load_index
+from source_snapshot import SourceFile
+from static_server import acquire_shared, release_shared
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SRC_ROOT = PROJECT_ROOT / "src"
 REPORT_PATH = PROJECT_ROOT / "reports" / "test_results" / "regression_sweep_report.json"
+EXERCISE_DATABASE = SRC_ROOT / "js" / "core" / "exercise-database.js"
 
-
-def _is_port_open(host: str, port: int) -> bool:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(0.4)
-        return sock.connect_ex((host, port)) == 0
-
-
-def _first_free_port(host: str, start: int) -> int:
-    port = start
-    while _is_port_open(host, port):
-        port += 1
-    return port
+GENERATOR_MODES: Tuple[Tuple[str, str, List[str], str], ...] = (
+    ("standard", "duration-30", ["eq-bodyweight"], "Intermediate"),
+    ("circuit", "duration-45", ["eq-dumbbells"], "Advanced"),
+    ("tabata", "duration-15", ["eq-kettlebell"], "Beginner"),
+    ("pyramid", "duration-60", ["eq-bodyweight", "eq-dumbbells"], "Advanced"),
+)
 
 
 @dataclass
 class LocalServer:
-    host: str = "127.0.0.1"
+    """Handle on the shared in-memory ``static_server``; ``start_port`` is only a preference."""
+
     start_port: int = 8001
 
     def __post_init__(self) -> None:
-        self.httpd: ThreadingHTTPServer | None = None
-        self.thread: threading.Thread | None = None
-        self.port = _first_free_port(self.host, self.start_port)
+        self._held = False
 
     def start(self) -> str:
-        handler = partial(SimpleHTTPRequestHandler, directory=str(SRC_ROOT))
-        self.httpd = ThreadingHTTPServer((self.host, self.port), handler)
-        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
-        self.thread.start()
-        time.sleep(0.4)
-        return f"http://{self.host}:{self.port}/index.html"
+        server = acquire_shared(self.start_port)
+        self._held = True
+        return server.url + "index.html"
 
     def stop(self) -> None:
-        if self.httpd is not None:
-            self.httpd.shutdown()
-            self.httpd.server_close()
-        if self.thread is not None:
-            self.thread.join(timeout=2)
+        if self._held:
+            self._held = False
+            release_shared()
 
 
-def _wait_for_app(page: Any) -> None:
-    page.goto(page.url or "about:blank")
-    page.wait_for_selector("#workout-form", timeout=15000)
-    page.wait_for_function("() => !!window.userAccount", timeout=15000)
+async def _open_app(page: Any, base_url: str) -> None:
+    await page.goto(base_url, wait_until="networkidle")
+    if not await wait_for_app(page, timeout=15):
+        raise RuntimeError("app did not expose #workout-form and window.userAccount")
 
 
-def _clear_app_storage(page: Any) -> None:
-    page.evaluate(
+async def _clear_app_storage(page: Any) -> None:
+    await page.evaluate(
         """() => {
             localStorage.removeItem('fitflow_current_user');
             localStorage.removeItem('fitflow_users');
@@ -84,7 +84,7 @@ def _clear_app_storage(page: Any) -> None:
     )
 
 
-def _generate_workout(
+async def _generate_workout(
     page: Any,
     duration_id: str,
     equipment_ids: List[str],
@@ -97,7 +97,8 @@ def _generate_workout(
         "fitness_level": fitness_level,
         "pattern": pattern,
     }
-    return page.evaluate(
+    await mark(page)
+    return await page.evaluate(
         """({ duration_id, equipment_ids, fitness_level, pattern }) => {
             const form = document.getElementById('workout-form');
             if (!form) return { ok: false, error: 'workout-form missing' };
@@ -139,36 +140,52 @@ def _generate_workout(
     )
 
 
-def run_generator_matrix(page: Any) -> Dict[str, Any]:
-    checks: Dict[str, Any] = {}
-    modes = [
-        ("standard", "duration-30", ["eq-bodyweight"], "Intermediate"),
-        ("circuit", "duration-45", ["eq-dumbbells"], "Advanced"),
-        ("tabata", "duration-15", ["eq-kettlebell"], "Beginner"),
-        ("pyramid", "duration-60", ["eq-bodyweight", "eq-dumbbells"], "Advanced"),
-    ]
-
-    for mode, duration_id, equipment_ids, level in modes:
-        start = _generate_workout(page, duration_id, equipment_ids, level, mode)
-        time.sleep(1.2)
-        details = page.evaluate(
-            """(mode) => {
-                const data = window.currentWorkoutData || window.workoutData || null;
-                const generated = !!data && Array.isArray(data.sequence) && data.sequence.length > 0;
-                return {
-                    mode,
-                    generated,
-                    actualPattern: data?.trainingPattern || null,
-                    sequenceLength: data?.sequence?.length || 0,
-                    workTime: data?.workTime || null,
-                    restTime: data?.restTime || null
-                };
-            }""",
-            mode,
-        )
-        checks[mode] = {"setup": start, "result": details}
+def _load_exercise_index() -> ExerciseIndex | None:
+    try:
+        data = EXERCISE_DATABASE.read_bytes()
+    except OSError:
+        return None
+    return load_index(SourceFile.from_bytes(EXERCISE_DATABASE.relative_to(SRC_ROOT).as_posix(), data))
+
+
+def _unknown_exercises(index: ExerciseIndex | None, details: Dict[str, Any]) -> List[str]:
+    if index is None:
+        return []
+    return sorted({name for name in details.get("exercises", []) if name not in index})
+
 
-    invalid = page.evaluate(
+async def run_generator_mode(
+    page: Any, mode: str, duration_id: str, equipment_ids: List[str], level: str, index: ExerciseIndex | None
+) -> Dict[str, Any]:
+    start = await _generate_workout(page, duration_id, equipment_ids, level, mode)
+    await wait_for_workout(page)
+    details = await page.evaluate(
+        """(mode) => {
+            const data = window.currentWorkoutData || window.workoutData || null;
+            const generated = !!data && Array.isArray(data.sequence) && data.sequence.length > 0;
+            return {
+                mode,
+                generated,
+                actualPattern: data?.trainingPattern || null,
+                sequenceLength: data?.sequence?.length || 0,
+                workTime: data?.workTime || null,
+                restTime: data?.restTime || null,
+                exercises: (data?.sequence || [])
+                    .filter(item => ['warmup', 'main', 'cooldown'].includes(item?.type))
+                    .map(item => item.name)
+            };
+        }""",
+        mode,
+    )
+    return {"setup": start, "result": details, "unknown_exercises": _unknown_exercises(index, details)}
+
+
+async def run_generator_invalid_input(page: Any) -> Dict[str, Any]:
+    # Start from a generated workout so "unchanged" means the invalid submit was rejected.
+    mode, duration_id, equipment_ids, level = GENERATOR_MODES[0]
+    await _generate_workout(page, duration_id, equipment_ids, level, mode)
+    await wait_for_workout(page)
+    return await page.evaluate(
         """() => {
             const form = document.getElementById('workout-form');
             if (!form) return { blocked: false, reason: 'form missing' };
@@ -192,17 +209,18 @@ def run_generator_matrix(page: Any) -> Dict[str, Any]:
             };
         }"""
     )
-    checks["invalid_input"] = invalid
 
-    edge = _generate_workout(
+
+async def run_generator_edge_case(page: Any) -> Dict[str, Any]:
+    edge = await _generate_workout(
         page,
         "duration-60",
         ["eq-bodyweight", "eq-dumbbells", "eq-kettlebell", "eq-trx", "eq-machine"],
         "Advanced",
         "pyramid",
     )
-    time.sleep(1.2)
-    edge_result = page.evaluate(
+    await wait_for_workout(page)
+    edge_result = await page.evaluate(
         """() => {
             const data = window.currentWorkoutData || null;
             return {
@@ -213,28 +231,41 @@ def run_generator_matrix(page: Any) -> Dict[str, Any]:
             };
         }"""
     )
-    checks["edge_case"] = {"setup": edge, "result": edge_result}
+    return {"setup": edge, "result": edge_result}
+
+
+def merge_generator_matrix(cells: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the generator section from its cells in declaration order."""
+    checks: Dict[str, Any] = {}
+    for mode, *_setup in GENERATOR_MODES:
+        checks[mode] = cells[mode]
+    checks["invalid_input"] = cells["invalid_input"]
+    checks["edge_case"] = cells["edge_case"]
 
     all_modes_ok = all(
-        checks[m]["result"]["generated"] and checks[m]["result"]["actualPattern"] == m
-        for m in ("standard", "circuit", "tabata", "pyramid")
+        checks[m].get("result", {}).get("generated")
+        and checks[m]["result"].get("actualPattern") == m
+        and not checks[m].get("unknown_exercises")
+        for m, *_setup in GENERATOR_MODES
     )
+    edge_ok = bool(checks["edge_case"].get("result", {}).get("generated"))
     return {
-        "status": "PASSED" if all_modes_ok and checks["edge_case"]["result"]["generated"] else "WARNING",
+        "status": "PASSED" if all_modes_ok and edge_ok else "WARNING",
         "checks": checks,
     }
 
 
-def run_timer_matrix(page: Any) -> Dict[str, Any]:
-    start_setup = _generate_workout(
+async def run_timer_matrix(page: Any) -> Dict[str, Any]:
+    start_setup = await _generate_workout(
         page, "duration-30", ["eq-bodyweight"], "Intermediate", "standard"
     )
-    time.sleep(1.1)
+    await wait_for_workout(page)
+    await wait_for_dom_settled(page)
     start_selectors = ["#start-workout-btn", 'button[onclick="startWorkout()"]']
     started = False
     for selector in start_selectors:
-        if page.locator(selector).count():
-            page.click(selector)
+        if await page.locator(selector).count():
+            await page.click(selector)
             started = True
             break
 
@@ -246,7 +277,7 @@ def run_timer_matrix(page: Any) -> Dict[str, Any]:
         }
 
     try:
-        page.wait_for_selector("#timer-mode-select", timeout=12000)
+        await page.wait_for_selector("#timer-mode-select", timeout=12000)
     except PlaywrightTimeoutError:
         return {
             "status": "FAILED",
@@ -254,7 +285,7 @@ def run_timer_matrix(page: Any) -> Dict[str, Any]:
             "setup": start_setup,
         }
 
-    baseline = page.evaluate(
+    baseline = await page.evaluate(
         """() => ({
             workTime: window.workoutState?.workTime || null,
             restTime: window.workoutState?.restTime || null
@@ -273,9 +304,9 @@ def run_timer_matrix(page: Any) -> Dict[str, Any]:
     }
 
     for mode in ("standard", "tabata", "hiit", "custom"):
-        page.select_option("#timer-mode-select", mode)
+        await page.select_option("#timer-mode-select", mode)
         if mode == "custom":
-            page.evaluate(
+            await page.evaluate(
                 """({ workTime, restTime }) => {
                     const work = document.getElementById('custom-work-time');
                     const rest = document.getElementById('custom-rest-time');
@@ -293,8 +324,8 @@ def run_timer_matrix(page: Any) -> Dict[str, Any]:
                     "restTime": mode_expectations["custom"]["restTime"],
                 },
             )
-        time.sleep(0.25)
-        result = page.evaluate(
+        await wait_for_dom_settled(page)
+        result = await page.evaluate(
             """(mode) => {
                 const s = window.workoutState || {};
                 const d = window.currentWorkoutData || {};
@@ -328,15 +359,15 @@ def run_timer_matrix(page: Any) -> Dict[str, Any]:
     return {"status": "PASSED" if passed else "WARNING", "checks": results, "setup": start_setup}
 
 
-def run_auth_matrix(page: Any) -> Dict[str, Any]:
-    _clear_app_storage(page)
+async def run_auth_matrix(page: Any) -> Dict[str, Any]:
+    await _clear_app_storage(page)
     username = f"regression_user_{int(time.time())}"
     password = "Pass1234!"
     new_password = "NewPass5678!"
 
     checks: Dict[str, Any] = {}
 
-    checks["register"] = page.evaluate(
+    checks["register"] = await page.evaluate(
         """async ({ username, password }) => {
             return await window.userAccount.register(username, password, {
                 name: 'Regression User',
@@ -348,24 +379,24 @@ def run_auth_matrix(page: Any) -> Dict[str, Any]:
         {"username": username, "password": password},
     )
 
-    page.evaluate("() => window.userAccount.logout()")
-    checks["login_original_password"] = page.evaluate(
+    await page.evaluate("() => window.userAccount.logout()")
+    checks["login_original_password"] = await page.evaluate(
         """async ({ username, password }) => {
             return await window.userAccount.login(username, password);
         }""",
         {"username": username, "password": password},
     )
 
-    checks["session_persists_after_reload"] = page.evaluate(
+    checks["session_persists_after_reload"] = await page.evaluate(
         """() => ({ isLoggedIn: window.userAccount.isLoggedIn, user: window.userAccount.currentUser?.username || null })"""
     )
-    page.reload(wait_until="networkidle")
-    page.wait_for_function("() => !!window.userAccount")
-    checks["session_after_reload"] = page.evaluate(
+    await page.reload(wait_until="networkidle")
+    await wait_for_app(page)
+    checks["session_after_reload"] = await page.evaluate(
         """() => ({ isLoggedIn: window.userAccount.isLoggedIn, user: window.userAccount.currentUser?.username || null })"""
     )
 
-    checks["reset_password"] = page.evaluate(
+    checks["reset_password"] = await page.evaluate(
         """async ({ username, newPassword }) => {
             return await window.userAccount.resetPassword(
                 username,
@@ -377,25 +408,25 @@ def run_auth_matrix(page: Any) -> Dict[str, Any]:
         {"username": username, "newPassword": new_password},
     )
 
-    page.evaluate("() => window.userAccount.logout()")
-    checks["login_new_password"] = page.evaluate(
+    await page.evaluate("() => window.userAccount.logout()")
+    checks["login_new_password"] = await page.evaluate(
         """async ({ username, password }) => {
             return await window.userAccount.login(username, password);
         }""",
         {"username": username, "password": new_password},
     )
-    page.evaluate("() => window.userAccount.logout()")
-    checks["login_old_password_after_reset"] = page.evaluate(
+    await page.evaluate("() => window.userAccount.logout()")
+    checks["login_old_password_after_reset"] = await page.evaluate(
         """async ({ username, password }) => {
             return await window.userAccount.login(username, password);
         }""",
         {"username": username, "password": password},
     )
 
-    page.evaluate("() => window.userAccount.logout()")
-    page.reload(wait_until="networkidle")
-    page.wait_for_function("() => !!window.userAccount")
-    checks["logged_out_after_reload"] = page.evaluate(
+    await page.evaluate("() => window.userAccount.logout()")
+    await page.reload(wait_until="networkidle")
+    await wait_for_app(page)
+    checks["logged_out_after_reload"] = await page.evaluate(
         """() => ({ isLoggedIn: window.userAccount.isLoggedIn, user: window.userAccount.currentUser || null })"""
     )
 
@@ -411,47 +442,102 @@ def run_auth_matrix(page: Any) -> Dict[str, Any]:
     return {"status": "PASSED" if passed else "WARNING", "checks": checks}
 
 
-def run_regression_sweep(headless: bool = True) -> Dict[str, Any]:
+CellBody = Callable[[Any], Awaitable[Dict[str, Any]]]
+Cell = Tuple[str, CellBody]
+
+
+def default_max_contexts() -> int:
+    """One context per core, capped so a large machine does not open every cell at once."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _sweep_cells(index: ExerciseIndex | None) -> List[Cell]:
+    cells: List[Cell] = []
+    for mode, duration_id, equipment_ids, level in GENERATOR_MODES:
+        body = partial(
+            run_generator_mode, mode=mode, duration_id=duration_id, equipment_ids=equipment_ids, level=level, index=index
+        )
+        cells.append((f"generator:{mode}", body))
+    cells.append(("generator:invalid_input", run_generator_invalid_input))
+    cells.append(("generator:edge_case", run_generator_edge_case))
+    cells.append(("timer_matrix", run_timer_matrix))
+    cells.append(("auth_matrix", run_auth_matrix))
+    return cells
+
+
+async def run_cell(browser: Any, base_url: str, semaphore: asyncio.Semaphore, body: CellBody) -> Dict[str, Any]:
+    """Run ``body`` on a fresh page in its own context; errors become a FAILED result."""
+    async with semaphore:
+        started = time.perf_counter()
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            await _open_app(page, base_url)
+            result = await body(page)
+        except Exception as exc:
+            result = {"status": "FAILED", "error": str(exc)}
+        finally:
+            await context.close()
+        result["cell_seconds"] = round(time.perf_counter() - started, 2)
+        return result
+
+
+async def run_cells(browser: Any, base_url: str, cells: List[Cell], max_contexts: int) -> Dict[str, Dict[str, Any]]:
+    """Run every cell, at most ``max_contexts`` at a time; results keep the order of ``cells``."""
+    semaphore = asyncio.Semaphore(max(1, max_contexts))
+    outcomes = await asyncio.gather(*(run_cell(browser, base_url, semaphore, body) for _name, body in cells))
+    return {name: outcome for (name, _body), outcome in zip(cells, outcomes)}
+
+
+def merge_sections(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    generator_cells = {name.split(":", 1)[1]: result for name, result in results.items() if name.startswith("generator:")}
+    return {
+        "generator_matrix": merge_generator_matrix(generator_cells),
+        "timer_matrix": results["timer_matrix"],
+        "auth_matrix": results["auth_matrix"],
+    }
+
+
+async def _run_sections(base_url: str, headless: bool, max_contexts: int) -> Dict[str, Any]:
+    cells = _sweep_cells(_load_exercise_index())
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            results = await run_cells(browser, base_url, cells, max_contexts)
+        finally:
+            await browser.close()
+    return merge_sections(results)
+
+
+def run_regression_sweep(headless: bool = True, max_contexts: Optional[int] = None) -> Dict[str, Any]:
     server = LocalServer()
     started = time.time()
     base_url = server.start()
+    max_contexts = max_contexts or default_max_contexts()
 
     report: Dict[str, Any] = {
         "timestamp": time.time(),
         "base_url": base_url,
         "status": "FAILED",
         "execution_seconds": 0.0,
+        "max_contexts": max_contexts,
         "sections": {},
         "blockers": [],
     }
 
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=headless)
-            page = browser.new_page()
-            page.goto(base_url, wait_until="networkidle")
-            page.wait_for_selector("#workout-form", timeout=15000)
-            page.wait_for_function("() => !!window.userAccount", timeout=15000)
-
-            generator = run_generator_matrix(page)
-            timer = run_timer_matrix(page)
-            auth = run_auth_matrix(page)
-
-            report["sections"]["generator_matrix"] = generator
-            report["sections"]["timer_matrix"] = timer
-            report["sections"]["auth_matrix"] = auth
-
-            for name, section in report["sections"].items():
-                if section.get("status") != "PASSED":
-                    report["blockers"].append(
-                        {
-                            "section": name,
-                            "status": section.get("status"),
-                        }
-                    )
-
-            report["status"] = "PASSED" if not report["blockers"] else "WARNING"
-            browser.close()
+        report["sections"] = asyncio.run(_run_sections(base_url, headless, max_contexts))
+
+        for name, section in report["sections"].items():
+            if section.get("status") != "PASSED":
+                report["blockers"].append(
+                    {
+                        "section": name,
+                        "status": section.get("status"),
+                    }
+                )
+
+        report["status"] = "PASSED" if not report["blockers"] else "WARNING"
     except Exception as exc:
         report["status"] = "FAILED"
         report["error"] = str(exc)
@@ -471,9 +557,15 @@ def main() -> None:
         action="store_true",
         help="Run browser in visible mode",
     )
+    parser.add_argument(
+        "--max-contexts",
+        type=int,
+        default=None,
+        help="Browser contexts to run at once (default: one per core, up to 8)",
+    )
     args = parser.parse_args()
 
-    report = run_regression_sweep(headless=not args.visible)
+    report = run_regression_sweep(headless=not args.visible, max_contexts=args.max_contexts)
     print(json.dumps(report, indent=2))
 
     if report["status"] == "PASSED":
@@ -0,0 +1,152 @@
+"""Admission control for pipeline tests based on declared and live resource use.
+
+A fixed worker count treats every test alike, but a browser test needs a
+core and hundreds of MB while a static check needs almost nothing. Each test
+declares a ``ResourceCost`` instead, and ``ResourceGovernor.admit`` blocks
+until the cost fits:
+
+- the declared CPU of running tests plus the new one stays within the
+  logical CPU count;
+- the declared RSS fits in the memory budget, which is the memory available
+  when the governor was created minus a reserve;
+- the live ``psutil`` reading still has room for the declared RSS above the
+  reserve. This catches memory used by other processes, or by running
+  tests that outgrew their estimate;
+- a test that needs a whole core or more waits while the live CPU load is
+  at or above ``busy_percent``.
+
+A test is always admitted when nothing else is running, so a test larger
+than the whole machine still runs, alone. Waiting tests re-check the live
+reading every ``poll`` seconds and are also woken whenever a running test
+finishes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+
+MB = 1024 * 1024
+DEFAULT_RESERVE_MB = 512
+DEFAULT_POLL = 0.25
+DEFAULT_BUSY_PERCENT = 95.0
+
+# (load percent across all CPUs, available bytes)
+ResourceProbe = Callable[[], Tuple[float, int]]
+
+
+@dataclass(frozen=True)
+class ResourceCost:
+    """Estimated peak use of one test: cores busy and resident memory."""
+
+    cpu: float = 0.1
+    rss_mb: int = 16
+
+    @classmethod
+    def from_definition(cls, definition: Mapping[str, Any]) -> "ResourceCost":
+        cost = definition.get("cost") or {}
+        return cls(float(cost.get("cpu", cls.cpu)), int(cost.get("rss_mb", cls.rss_mb)))
+
+
+def psutil_probe() -> Tuple[float, int]:
+    import psutil
+
+    return psutil.cpu_percent(interval=None), psutil.virtual_memory().available
+
+
+def _host_cpus() -> int:
+    import psutil
+
+    return psutil.cpu_count(logical=True) or 1
+
+
+class ResourceGovernor:
+    """Admit tests while their declared costs fit the CPU and memory budget."""
+
+    def __init__(
+        self,
+        cpu_capacity: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+        reserve_mb: int = DEFAULT_RESERVE_MB,
+        probe: ResourceProbe = psutil_probe,
+        poll: float = DEFAULT_POLL,
+        busy_percent: float = DEFAULT_BUSY_PERCENT,
+    ):
+        self.probe = probe
+        self.poll = poll
+        self.busy_percent = busy_percent
+        self.reserve_mb = reserve_mb
+        self.cpu_capacity = float(cpu_capacity if cpu_capacity is not None else _host_cpus())
+        if memory_mb is None:
+            memory_mb = max(0, probe()[1] // MB - reserve_mb)
+        self.memory_mb = int(memory_mb)
+
+        self._cond = threading.Condition()
+        self._cpu = 0.0
+        self._rss_mb = 0
+        self._running = 0
+        self.admitted = 0
+        self.throttled = 0
+        self.peak_running = 0
+        self.peak_cpu = 0.0
+        self.peak_rss_mb = 0
+        self.waited_seconds = 0.0
+
+    def _fits(self, cost: ResourceCost) -> bool:
+        if self._running == 0:
+            return True
+        if self._cpu + cost.cpu > self.cpu_capacity:
+            return False
+        if self._rss_mb + cost.rss_mb > self.memory_mb:
+            return False
+        load, available = self.probe()
+        if cost.cpu >= 1 and load >= self.busy_percent:
+            return False
+        return available // MB - self.reserve_mb >= cost.rss_mb
+
+    @contextmanager
+    def admit(self, cost: ResourceCost) -> Iterator[None]:
+        """Hold ``cost`` for the duration of the block, waiting until it fits."""
+        started = time.monotonic()
+        with self._cond:
+            waited = False
+            while not self._fits(cost):
+                waited = True
+                self._cond.wait(self.poll)
+            if waited:
+                self.throttled += 1
+                self.waited_seconds += time.monotonic() - started
+            self._cpu += cost.cpu
+            self._rss_mb += cost.rss_mb
+            self._running += 1
+            self.admitted += 1
+            self.peak_running = max(self.peak_running, self._running)
+            self.peak_cpu = max(self.peak_cpu, self._cpu)
+            self.peak_rss_mb = max(self.peak_rss_mb, self._rss_mb)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._cpu -= cost.cpu
+                self._rss_mb -= cost.rss_mb
+                self._running -= 1
+                self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Budget and peak usage, for reports."""
+        with self._cond:
+            return {
+                "cpu_capacity": self.cpu_capacity,
+                "memory_budget_mb": self.memory_mb,
+                "reserve_mb": self.reserve_mb,
+                "admitted": self.admitted,
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "peak_running": self.peak_running,
+                "peak_cpu": round(self.peak_cpu, 2),
+                "peak_rss_mb": self.peak_rss_mb,
+            }
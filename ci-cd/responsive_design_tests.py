@@ -19,22 +19,29 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_app, wait_for_dom_settled, wait_for_workout
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class ResponsiveDesignTests:
-    def __init__(self, base_url="http://127.0.0.1:8001", headless=True):
+    def __init__(self, base_url="http://127.0.0.1:8001", headless=True, driver=None):
         self.base_url = base_url
         self.headless = headless
-        self.driver = None
+        self.driver = driver
+        self.owns_driver = driver is None
         self.wait = None
         self.screenshot_dir = "responsive_design_screenshots"
         os.makedirs(self.screenshot_dir, exist_ok=True)
         
     def setup_driver(self):
         """Setup Chrome WebDriver with mobile emulation capabilities"""
+        if not self.owns_driver:
+            self.wait = WebDriverWait(self.driver, 15)
+            logger.info("✅ Responsive Design using pooled WebDriver")
+            return
+
         options = Options()
         if self.headless:
             options.add_argument("--headless")
@@ -44,14 +51,14 @@ class ResponsiveDesignTests:
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-logging")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 15)
         logger.info("✅ Responsive Design WebDriver initialized")
         
     def teardown_driver(self):
-        """Clean up WebDriver"""
-        if self.driver:
+        """Clean up WebDriver (pooled sessions are returned by the pool, not quit)"""
+        if self.driver and self.owns_driver:
             self.driver.quit()
             logger.info("🔚 WebDriver closed")
             
@@ -71,7 +78,7 @@ class ResponsiveDesignTests:
         
         # Set viewport size
         self.driver.set_window_size(width, height)
-        time.sleep(1)
+        wait_for_dom_settled(self.driver)
         
         # Navigate to app
         self.driver.get(self.base_url)
@@ -132,8 +139,9 @@ class ResponsiveDesignTests:
             
             # Generate workout
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             # Check if workout was generated
             workout_generated = self.driver.execute_script("""
@@ -258,7 +266,7 @@ class ResponsiveDesignTests:
             self.driver.set_window_size(1024, 768)  # Landscape
             self.driver.get(self.base_url)
             self.wait.until(EC.presence_of_element_located((By.ID, "workout-form")))
-            time.sleep(1)
+            wait_for_app(self.driver)
             
             landscape_check = self.driver.execute_script("""
                 return {
@@ -279,7 +287,7 @@ class ResponsiveDesignTests:
         # Test portrait orientation
         try:
             self.driver.set_window_size(768, 1024)  # Portrait
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             portrait_check = self.driver.execute_script("""
                 return {
@@ -365,17 +373,17 @@ class ResponsiveDesignTests:
             # Test checkbox touch
             duration_30 = self.driver.find_element(By.ID, "duration-30")
             duration_30.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             
             # Test equipment selection
             bodyweight = self.driver.find_element(By.ID, "eq-bodyweight")
             bodyweight.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             
             # Test dropdown interaction
             fitness_level = self.driver.find_element(By.ID, "fitness-level")
             fitness_level.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             fitness_level.send_keys(Keys.ARROW_DOWN)
             fitness_level.send_keys(Keys.ENTER)
             
@@ -426,7 +434,7 @@ class ResponsiveDesignTests:
         # Test mobile navigation
         try:
             self.driver.set_window_size(375, 667)
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             mobile_nav = self.driver.execute_script("""
                 return {
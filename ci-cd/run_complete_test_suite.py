@@ -10,17 +10,17 @@ import logging
 import time
 import os
 import sys
-import socket
-import threading
 from pathlib import Path
 from urllib.parse import urlparse
 from functools import partial
-from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from driver_pool import DriverPool, default_pool_size
+from static_server import acquire_shared, release_shared
+
 # Import all test suites
 from user_interaction_tests import UserInteractionTests
 from responsive_design_tests import ResponsiveDesignTests
@@ -32,55 +32,55 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 class CompleteTestSuiteRunner:
-    def __init__(self, base_url="http://127.0.0.1:8001", headless=True):
+    def __init__(self, base_url="http://127.0.0.1:8001", headless=True, workers=None):
         self.base_url = base_url
         self.headless = headless
+        self.workers = workers
         self.results = {}
         self._local_server = None
-        self._local_server_thread = None
-        self._started_local_server = False
-
-    def _is_port_open(self, host: str, port: int) -> bool:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(0.5)
-            return sock.connect_ex((host, port)) == 0
 
     def _start_local_server_if_needed(self):
-        """Start local HTTP server for Selenium suites when using localhost URL."""
+        """Point local base URLs at the shared in-memory server from ``static_server``."""
         parsed = urlparse(self.base_url)
         host = parsed.hostname or "127.0.0.1"
-        port = parsed.port or (443 if parsed.scheme == "https" else 80)
 
         # Only auto-manage local development URLs.
         if host not in {"127.0.0.1", "localhost"}:
             return
 
-        if self._is_port_open(host, port):
-            logger.info(f"🌐 Reusing existing local server on {host}:{port}")
-            return
-
-        src_dir = project_root / "src"
-        handler = partial(SimpleHTTPRequestHandler, directory=str(src_dir))
-        self._local_server = ThreadingHTTPServer((host, port), handler)
-        self._local_server_thread = threading.Thread(
-            target=self._local_server.serve_forever,
-            daemon=True
-        )
-        self._local_server_thread.start()
-        self._started_local_server = True
-        time.sleep(0.5)
-        logger.info(f"🌐 Started local test server on {host}:{port} serving {src_dir}")
+        server = acquire_shared(parsed.port or 8001)
+        self._local_server = server
+        self.base_url = server.url.rstrip("/") + parsed.path
+        logger.info(f"🌐 Serving {len(server.assets)} files from memory at {self.base_url}")
 
     def _stop_local_server(self):
-        if not self._started_local_server or self._local_server is None:
+        if self._local_server is None:
             return
 
-        self._local_server.shutdown()
-        self._local_server.server_close()
-        if self._local_server_thread is not None:
-            self._local_server_thread.join(timeout=2)
-        logger.info("🛑 Stopped local test server")
+        self._local_server = None
+        release_shared()
         
+    def _run_suite(self, suite_config, driver):
+        """Run one suite on a pooled driver and summarise its results"""
+        logger.info(f"🧪 Running {suite_config['name']}")
+        logger.info(f"   Description: {suite_config['description']}")
+
+        suite_start = time.time()
+        suite_runner = suite_config["class"](self.base_url, self.headless, driver=driver)
+        suite_result = suite_runner.run_all_tests()
+
+        logger.info(f"   ✅ {suite_config['name']} completed: {suite_result.get('status', 'UNKNOWN')} - {suite_result.get('overall_success_rate', 0.0):.1%} success rate")
+        return {
+            "status": suite_result.get("status", "UNKNOWN"),
+            "success_rate": suite_result.get("overall_success_rate", 0.0),
+            "total_tests": len(suite_result.get("tests", {})),
+            "passed_tests": sum(1 for test in suite_result.get("tests", {}).values()
+                               if test.get("status") == "PASSED"),
+            "execution_time": time.time() - suite_start,
+            "description": suite_config["description"],
+            "details": suite_result
+        }
+
     def run_all_test_suites(self):
         """Run all test suites and compile results"""
         logger.info("🚀 Starting Complete Test Suite Runner")
@@ -93,68 +93,72 @@ class CompleteTestSuiteRunner:
             {
                 "name": "User Interaction Tests",
                 "class": UserInteractionTests,
+                "profile": "default",
                 "description": "Complex user workflows and interactions"
             },
             {
                 "name": "Responsive Design Tests", 
                 "class": ResponsiveDesignTests,
+                "profile": "responsive",
                 "description": "Multi-device compatibility and responsive design"
             },
             {
                 "name": "Performance Monitoring Tests",
                 "class": PerformanceMonitoringTests,
+                "profile": "performance",
                 "description": "Performance metrics and monitoring"
             },
             {
                 "name": "Security Validation Tests",
                 "class": SecurityValidationTests,
+                "profile": "security",
                 "description": "Security testing and validation"
             },
             {
                 "name": "Accessibility Compliance Tests",
                 "class": AccessibilityComplianceTests,
+                "profile": "accessibility",
                 "description": "WCAG 2.1 compliance and accessibility"
             }
         ]
         
         suite_results = {}
         self._start_local_server_if_needed()
+        # Each suite gets a browser launched with its own flags (see driver_pool.PROFILES)
+        profiles = [suite_config["profile"] for suite_config in test_suites]
+        pool = DriverPool(
+            self.workers or default_pool_size(len(test_suites)),
+            base_url=self.base_url,
+            headless=self.headless,
+            warm_profiles=profiles,
+        )
 
         try:
-            for suite_config in test_suites:
-                logger.info(f"🧪 Running {suite_config['name']}")
-                logger.info(f"   Description: {suite_config['description']}")
-                
-                try:
-                    # Initialize and run test suite
-                    suite_runner = suite_config["class"](self.base_url, self.headless)
-                    suite_result = suite_runner.run_all_tests()
-                    
-                    suite_results[suite_config["name"]] = {
-                        "status": suite_result.get("status", "UNKNOWN"),
-                        "success_rate": suite_result.get("overall_success_rate", 0.0),
-                        "total_tests": len(suite_result.get("tests", {})),
-                        "passed_tests": sum(1 for test in suite_result.get("tests", {}).values() 
-                                           if test.get("status") == "PASSED"),
-                        "description": suite_config["description"],
-                        "details": suite_result
-                    }
-                    
-                    logger.info(f"   ✅ {suite_config['name']} completed: {suite_result.get('status', 'UNKNOWN')} - {suite_result.get('overall_success_rate', 0.0):.1%} success rate")
-                    
-                except Exception as e:
-                    logger.error(f"   ❌ {suite_config['name']} failed: {e}")
+            logger.info(f"🌐 Starting {pool.size} pooled browser session(s) for {len(test_suites)} suites")
+            try:
+                pool.start()
+                outcomes = pool.map(
+                    [partial(self._run_suite, suite_config) for suite_config in test_suites], profiles
+                )
+            except Exception as e:
+                logger.error(f"   ❌ Could not start browser pool: {e}")
+                outcomes = [e] * len(test_suites)
+
+            for suite_config, outcome in zip(test_suites, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"   ❌ {suite_config['name']} failed: {outcome}")
                     suite_results[suite_config["name"]] = {
                         "status": "FAILED",
                         "success_rate": 0.0,
                         "total_tests": 0,
                         "passed_tests": 0,
                         "description": suite_config["description"],
-                        "error": str(e)
+                        "error": str(outcome)
                     }
-                
-                logger.info("")
+                else:
+                    suite_results[suite_config["name"]] = outcome
         finally:
+            pool.close()
             self._stop_local_server()
         
         # Calculate overall statistics
@@ -185,6 +189,11 @@ class CompleteTestSuiteRunner:
             "total_passed": total_passed,
             "total_failed": total_tests - total_passed,
             "test_suites": suite_results,
+            "driver_pool": {
+                "size": pool.size,
+                "browsers_launched": pool.launched,
+                "browsers_replaced": pool.replaced
+            },
             "summary": {
                 "user_interaction_tests": suite_results.get("User Interaction Tests", {}).get("status", "NOT_RUN"),
                 "responsive_design_tests": suite_results.get("Responsive Design Tests", {}).get("status", "NOT_RUN"),
@@ -229,6 +238,7 @@ def main():
     parser.add_argument("--url", default="http://127.0.0.1:8001", help="Base URL for testing")
     parser.add_argument("--headless", action="store_true", default=True, help="Run tests in headless mode")
     parser.add_argument("--visible", action="store_true", help="Run tests with visible browser")
+    parser.add_argument("--workers", type=int, default=None, help="Browser sessions to run suites on concurrently (default: one per two cores)")
     
     args = parser.parse_args()
     
@@ -236,7 +246,7 @@ def main():
     headless = not args.visible
     
     # Run complete test suite
-    runner = CompleteTestSuiteRunner(args.url, headless)
+    runner = CompleteTestSuiteRunner(args.url, headless, workers=args.workers)
     results = runner.run_all_test_suites()
     
     # Exit with appropriate code
@@ -18,22 +18,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import wait_for_app, wait_for_dom_settled
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class SecurityValidationTests:
-    def __init__(self, base_url="http://127.0.0.1:8001", headless=True):
+    def __init__(self, base_url="http://127.0.0.1:8001", headless=True, driver=None):
         self.base_url = base_url
         self.headless = headless
-        self.driver = None
+        self.driver = driver
+        self.owns_driver = driver is None
         self.wait = None
         self.screenshot_dir = "security_validation_screenshots"
         os.makedirs(self.screenshot_dir, exist_ok=True)
         
     def setup_driver(self):
         """Setup Chrome WebDriver with security testing capabilities"""
+        if not self.owns_driver:
+            self.wait = WebDriverWait(self.driver, 15)
+            logger.info("✅ Security Validation using pooled WebDriver")
+            return
+
         options = Options()
         if self.headless:
             options.add_argument("--headless")
@@ -46,14 +53,14 @@ class SecurityValidationTests:
         options.add_argument("--disable-web-security")  # For testing purposes
         options.add_argument("--allow-running-insecure-content")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 15)
         logger.info("✅ Security Validation WebDriver initialized")
         
     def teardown_driver(self):
-        """Clean up WebDriver"""
-        if self.driver:
+        """Clean up WebDriver (pooled sessions are returned by the pool, not quit)"""
+        if self.driver and self.owns_driver:
             self.driver.quit()
             logger.info("🔚 WebDriver closed")
             
@@ -114,7 +121,7 @@ class SecurityValidationTests:
                         accepted_payload: afterSet === payload
                     };
                 """, payload)
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
                 
                 # Check if XSS was executed
                 alert_present = False
@@ -197,7 +204,7 @@ class SecurityValidationTests:
                         accepted_payload: afterSet === payload
                     };
                 """, malicious_input)
-                time.sleep(1)
+                wait_for_dom_settled(self.driver)
 
                 current_value = (sanitization_result or {}).get("afterSet")
                 input_sanitized = not bool((sanitization_result or {}).get("accepted_payload"))
@@ -251,7 +258,7 @@ class SecurityValidationTests:
                 
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
                 generate_btn.click()
-                time.sleep(2)
+                wait_for_dom_settled(self.driver)
                 
                 # Check if validation caught the invalid input
                 current_value = fitness_level.get_attribute("value")
@@ -367,7 +374,7 @@ class SecurityValidationTests:
             self.driver.execute_script("window.open('about:blank', '_blank');")
             self.driver.switch_to.window(self.driver.window_handles[1])
             self.driver.get(self.base_url)
-            time.sleep(2)
+            wait_for_app(self.driver)
             
             new_tab_session = self.driver.execute_script("""
                 return {
@@ -0,0 +1,250 @@
+"""Immutable, single-pass snapshot of the application sources under ``src/``.
+
+The automated pipeline's static checks read the same handful of files dozens
+of times per run. ``SourceSnapshot.capture`` reads every file once, decodes it
+once and hands out frozen ``SourceFile`` records with precomputed line/offset
+tables, so every check in a run observes exactly the same bytes even if an
+editor saves a file mid-run.
+
+``track_reads`` records which paths a piece of code looked at and what it saw,
+as ``token -> state`` pairs that ``state_of`` can re-evaluate against a later
+snapshot. The per-check result cache uses this to invalidate precisely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+
+PathLike = Union[str, os.PathLike]
+ReadSet = Dict[str, Optional[str]]
+
+
+def _line_offsets(text: str) -> Tuple[int, ...]:
+    """Return the character offset at which every line of ``text`` starts."""
+    offsets = [0]
+    find = text.find
+    index = find("\n")
+    while index != -1:
+        offsets.append(index + 1)
+        index = find("\n", index + 1)
+    return tuple(offsets)
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """A single decoded file captured by a snapshot."""
+
+    path: str
+    data: bytes
+    text: Optional[str]
+    sha256: str
+    line_offsets: Tuple[int, ...]
+
+    @classmethod
+    def from_bytes(cls, path: str, data: bytes) -> "SourceFile":
+        try:
+            text: Optional[str] = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+        return cls(
+            path=path,
+            data=data,
+            text=text,
+            sha256=hashlib.sha256(data).hexdigest(),
+            line_offsets=_line_offsets(text) if text is not None else (0,),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_offsets)
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing character ``offset``."""
+        return bisect_right(self.line_offsets, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """Return the 1-based ``(line, column)`` of character ``offset``."""
+        line = self.line_of(offset)
+        return line, offset - self.line_offsets[line - 1] + 1
+
+    def line(self, number: int) -> str:
+        """Return the text of 1-based line ``number`` without its newline."""
+        if self.text is None:
+            raise ValueError(f"{self.path} is not a UTF-8 text file")
+        if number < 1 or number > self.line_count:
+            raise IndexError(f"{self.path} has no line {number}")
+        start = self.line_offsets[number - 1]
+        end = self.line_offsets[number] - 1 if number < self.line_count else len(self.text)
+        return self.text[start:end]
+
+
+class SourceSnapshot:
+    """Read-only view of every file under a source root, captured in one pass."""
+
+    def __init__(self, root: PathLike, files: Mapping[str, SourceFile]):
+        self._root = Path(os.path.abspath(root))
+        self._resolved_root = self._root.resolve()
+        self._files: Mapping[str, SourceFile] = MappingProxyType(dict(files))
+        directories = set()
+        for relative in self._files:
+            parent = PurePosixPath(relative).parent
+            while str(parent) != ".":
+                directories.add(str(parent))
+                parent = parent.parent
+        self._directories = frozenset(directories)
+        self._tracking = threading.local()
+
+    @classmethod
+    def capture(cls, root: PathLike) -> "SourceSnapshot":
+        """Read and decode every regular file below ``root`` exactly once."""
+        root_path = Path(os.path.abspath(root))
+        files = {}
+        if root_path.is_dir():
+            for directory, dirnames, filenames in os.walk(root_path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    absolute = Path(directory) / filename
+                    relative = absolute.relative_to(root_path).as_posix()
+                    files[relative] = SourceFile.from_bytes(relative, absolute.read_bytes())
+        return cls(root_path, files)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def files(self) -> Mapping[str, SourceFile]:
+        return self._files
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(source.size for source in self._files.values())
+
+    def relative(self, path: PathLike) -> str:
+        """Normalise an absolute path or a root-relative path to a snapshot key."""
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = Path(os.path.normpath(candidate)).relative_to(self._root)
+            except ValueError:
+                try:
+                    candidate = candidate.resolve().relative_to(self._resolved_root)
+                except ValueError as exc:
+                    raise FileNotFoundError(f"{path} is outside snapshot root {self._root}") from exc
+        key = candidate.as_posix()
+        return "" if key == "." else key
+
+    def get(self, path: PathLike) -> Optional[SourceFile]:
+        try:
+            key = self.relative(path)
+        except FileNotFoundError:
+            return None
+        self._note(f"file:{key}")
+        return self._files.get(key)
+
+    def __getitem__(self, path: PathLike) -> SourceFile:
+        source = self.get(path)
+        if source is None:
+            raise FileNotFoundError(f"{path} is not part of the source snapshot")
+        return source
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, (str, os.PathLike)) and self.get(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def exists(self, path: PathLike) -> bool:
+        """Mirror ``Path.exists`` for files and directories inside the snapshot."""
+        try:
+            key = self.relative(path)
+        except FileNotFoundError:
+            return False
+        self._note(f"file:{key}")
+        self._note(f"dir:{key}")
+        return key == "" or key in self._files or key in self._directories
+
+    def read_text(self, path: PathLike) -> str:
+        source = self[path]
+        if source.text is None:
+            raise UnicodeDecodeError("utf-8", source.data, 0, 1, f"{source.path} is not UTF-8 text")
+        return source.text
+
+    def iter_files(self, prefix: str = "", suffix: str = "") -> Iterator[SourceFile]:
+        """Yield files whose snapshot key starts with ``prefix`` and ends with ``suffix``."""
+        self._note(f"glob:{prefix}*{suffix}")
+        for key, source in self._files.items():
+            if key.startswith(prefix) and key.endswith(suffix):
+                yield source
+
+    def state_of(self, token: str) -> Optional[str]:
+        """Current state of a read token recorded by ``track_reads``."""
+        kind, _, argument = token.partition(":")
+        if kind == "file":
+            source = self._files.get(argument)
+            return source.sha256 if source is not None else None
+        if kind == "dir":
+            return "dir" if argument == "" or argument in self._directories else None
+        if kind == "glob":
+            prefix, _, suffix = argument.partition("*")
+            digest = hashlib.sha256()
+            for key, source in self._files.items():
+                if key.startswith(prefix) and key.endswith(suffix):
+                    digest.update(f"{key}\0{source.sha256}\n".encode("utf-8"))
+            return digest.hexdigest()
+        raise ValueError(f"Unknown read token: {token}")
+
+    def matches(self, reads: Mapping[str, Optional[str]]) -> bool:
+        """True when every recorded read would observe the same state today."""
+        return all(self.state_of(token) == state for token, state in reads.items())
+
+    def changed_paths(self, other: "SourceSnapshot") -> List[str]:
+        """Keys that were added, removed or modified between ``self`` and ``other``."""
+        keys = set(self._files) | set(other.files)
+        return sorted(
+            key for key in keys
+            if self._files.get(key) is None
+            or other.files.get(key) is None
+            or self._files[key].sha256 != other.files[key].sha256
+        )
+
+    def replay_reads(self, reads: Mapping[str, Optional[str]]) -> None:
+        """Attribute previously recorded reads to whatever is tracking on this thread."""
+        for token in reads:
+            self._note(token)
+
+    @contextmanager
+    def track_reads(self) -> Iterator[ReadSet]:
+        """Record every path looked up on this thread while the block runs."""
+        stack: List[ReadSet] = getattr(self._tracking, "stack", None) or []
+        self._tracking.stack = stack
+        reads: ReadSet = {}
+        stack.append(reads)
+        try:
+            yield reads
+        finally:
+            stack.pop()
+
+    def _note(self, token: str) -> None:
+        stack = getattr(self._tracking, "stack", None)
+        if not stack:
+            return
+        state = self.state_of(token)
+        for reads in stack:
+            reads[token] = state
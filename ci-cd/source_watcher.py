@@ -0,0 +1,113 @@
+"""Wait for edits under a source tree, for the pipeline's ``--watch`` mode.
+
+Uses ``watchdog`` (inotify/FSEvents/ReadDirectoryChangesW) when it is
+installed and falls back to polling ``(mtime, size)`` otherwise. Bursts of
+events, such as an editor writing a temp file and renaming it, are debounced
+into a single change notification.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+Signature = Dict[str, Tuple[int, int]]
+
+
+def tree_signature(root: Path) -> Signature:
+    """``relative path -> (mtime_ns, size)`` for every file below ``root``."""
+    signature: Signature = {}
+    for directory, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature[os.path.relpath(path, root)] = (stat.st_mtime_ns, stat.st_size)
+    return signature
+
+
+class SourceWatcher:
+    """Block until files under ``root`` change."""
+
+    def __init__(self, root: Path, interval: float = 0.5, debounce: float = 0.2, use_watchdog: bool = True):
+        self.root = Path(root)
+        self.interval = interval
+        self.debounce = debounce
+        self._event = threading.Event()
+        self._observer = None
+        self._signature: Signature = tree_signature(self.root)
+        if use_watchdog:
+            self._observer = self._start_watchdog()
+
+    @property
+    def backend(self) -> str:
+        return "watchdog" if self._observer is not None else "polling"
+
+    def _start_watchdog(self):
+        try:
+            from watchdog.events import FileSystemEventHandler  # type: ignore
+            from watchdog.observers import Observer  # type: ignore
+        except Exception:
+            return None
+
+        event = self._event
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, _event):
+                event.set()
+
+        observer = Observer()
+        observer.schedule(_Handler(), str(self.root), recursive=True)
+        observer.daemon = True
+        observer.start()
+        return observer
+
+    def _poll_changed(self) -> bool:
+        current = tree_signature(self.root)
+        if current != self._signature:
+            self._signature = current
+            return True
+        return False
+
+    def wait_for_change(self, timeout: Optional[float] = None) -> bool:
+        """Return True once a debounced change is seen, False if ``timeout`` elapses first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._observer is not None:
+                wait_for = self.interval if remaining is None else min(self.interval, remaining)
+                changed = self._event.wait(wait_for)
+            else:
+                changed = self._poll_changed()
+                if not changed:
+                    time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+            if changed:
+                self._settle()
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _settle(self) -> None:
+        """Swallow the rest of an edit burst so one save triggers one rerun."""
+        if self._observer is not None:
+            while True:
+                self._event.clear()
+                if not self._event.wait(self.debounce):
+                    return
+        else:
+            while True:
+                time.sleep(self.debounce)
+                if not self._poll_changed():
+                    return
+
+    def close(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""In-memory static server for ``src/`` shared by every browser suite.
+
+The runners used to start their own ``SimpleHTTPRequestHandler`` (or shell
+out to ``python3 -m http.server``), which reads each file from disk per
+request, speaks HTTP/1.0 and closes the connection after every response, so
+page-load timings mostly measured Python's file server. ``StaticServer``
+instead:
+
+- reads ``src/`` once at start-up;
+- precomputes a strong ETag and gzip (and, if the optional ``brotli``
+  package is installed, brotli) variants for every text asset;
+- speaks HTTP/1.1 with keep-alive and answers ``If-None-Match`` with 304;
+- binds its listening socket, then probes it with a real ``HEAD /`` before
+  ``start`` returns, so callers never sleep and never race the serving
+  thread. The preferred port is used when it is free, otherwise the OS
+  assigns one (port 0); there is no probe-then-bind race on the port.
+
+``acquire_shared``/``release_shared`` (or the ``shared_server`` context
+manager) hand out one reference-counted server per process, so suites that
+run side by side share a single listener. Files are snapshotted when the
+server starts; edits to ``src/`` are picked up by the next start.
+
+Run it directly to serve the app for manual runs::
+
+    python ci-cd/static_server.py --port 8001
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import http.client
+import mimetypes
+import posixpath
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8001
+KEEP_ALIVE_TIMEOUT = 30.0
+READY_TIMEOUT = 5.0
+MIN_COMPRESS_BYTES = 256
+
+_COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+class ServerNotReady(RuntimeError):
+    """Raised when a started server does not answer its readiness probe."""
+
+
+@dataclass(frozen=True)
+class Asset:
+    """One preloaded file: identity body plus precomputed encodings."""
+
+    content_type: str
+    etag: str
+    body: bytes
+    encoded: Dict[str, bytes]
+
+
+def _content_type(path: str) -> str:
+    guessed = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if guessed == "text/javascript":
+        guessed = "application/javascript"
+    if guessed.startswith("text/") or guessed in {"application/javascript", "application/json"}:
+        return f"{guessed}; charset=utf-8"
+    return guessed
+
+
+def _compressible(content_type: str) -> bool:
+    base = content_type.split(";", 1)[0]
+    return base.startswith("text/") or base in _COMPRESSIBLE_TYPES
+
+
+def _brotli():
+    try:
+        import brotli  # type: ignore
+    except ImportError:
+        return None
+    return brotli
+
+
+def brotli_available() -> bool:
+    return _brotli() is not None
+
+
+def _encode(body: bytes, content_type: str) -> Dict[str, bytes]:
+    if len(body) < MIN_COMPRESS_BYTES or not _compressible(content_type):
+        return {}
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    brotli = _brotli()
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return {name: data for name, data in variants.items() if len(data) < len(body)}
+
+
+def transfer_sizes(path: str, body: bytes) -> Dict[str, int]:
+    """Bytes this server sends for ``body`` per coding: ``raw``, ``gzip`` and, with brotli, ``br``."""
+    encoded = _encode(body, _content_type(path))
+    sizes = {"raw": len(body), "gzip": len(encoded.get("gzip", body))}
+    if brotli_available():
+        sizes["br"] = len(encoded.get("br", body))
+    return sizes
+
+
+def load_assets(root: Path = SRC_ROOT) -> Dict[str, Asset]:
+    """Every file under ``root`` keyed by its URL path (``/js/app.js``)."""
+    assets: Dict[str, Asset] = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        key = "/" + path.relative_to(root).as_posix()
+        content_type = _content_type(key)
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        assets[key] = Asset(content_type, etag, body, _encode(body, content_type))
+    return assets
+
+
+def negotiate(accept_encoding: str, available: Dict[str, bytes]) -> Optional[str]:
+    """Best encoding the client accepts (``br`` before ``gzip``), or ``None`` for identity."""
+    accepted: Dict[str, float] = {}
+    for token in (accept_encoding or "").split(","):
+        name, _, params = token.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for name in ("br", "gzip"):
+        if name in available and accepted.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+def probe(host: str, port: int, timeout: float = READY_TIMEOUT) -> int:
+    """Status of ``HEAD /`` on ``host:port``; raises ``ServerNotReady`` if nothing answers.
+
+    The listening socket already exists when this runs, so the connect is
+    queued by the kernel and the call returns as soon as the serving thread
+    handles it: there is nothing to poll or sleep for.
+    """
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("HEAD", "/")
+        return conn.getresponse().status
+    except (OSError, http.client.HTTPException) as exc:
+        raise ServerNotReady(f"no HTTP answer from {host}:{port} within {timeout}s: {exc}") from exc
+    finally:
+        conn.close()
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    server: "_Listener"
+
+    def _lookup(self) -> Optional[Asset]:
+        raw = unquote(urlsplit(self.path).path) or "/"
+        path = posixpath.normpath(raw)
+        assets = self.server.assets
+        if raw.endswith("/"):
+            path = path.rstrip("/") + "/index.html"
+        elif path not in assets and f"{path}/index.html" in assets:
+            path = f"{path}/index.html"
+        return assets.get("/" + path.lstrip("/"))
+
+    def _respond(self, send_body: bool) -> None:
+        asset = self._lookup()
+        if asset is None:
+            self.send_error(404, "File not found")
+            return
+
+        if _matches(self.headers.get("If-None-Match", ""), asset.etag):
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        encoding = negotiate(self.headers.get("Accept-Encoding", ""), asset.encoded)
+        body = asset.encoded[encoding] if encoding else asset.body
+        self.send_response(200)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", asset.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:  # noqa: N802 - http.server naming
+        self._respond(send_body=False)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - signature from http.server
+        pass
+
+
+class _Listener(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], assets: Dict[str, Asset]):
+        self.assets = assets
+        super().__init__(address, _Handler)
+
+
+class StaticServer:
+    """Serve ``root`` from memory on ``host``; ``port`` is preferred, 0 means any."""
+
+    def __init__(self, root: Path = SRC_ROOT, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.root = Path(root)
+        self.host = host
+        self.preferred_port = port
+        self.port: Optional[int] = None
+        self._listener: Optional[_Listener] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self.port is None:
+            raise RuntimeError("static server is not running")
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def assets(self) -> Dict[str, Asset]:
+        return self._listener.assets if self._listener else {}
+
+    def _bind(self, assets: Dict[str, Asset]) -> _Listener:
+        if self.preferred_port:
+            try:
+                return _Listener((self.host, self.preferred_port), assets)
+            except OSError:
+                pass
+        return _Listener((self.host, 0), assets)
+
+    def start(self, timeout: float = READY_TIMEOUT) -> str:
+        """Load ``root``, bind, start serving and probe; the server answers HTTP when this returns."""
+        if self._listener is None:
+            self._listener = self._bind(load_assets(self.root))
+            self.port = self._listener.server_address[1]
+            self._thread = threading.Thread(target=self._listener.serve_forever, name="static-server", daemon=True)
+            self._thread.start()
+            try:
+                probe(self.host, self.port, timeout)
+            except ServerNotReady:
+                self.stop()
+                raise
+        return self.url
+
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.shutdown()
+        self._listener.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self._listener = None
+        self._thread = None
+        self.port = None
+
+    def __enter__(self) -> "StaticServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.stop()
+
+
+_shared: Optional[StaticServer] = None
+_shared_refs = 0
+_shared_lock = threading.Lock()
+
+
+def acquire_shared(port: int = DEFAULT_PORT) -> StaticServer:
+    """The process-wide server, started on first use; pair with ``release_shared``.
+
+    ``port`` only matters for the call that starts it.
+    """
+    global _shared, _shared_refs
+    with _shared_lock:
+        if _shared is None:
+            server = StaticServer(port=port)
+            server.start()
+            _shared = server
+        _shared_refs += 1
+        return _shared
+
+
+def release_shared() -> None:
+    """Drop one reference; the server stops when the last user releases it."""
+    global _shared, _shared_refs
+    with _shared_lock:
+        if _shared is None:
+            return
+        _shared_refs -= 1
+        if _shared_refs <= 0:
+            _shared.stop()
+            _shared, _shared_refs = None, 0
+
+
+@contextmanager
+def shared_server(port: int = DEFAULT_PORT) -> Iterator[StaticServer]:
+    server = acquire_shared(port)
+    try:
+        yield server
+    finally:
+        release_shared()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve src/ from memory with keep-alive and precompressed assets")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Preferred port (0 picks a free one)")
+    args = parser.parse_args()
+
+    server = StaticServer(host=args.host, port=args.port)
+    server.start()
+    print(f"Serving {len(server.assets)} files from {server.root} at {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
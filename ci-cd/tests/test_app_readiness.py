@@ -0,0 +1,142 @@
+import asyncio
+import json
+import shutil
+import subprocess
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError  # noqa: E402
+
+from app_readiness import (  # noqa: E402
+    DOM_SETTLED,
+    MARK,
+    PHASE_CHANGED,
+    WORKOUT_READY,
+    mark,
+    wait_for_dom_settled,
+    wait_for_workout,
+)
+
+
+class _SyncPage:
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.calls = []
+
+    def wait_for_function(self, predicate, arg=None, timeout=None):
+        self.calls.append((predicate, arg, timeout))
+        if not self.ready:
+            raise PlaywrightTimeoutError("Timeout exceeded")
+        return object()
+
+    def evaluate(self, script):
+        self.calls.append((script, None, None))
+        return True
+
+
+class _AsyncPage(_SyncPage):
+    async def wait_for_function(self, predicate, arg=None, timeout=None):
+        return _SyncPage.wait_for_function(self, predicate, arg, timeout)
+
+
+class _Driver:
+    def __init__(self):
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return True
+
+
+class PlaywrightWaitTests(unittest.TestCase):
+    def test_sync_page_reports_ready_and_timeout(self):
+        self.assertTrue(wait_for_workout(_SyncPage(ready=True), timeout=2))
+        self.assertFalse(wait_for_workout(_SyncPage(ready=False), timeout=2))
+
+    def test_timeout_is_passed_in_milliseconds(self):
+        page = _SyncPage()
+        wait_for_dom_settled(page, quiet=0.2, timeout=3)
+        predicate, arg, timeout = page.calls[0]
+        self.assertEqual((predicate, arg, timeout), (DOM_SETTLED, 200.0, 3000))
+
+    def test_async_page_returns_awaitable(self):
+        self.assertTrue(asyncio.run(wait_for_workout(_AsyncPage(ready=True))))
+        self.assertFalse(asyncio.run(wait_for_workout(_AsyncPage(ready=False))))
+
+    def test_mark_uses_evaluate_or_execute_script(self):
+        page = _SyncPage()
+        mark(page)
+        self.assertEqual(page.calls[0][0], MARK)
+
+        driver = _Driver()
+        self.assertIsNone(mark(driver))
+        self.assertIn(MARK, driver.scripts[0])
+
+
+_NODE_HARNESS = """
+let now = 0;
+const observers = [];
+global.performance = { now: () => now };
+global.MutationObserver = class { constructor(cb) { observers.push(cb); } observe() {} };
+global.document = { documentElement: {} };
+global.window = {};
+const mark = %(mark)s;
+const workoutReady = %(workout)s;
+const phaseChanged = %(phase)s;
+const domSettled = %(settled)s;
+const out = {};
+
+out.noWorkout = workoutReady();
+window.currentWorkoutData = { sequence: [{ name: 'Squat' }] };
+out.unmarkedWorkout = workoutReady();
+mark();
+out.sameWorkoutAfterMark = workoutReady();
+window.currentWorkoutData = { sequence: [{ name: 'Lunge' }] };
+out.newWorkoutAfterMark = workoutReady();
+
+window.workoutState = { phase: 'work', currentIndex: 0 };
+mark();
+out.phaseUnchanged = phaseChanged();
+window.workoutState.phase = 'rest';
+out.phaseChanged = phaseChanged();
+
+now = 1000;
+observers.forEach((cb) => cb());
+now = 1100;
+out.settledTooSoon = domSettled(150);
+now = 1200;
+out.settledAfterQuiet = domSettled(150);
+console.log(JSON.stringify(out));
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class PredicateTests(unittest.TestCase):
+    def test_predicates_track_app_state_since_mark(self):
+        script = _NODE_HARNESS % {"mark": MARK, "workout": WORKOUT_READY, "phase": PHASE_CHANGED, "settled": DOM_SETTLED}
+        completed = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True)
+        result = json.loads(completed.stdout)
+
+        self.assertEqual(
+            result,
+            {
+                "noWorkout": False,
+                "unmarkedWorkout": True,
+                "sameWorkoutAfterMark": False,
+                "newWorkoutAfterMark": True,
+                "phaseUnchanged": False,
+                "phaseChanged": True,
+                "settledTooSoon": False,
+                "settledAfterQuiet": True,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from bench_history import BenchHistory, detect, runner_fingerprint, samples_from_report  # noqa: E402
+
+
+RUNNER = ("runner-a", {"cpu": "test"})
+OTHER_RUNNER = ("runner-b", {"cpu": "other"})
+
+
+class BenchHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.history = BenchHistory(Path(self._tmp.name) / "history.sqlite3")
+        self.rng = random.Random(7)
+
+    def tearDown(self):
+        self.history.close()
+        self._tmp.cleanup()
+
+    def _record(self, lcp, commit="c0", runner=RUNNER):
+        values = [lcp * (1 + self.rng.uniform(-0.03, 0.03)) for _ in range(5)]
+        return self.history.record({"desktop/cold": {"lcp": values}}, commit=commit, fingerprint=runner)
+
+    def test_runs_are_grouped_per_series_and_runner(self):
+        self._record(800, "c1")
+        self._record(810, "c2")
+        self._record(400, "c3", runner=OTHER_RUNNER)
+
+        runs = self.history.runs("desktop/cold", "lcp", "runner-a")
+        self.assertEqual([run.commit for run in runs], ["c1", "c2"])
+        self.assertEqual(len(runs[0].values), 5)
+        self.assertEqual(self.history.series("runner-b"), [("desktop/cold", "lcp")])
+        self.assertEqual(self.history.latest_fingerprint(), "runner-b")
+
+    def test_baseline_pools_the_last_runs_of_one_runner(self):
+        self.assertEqual(self.history.baseline("runner-a"), {})
+        for index in range(4):
+            self._record(800, f"c{index}")
+        self._record(400, "other", runner=OTHER_RUNNER)
+
+        baseline = self.history.baseline("runner-a", window=3)
+        self.assertEqual(list(baseline), ["desktop/cold"])
+        self.assertEqual(len(baseline["desktop/cold"]["lcp"]), 15)
+        self.assertTrue(all(value > 700 for value in baseline["desktop/cold"]["lcp"]))
+
+    def test_history_is_append_only(self):
+        self._record(800)
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.history._conn.execute("DELETE FROM samples")
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.history._conn.execute("UPDATE runs SET commit_sha = 'x'")
+
+    def test_step_regression_and_improvement(self):
+        for index in range(5):
+            self._record(800, f"c{index}")
+        self._record(1000, "slow")
+        verdict = detect(self.history)
+        self.assertEqual(verdict.status, "FAILED")
+        self.assertEqual([finding.kind for finding in verdict.findings], ["regression"])
+
+        self._record(600, "fast")
+        verdict = detect(self.history)
+        self.assertEqual(verdict.status, "PASSED")
+        self.assertEqual(verdict.to_dict()["improvements"][0].split(":")[0], "desktop/cold lcp")
+
+    def test_slow_creep_is_caught_against_older_runs(self):
+        # +2% per commit: each step is noise, the drift over 14 commits is not
+        for index in range(15):
+            self._record(800 * 1.02 ** index, f"c{index}")
+        verdict = detect(self.history, window=5)
+        self.assertEqual([finding.kind for finding in verdict.findings], ["creep"])
+        self.assertEqual(verdict.findings[0].commit, "c14")
+
+    def test_other_runners_are_not_compared(self):
+        for index in range(5):
+            self._record(800, f"c{index}")
+        self._record(1600, "slow", runner=OTHER_RUNNER)
+        self.assertEqual(detect(self.history).compared, 0)
+        self.assertEqual(detect(self.history, fingerprint="runner-a").status, "PASSED")
+
+    def test_samples_from_result_files(self):
+        monitoring = {
+            "tests": {
+                "page_load_performance": {"samples": {"desktop/warm": {"load": [100.0]}}},
+                "workout_generation_performance": {"generation_times": [0.5, None, 0.25]},
+            }
+        }
+        self.assertEqual(
+            samples_from_report(monitoring),
+            {"desktop/warm": {"load": [100.0]}, "generation/bodyweight-30": {"generation_ms": [500.0, 250.0]}},
+        )
+        self.assertEqual(samples_from_report({"samples": {"mobile/cold": {"lcp": [1.0]}}}),
+                         {"mobile/cold": {"lcp": [1.0]}})
+
+    def test_fingerprint_is_stable(self):
+        self.assertEqual(runner_fingerprint()[0], runner_fingerprint()[0])
+        self.assertNotEqual(runner_fingerprint({"browser": "1"})[0], runner_fingerprint({"browser": "2"})[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
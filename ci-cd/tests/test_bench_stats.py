@@ -0,0 +1,71 @@
+import random
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from bench_stats import bootstrap_ci, compare, mann_whitney_greater, median, percentile, summarize  # noqa: E402
+
+
+def _noisy(center, n, spread=0.05, seed=1):
+    rng = random.Random(seed)
+    return [center * (1 + rng.uniform(-spread, spread)) for _ in range(n)]
+
+
+class SummaryTests(unittest.TestCase):
+    def test_percentiles_interpolate_between_ranks(self):
+        values = [4, 1, 3, 2]
+        self.assertEqual(median(values), 2.5)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 100), 4)
+        self.assertAlmostEqual(percentile(values, 95), 3.85)
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+    def test_summary_is_robust_to_an_outlier(self):
+        summary = summarize([100, 101, 99, 102, 98, 100, 5000])
+        self.assertEqual(summary.n, 7)
+        self.assertEqual(summary.median, 100)
+        self.assertGreater(summary.mean, 500)
+        self.assertLessEqual(summary.ci_low, summary.median)
+        self.assertGreaterEqual(summary.ci_high, summary.median)
+
+    def test_bootstrap_is_reproducible(self):
+        values = _noisy(100, 9)
+        self.assertEqual(bootstrap_ci(values), bootstrap_ci(values))
+
+
+class ComparisonTests(unittest.TestCase):
+    def test_mann_whitney_direction(self):
+        low, high = list(range(10)), list(range(20, 30))
+        self.assertLess(mann_whitney_greater(high, low), 0.001)
+        self.assertGreater(mann_whitney_greater(low, high), 0.99)
+        self.assertEqual(mann_whitney_greater([5, 5, 5], [5, 5, 5]), 1.0)
+
+    def test_large_consistent_slowdown_is_a_regression(self):
+        result = compare(_noisy(1000, 7), _noisy(1300, 7, seed=2))
+        self.assertTrue(result.significant)
+        self.assertTrue(result.regressed)
+        self.assertGreater(result.ci_low, 0)
+
+    def test_noise_and_speedups_are_not_regressions(self):
+        self.assertFalse(compare(_noisy(1000, 7), _noisy(1000, 7, seed=2)).regressed)
+        self.assertFalse(compare(_noisy(1000, 7), _noisy(700, 7, seed=2)).regressed)
+
+    def test_significant_but_immaterial_shift_passes(self):
+        result = compare(_noisy(1000, 9, spread=0.001), _noisy(1030, 9, spread=0.001, seed=2), min_ratio=0.10)
+        self.assertTrue(result.significant)
+        self.assertFalse(result.regressed)
+
+    def test_too_few_samples_never_regress(self):
+        result = compare([100, 100], [900, 900])
+        self.assertEqual(result.p_value, 1.0)
+        self.assertFalse(result.regressed)
+
+
+if __name__ == "__main__":
+    unittest.main()
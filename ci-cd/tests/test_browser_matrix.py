@@ -0,0 +1,116 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from browser_matrix import (  # noqa: E402
+    DEFAULT_ENGINES,
+    BrowserCell,
+    engine_summary,
+    expand,
+    load_engines,
+    matrix_workers,
+    split_installed,
+)
+
+
+GIB = 1024 ** 3
+
+DEFINITIONS = {
+    "security_scan": {},
+    "selenium_e2e": {"browsers": "selenium"},
+    "browser_smoke": {"browsers": "playwright"},
+}
+
+
+class LoadEnginesTests(unittest.TestCase):
+    def _config(self, browsers):
+        handle = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        with handle:
+            json.dump({"browsers": browsers}, handle)
+        self.addCleanup(Path(handle.name).unlink)
+        return Path(handle.name)
+
+    def test_reads_enabled_runners_and_drops_disabled_ones(self):
+        path = self._config(
+            {
+                "selenium": {"enabled": False, "browsers": ["chrome", "firefox"]},
+                "playwright": {"enabled": True, "browsers": ["chromium", "firefox", "webkit", "firefox"]},
+            }
+        )
+        self.assertEqual(load_engines(path), {"selenium": (), "playwright": ("chromium", "firefox", "webkit")})
+
+    def test_missing_file_falls_back_to_defaults(self):
+        self.assertEqual(load_engines(Path("/nonexistent/config.json")), dict(DEFAULT_ENGINES))
+
+    def test_repository_config_declares_the_full_matrix(self):
+        engines = load_engines(CI_CD_DIR / "enhanced_pipeline_config.json")
+        self.assertEqual(engines["playwright"], ("chromium", "firefox", "webkit"))
+        self.assertEqual(engines["selenium"], ("chrome", "firefox"))
+
+
+class ExpandTests(unittest.TestCase):
+    def test_browser_tests_become_one_cell_per_engine(self):
+        engines = {"selenium": ("chrome", "firefox"), "playwright": ("chromium", "webkit")}
+        plain, cells = expand(["security_scan", "selenium_e2e", "browser_smoke"], DEFINITIONS, engines)
+
+        self.assertEqual(plain, ["security_scan"])
+        self.assertEqual(
+            [cell.name for cell in cells],
+            ["selenium_e2e[chrome]", "selenium_e2e[firefox]", "browser_smoke[chromium]", "browser_smoke[webkit]"],
+        )
+        self.assertEqual(cells[0], BrowserCell("selenium_e2e", "selenium", "chrome"))
+
+    def test_runner_without_engines_yields_no_cells(self):
+        plain, cells = expand(["selenium_e2e"], DEFINITIONS, {"selenium": ()})
+        self.assertEqual((plain, cells), ([], []))
+
+    def test_engines_without_a_browser_binary_are_split_off(self):
+        engines = {"selenium": ("chrome", "firefox"), "playwright": ("chromium", "firefox", "webkit")}
+        present = {("selenium", "chrome"), ("playwright", "chromium")}
+        installed, missing = split_installed(engines, probe=lambda runner, name: (runner, name) in present)
+
+        self.assertEqual(installed, {"selenium": ("chrome",), "playwright": ("chromium",)})
+        self.assertEqual(missing, {"selenium": ("firefox",), "playwright": ("firefox", "webkit")})
+        _, cells = expand(["selenium_e2e", "browser_smoke"], DEFINITIONS, installed)
+        self.assertEqual([cell.name for cell in cells], ["selenium_e2e[chrome]", "browser_smoke[chromium]"])
+
+
+class MatrixWorkersTests(unittest.TestCase):
+    def test_bounded_by_cells_cpus_and_memory(self):
+        self.assertEqual(matrix_workers(5, cpu_count=16, available_bytes=64 * GIB), 5)
+        self.assertEqual(matrix_workers(5, cpu_count=2, available_bytes=64 * GIB), 2)
+        self.assertEqual(matrix_workers(5, cpu_count=16, available_bytes=int(1.5 * GIB)), 3)
+
+    def test_always_at_least_one_browser_when_there_is_work(self):
+        self.assertEqual(matrix_workers(3, cpu_count=8, available_bytes=100 * 1024 * 1024), 1)
+        self.assertEqual(matrix_workers(0, cpu_count=8, available_bytes=64 * GIB), 0)
+
+    def test_reads_host_resources_when_not_given(self):
+        self.assertGreaterEqual(matrix_workers(2), 1)
+
+
+class EngineSummaryTests(unittest.TestCase):
+    def test_counts_and_times_per_engine(self):
+        summary = engine_summary(
+            [
+                ("playwright:chromium", "passed", 1.25),
+                ("playwright:chromium", "failed", 2.5),
+                ("playwright:webkit", "passed", 3.0),
+            ]
+        )
+        self.assertEqual(
+            summary["playwright:chromium"],
+            {"tests": 2, "passed": 1, "total_seconds": 3.75, "slowest_seconds": 2.5},
+        )
+        self.assertEqual(summary["playwright:webkit"]["passed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from bundle_budget import BASELINE_PATH, KB, Budget, analyze, load_baseline, save_baseline  # noqa: E402
+from source_snapshot import SourceSnapshot  # noqa: E402
+
+
+def _noise(size):
+    # Random hex, so gzip sizes grow with the raw size
+    return os.urandom(size).hex()[:size]
+
+
+class BundleBudgetTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src = Path(self._tmp.name) / "src"
+        (self.src / "js").mkdir(parents=True)
+        self._write("index.html", '<script type="module" src="js/main.js"></script>')
+        self._write("js/main.js", "import './big.js';\n" + "const a = 1;\n" * 100)
+        self._write("js/big.js", f"export const blob = '{_noise(6000)}';")
+        self._write("js/orphan.js", f"export const unused = '{_noise(9000)}';")
+        self.baseline = Path(self._tmp.name) / "baseline.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, key, text):
+        (self.src / key).write_text(text, encoding="utf-8")
+
+    def _analyze(self, budget=None, baseline=None):
+        return analyze(SourceSnapshot.capture(self.src), budget or Budget(), baseline)
+
+    def test_measures_only_what_the_entry_loads(self):
+        report = self._analyze()
+        self.assertEqual([size.key for size in report.files], ["index.html", "js/big.js", "js/main.js"])
+        main = next(size for size in report.files if size.key == "js/main.js")
+        data = (self.src / "js" / "main.js").read_bytes()
+        self.assertEqual(main.raw, len(data))
+        self.assertEqual(main.gzip, len(gzip.compress(data, compresslevel=9, mtime=0)))
+        self.assertEqual(report.total.raw, sum(size.raw for size in report.files))
+        self.assertEqual(report.status, "PASSED")
+
+    def test_module_and_total_budgets(self):
+        report = self._analyze(Budget(module_kb=2, total_kb=5, modules={"js/big.js": 8}))
+        self.assertEqual(report.violations, [])
+
+        report = self._analyze(Budget(module_kb=2, total_kb=3))
+        self.assertEqual(report.status, "FAILED")
+        self.assertEqual(len(report.violations), 2)
+        self.assertTrue(report.violations[0].startswith("js/big.js:"))
+        self.assertIn("index.html total", report.violations[1])
+
+    def test_growth_since_the_saved_baseline_is_a_regression(self):
+        save_baseline(self._analyze(), self.baseline)
+        self._write("js/big.js", f"export const blob = '{_noise(9000)}';")
+        self._write("js/extra.js", "export {};")
+        self._write("js/main.js", "import './big.js';\nimport './extra.js';\n" + "const a = 1;\n" * 100)
+
+        report = self._analyze(baseline=load_baseline(self.baseline))
+        self.assertTrue(report.baseline_found)
+        self.assertEqual(report.status, "WARNING")
+        self.assertEqual(report.added, ["js/extra.js"])
+        self.assertGreater(report.deltas["js/big.js"], 1000)
+        self.assertEqual([line.split(":")[0] for line in report.regressions], ["js/big.js", "*total*"])
+
+    def test_small_growth_is_not_a_regression(self):
+        save_baseline(self._analyze(), self.baseline)
+        self._write("js/main.js", "import './big.js';\n" + "const a = 1;\n" * 101)
+        report = self._analyze(Budget(min_growth_bytes=512), load_baseline(self.baseline))
+        self.assertEqual(report.regressions, [])
+
+    def test_budget_is_read_from_config(self):
+        config = Path(self._tmp.name) / "config.json"
+        config.write_text(json.dumps({"performance": {"bundle_budget": {"total_kb": 50, "unknown": 1}}}))
+        self.assertEqual(Budget.from_config(config).total_kb, 50)
+        self.assertEqual(Budget.from_config(config.with_name("missing.json")), Budget())
+
+    def test_repository_app_fits_its_budget(self):
+        report = analyze(SourceSnapshot.capture(CI_CD_DIR.parent / "src"), Budget.from_config())
+        self.assertEqual(report.violations, [])
+        self.assertGreater(report.total.raw, 100 * KB)
+
+    def test_repository_app_is_diffed_against_the_committed_baseline(self):
+        report = analyze(
+            SourceSnapshot.capture(CI_CD_DIR.parent / "src"), Budget.from_config(), load_baseline(BASELINE_PATH)
+        )
+        self.assertTrue(report.baseline_found)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from cache_store import SCHEMA_VERSION, CacheSchemaError, CacheStore  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheStoreTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "cache.sqlite3"
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_and_partial_reads(self):
+        with CacheStore(self.path, clock=self.clock) as store:
+            store.put("checks", "a", {"status": "PASSED"})
+            store.put("checks", "b", [1, 2])
+            store.put("other", "a", "x")
+
+            self.assertEqual(store.get("checks", "a"), {"status": "PASSED"})
+            self.assertEqual(store.get_many("checks", ["b", "missing"]), {"b": [1, 2]})
+            self.assertEqual(store.get("other", "a"), "x")
+
+    def test_entries_expire_after_ttl(self):
+        with CacheStore(self.path, ttl_seconds=60, clock=self.clock) as store:
+            store.put("checks", "a", 1)
+            self.clock.now += 61
+            self.assertIsNone(store.get("checks", "a"))
+            self.assertEqual(store.stats()["entries"], 0)
+
+    def test_least_recently_used_entries_are_evicted_past_budget(self):
+        with CacheStore(self.path, max_bytes=25, clock=self.clock) as store:
+            store.put("checks", "old", "x" * 8)
+            self.clock.now += 1
+            store.put("checks", "used", "y" * 8)
+            self.clock.now += 1
+            store.get("checks", "old")
+            self.clock.now += 1
+            store.put("checks", "new", "z" * 8)
+
+            self.assertIsNone(store.get("checks", "used"))
+            self.assertEqual(store.get("checks", "old"), "x" * 8)
+            self.assertLessEqual(store.stats()["bytes"], 25)
+
+    def test_newer_schema_version_is_refused_and_left_intact(self):
+        with CacheStore(self.path, clock=self.clock) as store:
+            store.put("checks", "a", 1)
+        conn = sqlite3.connect(str(self.path))
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        conn.commit()
+        conn.close()
+
+        with self.assertRaises(CacheSchemaError):
+            CacheStore(self.path, clock=self.clock)
+        conn = sqlite3.connect(str(self.path))
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION + 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0], 1)
+        conn.close()
+
+    def test_corrupt_file_is_recreated(self):
+        self.path.write_bytes(b"this is not a sqlite database" * 100)
+        with CacheStore(self.path, clock=self.clock) as store:
+            self.assertIsNone(store.get("checks", "a"))
+            store.put("checks", "a", 1)
+        with CacheStore(self.path, clock=self.clock) as store:
+            self.assertEqual(store.get("checks", "a"), 1)
+
+    def test_update_is_an_atomic_read_modify_write(self):
+        stores = [CacheStore(self.path) for _ in range(4)]
+
+        def append(index, store):
+            for item in range(10):
+                store.update("checks", "list", lambda current: (current or []) + [f"{index}-{item}"])
+
+        threads = [threading.Thread(target=append, args=(i, s)) for i, s in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(stores[0].get("checks", "list")), 40)
+        with self.assertRaises(TypeError):
+            stores[0].update("checks", "list", lambda current: object())
+        self.assertEqual(len(stores[0].get("checks", "list")), 40)
+        for store in stores:
+            store.close()
+
+    def test_corrupt_rows_are_dropped_instead_of_failing(self):
+        with CacheStore(self.path, clock=self.clock) as store:
+            store.put("checks", "a", 1)
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("UPDATE entries SET value = '{not json'")
+        conn.commit()
+        conn.close()
+
+        with CacheStore(self.path, clock=self.clock) as store:
+            self.assertIsNone(store.get("checks", "a"))
+
+    def test_concurrent_writers_on_separate_connections(self):
+        stores = [CacheStore(self.path) for _ in range(4)]
+
+        def write(index, store):
+            for item in range(25):
+                store.put("checks", f"{index}-{item}", {"index": index, "item": item})
+
+        threads = [threading.Thread(target=write, args=(i, s)) for i, s in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(stores[0].stats()["entries"], 100)
+        for store in stores:
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
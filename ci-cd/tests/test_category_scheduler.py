@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from category_scheduler import (  # noqa: E402
+    DurationHistory,
+    WORKER_CAP_ENV,
+    critical_path_priorities,
+    default_worker_count,
+    plan_schedule,
+    validate_dag,
+)
+
+
+class CategorySchedulerTests(unittest.TestCase):
+    def test_validate_dag_rejects_cycles_and_unknown_dependencies(self):
+        with self.assertRaises(ValueError):
+            validate_dag({"a": ["b"], "b": ["a"]})
+        with self.assertRaises(ValueError):
+            validate_dag({"a": ["missing"]})
+        self.assertEqual(validate_dag({"b": ["a"], "a": []}), ["a", "b"])
+
+    def test_priorities_follow_longest_dependent_chain(self):
+        dependencies = {"lint": [], "build": [], "e2e": ["build"]}
+        durations = {"lint": 30, "build": 10, "e2e": 40}
+
+        priorities = critical_path_priorities(dependencies, durations)
+
+        self.assertEqual(priorities["build"], 50)
+        self.assertGreater(priorities["build"], priorities["lint"])
+
+    def test_plan_starts_critical_path_first(self):
+        dependencies = {"lint": [], "build": [], "e2e": ["build"]}
+        durations = {"lint": 30, "build": 10, "e2e": 40}
+
+        single = plan_schedule(dependencies, durations, max_workers=1)
+        pair = plan_schedule(dependencies, durations, max_workers=2)
+
+        self.assertEqual(single.tasks[0].name, "build")
+        self.assertEqual(single.makespan, 80)
+        self.assertEqual(pair.makespan, 50)
+        e2e = next(task for task in pair.tasks if task.name == "e2e")
+        self.assertEqual(e2e.start, 10)
+
+    def test_plan_packs_independent_work_onto_workers(self):
+        durations = {"a": 45, "b": 30, "c": 25, "d": 20}
+        dependencies = {name: [] for name in durations}
+
+        plan = plan_schedule(dependencies, durations, max_workers=2)
+
+        self.assertEqual(plan.makespan, 65)
+        self.assertEqual(plan.sequential_time, 120)
+
+    def test_duration_history_learns_and_persists(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / ".test_durations.json"
+            history = DurationHistory(path, alpha=0.5)
+            self.assertEqual(history.estimate("ui", 45), 45)
+
+            history.record("ui", 10)
+            history.record("ui", 20)
+            history.save()
+
+            reloaded = DurationHistory(path)
+            self.assertEqual(reloaded.estimate("ui", 45), 15)
+            self.assertEqual(reloaded.estimates({"ui": 45, "security": 25}), {"ui": 15, "security": 25})
+
+    def test_worker_count_follows_tasks_not_cpus(self):
+        self.assertEqual(default_worker_count(6, cap=8), 6)
+        self.assertEqual(default_worker_count(12, cap=8), 8)
+        self.assertEqual(default_worker_count(0, cap=8), 1)
+        with mock.patch.dict(os.environ, {WORKER_CAP_ENV: "3"}):
+            self.assertEqual(default_worker_count(6), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from cache_store import CacheStore  # noqa: E402
+from check_cache import CheckCache, pipeline_code_files  # noqa: E402
+from source_snapshot import SourceSnapshot  # noqa: E402
+
+
+class CheckCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.src = self.base / "src"
+        (self.src / "js" / "core").mkdir(parents=True)
+        (self.src / "index.html").write_text("<main></main>", encoding="utf-8")
+        (self.src / "js" / "core" / "exercise-database.js").write_text("export const exercises = [];", encoding="utf-8")
+        self.cache_path = self.base / ".test_cache.sqlite3"
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self._tmp.cleanup()
+
+    def _cache(self, code):
+        store = CacheStore(self.cache_path)
+        self.stores.append(store)
+        return CheckCache(store, code)
+
+    def _record(self, snapshot, cache, name, paths):
+        with snapshot.track_reads() as reads:
+            for path in paths:
+                snapshot.exists(path) and snapshot.read_text(path)
+        cache.store_result(name, reads, {"status": "PASSED", "name": name})
+
+    def test_only_checks_that_read_a_changed_file_are_invalidated(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+        self._record(snapshot, cache, "html", ["index.html"])
+        self._record(snapshot, cache, "database", ["js/core/exercise-database.js"])
+
+        (self.src / "js" / "core" / "exercise-database.js").write_text("export const exercises = [1];", encoding="utf-8")
+        changed = SourceSnapshot.capture(self.src)
+        reloaded = self._cache("code-v1")
+
+        self.assertEqual(reloaded.lookup("html", changed), {"status": "PASSED", "name": "html"})
+        self.assertIsNone(reloaded.lookup("database", changed))
+        self.assertEqual(reloaded.stats()["rerun_checks"], ["database"])
+
+    def test_missing_file_that_appears_invalidates_entry(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+        self._record(snapshot, cache, "optional", ["js/missing.js"])
+
+        self.assertIsNotNone(cache.lookup("optional", snapshot))
+        (self.src / "js" / "missing.js").write_text("x", encoding="utf-8")
+        self.assertIsNone(cache.lookup("optional", SourceSnapshot.capture(self.src)))
+
+    def test_listing_reads_notice_new_files(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+        with snapshot.track_reads() as reads:
+            list(snapshot.iter_files("js/", ".js"))
+        cache.store_result("modules", reads, {"status": "PASSED"})
+
+        (self.src / "js" / "extra.js").write_text("x", encoding="utf-8")
+        self.assertIsNone(cache.lookup("modules", SourceSnapshot.capture(self.src)))
+
+    def test_code_change_invalidates_everything(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+        self._record(snapshot, cache, "html", ["index.html"])
+
+        self.assertIsNone(self._cache("code-v2").lookup("html", snapshot))
+
+    def test_pipeline_config_is_part_of_the_code_fingerprint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            for name in ("pipeline.py", "enhanced_pipeline_config.json", ".test_durations.json", "notes.md"):
+                (directory / name).write_text("{}", encoding="utf-8")
+            self.assertEqual(
+                [path.name for path in pipeline_code_files(directory)],
+                ["enhanced_pipeline_config.json", "pipeline.py"],
+            )
+        names = {path.name for path in pipeline_code_files(CI_CD_DIR)}
+        self.assertTrue({"enhanced_pipeline_config.json", "app_features.json"} <= names)
+
+    def test_concurrent_runs_keep_each_others_variants(self):
+        caches = [self._cache("code-v1") for _ in range(4)]
+
+        def store(index, cache):
+            cache.store_result("structure", {f"file:{index}.js": str(index)}, {"status": "PASSED"})
+
+        threads = [threading.Thread(target=store, args=(i, c)) for i, c in enumerate(caches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(caches[0]._variants("structure")), 4)
+
+    def test_cached_results_are_copies(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+        self._record(snapshot, cache, "html", ["index.html"])
+
+        cache.lookup("html", snapshot)["status"] = "FAILED"
+        self.assertEqual(cache.lookup("html", snapshot)["status"], "PASSED")
+
+    def test_unserialisable_results_are_skipped(self):
+        snapshot = SourceSnapshot.capture(self.src)
+        cache = self._cache("code-v1")
+
+        self.assertFalse(cache.store_result("odd", {}, {"value": object()}))
+        self.assertIsNone(cache.lookup("odd", snapshot))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from driver_pool import HEADLESS_WINDOW_SIZE, PROFILES, WINDOW_SIZE, DriverPool, default_pool_size, reset_session  # noqa: E402
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class _FakeDriver:
+    def __init__(self, number, broken=False, profile="default"):
+        self.number = number
+        self.profile = profile
+        self.broken = broken
+        self.window_handles = ["main"]
+        self.current = "main"
+        self.switch_to = _SwitchTo(self)
+        self.cdp = []
+        self.visited = []
+        self.size = None
+        self.cookies_cleared = 0
+        self.quit_calls = 0
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def delete_all_cookies(self):
+        if self.broken:
+            raise RuntimeError("session deleted because of page crash")
+        self.cookies_cleared += 1
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+
+    def set_window_size(self, width, height):
+        self.size = (width, height)
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class _Factory:
+    def __init__(self):
+        self.drivers = []
+        self.lock = threading.Lock()
+
+    def __call__(self, profile):
+        with self.lock:
+            driver = _FakeDriver(len(self.drivers), profile=profile)
+            self.drivers.append(driver)
+        return driver
+
+
+class ResetSessionTests(unittest.TestCase):
+    def test_closes_extra_windows_and_clears_origin_storage(self):
+        driver = _FakeDriver(0)
+        driver.window_handles = ["main", "popup"]
+
+        reset_session(driver, ["http://127.0.0.1:8001"])
+
+        self.assertEqual(driver.window_handles, ["main"])
+        self.assertEqual(driver.current, "main")
+        self.assertEqual(driver.cookies_cleared, 1)
+        self.assertEqual(
+            driver.cdp, [("Storage.clearDataForOrigin", {"origin": "http://127.0.0.1:8001", "storageTypes": "all"})]
+        )
+        self.assertEqual(driver.size, WINDOW_SIZE)
+        self.assertEqual(driver.visited, ["about:blank"])
+
+
+class DriverPoolTests(unittest.TestCase):
+    def test_sessions_are_launched_once_and_reused(self):
+        factory = _Factory()
+        with DriverPool(2, factory=factory, base_url="http://127.0.0.1:8001/index.html") as pool:
+            used = pool.map([lambda driver: driver.number for _ in range(6)])
+
+        self.assertEqual(len(factory.drivers), 2)
+        self.assertLessEqual(set(used), {0, 1})
+        self.assertEqual(pool.origins, ("http://127.0.0.1:8001",))
+        self.assertTrue(all(driver.quit_calls == 1 for driver in factory.drivers))
+
+    def test_map_keeps_task_order_and_bounds_concurrency(self):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def task(value):
+            def run(_driver):
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.01)
+                with lock:
+                    active["now"] -= 1
+                return value
+            return run
+
+        with DriverPool(3, factory=_Factory()) as pool:
+            results = pool.map([task(n) for n in range(8)])
+
+        self.assertEqual(results, list(range(8)))
+        self.assertLessEqual(active["peak"], 3)
+
+    def test_failing_task_returns_its_exception(self):
+        def broken(_driver):
+            raise ValueError("suite crashed")
+
+        with DriverPool(1, factory=_Factory()) as pool:
+            results = pool.map([broken, lambda driver: "ok"])
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1], "ok")
+
+    def test_session_that_cannot_be_reset_is_replaced(self):
+        factory = _Factory()
+        with DriverPool(1, factory=factory) as pool:
+            with pool.lease() as driver:
+                driver.broken = True
+            with pool.lease() as driver:
+                replacement = driver.number
+
+        self.assertEqual(replacement, 1)
+        self.assertEqual(pool.replaced, 1)
+        self.assertEqual(factory.drivers[0].quit_calls, 1)
+
+    def test_sessions_only_serve_their_own_profile(self):
+        factory = _Factory()
+        with DriverPool(1, factory=factory, warm_profiles=["responsive"]) as pool:
+            used = pool.map([lambda driver: driver.profile] * 3, ["responsive", "security", "security"])
+            self.assertEqual(pool.replaced, 0)
+
+        self.assertEqual(used, ["responsive", "security", "security"])
+        # The responsive browser was reset to its own window size, then swapped out once
+        self.assertEqual([driver.profile for driver in factory.drivers], ["responsive", "security"])
+        self.assertEqual(factory.drivers[0].size, HEADLESS_WINDOW_SIZE)
+        self.assertEqual(factory.drivers[0].quit_calls, 1)
+        self.assertEqual(factory.drivers[1].size, WINDOW_SIZE)
+        # Only the security browser may run with the same-origin policy off
+        flagged = [name for name, profile in PROFILES.items() if "--disable-web-security" in profile.arguments]
+        self.assertEqual(flagged, ["security"])
+
+    def test_unknown_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            DriverPool(1, factory=_Factory(), warm_profiles=["nope"])
+        with DriverPool(1, factory=_Factory()) as pool:
+            with self.assertRaises(ValueError):
+                with pool.lease("nope"):
+                    pass
+
+    def test_launch_failure_is_raised_from_start(self):
+        def factory(profile):
+            raise RuntimeError("chrome not found")
+
+        pool = DriverPool(2, factory=factory)
+        with self.assertRaises(RuntimeError):
+            pool.start()
+
+    def test_default_pool_size_never_exceeds_suite_count(self):
+        self.assertEqual(default_pool_size(1), 1)
+        self.assertGreaterEqual(default_pool_size(5), 1)
+        self.assertLessEqual(default_pool_size(5), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
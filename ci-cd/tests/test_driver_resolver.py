@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from driver_resolver import (  # noqa: E402
+    DriverCache,
+    DriverResolutionError,
+    detect_browser,
+    parse_version,
+    resolve_chromedriver,
+)
+
+
+def _no_probe(_binary):
+    raise AssertionError("resolution must not run binaries when the browser version is given")
+
+
+class DriverResolverTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.cache = DriverCache(self.root / "cache")
+        self._env = mock.patch.dict(os.environ, {"PATH": str(self.root / "empty-bin")})
+        self._env.start()
+        os.environ.pop("CHROMEDRIVER", None)
+        os.environ.pop("CHROME_BINARY", None)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def _binary(self, name, content=b"#!/bin/sh\n"):
+        path = self.root / name
+        path.write_bytes(content)
+        return path
+
+    def test_parse_version_reads_chrome_and_driver_output(self):
+        self.assertEqual(parse_version("Chromium 120.0.6099.109 built on Debian"), (120, 0, 6099, 109))
+        self.assertEqual(parse_version("ChromeDriver 121.0.6167.85 (abc-refs/heads@{#1})"), (121, 0, 6167, 85))
+        self.assertIsNone(parse_version("not a version"))
+
+    def test_add_records_version_and_checksum(self):
+        entry = self.cache.add(self._binary("chromedriver"), version="120.0.6099.109")
+
+        self.assertEqual(entry.version, "120.0.6099.109")
+        self.assertEqual(self.cache.entries(), [entry])
+        self.assertTrue((self.cache.root / entry.path).is_file())
+
+    def test_resolves_same_build_before_newer_patch(self):
+        self.cache.add(self._binary("a", b"a"), version="120.0.6099.71")
+        self.cache.add(self._binary("b", b"b"), version="120.0.6100.1")
+        self.cache.add(self._binary("c", b"c"), version="121.0.6167.85")
+
+        path = resolve_chromedriver(self.cache, browser_version=(120, 0, 6099, 109), probe=_no_probe)
+        self.assertTrue(path.endswith(os.path.join("120.0.6099.71", "chromedriver")))
+
+        path = resolve_chromedriver(self.cache, browser_version=(120, 0, 6200, 1), probe=_no_probe)
+        self.assertIn("120.0.6100.1", path)
+
+    def test_checksum_mismatch_is_rejected(self):
+        entry = self.cache.add(self._binary("chromedriver"), version="120.0.6099.109")
+        (self.cache.root / entry.path).write_bytes(b"tampered")
+
+        with self.assertRaisesRegex(DriverResolutionError, "checksum"):
+            resolve_chromedriver(self.cache, browser_version=(120, 0, 6099, 109), probe=_no_probe)
+
+    def test_missing_match_explains_how_to_populate(self):
+        self.cache.add(self._binary("chromedriver"), version="119.0.6045.105")
+
+        with self.assertRaises(DriverResolutionError) as caught:
+            resolve_chromedriver(self.cache, browser_version=(120, 0, 6099, 109), probe=_no_probe)
+
+        message = str(caught.exception)
+        self.assertIn("Chrome 120.0.6099.109", message)
+        self.assertIn("119.0.6045.105", message)
+        self.assertIn("--add", message)
+
+    def test_explicit_chromedriver_wins(self):
+        binary = self._binary("my-driver")
+        with mock.patch.dict(os.environ, {"CHROMEDRIVER": str(binary)}):
+            self.assertEqual(resolve_chromedriver(self.cache, probe=_no_probe), str(binary))
+
+    def test_detect_browser_uses_chrome_binary_and_reports_absence(self):
+        chrome = self._binary("chrome-for-testing")
+        with mock.patch.dict(os.environ, {"CHROME_BINARY": str(chrome)}):
+            binary, version = detect_browser(candidates=(), probe=lambda _binary: "Google Chrome 122.0.6261.94")
+        self.assertEqual((binary, version), (str(chrome), (122, 0, 6261, 94)))
+
+        with self.assertRaises(DriverResolutionError):
+            detect_browser(candidates=("definitely-not-a-browser",), probe=lambda _binary: None)
+
+
+if __name__ == "__main__":
+    unittest.main()
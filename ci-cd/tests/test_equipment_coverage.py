@@ -0,0 +1,103 @@
+import itertools
+import random
+import time
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from equipment_coverage import EquipmentCoverageIndex  # noqa: E402
+
+
+LEVELS = ("Beginner", "Intermediate", "Advanced")
+
+
+def _random_exercises(seed, equipment, count):
+    rng = random.Random(seed)
+    exercises = []
+    for index in range(count):
+        exercises.append({
+            "name": f"exercise-{index}",
+            "equipment": rng.choice(equipment),
+            "type": rng.choice(["warmup", "main", "main", "cooldown"]),
+            "level": rng.sample(LEVELS, rng.randint(1, 3)),
+        })
+    return exercises
+
+
+def _brute_force_failures(exercises, equipment, requirements):
+    failures = set()
+    for size in range(len(equipment) + 1):
+        for subset in itertools.combinations(sorted(equipment), size):
+            for level in LEVELS:
+                usable = [
+                    e for e in exercises
+                    if (e["equipment"] in subset or e["equipment"] == "Bodyweight") and level in e["level"]
+                ]
+                if any(sum(1 for e in usable if e["type"] == etype) < minimum for etype, minimum in requirements):
+                    failures.add((subset, level))
+    return failures
+
+
+class EquipmentCoverageIndexTests(unittest.TestCase):
+    def test_failures_match_brute_force_enumeration(self):
+        equipment = ["Bodyweight", "Dumbbells", "Kettlebell", "Resistance Band", "Pull-up Bar", "Bench"]
+        requirements = (("warmup", 3), ("main", 6), ("cooldown", 3))
+        for seed in range(5):
+            exercises = _random_exercises(seed, equipment, 60)
+            index = EquipmentCoverageIndex(exercises, requirements=requirements)
+
+            found = {
+                (failure.equipment, failure.level)
+                for level in LEVELS
+                for failure in index.failures(level)
+            }
+            expected = _brute_force_failures(exercises, set(e["equipment"] for e in exercises), requirements)
+            self.assertEqual(found, expected, seed)
+
+    def test_counts_are_additive_and_bodyweight_is_always_available(self):
+        exercises = [
+            {"equipment": "Bodyweight", "type": "main", "level": ["Beginner"]},
+            {"equipment": "Dumbbells", "type": "main", "level": ["Beginner", "Advanced"]},
+            {"equipment": "Kettlebell", "type": "main", "level": "Beginner"},
+        ]
+        index = EquipmentCoverageIndex(exercises)
+
+        self.assertEqual(index.count(0, "main", "Beginner"), 1)
+        self.assertEqual(index.count(index.mask(["Dumbbells", "Kettlebell"]), "main", "Beginner"), 3)
+        self.assertEqual(index.count(index.full_mask, "main", "Advanced"), 1)
+
+    def test_maximal_failures_pass_with_any_single_addition(self):
+        exercises = _random_exercises(7, ["Bodyweight", "Dumbbells", "Kettlebell", "Bench"], 40)
+        index = EquipmentCoverageIndex(exercises, requirements=(("main", 8),))
+
+        for level in LEVELS:
+            failing = {failure.mask for failure in index.failures(level)}
+            for failure in index.maximal_failures(level):
+                for bit in range(len(index.equipment)):
+                    if not failure.mask >> bit & 1:
+                        self.assertNotIn(failure.mask | 1 << bit, failing)
+
+    def test_many_equipment_types_do_not_enumerate_passing_subsets(self):
+        equipment = ["Bodyweight"] + [f"Equipment {index}" for index in range(30)]
+        exercises = _random_exercises(3, equipment, 600)
+        exercises += [
+            {"name": f"base-{etype}-{n}", "equipment": "Bodyweight", "type": etype, "level": list(LEVELS)}
+            for etype in ("warmup", "main", "cooldown")
+            for n in range(12)
+        ]
+        index = EquipmentCoverageIndex(exercises)
+
+        started = time.perf_counter()
+        failures = [failure for level in LEVELS for failure in index.failures(level)]
+        self.assertEqual(failures, [])
+        self.assertEqual(index.total_combinations, 3 * 2 ** 31)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
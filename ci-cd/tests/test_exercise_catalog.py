@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from exercise_catalog import load_catalog, parse_catalog  # noqa: E402
+from source_snapshot import SourceFile, SourceSnapshot  # noqa: E402
+
+
+DATABASE = """// Exercise database
+export const exercises = [
+  {
+    name: 'Push-ups',
+    description: "Keep your body straight. DON'T sag.",
+    equipment: 'Bodyweight',
+    level: ['Beginner', 'Intermediate'],
+    muscle: 'Chest',
+    type: 'main',
+    resources: { progression: ['Knee → Full'] },
+    alternatives: ['Wall Push-ups'],
+    difficulty: 2,
+    injury_safe: ['knee_pain'],
+  },
+  {
+    name: 'Goblet Squat',
+    equipment: 'Kettlebell',
+    level: 'Advanced',
+    muscle: 'Legs',
+    type: 'main',
+  },
+  {
+    name: 'Mystery',
+    equipment: 'Rower',
+    type: 'cooldown',
+  },
+];
+
+export const exerciseDatabase = { getAll: () => exercises };
+"""
+
+
+def _source(text):
+    return SourceFile.from_bytes("js/core/exercise-database.js", text.encode("utf-8"))
+
+
+class ExerciseCatalogTests(unittest.TestCase):
+    def test_records_are_typed(self):
+        catalog = parse_catalog(_source(DATABASE))
+        push_ups, squat = catalog.records
+
+        self.assertEqual(push_ups.name, "Push-ups")
+        self.assertEqual(push_ups.levels, ("Beginner", "Intermediate"))
+        self.assertEqual(push_ups.description, "Keep your body straight. DON'T sag.")
+        self.assertEqual((push_ups.difficulty, push_ups.alternatives, push_ups.injury_safe), (2, ("Wall Push-ups",), ("knee_pain",)))
+        self.assertEqual(push_ups.line, 3)
+        self.assertEqual(squat.levels, ("Advanced",))
+        self.assertIsNone(squat.difficulty)
+        self.assertEqual(squat.as_dict()["level"], ["Advanced"])
+
+    def test_incomplete_entries_are_reported(self):
+        catalog = parse_catalog(_source(DATABASE))
+        self.assertEqual(catalog.issues, ("line 22: Mystery is missing level, muscle",))
+        self.assertEqual(catalog.equipment(), ("Bodyweight", "Kettlebell"))
+
+    def test_catalog_is_cached_by_content(self):
+        first = load_catalog(_source(DATABASE))
+        self.assertIs(load_catalog(_source(DATABASE)), first)
+        self.assertIsNot(load_catalog(_source(DATABASE.replace("Push-ups", "Dips"))), first)
+
+    def test_real_database_parses_completely(self):
+        snapshot = SourceSnapshot.capture(CI_CD_DIR.parent / "src")
+        catalog = parse_catalog(snapshot["js/core/exercise-database.js"])
+        self.assertGreater(len(catalog), 0)
+        self.assertEqual(catalog.issues, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from exercise_catalog import ExerciseRecord  # noqa: E402
+from exercise_index import ExerciseIndex  # noqa: E402
+
+
+def _record(name, etype="main", equipment="Bodyweight", levels=("Beginner",), muscle="Legs", line=1, **extra):
+    fields = dict(
+        name=name,
+        equipment=equipment,
+        levels=levels,
+        muscle=muscle,
+        type=etype,
+        difficulty=None,
+        alternatives=(),
+        injury_safe=(),
+        equipment_needed=(),
+        muscle_groups=(),
+        description="",
+        line=line,
+    )
+    fields.update(extra)
+    return ExerciseRecord(**fields)
+
+
+class ExerciseIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.squat = _record("Squats", levels=("Beginner", "Intermediate"), alternatives=("Lunges", "Wall Sits"), injury_safe=("back_pain",), line=10)
+        self.lunges = _record("Lunges", levels=("Intermediate",), alternatives=("Squats",), line=20)
+        self.warmup_lunges = _record("Lunges", etype="warmup", line=30)
+        self.press = _record("Shoulder Press", equipment="Dumbbells", muscle="Shoulders", injury_safe=("back_pain", "knee_pain"), line=40)
+        self.index = ExerciseIndex([self.squat, self.lunges, self.warmup_lunges, self.press])
+
+    def test_lookups(self):
+        self.assertEqual(self.index.named("Lunges"), (self.lunges, self.warmup_lunges))
+        self.assertIs(self.index.get("Lunges", "warmup"), self.warmup_lunges)
+        self.assertIn("Shoulder Press", self.index)
+        self.assertEqual(self.index.slot("main", "Intermediate", "Bodyweight"), (self.squat, self.lunges))
+        self.assertEqual(self.index.slot("main", "Advanced", "Bodyweight"), ())
+        self.assertEqual(self.index.for_muscle("Shoulders"), (self.press,))
+
+    def test_inverted_indexes(self):
+        self.assertEqual(self.index.alternatives("Squats"), (self.lunges, self.warmup_lunges))
+        self.assertEqual(self.index.listed_as_alternative("Squats"), (self.lunges,))
+        self.assertEqual(self.index.listed_as_alternative("Wall Sits"), (self.squat,))
+        self.assertEqual(self.index.safe_for("back_pain"), (self.squat, self.press))
+        self.assertEqual(self.index.conditions(), ("back_pain", "knee_pain"))
+
+    def test_integrity_issues(self):
+        repeated = _record("Squats", levels=("Expert",), alternatives=("Squats",), line=50)
+        issues = ExerciseIndex([self.squat, self.lunges, repeated]).integrity_issues()
+
+        self.assertEqual(
+            [(issue.kind, issue.exercise, issue.line) for issue in issues],
+            [
+                ("unknown_alternative", "Squats", 10),
+                ("duplicate_entry", "Squats", 50),
+                ("unknown_level", "Squats", 50),
+                ("self_alternative", "Squats", 50),
+            ],
+        )
+        self.assertEqual(issues[0].describe(), "line 10: Squats: alternative 'Wall Sits' is not in the database")
+
+    def test_unique_records_keep_one_entry_per_phase(self):
+        repeated = _record("Lunges", line=60)
+        index = ExerciseIndex([self.lunges, self.warmup_lunges, repeated])
+        self.assertEqual(index.unique_records(), (self.lunges, self.warmup_lunges))
+
+
+if __name__ == "__main__":
+    unittest.main()
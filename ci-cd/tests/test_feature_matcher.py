@@ -0,0 +1,97 @@
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from feature_matcher import FeatureDetector, PatternMatcher  # noqa: E402
+from source_snapshot import SourceFile  # noqa: E402
+
+
+def _naive_offsets(text, pattern):
+    offsets = []
+    index = text.find(pattern)
+    while index != -1:
+        offsets.append(index)
+        index = text.find(pattern, index + 1)
+    return offsets
+
+
+class PatternMatcherTests(unittest.TestCase):
+    def test_reports_overlapping_and_prefix_occurrences(self):
+        matcher = PatternMatcher(["ab", "abc", "bc", "c", "a.b"])
+
+        hits = matcher.scan("xabcabc a.b")
+
+        self.assertEqual(hits["abc"], [1, 4])
+        self.assertEqual(hits["ab"], [1, 4])
+        self.assertEqual(hits["bc"], [2, 5])
+        self.assertEqual(hits["c"], [3, 6])
+        self.assertEqual(hits["a.b"], [8])
+
+    def test_matches_naive_search_exactly(self):
+        patterns = ["timer", "timerDisplay", "setInterval", "Interval", "aria-", "aria-live", "\"", "a"]
+        text = 'const timerDisplay = setInterval(tick); <div aria-live="polite" aria-label="timer">'
+
+        hits = PatternMatcher(patterns).scan(text)
+
+        for pattern in patterns:
+            self.assertEqual(hits.get(pattern, []), _naive_offsets(text, pattern), pattern)
+
+    def test_empty_pattern_list_matches_nothing(self):
+        self.assertEqual(PatternMatcher([]).scan("anything"), {})
+
+
+class FeatureDetectorTests(unittest.TestCase):
+    def setUp(self):
+        self.features = {
+            "timers": {
+                "name": "Timers",
+                "detection_patterns": {"html": ["timer-display"], "js": ["setInterval"]},
+                "test_function": "test_timer",
+            },
+            "audio": {
+                "name": "Audio",
+                "detection_patterns": {"html": [], "js": ["AudioContext"]},
+                "test_function": "test_audio",
+            },
+            "html_only": {
+                "name": "Overlay",
+                "detection_patterns": {"html": ["rest-overlay"], "js": []},
+                "test_function": "test_overlay",
+            },
+        }
+        self.html = SourceFile.from_bytes("index.html", b"<main>\n  <div id=\"timer-display\"></div>\n</main>")
+        self.js = SourceFile.from_bytes("js/main.js", b"// rest-overlay is JS-only here\nsetInterval(tick, 1000);\n")
+
+    def test_detects_features_with_file_and_line_locations(self):
+        detections = FeatureDetector(self.features).detect([self.html], [self.js])
+
+        timers = detections["timers"]
+        self.assertTrue(timers.detected)
+        self.assertEqual([hit.location() for hit in timers.hits], ["index.html:2:12", "js/main.js:2:1"])
+        self.assertEqual(timers.locations()["js/main.js"], {"setInterval": ["2:1"]})
+        self.assertFalse(detections["audio"].detected)
+
+    def test_html_patterns_are_not_matched_against_javascript(self):
+        detections = FeatureDetector(self.features).detect([self.html], [self.js])
+
+        self.assertFalse(detections["html_only"].detected)
+
+    def test_each_file_is_scanned_once(self):
+        detector = FeatureDetector(self.features)
+        calls = []
+        original = detector.matcher.scan
+        detector.matcher.scan = lambda text: calls.append(text) or original(text)
+
+        detector.detect([self.html], [self.js])
+        detector.detect([self.html], [self.js])
+
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from cache_store import CacheStore  # noqa: E402
+from impact_analysis import (  # noqa: E402
+    ImpactError,
+    changed_files,
+    load_recorded_inputs,
+    record_inputs,
+    select_checks,
+    token_covers,
+)
+from module_graph import ModuleGraph  # noqa: E402
+
+
+GRAPH = ModuleGraph.from_sources(
+    {
+        "index.html": '<script type="module" src="js/main.js"></script>',
+        "dashboard.html": '<script src="js/dashboard.js"></script>',
+        "js/main.js": "import './core/data.js';",
+        "js/core/data.js": "export const exercises = [];",
+        "js/dashboard.js": "export {};",
+    }
+)
+
+
+class TokenCoversTests(unittest.TestCase):
+    def test_token_kinds(self):
+        self.assertTrue(token_covers("file:js/main.js", "js/main.js"))
+        self.assertFalse(token_covers("file:js/main.js", "js/main.jsx"))
+        self.assertTrue(token_covers("dir:js/core", "js/core/data.js"))
+        self.assertFalse(token_covers("dir:js/core", "js/core-utils.js"))
+        self.assertFalse(token_covers("dir:", "index.html"))
+        self.assertTrue(token_covers("glob:js/*.js", "js/core/data.js"))
+        self.assertFalse(token_covers("glob:*.js", "css/app.css"))
+
+
+class SelectChecksTests(unittest.TestCase):
+    INPUTS = {
+        "app_loading": ["file:index.html"],
+        "workout_flow": ["entry:index.html"],
+        "dashboard": ["entry:dashboard.html"],
+        "styles": ["glob:*.css"],
+    }
+
+    def test_entry_inputs_follow_the_import_graph(self):
+        impact = select_checks(["src/js/core/data.js"], self.INPUTS, GRAPH)
+        self.assertEqual(impact.selected, ["workout_flow"])
+        self.assertEqual(impact.skipped, ["app_loading", "dashboard", "styles"])
+        self.assertEqual(impact.reasons["workout_flow"], ["src/js/core/data.js"])
+
+    def test_changes_outside_src_select_nothing(self):
+        impact = select_checks(["README.md", "ci-cd/tests/test_x.py"], self.INPUTS, GRAPH)
+        self.assertEqual(impact.selected, [])
+
+    def test_pipeline_code_changes_select_everything(self):
+        impact = select_checks(["ci-cd/automated_test_pipeline.py"], self.INPUTS, GRAPH)
+        self.assertEqual(impact.selected, list(self.INPUTS))
+
+    def test_checks_without_known_inputs_run_on_any_src_change(self):
+        impact = select_checks(["src/js/dashboard.js"], {"never_run": None, "app_loading": ["file:index.html"]})
+        self.assertEqual(impact.selected, ["never_run"])
+
+
+class RecordedInputsTests(unittest.TestCase):
+    def test_reads_round_trip_through_the_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = CacheStore(Path(tmp) / "cache.sqlite3")
+            try:
+                record_inputs(store, "security", {"glob:*.js": "abc", "file:index.html": "def"})
+                self.assertEqual(
+                    load_recorded_inputs(store, ["security", "performance"]),
+                    {"security": ["file:index.html", "glob:*.js"], "performance": None},
+                )
+            finally:
+                store.close()
+
+
+class ChangedFilesTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._git("init", "-q")
+        self._git("config", "user.email", "ci@example.com")
+        self._git("config", "user.name", "ci")
+        (self.root / "src").mkdir()
+        (self.root / "src" / "index.html").write_text("<main></main>", encoding="utf-8")
+        (self.root / "README.md").write_text("readme", encoding="utf-8")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "base")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.root, check=True, capture_output=True)
+
+    def test_worktree_staged_and_range(self):
+        (self.root / "src" / "index.html").write_text("<main>v2</main>", encoding="utf-8")
+        (self.root / "src" / "new.js").write_text("export {};", encoding="utf-8")
+        self.assertEqual(changed_files(self.root, "worktree"), ["src/index.html", "src/new.js"])
+
+        self._git("add", "src/new.js")
+        self.assertEqual(changed_files(self.root, "staged"), ["src/new.js"])
+
+        self._git("commit", "-q", "-m", "add module")
+        self.assertEqual(changed_files(self.root, "HEAD~1..HEAD"), ["src/new.js"])
+
+    def test_bad_range_raises(self):
+        with self.assertRaises(ImpactError):
+            changed_files(self.root, "no-such-ref..HEAD")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from js_literal import JSLiteralError, decode_string, iter_declared_array, parse_declaration, parse_literal, tokenize  # noqa: E402
+
+
+class JSLiteralTests(unittest.TestCase):
+    def test_comments_trailing_commas_and_nesting(self):
+        source = """
+        // leading comment
+        const data = [
+          /* block */ { name: 'A', level: ['Beginner', 'Advanced',], resources: { tips: ["x → y"] }, },
+          { 'quoted-key': -2.5, flag: true, none: null, },
+        ];
+        function after() { return /regex[/]/.test('x'); }
+        """
+        self.assertEqual(
+            parse_declaration(source, "data"),
+            [
+                {"name": "A", "level": ["Beginner", "Advanced"], "resources": {"tips": ["x → y"]}},
+                {"quoted-key": -2.5, "flag": True, "none": None},
+            ],
+        )
+
+    def test_string_escapes(self):
+        self.assertEqual(decode_string(r"'Don\'t'"), "Don't")
+        self.assertEqual(decode_string(r'"a\\b"'), "a\\b")
+        self.assertEqual(decode_string(r"'é\x41\u{1F600}\n'"), "éA\U0001F600\n")
+        self.assertEqual(decode_string("'line \\\ncontinued'"), "line continued")
+
+    def test_escaped_quote_does_not_end_string(self):
+        self.assertEqual(parse_literal(r"{ text: 'it\'s ] } fine' }"), {"text": "it's ] } fine"})
+
+    def test_duplicate_keys_keep_last_value(self):
+        self.assertEqual(parse_literal("{ a: 1, b: 2, a: 3 }"), {"a": 3, "b": 2})
+
+    def test_stream_yields_element_offsets(self):
+        source = "export const items = [\n  { id: 1 },\n  { id: 2 },\n];"
+        items = list(iter_declared_array(source, "items"))
+        self.assertEqual([value for _offset, value in items], [{"id": 1}, {"id": 2}])
+        self.assertEqual(source[items[1][0]], "{")
+
+    def test_tokenizer_is_lazy(self):
+        tokens = tokenize("[1] @@@ not javascript")
+        self.assertEqual([next(tokens).value for _ in range(3)], ["[", "1", "]"])
+        with self.assertRaises(JSLiteralError):
+            next(tokens)
+
+    def test_errors_report_position(self):
+        with self.assertRaises(JSLiteralError) as caught:
+            parse_literal("[\n  { a: 1 }\n  { b: 2 }\n]")
+        self.assertEqual((caught.exception.line, caught.exception.column), (3, 3))
+
+    def test_non_constant_values_are_rejected(self):
+        with self.assertRaises(JSLiteralError):
+            parse_literal("{ a: someVariable }")
+        with self.assertRaises(JSLiteralError):
+            parse_literal("{ a: `hello ${name}` }")
+        with self.assertRaises(JSLiteralError):
+            parse_declaration("const other = [];", "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
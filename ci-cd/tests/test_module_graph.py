@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from module_graph import ModuleGraph, blank_comments, parse_module, parse_specifiers, resolve_specifier  # noqa: E402
+from source_snapshot import SourceSnapshot  # noqa: E402
+
+
+SOURCES = {
+    "index.html": '<link rel="stylesheet" href="css/app.css"><script type="module" src="js/main.js?v=63"></script>',
+    "js/main.js": "import { generate } from './core/generator.js';\nimport './ui/view.js';",
+    "js/core/generator.js": "export * from './data.js';\nconst lazy = () => import('../ui/modal.js');",
+    "js/core/data.js": "export const exercises = [];\nexport function legacyLookup() {}",
+    "js/ui/view.js": "import { exercises } from '../core/data.js';\nexport default class View {}",
+    "js/ui/modal.js": "// import './unused.js';\nexport function open() {}",
+    "js/unused.js": "import 'https://cdn.example.com/lib.js';",
+    "css/app.css": "body { margin: 0; }",
+}
+
+
+class ParsingTests(unittest.TestCase):
+    def test_static_reexport_side_effect_and_dynamic_imports(self):
+        text = "import a from './a.js';\nexport { b } from \"./b.js\";\nimport './c.js';\nawait import('./d.js');"
+        self.assertEqual(parse_specifiers("js/x.js", text), ["./a.js", "./b.js", "./c.js", "./d.js"])
+
+    def test_commented_imports_are_ignored_but_strings_are_kept(self):
+        text = "/* import './a.js'; */\nconst url = 'http://x//y';\n// import './b.js';\nimport './c.js';"
+        self.assertEqual(parse_specifiers("js/x.js", text), ["./c.js"])
+        self.assertEqual(len(blank_comments(text)), len(text))
+
+    def test_exports_and_imported_names(self):
+        info = parse_module(
+            "js/x.js",
+            "import def, { a, b as c } from './a.js';\nimport * as ns from './b.js';\n"
+            "export { d as e, f } from './c.js';\nexport * from './d.js';\n"
+            "export async function run() {}\nexport class Player {}\nexport let count = 0;\n"
+            "export default run;\nexport * as helpers from './e.js';",
+        )
+        self.assertEqual(
+            info.loads,
+            (
+                ("./a.js", ("default", "a", "b")),
+                ("./b.js", ("*",)),
+                ("./c.js", ("d", "f")),
+                ("./d.js", ("*",)),
+                ("./e.js", ("*",)),
+            ),
+        )
+        self.assertEqual(info.exports, {"e", "f", "run", "Player", "count", "default", "helpers"})
+
+    def test_resolution_is_relative_to_the_importer(self):
+        self.assertEqual(resolve_specifier("js/core/a.js", "../ui/b.js"), "js/ui/b.js")
+        self.assertEqual(resolve_specifier("index.html", "js/main.js?v=1"), "js/main.js")
+        self.assertEqual(resolve_specifier("js/a.js", "/css/app.css"), "css/app.css")
+        self.assertIsNone(resolve_specifier("js/a.js", "lodash"))
+        self.assertIsNone(resolve_specifier("js/a.js", "https://cdn.example.com/x.js"))
+        self.assertIsNone(resolve_specifier("js/a.js", "../../outside.js"))
+
+
+class ModuleGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.graph = ModuleGraph.from_sources(SOURCES)
+
+    def test_entry_closure_follows_static_and_dynamic_imports(self):
+        self.assertEqual(self.graph.entries, ["index.html"])
+        self.assertEqual(
+            self.graph.dependencies_of(["index.html"]),
+            {
+                "index.html", "css/app.css", "js/main.js", "js/core/generator.js",
+                "js/core/data.js", "js/ui/view.js", "js/ui/modal.js",
+            },
+        )
+
+    def test_dependents_walk_imports_backwards(self):
+        self.assertEqual(
+            self.graph.dependents_of(["js/core/data.js"]),
+            {"js/core/data.js", "js/core/generator.js", "js/ui/view.js", "js/main.js", "index.html"},
+        )
+
+    def test_reachability_and_dead_exports(self):
+        self.assertEqual(self.graph.unreachable(), ["js/unused.js"])
+        # main.js is loaded by the page itself, modal.js dynamically and data.js through
+        # ``export *``, so all of their names count as used
+        self.assertEqual(self.graph.dead_exports(), {"js/ui/view.js": ["default"]})
+
+    def test_entry_bytes_cover_the_transitive_closure(self):
+        closure = self.graph.dependencies_of(["index.html"])
+        self.assertEqual(
+            self.graph.entry_bytes(),
+            {"index.html": sum(len(SOURCES[key].encode("utf-8")) for key in closure)},
+        )
+
+    def test_unresolved_local_imports_are_reported(self):
+        graph = ModuleGraph.from_sources({"js/a.js": "import './gone.js';"})
+        self.assertEqual(graph.missing, {"js/a.js": ("./gone.js",)})
+
+    def test_repository_app_has_no_missing_modules(self):
+        graph = ModuleGraph.build(SourceSnapshot.capture(CI_CD_DIR.parent / "src"))
+        self.assertEqual(graph.missing, {})
+        self.assertIn("js/main.js", graph.dependencies_of(["index.html"]))
+
+    def test_build_is_cached_by_content_and_records_reads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for key, text in SOURCES.items():
+                (root / key).parent.mkdir(parents=True, exist_ok=True)
+                (root / key).write_text(text, encoding="utf-8")
+            snapshot = SourceSnapshot.capture(root)
+            with snapshot.track_reads() as reads:
+                first = ModuleGraph.build(snapshot)
+            self.assertIn("glob:*.js", reads)
+            self.assertIs(ModuleGraph.build(SourceSnapshot.capture(root)), first)
+
+            (root / "js" / "ui" / "view.js").write_text("export const view = 1;", encoding="utf-8")
+            changed = ModuleGraph.build(SourceSnapshot.capture(root))
+            self.assertIsNot(changed, first)
+            self.assertEqual(changed.imports["js/ui/view.js"], frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from page_load_benchmark import PROFILES, evaluate, load_baseline, run_benchmark, save_baseline  # noqa: E402
+
+
+class FakeTarget:
+    """Records CDP commands and serves canned metrics; warm loads are faster."""
+
+    def __init__(self, lcp=800.0):
+        self.commands = []
+        self.lcp = lcp
+        self.cold = False
+
+    def send(self, method, params=None):
+        self.commands.append((method, params or {}))
+        if method == "Network.clearBrowserCache":
+            self.cold = True
+        if method == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": "1"}
+        return {}
+
+    def navigate(self, url):
+        pass
+
+    def evaluate(self, function):
+        lcp = self.lcp if self.cold else self.lcp / 2
+        self.cold = False
+        return {"load": lcp + 100, "lcp": lcp, "cls": 0.01, "tbt": 0, "fcp": None}
+
+
+class PageLoadBenchmarkTests(unittest.TestCase):
+    def test_scenarios_throttle_clear_caches_and_restore(self):
+        target = FakeTarget()
+        samples = run_benchmark(target, "http://127.0.0.1:8001/", [PROFILES["mobile"]], samples=3, settle_ms=0)
+
+        self.assertEqual(set(samples), {"mobile/cold", "mobile/warm"})
+        self.assertEqual(samples["mobile/cold"]["lcp"], [800.0] * 3)
+        self.assertEqual(samples["mobile/warm"]["lcp"], [400.0] * 3)
+        self.assertNotIn("fcp", samples["mobile/cold"])
+
+        methods = [method for method, _ in target.commands]
+        self.assertEqual(methods.count("Network.clearBrowserCache"), 3)
+        network = [params for method, params in target.commands if method == "Network.emulateNetworkConditions"]
+        self.assertEqual(network[0]["latency"], 150)
+        self.assertEqual(network[0]["downloadThroughput"], 1638.4 * 1024 / 8)
+        self.assertEqual(network[-1]["downloadThroughput"], -1)
+        clear = dict(target.commands)["Storage.clearDataForOrigin"]
+        self.assertEqual(clear["origin"], "http://127.0.0.1:8001")
+        self.assertEqual(methods[-1], "Page.removeScriptToEvaluateOnNewDocument")
+
+    def test_only_significant_regressions_fail(self):
+        def run(lcp):
+            return {"desktop/cold": {"lcp": [lcp + offset for offset in (0, 7, -5, 3, -2)], "cls": [0.01] * 5},
+                    "desktop/new": {"lcp": [500.0] * 5}}
+
+        baseline = {"desktop/cold": run(800)["desktop/cold"]}
+        self.assertEqual(evaluate(run(805), baseline)["status"], "PASSED")
+
+        report = evaluate(run(1200), baseline)
+        self.assertEqual(report["status"], "FAILED")
+        self.assertEqual(len(report["regressions"]), 1)
+        self.assertTrue(report["regressions"][0].startswith("desktop/cold lcp"))
+        self.assertNotIn("desktop/new", report["comparisons"])
+        self.assertEqual(report["summary"]["desktop/cold"]["lcp"]["n"], 5)
+
+    def test_baseline_round_trip_merges_scenarios(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "baseline.json"
+            self.assertEqual(load_baseline(path), {})
+            save_baseline({"desktop/cold": {"lcp": [1.0]}}, path)
+            save_baseline({"mobile/cold": {"lcp": [2.0]}}, path)
+            self.assertEqual(set(load_baseline(path)), {"desktop/cold", "mobile/cold"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -123,6 +123,23 @@ class QualityGateTests(unittest.TestCase):
         self.assertEqual(checks["e2e_status"], "SKIPPED")
         self.assertIn("e2e smoke status is SKIPPED", failures)
 
+    def test_quality_gate_fails_on_benchmark_regression_only(self):
+        pipeline_results = self._base_pipeline_results()
+        e2e_results = {"status": "PASSED"}
+        thresholds = dict(min_success_rate=85, min_security_score=70, min_accessibility_score=80)
+
+        passed, checks, _ = evaluate_quality_gate(pipeline_results, e2e_results, **thresholds)
+        self.assertTrue(passed)
+        self.assertEqual(checks["bench_status"], "MISSING")
+
+        verdict = {"status": "FAILED", "regressions": ["desktop/cold lcp: creep 800.0 -> 900.0"]}
+        passed, checks, failures = evaluate_quality_gate(
+            pipeline_results, e2e_results, bench_verdict=verdict, **thresholds
+        )
+        self.assertFalse(passed)
+        self.assertEqual(checks["bench_status"], "FAILED")
+        self.assertIn("benchmark regression: desktop/cold lcp: creep 800.0 -> 900.0", failures)
+
 
 if __name__ == "__main__":
     unittest.main()
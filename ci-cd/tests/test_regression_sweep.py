@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from regression_sweep import merge_sections, run_cells  # noqa: E402
+
+
+class _FakePage:
+    async def goto(self, url, wait_until=None):
+        self.url = url
+
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        return True
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.page = _FakePage()
+
+    async def new_page(self):
+        return self.page
+
+    async def close(self):
+        self.browser.open -= 1
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.open = 0
+        self.peak = 0
+        self.contexts = []
+
+    async def new_context(self):
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+def _cell(result, delay):
+    async def body(page):
+        await asyncio.sleep(delay)
+        return dict(result, page=id(page))
+    return body
+
+
+class RunCellsTests(unittest.TestCase):
+    def test_results_keep_declaration_order_and_isolated_pages(self):
+        browser = _FakeBrowser()
+        cells = [("slow", _cell({"status": "PASSED"}, 0.03)), ("fast", _cell({"status": "PASSED"}, 0.0))]
+
+        results = asyncio.run(run_cells(browser, "http://app/index.html", cells, max_contexts=2))
+
+        self.assertEqual(list(results), ["slow", "fast"])
+        self.assertNotEqual(results["slow"]["page"], results["fast"]["page"])
+        self.assertEqual(browser.open, 0)
+
+    def test_semaphore_caps_open_contexts(self):
+        browser = _FakeBrowser()
+        cells = [(f"cell{n}", _cell({"status": "PASSED"}, 0.01)) for n in range(6)]
+
+        asyncio.run(run_cells(browser, "http://app/index.html", cells, max_contexts=2))
+
+        self.assertEqual(len(browser.contexts), 6)
+        self.assertEqual(browser.peak, 2)
+
+    def test_failing_cell_becomes_failed_result_and_closes_its_context(self):
+        async def broken(page):
+            raise RuntimeError("timer selector missing")
+
+        browser = _FakeBrowser()
+        results = asyncio.run(run_cells(browser, "http://app/index.html", [("timer_matrix", broken)], max_contexts=1))
+
+        self.assertEqual(results["timer_matrix"]["status"], "FAILED")
+        self.assertIn("timer selector missing", results["timer_matrix"]["error"])
+        self.assertEqual(browser.open, 0)
+
+
+class MergeSectionsTests(unittest.TestCase):
+    def _generator_cell(self, mode, generated=True):
+        return {"setup": {"ok": True}, "result": {"generated": generated, "actualPattern": mode}, "unknown_exercises": []}
+
+    def _results(self, **overrides):
+        results = {
+            f"generator:{mode}": self._generator_cell(mode) for mode in ("pyramid", "standard", "tabata", "circuit")
+        }
+        results["generator:edge_case"] = {"setup": {"ok": True}, "result": {"generated": True}}
+        results["generator:invalid_input"] = {"blocked": True}
+        results["auth_matrix"] = {"status": "PASSED"}
+        results["timer_matrix"] = {"status": "PASSED"}
+        results.update(overrides)
+        return results
+
+    def test_merge_is_independent_of_completion_order(self):
+        merged = merge_sections(self._results())
+
+        self.assertEqual(list(merged), ["generator_matrix", "timer_matrix", "auth_matrix"])
+        self.assertEqual(
+            list(merged["generator_matrix"]["checks"]),
+            ["standard", "circuit", "tabata", "pyramid", "invalid_input", "edge_case"],
+        )
+        self.assertEqual(merged["generator_matrix"]["status"], "PASSED")
+
+    def test_failed_generator_cell_downgrades_the_section(self):
+        merged = merge_sections(self._results(**{"generator:tabata": {"status": "FAILED", "error": "crashed"}}))
+
+        self.assertEqual(merged["generator_matrix"]["status"], "WARNING")
+        self.assertEqual(merged["generator_matrix"]["checks"]["tabata"]["error"], "crashed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from resource_admission import MB, ResourceCost, ResourceGovernor  # noqa: E402
+
+
+BROWSER = ResourceCost(cpu=1.0, rss_mb=500)
+STATIC = ResourceCost(cpu=0.1, rss_mb=16)
+
+
+class _Probe:
+    def __init__(self, load=10.0, available_mb=8192):
+        self.load = load
+        self.available_mb = available_mb
+
+    def __call__(self):
+        return self.load, self.available_mb * MB
+
+
+def _governor(probe, cpu=2, memory_mb=4096):
+    return ResourceGovernor(cpu_capacity=cpu, memory_mb=memory_mb, reserve_mb=256, probe=probe, poll=0.01)
+
+
+def _try_admit(governor, cost):
+    """Start a thread that admits ``cost``; returns (admitted event, release event)."""
+    admitted, release = threading.Event(), threading.Event()
+
+    def run():
+        with governor.admit(cost):
+            admitted.set()
+            release.wait(5)
+
+    threading.Thread(target=run, daemon=True).start()
+    return admitted, release
+
+
+class ResourceGovernorTests(unittest.TestCase):
+    def test_cheap_checks_fill_slots_a_browser_cannot(self):
+        governor = _governor(_Probe(), cpu=2)
+        first, release_first = _try_admit(governor, BROWSER)
+        self.assertTrue(first.wait(1))
+        second, release_second = _try_admit(governor, BROWSER)
+        self.assertTrue(second.wait(1))
+
+        blocked, release_blocked = _try_admit(governor, BROWSER)
+        self.assertFalse(blocked.wait(0.1))
+
+        for release in (release_first, release_second):
+            release.set()
+        self.assertTrue(blocked.wait(1))
+        release_blocked.set()
+        self.assertEqual(governor.snapshot()["throttled"], 1)
+
+    def test_static_checks_are_admitted_beside_running_browsers(self):
+        governor = _governor(_Probe(), cpu=1.5)
+        browser, release_browser = _try_admit(governor, BROWSER)
+        self.assertTrue(browser.wait(1))
+
+        releases = []
+        for _ in range(4):
+            admitted, release = _try_admit(governor, STATIC)
+            self.assertTrue(admitted.wait(1))
+            releases.append(release)
+        for release in releases + [release_browser]:
+            release.set()
+        self.assertEqual(governor.snapshot()["peak_running"], 5)
+
+    def test_live_memory_pressure_holds_heavy_tests(self):
+        probe = _Probe(available_mb=600)
+        governor = _governor(probe, cpu=8)
+        running, release_running = _try_admit(governor, STATIC)
+        self.assertTrue(running.wait(1))
+
+        heavy, release_heavy = _try_admit(governor, BROWSER)
+        self.assertFalse(heavy.wait(0.1))
+        probe.available_mb = 2048
+        self.assertTrue(heavy.wait(1))
+        release_running.set()
+        release_heavy.set()
+
+    def test_busy_cpu_holds_tests_that_need_a_core(self):
+        probe = _Probe(load=99.0)
+        governor = _governor(probe, cpu=8)
+        running, release_running = _try_admit(governor, STATIC)
+        self.assertTrue(running.wait(1))
+
+        cheap, release_cheap = _try_admit(governor, STATIC)
+        self.assertTrue(cheap.wait(1))
+        heavy, release_heavy = _try_admit(governor, BROWSER)
+        self.assertFalse(heavy.wait(0.1))
+        probe.load = 40.0
+        self.assertTrue(heavy.wait(1))
+        for release in (release_running, release_cheap, release_heavy):
+            release.set()
+
+    def test_oversized_test_still_runs_alone(self):
+        governor = _governor(_Probe(available_mb=128), cpu=1, memory_mb=100)
+        with governor.admit(ResourceCost(cpu=4, rss_mb=4096)):
+            self.assertEqual(governor.snapshot()["peak_rss_mb"], 4096)
+
+    def test_cost_is_read_from_test_definition(self):
+        self.assertEqual(
+            ResourceCost.from_definition({"cost": {"cpu": 1.5, "rss_mb": 700}}),
+            ResourceCost(cpu=1.5, rss_mb=700),
+        )
+        self.assertEqual(ResourceCost.from_definition({}), ResourceCost())
+
+    def test_memory_budget_defaults_to_available_minus_reserve(self):
+        governor = ResourceGovernor(cpu_capacity=2, reserve_mb=256, probe=_Probe(available_mb=2048))
+        self.assertEqual(governor.memory_mb, 2048 - 256)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from source_snapshot import SourceFile, SourceSnapshot  # noqa: E402
+
+
+class SourceSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "js" / "core").mkdir(parents=True)
+        (self.root / "index.html").write_text("<title>x</title>\n<main></main>\n", encoding="utf-8")
+        (self.root / "js" / "main.js").write_text("import a from './core/a.js';\nrun();", encoding="utf-8")
+        (self.root / "js" / "core" / "a.js").write_text("export default 1;\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_snapshot_is_isolated_from_later_writes(self):
+        snapshot = SourceSnapshot.capture(self.root)
+        (self.root / "js" / "main.js").write_text("changed", encoding="utf-8")
+
+        self.assertIn("run();", snapshot.read_text(self.root / "js" / "main.js"))
+        self.assertEqual(snapshot.read_text("js/main.js"), snapshot["js/main.js"].text)
+
+    def test_exists_covers_files_directories_and_missing_paths(self):
+        snapshot = SourceSnapshot.capture(self.root)
+
+        self.assertTrue(snapshot.exists(self.root / "js" / "core"))
+        self.assertTrue(snapshot.exists("js/core/a.js"))
+        self.assertFalse(snapshot.exists("js/missing.js"))
+        self.assertFalse(snapshot.exists(self.root.parent / "elsewhere.js"))
+        with self.assertRaises(FileNotFoundError):
+            snapshot.read_text("js/missing.js")
+
+    def test_line_table_maps_offsets_to_positions(self):
+        source = SourceFile.from_bytes("x.js", b"one\ntwo\n\nfour")
+        offset = source.text.index("four")
+
+        self.assertEqual(source.line_count, 4)
+        self.assertEqual(source.position(offset), (4, 1))
+        self.assertEqual(source.position(source.text.index("wo")), (2, 2))
+        self.assertEqual(source.line(2), "two")
+        self.assertEqual(source.line(3), "")
+
+    def test_iter_files_filters_by_prefix_and_suffix(self):
+        snapshot = SourceSnapshot.capture(self.root)
+        paths = [source.path for source in snapshot.iter_files("js/", ".js")]
+
+        self.assertEqual(paths, ["js/main.js", "js/core/a.js"])
+
+    def test_files_mapping_is_read_only(self):
+        snapshot = SourceSnapshot.capture(self.root)
+
+        with self.assertRaises(TypeError):
+            snapshot.files["new.js"] = SourceFile.from_bytes("new.js", b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from source_snapshot import SourceSnapshot  # noqa: E402
+from source_watcher import SourceWatcher  # noqa: E402
+
+
+class SourceWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "main.js").write_text("one", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_polling_times_out_without_changes(self):
+        watcher = SourceWatcher(self.root, interval=0.01, debounce=0.01, use_watchdog=False)
+        self.assertEqual(watcher.backend, "polling")
+        self.assertFalse(watcher.wait_for_change(timeout=0.05))
+
+    def test_polling_reports_a_burst_of_edits_once(self):
+        watcher = SourceWatcher(self.root, interval=0.01, debounce=0.05, use_watchdog=False)
+
+        def edit():
+            time.sleep(0.02)
+            (self.root / "main.js").write_text("two!", encoding="utf-8")
+            (self.root / "extra.js").write_text("x", encoding="utf-8")
+
+        thread = threading.Thread(target=edit)
+        thread.start()
+        self.assertTrue(watcher.wait_for_change(timeout=2))
+        thread.join()
+        self.assertFalse(watcher.wait_for_change(timeout=0.05))
+
+    def test_snapshot_diff_lists_added_modified_and_removed_files(self):
+        (self.root / "gone.js").write_text("x", encoding="utf-8")
+        before = SourceSnapshot.capture(self.root)
+        (self.root / "main.js").write_text("changed", encoding="utf-8")
+        (self.root / "gone.js").unlink()
+        (self.root / "new.js").write_text("y", encoding="utf-8")
+
+        self.assertEqual(before.changed_paths(SourceSnapshot.capture(self.root)), ["gone.js", "main.js", "new.js"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import gzip
+import http.client
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+import static_server  # noqa: E402
+from static_server import (  # noqa: E402
+    ServerNotReady,
+    StaticServer,
+    acquire_shared,
+    negotiate,
+    probe,
+    release_shared,
+)
+
+
+SCRIPT = b"const exercises = [" + b"'squat', " * 200 + b"];\n"
+
+
+class StaticServerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        (root / "js").mkdir()
+        (root / "index.html").write_bytes(b"<html><body>workout</body></html>")
+        (root / "js" / "app.js").write_bytes(SCRIPT)
+        self.server = StaticServer(root=root, port=0)
+        self.server.start()
+        self.conn = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=5)
+
+    def tearDown(self):
+        self.conn.close()
+        self.server.stop()
+        self._tmp.cleanup()
+
+    def _get(self, path, **headers):
+        self.conn.request("GET", path, headers=headers)
+        response = self.conn.getresponse()
+        return response, response.read()
+
+    def test_directory_and_query_map_to_index(self):
+        response, body = self._get("/?v=3#top")
+        self.assertEqual(response.status, 200)
+        self.assertIn(b"workout", body)
+        self.assertEqual(response.getheader("Content-Type"), "text/html; charset=utf-8")
+
+    def test_keep_alive_serves_several_requests_on_one_connection(self):
+        self._get("/index.html")
+        sock = self.conn.sock
+        response, _ = self._get("/js/app.js")
+        self.assertEqual(response.status, 200)
+        self.assertIs(self.conn.sock, sock)
+        self.assertEqual(response.version, 11)
+
+    def test_etag_revalidation_returns_304(self):
+        response, _ = self._get("/js/app.js")
+        etag = response.getheader("ETag")
+        response, body = self._get("/js/app.js", **{"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_gzip_variant_is_precomputed_and_negotiated(self):
+        response, body = self._get("/js/app.js", **{"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(body), SCRIPT)
+
+        response, body = self._get("/js/app.js")
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, SCRIPT)
+
+    def test_missing_file_and_traversal_are_404(self):
+        self.assertEqual(self._get("/missing.js")[0].status, 404)
+        self.assertEqual(self._get("/../../etc/passwd")[0].status, 404)
+
+    def test_busy_preferred_port_falls_back_to_a_free_one(self):
+        other = StaticServer(root=self.server.root, port=self.server.port)
+        try:
+            other.start()
+            self.assertNotEqual(other.port, self.server.port)
+        finally:
+            other.stop()
+
+
+class ProbeTests(unittest.TestCase):
+    def test_started_server_already_answers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "index.html").write_bytes(b"ok")
+            with StaticServer(root=Path(tmp), port=0) as server:
+                self.assertEqual(probe(server.host, server.port, timeout=1), 200)
+
+    def test_listener_that_never_answers_is_not_ready(self):
+        with socket.socket() as silent:
+            silent.bind(("127.0.0.1", 0))
+            silent.listen(1)
+            with self.assertRaises(ServerNotReady):
+                probe("127.0.0.1", silent.getsockname()[1], timeout=0.2)
+
+    def test_closed_port_is_not_ready(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with self.assertRaises(ServerNotReady):
+            probe("127.0.0.1", port, timeout=0.2)
+
+
+class NegotiateTests(unittest.TestCase):
+    def test_prefers_brotli_and_honours_q_zero(self):
+        available = {"gzip": b"g", "br": b"b"}
+        self.assertEqual(negotiate("gzip, br", available), "br")
+        self.assertEqual(negotiate("br;q=0, gzip", available), "gzip")
+        self.assertEqual(negotiate("*", {"gzip": b"g"}), "gzip")
+        self.assertIsNone(negotiate("identity", available))
+
+
+class SharedServerTests(unittest.TestCase):
+    def test_shared_server_is_reference_counted(self):
+        first = acquire_shared(port=0)
+        second = acquire_shared(port=0)
+        try:
+            self.assertIs(first, second)
+            release_shared()
+            self.assertIsNotNone(first.port)
+        finally:
+            release_shared()
+        self.assertIsNone(first.port)
+        self.assertIsNone(static_server._shared)
+
+
+if __name__ == "__main__":
+    unittest.main()
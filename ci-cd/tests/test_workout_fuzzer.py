@@ -0,0 +1,133 @@
+import unittest
+from pathlib import Path
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from workout_fuzzer import (  # noqa: E402
+    FormOptions,
+    WorkoutFuzzer,
+    check_invariants,
+    estimated_minutes,
+    random_scenario,
+    shrink,
+)
+from workout_harness import Scenario  # noqa: E402
+
+
+def fake_generator(scenarios):
+    """Stands in for the page: Rower selections at 45+ minutes leak a Kettlebell exercise."""
+    results = []
+    for scenario in scenarios:
+        items = [["Jumping Jacks", "warmup", "Bodyweight", "Warm-up"]]
+        items += [[f"Main {index}", "main", scenario.equipment[0], "Main"] for index in range(scenario.duration // 3)]
+        if "Rower" in scenario.equipment and scenario.duration >= 45:
+            items.append(["Goblet Squat", "main", "Kettlebell", "Main"])
+        results.append({
+            "ok": True,
+            "trainingPattern": scenario.pattern,
+            "workTime": 45,
+            "restTime": 15,
+            "hasCircuitData": scenario.pattern == "circuit",
+            "items": items,
+        })
+    return results
+
+
+class InvariantTests(unittest.TestCase):
+    def test_estimate_mirrors_calculate_workout_time(self):
+        result = {"workTime": 45, "restTime": 15, "items": [["a", "main", "Bodyweight", None]] * 3 + [["Set", "tabata_set", None, None]]}
+        self.assertEqual(estimated_minutes(result), round((3 * 45 + 2 * 15) / 60))
+
+    def test_each_invariant(self):
+        scenario = Scenario(30, ("Dumbbells",), "Beginner", "circuit")
+        result = {
+            "ok": True,
+            "trainingPattern": "circuit",
+            "workTime": 45,
+            "restTime": 15,
+            "hasCircuitData": False,
+            "items": [["Row", "main", "Rower", "Main"]],
+        }
+        self.assertEqual(
+            [failure.invariant for failure in check_invariants(scenario, result)],
+            ["equipment", "duration", "circuit_data"],
+        )
+        self.assertEqual(
+            [failure.invariant for failure in check_invariants(scenario, {"ok": True, "items": []})],
+            ["non_empty", "duration", "circuit_data"],
+        )
+        self.assertEqual(check_invariants(scenario, {"ok": False, "error": "x"})[0].invariant, "generates")
+
+    def test_bodyweight_is_always_allowed(self):
+        scenario = Scenario(30, ("Dumbbells",), "Beginner", "standard")
+        result = fake_generator([scenario])[0]
+        result["items"].append(["Push-ups", "main", "Bodyweight", "Main"])
+        self.assertNotIn("equipment", [failure.invariant for failure in check_invariants(scenario, result)])
+
+
+class ShrinkTests(unittest.TestCase):
+    def test_counterexample_shrinks_to_minimal_form_state(self):
+        options = FormOptions()
+        original = Scenario(
+            60, ("Dumbbells", "Rower", "Jump Rope"), "Advanced", "tabata",
+            seed=987654, settings=(("rounds", 11),), work_time=90, rest_time=40,
+        )
+        self.assertIn("equipment", [failure.invariant for failure in check_invariants(original, fake_generator([original])[0])])
+
+        minimal, steps = shrink(original, "equipment", fake_generator, options)
+
+        self.assertEqual(minimal, Scenario(45, ("Rower",), "Beginner", "standard"))
+        self.assertGreater(steps, 0)
+
+    def test_shrinking_keeps_the_same_invariant(self):
+        options = FormOptions()
+        original = Scenario(60, ("Dumbbells",), "Advanced", "circuit", settings=(("rounds", 5), ("exercisesPerRound", 8), ("circuitRest", 90)))
+        minimal, _steps = shrink(original, "equipment", fake_generator, options)
+        self.assertEqual(minimal, original)
+
+
+class FuzzerTests(unittest.TestCase):
+    def test_same_seed_reproduces_the_run(self):
+        options = FormOptions()
+        first = WorkoutFuzzer(fake_generator, options, seed=7, batch_size=25, budget_seconds=60, max_scenarios=100).run()
+        second = WorkoutFuzzer(fake_generator, options, seed=7, batch_size=25, budget_seconds=60, max_scenarios=100).run()
+
+        self.assertEqual(first.scenarios_run, 100)
+        self.assertEqual(first.counterexamples, second.counterexamples)
+        self.assertEqual(first.status, "FAILED")
+        equipment = [example for example in first.counterexamples if example["invariant"] == "equipment"][0]
+        self.assertEqual(equipment["minimal"]["equipment"], ["Rower"])
+        self.assertEqual(equipment["minimal"]["duration"], 45)
+
+    def test_budget_stops_the_run(self):
+        ticks = iter(range(1000))
+        fuzzer = WorkoutFuzzer(fake_generator, seed=1, batch_size=10, budget_seconds=3, clock=lambda: next(ticks))
+        report = fuzzer.run()
+        self.assertLessEqual(report.batches, 3)
+
+    def test_random_scenarios_are_valid(self):
+        import random
+
+        options = FormOptions()
+        rng = random.Random(3)
+        for _ in range(200):
+            scenario = random_scenario(rng, options)
+            self.assertTrue(scenario.equipment)
+            self.assertIn(scenario.duration, options.durations)
+            ranges = dict(options.pattern_settings.get(scenario.pattern, ()))
+            for key, value in scenario.settings:
+                self.assertTrue(ranges[key].minimum <= value <= ranges[key].maximum)
+
+    def test_options_are_read_from_the_form(self):
+        options = FormOptions.from_html((CI_CD_DIR.parent / "src" / "index.html").read_text(encoding="utf-8"))
+        self.assertEqual(options.levels, ("Beginner", "Intermediate", "Advanced"))
+        self.assertIn("Rower", options.equipment)
+        self.assertEqual(dict(options.pattern_settings["tabata"])["rounds"].maximum, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
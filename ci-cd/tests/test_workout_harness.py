@@ -0,0 +1,142 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+
+CI_CD_DIR = Path(__file__).resolve().parents[1]
+if str(CI_CD_DIR) not in sys.path:
+    sys.path.insert(0, str(CI_CD_DIR))
+
+from exercise_catalog import ExerciseRecord  # noqa: E402
+from exercise_index import ExerciseIndex  # noqa: E402
+from automated_test_pipeline import AutomatedTestPipeline  # noqa: E402
+from source_snapshot import SourceFile, SourceSnapshot  # noqa: E402
+from workout_harness import BOOTSTRAP_PATH, HARNESS_ORIGIN, Scenario, WorkoutHarness, form_space, workout_violations  # noqa: E402
+
+
+def _record(name, etype, equipment="Bodyweight", levels=("Beginner",)):
+    return ExerciseRecord(name, equipment, levels, "Legs", etype, None, (), (), (), (), "", 1)
+
+
+class FormSpaceTests(unittest.TestCase):
+    def test_every_selection_keeps_always_available_equipment(self):
+        scenarios = form_space([15, 30], ["Bodyweight", "Dumbbells", "Rower"], ["Beginner"], ["standard", "tabata"], always_available=("Bodyweight",))
+
+        self.assertEqual(len(scenarios), 2 * 4 * 2)
+        self.assertTrue(all(scenario.equipment[0] == "Bodyweight" for scenario in scenarios))
+        self.assertEqual(len({scenario.seed for scenario in scenarios}), len(scenarios))
+
+    def test_empty_selection_is_skipped(self):
+        self.assertEqual(len(form_space([30], ["Dumbbells", "Rower"], ["Beginner"], ["standard"])), 3)
+
+    def test_form_data_matches_get_form_data_shape(self):
+        scenario = Scenario(45, ("Dumbbells",), "Advanced", "pyramid", settings=(("levels", 5),))
+        self.assertEqual(
+            scenario.form_data(),
+            {
+                "level": "Advanced",
+                "duration": 45,
+                "equipment": ["Dumbbells"],
+                "workTime": 45,
+                "restTime": 15,
+                "trainingPattern": "pyramid",
+                "patternSettings": {"levels": 5},
+            },
+        )
+
+
+class WorkoutViolationTests(unittest.TestCase):
+    def setUp(self):
+        self.index = ExerciseIndex([
+            _record("Jumping Jacks", "warmup"),
+            _record("Squats", "main", levels=("Beginner", "Intermediate")),
+            _record("Goblet Squat", "main", equipment="Kettlebell", levels=("Advanced",)),
+            _record("Quad Stretch", "cooldown"),
+        ])
+        self.scenario = Scenario(30, ("Bodyweight",), "Beginner", "standard")
+
+    def _result(self, items, pattern="standard"):
+        return {"ok": True, "trainingPattern": pattern, "items": items}
+
+    def test_valid_workout_has_no_violations(self):
+        items = [
+            ["Jumping Jacks", "warmup", "Bodyweight", "Warm-up"],
+            ["Tabata Set 1", "tabata_set", None, None],
+            ["Squats", "main", "Bodyweight", "Main"],
+            ["Quad Stretch", "cooldown", "Bodyweight", "Cool-down"],
+        ]
+        self.assertEqual(workout_violations(self.index, self.scenario, self._result(items)), [])
+
+    def test_violations_are_reported(self):
+        items = [
+            ["Goblet Squat", "main", "Kettlebell", "Main"],
+            ["Made Up", "cooldown", "Bodyweight", "Cool-down"],
+        ]
+        self.assertEqual(
+            workout_violations(self.index, self.scenario, self._result(items, pattern="circuit")),
+            [
+                "pattern 'circuit' != requested 'standard'",
+                "'Goblet Squat' needs 'Kettlebell', which was not selected",
+                "main exercise 'Goblet Squat' is not offered at Beginner",
+                "cooldown exercise 'Made Up' is not in the database",
+            ],
+        )
+
+    def test_empty_and_failed_workouts(self):
+        self.assertEqual(workout_violations(self.index, self.scenario, self._result([])), ["workout has no main exercises"])
+        self.assertEqual(
+            workout_violations(self.index, self.scenario, {"ok": False, "error": "boom"}),
+            ["generateWorkout threw: boom"],
+        )
+
+
+class HarnessRoutingTests(unittest.TestCase):
+    def test_requests_are_served_from_the_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "js" / "core").mkdir(parents=True)
+            (root / "js" / "core" / "workout-generator.js").write_text("export function generateWorkout() {}", encoding="utf-8")
+            snapshot = SourceSnapshot.capture(root)
+        harness = WorkoutHarness(snapshot)
+
+        with snapshot.track_reads() as reads:
+            status, body, content_type = harness.resolve(HARNESS_ORIGIN + "/js/core/workout-generator.js?v=2")
+        self.assertEqual((status, content_type), (200, "text/javascript"))
+        self.assertIn(b"generateWorkout", body)
+        self.assertIn("file:js/core/workout-generator.js", reads)
+
+        self.assertEqual(harness.resolve(HARNESS_ORIGIN + BOOTSTRAP_PATH)[0], 200)
+        self.assertEqual(harness.resolve(HARNESS_ORIGIN + "/js/missing.js")[0], 404)
+
+
+class FormSpaceMemoTests(unittest.TestCase):
+    GENERATOR = "js/core/workout-generator.js"
+
+    def test_an_edited_generator_runs_the_harness_again(self):
+        pipeline = AutomatedTestPipeline(persist_artifacts=False, enable_cache=False)
+        scenarios = form_space([30], ["Bodyweight"], ["Beginner"], ["standard"])
+        runs = []
+
+        def fake_run_form_space(snapshot, index, scenarios):
+            runs.append(snapshot.read_text(self.GENERATOR))
+            return {"failed": 0, "generator_bytes": len(runs[-1])}
+
+        with mock.patch("automated_test_pipeline.run_form_space", fake_run_form_space):
+            first = pipeline._generate_form_space(scenarios)
+            self.assertEqual(pipeline._generate_form_space(scenarios), first)
+            self.assertEqual(len(runs), 1)
+
+            edited = runs[0] + "\n// edited\n"
+            files = dict(pipeline.snapshot.files)
+            files[self.GENERATOR] = SourceFile.from_bytes(self.GENERATOR, edited.encode("utf-8"))
+            pipeline.snapshot = SourceSnapshot(pipeline.snapshot.root, files)
+            second = pipeline._generate_form_space(scenarios)
+
+        self.assertEqual(runs[1], edited)
+        self.assertNotEqual(second["generator_bytes"], first["generator_bytes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
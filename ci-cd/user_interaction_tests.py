@@ -19,22 +19,29 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_app, wait_for_dom_settled, wait_for_phase_change, wait_for_workout
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class UserInteractionTests:
-    def __init__(self, base_url="http://127.0.0.1:8001", headless=True):
+    def __init__(self, base_url="http://127.0.0.1:8001", headless=True, driver=None):
         self.base_url = base_url
         self.headless = headless
-        self.driver = None
+        self.driver = driver
+        self.owns_driver = driver is None
         self.wait = None
         self.screenshot_dir = "user_interaction_screenshots"
         os.makedirs(self.screenshot_dir, exist_ok=True)
         
     def setup_driver(self):
         """Setup Chrome WebDriver with optimal settings"""
+        if not self.owns_driver:
+            self.wait = WebDriverWait(self.driver, 15)
+            logger.info("✅ User Interaction using pooled WebDriver")
+            return
+
         options = Options()
         if self.headless:
             options.add_argument("--headless")
@@ -45,14 +52,14 @@ class UserInteractionTests:
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-logging")
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 15)
         logger.info("✅ User Interaction WebDriver initialized")
         
     def teardown_driver(self):
-        """Clean up WebDriver"""
-        if self.driver:
+        """Clean up WebDriver (pooled sessions are returned by the pool, not quit)"""
+        if self.driver and self.owns_driver:
             self.driver.quit()
             logger.info("🔚 WebDriver closed")
             
@@ -82,7 +89,7 @@ class UserInteractionTests:
             }
         """)
         self.wait.until(EC.presence_of_element_located((By.ID, "workout-form")))
-        time.sleep(0.2)
+        wait_for_app(self.driver)
 
     # ==================== MULTIPLE WORKOUT GENERATION TESTS ====================
     
@@ -102,7 +109,7 @@ class UserInteractionTests:
 
                 # Reset form
                 self.driver.execute_script("document.getElementById('workout-form').reset();")
-                time.sleep(0.5)
+                wait_for_dom_settled(self.driver)
                 
                 # Vary the workout parameters
                 if i == 0:
@@ -150,8 +157,9 @@ class UserInteractionTests:
                 
                 # Generate workout
                 generate_btn = self.driver.find_element(By.ID, "generate-btn")
+                mark(self.driver)
                 self.driver.execute_script("arguments[0].click();", generate_btn)
-                time.sleep(3)
+                wait_for_workout(self.driver)
                 
                 # Check if workout was generated
                 workout_data = self.driver.execute_script("return window.workoutData || window.currentWorkoutData;")
@@ -198,7 +206,7 @@ class UserInteractionTests:
             # Test Tab navigation
             body = self.driver.find_element(By.TAG_NAME, "body")
             body.send_keys(Keys.TAB)
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             
             # Test arrow key navigation on fitness level dropdown
             fitness_level = self.driver.find_element(By.ID, "fitness-level")
@@ -231,7 +239,7 @@ class UserInteractionTests:
                     d30.dispatchEvent(new Event('change', { bubbles: true }));
                 }
             """)
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             
             checkbox_states = self.driver.execute_script("""
                 return {
@@ -263,7 +271,7 @@ class UserInteractionTests:
                     dumbbells.dispatchEvent(new Event('change', { bubbles: true }));
                 }
             """)
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             
             equipment_states = self.driver.execute_script("""
                 return {
@@ -333,8 +341,9 @@ class UserInteractionTests:
         try:
             # Generate workout first
             generate_btn = self.driver.find_element(By.ID, "generate-btn")
+            mark(self.driver)
             generate_btn.click()
-            time.sleep(3)
+            wait_for_workout(self.driver)
             
             # Check start workout button
             start_btn = self.driver.find_element(By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')
@@ -372,12 +381,14 @@ class UserInteractionTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         navigation_tests = {}
         
@@ -385,7 +396,7 @@ class UserInteractionTests:
         try:
             prev_btn = self.driver.find_element(By.CSS_SELECTOR, '[onclick*="previous"]')
             prev_btn.click()
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             navigation_tests["previous_button"] = {
                 "found": True,
@@ -401,7 +412,7 @@ class UserInteractionTests:
         try:
             next_btn = self.driver.find_element(By.CSS_SELECTOR, '[onclick*="next"]')
             next_btn.click()
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             navigation_tests["next_button"] = {
                 "found": True,
@@ -417,7 +428,7 @@ class UserInteractionTests:
         try:
             resume_btn = self.driver.find_element(By.CSS_SELECTOR, '[onclick*="resume"]')
             resume_btn.click()
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             navigation_tests["resume_button"] = {
                 "found": True,
@@ -454,12 +465,14 @@ class UserInteractionTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         toggle_tests = {}
         
@@ -470,12 +483,12 @@ class UserInteractionTests:
             
             # Toggle sound off
             sound_toggle.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             sound_off_state = sound_toggle.is_selected()
             
             # Toggle sound on
             sound_toggle.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             sound_on_state = sound_toggle.is_selected()
             
             toggle_tests["sound_toggle"] = {
@@ -495,12 +508,12 @@ class UserInteractionTests:
             
             # Toggle vibration off
             vibration_toggle.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             vibration_off_state = vibration_toggle.is_selected()
             
             # Toggle vibration on
             vibration_toggle.click()
-            time.sleep(0.5)
+            wait_for_dom_settled(self.driver)
             vibration_on_state = vibration_toggle.is_selected()
             
             toggle_tests["vibration_toggle"] = {
@@ -538,12 +551,14 @@ class UserInteractionTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         exit_tests = {}
         
@@ -551,7 +566,7 @@ class UserInteractionTests:
         try:
             exit_btn = self.driver.find_element(By.ID, "exit-workout-btn")
             exit_btn.click()
-            time.sleep(2)
+            wait_for_dom_settled(self.driver)
             
             # Check if we're back to the main form
             form_visible = self.driver.find_element(By.ID, "workout-form").is_displayed()
@@ -591,12 +606,14 @@ class UserInteractionTests:
         """)
         
         generate_btn = self.driver.find_element(By.ID, "generate-btn")
+        mark(self.driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(self.driver)
         
         start_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')))
+        mark(self.driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(self.driver)
         
         pause_resume_tests = {}
         
@@ -605,7 +622,7 @@ class UserInteractionTests:
             # Look for pause button
             pause_btn = self.driver.find_element(By.CSS_SELECTOR, '[onclick*="pause"], [onclick*="stop"]')
             pause_btn.click()
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             # Check workout state
             workout_state = self.driver.execute_script("""
@@ -631,7 +648,7 @@ class UserInteractionTests:
             # Look for resume button
             resume_btn = self.driver.find_element(By.CSS_SELECTOR, '[onclick*="resume"], [onclick*="start"]')
             resume_btn.click()
-            time.sleep(1)
+            wait_for_dom_settled(self.driver)
             
             # Check workout state after resume
             workout_state_after = self.driver.execute_script("""
@@ -7,7 +7,6 @@ by running a test and showing the captured screenshots.
 
 import json
 import logging
-import time
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -15,7 +14,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import resolve_driver_path
+from app_readiness import mark, wait_for_dom_settled, wait_for_phase_change, wait_for_workout
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,7 +33,7 @@ def visual_testing_demo():
     options.add_argument("--window-size=1920,1080")
     # Note: Not using headless mode for visual demo
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_driver_path())
     driver = webdriver.Chrome(service=service, options=options)
     wait = WebDriverWait(driver, 15)
     
@@ -82,8 +82,10 @@ def visual_testing_demo():
         logger.info("📸 Step 3: Capturing workout generation...")
         
         generate_btn = driver.find_element(By.ID, "generate-btn")
+        mark(driver)
         generate_btn.click()
-        time.sleep(3)
+        wait_for_workout(driver)
+        wait_for_dom_settled(driver)
         
         # Take screenshot
         screenshot3 = screenshots_dir / "03_workout_generated.png"
@@ -94,8 +96,10 @@ def visual_testing_demo():
         logger.info("📸 Step 4: Capturing workout start...")
         
         start_btn = driver.find_element(By.CSS_SELECTOR, 'button[onclick="startWorkout()"]')
+        mark(driver)
         start_btn.click()
-        time.sleep(2)
+        wait_for_phase_change(driver)
+        wait_for_dom_settled(driver)
         
         # Take screenshot
         screenshot4 = screenshots_dir / "04_workout_started.png"
@@ -108,12 +112,12 @@ def visual_testing_demo():
         # Test sound toggle
         sound_toggle = driver.find_element(By.ID, "sound-toggle")
         sound_toggle.click()
-        time.sleep(0.5)
+        wait_for_dom_settled(driver)
         
         # Test vibration toggle
         vibration_toggle = driver.find_element(By.ID, "vibration-toggle")
         vibration_toggle.click()
-        time.sleep(0.5)
+        wait_for_dom_settled(driver)
         
         # Take screenshot
         screenshot5 = screenshots_dir / "05_controls_tested.png"
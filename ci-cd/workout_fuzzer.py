@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Property-based fuzzing of ``generateWorkout`` with counterexample shrinking.
+
+Random but valid form states are drawn from the options and number ranges
+declared in ``src/index.html``. They are run in batches through the
+``WorkoutHarness`` page, and each generated workout is checked against
+these invariants:
+
+- ``generates``: ``generateWorkout`` does not throw.
+- ``non_empty``: the sequence contains at least one exercise.
+- ``equipment``: every exercise uses selected equipment or Bodyweight.
+- ``duration``: the ``_calculateWorkoutTime`` estimate is within
+  ``tolerance`` of the requested duration.
+- ``circuit_data``: circuit workouts carry ``_circuitData``.
+
+The first failure of each invariant is shrunk greedily to a minimal
+counterexample. Shrinking tries a simpler form state (fewer equipment
+items, shorter duration, smaller settings, seed 0, ...) and keeps it while
+the same invariant still fails. A fixed ``--seed`` reproduces a run, and
+``--budget`` caps the wall time so the fuzzer fits the pre-commit window.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from workout_harness import EXERCISE_TYPES, HarnessUnavailable, Scenario, WorkoutHarness
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = PROJECT_ROOT / "src"
+REPORT_PATH = PROJECT_ROOT / "reports" / "test_results" / "workout_fuzz_report.json"
+
+DEFAULT_SEED = 20240601
+DEFAULT_BUDGET_SECONDS = 20.0
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_TOLERANCE = 0.5
+MAX_SHRINK_STEPS = 200
+ALWAYS_ALLOWED_EQUIPMENT = "Bodyweight"
+# Item types that _calculateWorkoutTime leaves out of its exercise count.
+NON_EXERCISE_TYPES = ("circuit_round", "tabata_set", "pyramid_set", "circuit_header")
+
+RunBatch = Callable[[Sequence[Scenario]], List[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class NumberRange:
+    default: int
+    minimum: int
+    maximum: int
+
+
+@dataclass(frozen=True)
+class FormOptions:
+    durations: Tuple[int, ...] = (15, 30, 45, 60)
+    equipment: Tuple[str, ...] = (
+        "Bodyweight", "Dumbbells", "Kettlebell", "TRX Bands", "Resistance Band", "Pull-up Bar", "Jump Rope", "Rower",
+    )
+    levels: Tuple[str, ...] = ("Beginner", "Intermediate", "Advanced")
+    patterns: Tuple[str, ...] = ("standard", "circuit", "tabata", "pyramid")
+    work_time: NumberRange = NumberRange(45, 20, 120)
+    rest_time: NumberRange = NumberRange(15, 10, 60)
+    # pattern -> ((patternSettings key, range), ...), mirroring getFormData
+    pattern_settings: Mapping[str, Tuple[Tuple[str, NumberRange], ...]] = field(default_factory=lambda: {
+        "circuit": (
+            ("rounds", NumberRange(3, 2, 8)),
+            ("exercisesPerRound", NumberRange(6, 4, 10)),
+            ("circuitRest", NumberRange(60, 30, 180)),
+        ),
+        "tabata": (("rounds", NumberRange(8, 4, 12)),),
+        "pyramid": (("levels", NumberRange(5, 3, 7)),),
+    })
+
+    @classmethod
+    def from_html(cls, html: str) -> "FormOptions":
+        """Options and number ranges declared by the workout form; missing ones keep the defaults."""
+        defaults = cls()
+
+        def values(name: str) -> List[str]:
+            return re.findall(rf'<input[^>]*name="{name}"[^>]*value="([^"]*)"', html)
+
+        def number(element_id: str, fallback: NumberRange) -> NumberRange:
+            tag = re.search(rf'<input[^>]*id="{element_id}"[^>]*>', html)
+            if tag is None:
+                return fallback
+            attributes = dict(re.findall(r'(value|min|max)="(-?\d+)"', tag.group(0)))
+            return NumberRange(
+                int(attributes.get("value", fallback.default)),
+                int(attributes.get("min", fallback.minimum)),
+                int(attributes.get("max", fallback.maximum)),
+            )
+
+        level_select = re.search(r'<select[^>]*id="fitness-level"[^>]*>(.*?)</select>', html, re.S)
+        levels = re.findall(r'<option[^>]*value="([^"]+)"', level_select.group(1)) if level_select else []
+        element_ids = {
+            ("circuit", "rounds"): "circuit-rounds",
+            ("circuit", "exercisesPerRound"): "circuit-exercises",
+            ("circuit", "circuitRest"): "circuit-rest",
+            ("tabata", "rounds"): "tabata-rounds",
+            ("pyramid", "levels"): "pyramid-levels",
+        }
+        settings = {
+            pattern: tuple((key, number(element_ids[(pattern, key)], bounds)) for key, bounds in entries)
+            for pattern, entries in defaults.pattern_settings.items()
+        }
+        return cls(
+            durations=tuple(int(value) for value in values("duration") if value.isdigit()) or defaults.durations,
+            equipment=tuple(values("equipment")) or defaults.equipment,
+            levels=tuple(levels) or defaults.levels,
+            patterns=tuple(values("training-pattern")) or defaults.patterns,
+            work_time=number("work-time", defaults.work_time),
+            rest_time=number("rest-time", defaults.rest_time),
+            pattern_settings=settings,
+        )
+
+
+class InvariantFailure(NamedTuple):
+    invariant: str
+    message: str
+
+
+def estimated_minutes(result: Mapping[str, Any]) -> int:
+    """Mirror of ``_calculateWorkoutTime`` in workout-generator.js."""
+    count = sum(1 for _name, etype, _equipment, _section in result.get("items", ()) if etype not in NON_EXERCISE_TYPES)
+    work = result.get("workTime") or 0
+    rest = result.get("restTime") or 0
+    return round((count * work + (count - 1) * rest) / 60)
+
+
+def check_invariants(scenario: Scenario, result: Mapping[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[InvariantFailure]:
+    if not result.get("ok"):
+        return [InvariantFailure("generates", f"generateWorkout threw: {result.get('error')}")]
+    failures = []
+    exercises = [item for item in result.get("items", ()) if item[1] in EXERCISE_TYPES]
+    if not exercises:
+        failures.append(InvariantFailure("non_empty", "workout contains no exercises"))
+    allowed = set(scenario.equipment) | {ALWAYS_ALLOWED_EQUIPMENT}
+    wrong = sorted({f"{name} ({equipment})" for name, _etype, equipment, _section in exercises if equipment not in allowed})
+    if wrong:
+        failures.append(InvariantFailure("equipment", f"unselected equipment used by {', '.join(wrong)}"))
+    estimate = estimated_minutes(result)
+    if abs(estimate - scenario.duration) > tolerance * scenario.duration:
+        failures.append(InvariantFailure(
+            "duration", f"estimated {estimate} min for a requested {scenario.duration} min (tolerance {tolerance:.0%})"
+        ))
+    if scenario.pattern == "circuit" and not result.get("hasCircuitData"):
+        failures.append(InvariantFailure("circuit_data", "circuit workout has no _circuitData"))
+    return failures
+
+
+def random_scenario(rng: random.Random, options: FormOptions) -> Scenario:
+    equipment = tuple(name for name in options.equipment if rng.random() < 0.5)
+    if not equipment:
+        equipment = (rng.choice(options.equipment),)
+    pattern = rng.choice(options.patterns)
+    settings = tuple(
+        (key, rng.randint(bounds.minimum, bounds.maximum))
+        for key, bounds in options.pattern_settings.get(pattern, ())
+    )
+    return Scenario(
+        duration=rng.choice(options.durations),
+        equipment=equipment,
+        level=rng.choice(options.levels),
+        pattern=pattern,
+        seed=rng.getrandbits(32),
+        settings=settings,
+        work_time=rng.randint(options.work_time.minimum, options.work_time.maximum),
+        rest_time=rng.randint(options.rest_time.minimum, options.rest_time.maximum),
+    )
+
+
+def default_settings(options: FormOptions, pattern: str) -> Tuple[Tuple[str, int], ...]:
+    return tuple((key, bounds.default) for key, bounds in options.pattern_settings.get(pattern, ()))
+
+
+def shrink_candidates(scenario: Scenario, options: FormOptions) -> Iterator[Scenario]:
+    """Strictly simpler valid variants of ``scenario``, most aggressive first."""
+    simplest_pattern = options.patterns[0]
+    if scenario.pattern != simplest_pattern:
+        yield replace(scenario, pattern=simplest_pattern, settings=default_settings(options, simplest_pattern))
+    bounds = dict(options.pattern_settings.get(scenario.pattern, ()))
+    for position, (key, value) in enumerate(scenario.settings):
+        minimum = bounds[key].minimum if key in bounds else value
+        for smaller in dict.fromkeys((minimum, (minimum + value) // 2, value - 1)):
+            if minimum <= smaller < value:
+                settings = scenario.settings[:position] + ((key, smaller),) + scenario.settings[position + 1:]
+                yield replace(scenario, settings=settings)
+    if len(scenario.equipment) > 1:
+        yield replace(scenario, equipment=scenario.equipment[:1])
+        for position in range(len(scenario.equipment)):
+            yield replace(scenario, equipment=scenario.equipment[:position] + scenario.equipment[position + 1:])
+    for duration in options.durations:
+        if duration < scenario.duration:
+            yield replace(scenario, duration=duration)
+    if scenario.level in options.levels:
+        for level in options.levels[:options.levels.index(scenario.level)]:
+            yield replace(scenario, level=level)
+    if scenario.work_time != options.work_time.default:
+        yield replace(scenario, work_time=options.work_time.default)
+    if scenario.rest_time != options.rest_time.default:
+        yield replace(scenario, rest_time=options.rest_time.default)
+    if scenario.seed != 0:
+        yield replace(scenario, seed=0)
+
+
+def shrink(
+    scenario: Scenario,
+    invariant: str,
+    run_batch: RunBatch,
+    options: FormOptions,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_steps: int = MAX_SHRINK_STEPS,
+    deadline: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Tuple[Scenario, int]:
+    """Greedily replace ``scenario`` by the first simpler variant that still breaks ``invariant``."""
+    steps = 0
+    while steps < max_steps and (deadline is None or clock() < deadline):
+        candidates = list(dict.fromkeys(shrink_candidates(scenario, options)))
+        if not candidates:
+            break
+        results = run_batch(candidates)
+        for candidate, result in zip(candidates, results):
+            if any(failure.invariant == invariant for failure in check_invariants(candidate, result, tolerance)):
+                scenario = candidate
+                steps += 1
+                break
+        else:
+            break
+    return scenario, steps
+
+
+@dataclass
+class FuzzReport:
+    seed: int
+    budget_seconds: float
+    tolerance: float
+    scenarios_run: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    failure_counts: Dict[str, int] = field(default_factory=dict)
+    counterexamples: List[Dict[str, Any]] = field(default_factory=list)
+    status: str = "PASSED"
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "seed": self.seed,
+            "budget_seconds": self.budget_seconds,
+            "tolerance": self.tolerance,
+            "scenarios_run": self.scenarios_run,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "scenarios_per_second": round(self.scenarios_run / self.elapsed_seconds, 1) if self.elapsed_seconds else None,
+            "failure_counts": dict(sorted(self.failure_counts.items())),
+            "counterexamples": self.counterexamples,
+            "error": self.error,
+        }
+
+
+class WorkoutFuzzer:
+    """Draw, run and check random scenarios until the time budget is spent."""
+
+    def __init__(
+        self,
+        run_batch: RunBatch,
+        options: Optional[FormOptions] = None,
+        seed: int = DEFAULT_SEED,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_scenarios: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.run_batch = run_batch
+        self.options = options or FormOptions()
+        self.seed = seed
+        self.batch_size = max(1, batch_size)
+        self.budget_seconds = budget_seconds
+        self.tolerance = tolerance
+        self.max_scenarios = max_scenarios
+        self.clock = clock
+
+    def run(self) -> FuzzReport:
+        rng = random.Random(self.seed)
+        report = FuzzReport(self.seed, self.budget_seconds, self.tolerance)
+        started = self.clock()
+        deadline = started + self.budget_seconds
+        shrunk: Dict[str, Dict[str, Any]] = {}
+        while self.clock() < deadline:
+            if self.max_scenarios is not None and report.scenarios_run >= self.max_scenarios:
+                break
+            size = self.batch_size
+            if self.max_scenarios is not None:
+                size = min(size, self.max_scenarios - report.scenarios_run)
+            batch = [random_scenario(rng, self.options) for _ in range(size)]
+            results = self.run_batch(batch)
+            report.batches += 1
+            report.scenarios_run += len(batch)
+            for scenario, result in zip(batch, results):
+                for failure in check_invariants(scenario, result, self.tolerance):
+                    report.failure_counts[failure.invariant] = report.failure_counts.get(failure.invariant, 0) + 1
+                    if failure.invariant not in shrunk:
+                        shrunk[failure.invariant] = self._counterexample(scenario, failure, deadline)
+        report.counterexamples = [shrunk[invariant] for invariant in sorted(shrunk)]
+        report.status = "FAILED" if shrunk else "PASSED"
+        report.elapsed_seconds = self.clock() - started
+        return report
+
+    def _counterexample(self, scenario: Scenario, failure: InvariantFailure, deadline: float) -> Dict[str, Any]:
+        minimal, steps = shrink(
+            scenario, failure.invariant, self.run_batch, self.options, self.tolerance, deadline=deadline, clock=self.clock
+        )
+        message = failure.message
+        if minimal != scenario:
+            for shrunk_failure in check_invariants(minimal, self.run_batch([minimal])[0], self.tolerance):
+                if shrunk_failure.invariant == failure.invariant:
+                    message = shrunk_failure.message
+        return {
+            "invariant": failure.invariant,
+            "message": message,
+            "original": scenario.describe(),
+            "minimal": minimal.describe(),
+            "shrink_steps": steps,
+        }
+
+
+def run_fuzzer(
+    seed: int = DEFAULT_SEED,
+    budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    tolerance: float = DEFAULT_TOLERANCE,
+    headless: bool = True,
+) -> FuzzReport:
+    from source_snapshot import SourceSnapshot
+
+    snapshot = SourceSnapshot.capture(SRC_ROOT)
+    options = FormOptions.from_html(snapshot.read_text("index.html")) if snapshot.exists("index.html") else FormOptions()
+    report = FuzzReport(seed, budget_seconds, tolerance)
+    try:
+        with WorkoutHarness(snapshot, batch_size=batch_size, headless=headless) as harness:
+            fuzzer = WorkoutFuzzer(harness.run, options, seed, batch_size, budget_seconds, tolerance)
+            report = fuzzer.run()
+    except HarnessUnavailable as exc:
+        report.status = "SKIPPED"
+        report.error = str(exc)
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fuzz generateWorkout with random valid form inputs")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed (reuse it to reproduce a run)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Wall-time budget in seconds")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Scenarios per page.evaluate call")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative duration error")
+    parser.add_argument("--visible", action="store_true", help="Run the browser in visible mode")
+    parser.add_argument("--output", type=Path, default=REPORT_PATH, help="Where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    report = run_fuzzer(args.seed, args.budget, args.batch_size, args.tolerance, headless=not args.visible)
+    payload = report.to_dict()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+    if report.status == "PASSED":
+        return 0
+    return 2 if report.status == "SKIPPED" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""Run the app's ``generateWorkout`` directly in one long-lived headless page.
+
+``WorkoutHarness`` opens a single Playwright page on a private origin whose
+requests are answered from a ``SourceSnapshot`` through ``page.route``. No
+server and no disk reads are involved, and the check cache sees exactly
+which modules were loaded. The page imports
+``js/core/workout-generator.js`` once. After that, scenarios are sent in
+batches: each ``page.evaluate`` call runs ``generateWorkout(formData)`` for
+a whole batch and returns compact per-item summaries, so the cost per
+scenario is a function call rather than a DOM round trip.
+
+``Math.random`` is replaced by a seeded generator for each scenario, so a
+scenario and its seed always produce the same workout.
+``workout_violations`` checks one result against the exercise index.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from exercise_index import ExerciseIndex
+from source_snapshot import SourceSnapshot
+
+
+HARNESS_ORIGIN = "http://workout-harness.invalid"
+BOOTSTRAP_PATH = "/__harness__.html"
+GENERATOR_MODULE = "js/core/workout-generator.js"
+DEFAULT_BATCH_SIZE = 500
+EXERCISE_TYPES = ("warmup", "main", "cooldown")
+
+_BOOTSTRAP_HTML = b"<!doctype html><html><head><meta charset='utf-8'></head><body></body></html>"
+
+_LOAD_MODULE = """async (path) => {
+    window.__workoutHarness = await import(path);
+    return typeof window.__workoutHarness.generateWorkout === 'function';
+}"""
+
+_RUN_BATCH = """(scenarios) => {
+    const nativeRandom = Math.random;
+    const results = [];
+    try {
+        for (const scenario of scenarios) {
+            let state = (scenario.seed >>> 0) || 0x9e3779b9;
+            Math.random = () => {
+                state = (state + 0x6d2b79f5) | 0;
+                let t = Math.imul(state ^ (state >>> 15), 1 | state);
+                t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+                return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+            };
+            try {
+                const result = window.__workoutHarness.generateWorkout(scenario.formData);
+                const workout = Array.isArray(result.workout) ? result.workout : [];
+                results.push({
+                    ok: true,
+                    trainingPattern: result.trainingPattern,
+                    duration: result.duration,
+                    workTime: result.workTime,
+                    restTime: result.restTime,
+                    hasCircuitData: !!result._circuitData,
+                    items: workout.map((item) => [
+                        item?.name ?? null,
+                        item?.type ?? null,
+                        item?.equipment ?? null,
+                        item?._section ?? null,
+                    ]),
+                });
+            } catch (error) {
+                results.push({ ok: false, error: String((error && error.message) || error) });
+            }
+        }
+    } finally {
+        Math.random = nativeRandom;
+    }
+    return results;
+}"""
+
+
+class HarnessUnavailable(RuntimeError):
+    """Raised when Playwright or its browser cannot be started."""
+
+
+@dataclass(frozen=True)
+class Scenario:
+    duration: int
+    equipment: Tuple[str, ...]
+    level: str
+    pattern: str
+    seed: int = 0
+    settings: Tuple[Tuple[str, int], ...] = field(default=())
+    work_time: int = 45
+    rest_time: int = 15
+
+    def form_data(self) -> Dict[str, Any]:
+        """The object ``getFormData`` would build for this form state."""
+        return {
+            "level": self.level,
+            "duration": self.duration,
+            "equipment": list(self.equipment) or ["Bodyweight"],
+            "workTime": self.work_time,
+            "restTime": self.rest_time,
+            "trainingPattern": self.pattern,
+            "patternSettings": dict(self.settings),
+        }
+
+    def describe(self) -> Dict[str, Any]:
+        described = {
+            "duration": self.duration,
+            "equipment": list(self.equipment),
+            "level": self.level,
+            "pattern": self.pattern,
+            "seed": self.seed,
+        }
+        if self.settings:
+            described["settings"] = dict(self.settings)
+        if (self.work_time, self.rest_time) != (45, 15):
+            described["work_time"] = self.work_time
+            described["rest_time"] = self.rest_time
+        return described
+
+
+def workout_violations(index: ExerciseIndex, scenario: Scenario, result: Dict[str, Any]) -> List[str]:
+    """Invariants every generated workout must satisfy, as human-readable violations."""
+    if not result.get("ok"):
+        return [f"generateWorkout threw: {result.get('error')}"]
+    violations = []
+    if result.get("trainingPattern") != scenario.pattern:
+        violations.append(f"pattern {result.get('trainingPattern')!r} != requested {scenario.pattern!r}")
+    allowed = set(scenario.equipment) or {"Bodyweight"}
+    main_count = 0
+    for name, etype, equipment, _section in result.get("items", ()):
+        if etype not in EXERCISE_TYPES:
+            continue
+        main_count += etype == "main"
+        records = [record for record in index.named(name) if record.type == etype]
+        if not records:
+            violations.append(f"{etype} exercise {name!r} is not in the database")
+            continue
+        if equipment not in allowed:
+            violations.append(f"{name!r} needs {equipment!r}, which was not selected")
+        if etype == "main" and not any(scenario.level in record.levels for record in records):
+            violations.append(f"main exercise {name!r} is not offered at {scenario.level}")
+    if main_count == 0:
+        violations.append("workout has no main exercises")
+    return violations
+
+
+class WorkoutHarness:
+    """One headless page with the generator module preloaded, fed scenarios in batches."""
+
+    def __init__(
+        self,
+        snapshot: SourceSnapshot,
+        module: str = GENERATOR_MODULE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        headless: bool = True,
+        browser_name: str = "chromium",
+    ):
+        self.snapshot = snapshot
+        self.module = module
+        self.batch_size = max(1, batch_size)
+        self.headless = headless
+        self.browser_name = browser_name
+        self.served: List[str] = []
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    def __enter__(self) -> "WorkoutHarness":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def resolve(self, url: str) -> Tuple[int, bytes, str]:
+        """``(status, body, content type)`` for a request to the harness origin."""
+        path = urlsplit(url).path
+        if path == BOOTSTRAP_PATH:
+            return 200, _BOOTSTRAP_HTML, "text/html; charset=utf-8"
+        source = self.snapshot.get(path.lstrip("/")) if path.startswith("/") else None
+        if source is None:
+            return 404, b"", "text/plain"
+        self.served.append(source.path)
+        content_type = mimetypes.guess_type(source.path)[0] or "application/octet-stream"
+        if source.path.endswith((".js", ".mjs")):
+            content_type = "text/javascript"
+        return 200, source.data, content_type
+
+    def _handle(self, route: Any) -> None:
+        if not route.request.url.startswith(HARNESS_ORIGIN):
+            route.abort()
+            return
+        status, body, content_type = self.resolve(route.request.url)
+        route.fulfill(status=status, body=body, content_type=content_type)
+
+    def start(self) -> None:
+        if self._page is not None:
+            return
+        try:
+            from playwright.sync_api import Error as PlaywrightError
+            from playwright.sync_api import sync_playwright
+        except ImportError as exc:
+            raise HarnessUnavailable(f"Playwright is not installed: {exc}") from exc
+        try:
+            self._playwright = sync_playwright().start()
+            self._browser = getattr(self._playwright, self.browser_name).launch(headless=self.headless)
+            self._page = self._browser.new_page()
+            self._page.route("**/*", self._handle)
+            self._page.goto(HARNESS_ORIGIN + BOOTSTRAP_PATH)
+            loaded = self._page.evaluate(_LOAD_MODULE, "/" + self.module)
+        except PlaywrightError as exc:
+            self.close()
+            reason = str(exc).strip().splitlines()[0] if str(exc).strip() else type(exc).__name__
+            raise HarnessUnavailable(f"Could not start {self.browser_name}: {reason}") from exc
+        if not loaded:
+            self.close()
+            raise HarnessUnavailable(f"{self.module} does not export generateWorkout")
+
+    def run(self, scenarios: Sequence[Scenario]) -> List[Dict[str, Any]]:
+        """Generate one workout per scenario; results line up with ``scenarios``."""
+        self.start()
+        results: List[Dict[str, Any]] = []
+        for offset in range(0, len(scenarios), self.batch_size):
+            batch = scenarios[offset:offset + self.batch_size]
+            payload = [{"formData": scenario.form_data(), "seed": scenario.seed} for scenario in batch]
+            results.extend(self._page.evaluate(_RUN_BATCH, payload))
+        return results
+
+    def close(self) -> None:
+        browser, playwright = self._browser, self._playwright
+        self._page = self._browser = self._playwright = None
+        try:
+            if browser is not None:
+                browser.close()
+        finally:
+            if playwright is not None:
+                playwright.stop()
+
+
+def form_space(
+    durations: Iterable[int],
+    equipment: Sequence[str],
+    levels: Iterable[str],
+    patterns: Iterable[str],
+    always_available: Sequence[str] = (),
+    seed: int = 0,
+) -> List[Scenario]:
+    """Every (duration, equipment selection, level, pattern) combination.
+
+    Selections are the subsets of ``equipment`` plus ``always_available``;
+    the empty selection is skipped.
+    """
+    always = tuple(name for name in equipment if name in always_available)
+    optional = [name for name in equipment if name not in always_available]
+    selections = []
+    for mask in range(1 << len(optional)):
+        chosen = always + tuple(name for bit, name in enumerate(optional) if mask >> bit & 1)
+        if chosen:
+            selections.append(chosen)
+    combinations = product(durations, selections, levels, patterns)
+    return [
+        Scenario(duration, selection, level, pattern, seed=seed + position)
+        for position, (duration, selection, level, pattern) in enumerate(combinations)
+    ]
+
+
+def summarize(
+    index: ExerciseIndex,
+    scenarios: Sequence[Scenario],
+    results: Sequence[Dict[str, Any]],
+    max_examples: int = 20,
+) -> Dict[str, Any]:
+    failing = []
+    for scenario, result in zip(scenarios, results):
+        violations = workout_violations(index, scenario, result)
+        if violations:
+            failing.append({"scenario": scenario.describe(), "violations": violations})
+    return {
+        "scenarios": len(scenarios),
+        "failed": len(failing),
+        "examples": failing[:max_examples],
+    }
+
+
+def run_form_space(
+    snapshot: SourceSnapshot,
+    index: ExerciseIndex,
+    scenarios: Sequence[Scenario],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    harness: Optional[WorkoutHarness] = None,
+) -> Dict[str, Any]:
+    """Run ``scenarios`` through a (possibly shared) harness and summarise the violations."""
+    if harness is not None:
+        return summarize(index, scenarios, harness.run(scenarios))
+    with WorkoutHarness(snapshot, batch_size=batch_size) as owned:
+        return summarize(index, scenarios, owned.run(scenarios))